@@ -93,6 +93,8 @@ class Agent:
     def __init__(self, skills: Skill) -> None:
         self._skills = skills
         self._agents: Optional[Dict[str, AgentInfo]] = None
+        # Bumped on reset so dependents (e.g. cached tool descriptions) refresh.
+        self.version = 0
 
     async def init(self) -> None:
         """Eagerly initialize agents during startup."""
@@ -408,3 +410,4 @@ class Agent:
 
     def reset(self) -> None:
         self._agents = None
+        self.version += 1
@@ -99,8 +99,9 @@ class HotaruAPIClient:
         *,
         json_body: dict[str, Any] | list[Any] | None = None,
         params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
     ) -> httpx.Response:
-        request = self._client.build_request(method, path, json=json_body, params=params)
+        request = self._client.build_request(method, path, json=json_body, params=params, headers=headers)
         response = await self._client.send(request, stream=True)
 
         self._raise_for_status(response)
@@ -147,7 +148,7 @@ class HotaruAPIClient:
         value = line.strip()
         if not value or value.startswith(":"):
             return None
-        if value.startswith("event:"):
+        if value.startswith(("event:", "id:", "retry:")):
             return None
         if value.startswith("data:"):
             value = value[5:].strip()
@@ -219,6 +220,13 @@ class HotaruAPIClient:
         )
         return result if isinstance(result, list) else []
 
+    async def session_cache(self, session_id: str) -> dict[str, Any]:
+        result = await self._request_json(
+            "GET",
+            f"/v1/sessions/{session_id}/cache",
+        )
+        return result if isinstance(result, dict) else {}
+
     async def delete_messages(
         self,
         session_id: str,
@@ -266,10 +274,13 @@ class HotaruAPIClient:
         )
         return result if isinstance(result, dict) else {}
 
-    async def stream_events(self) -> AsyncIterator[dict[str, Any]]:
+    async def stream_events(self, last_event_id: int | None = None) -> AsyncIterator[dict[str, Any]]:
+        """Stream server events, resuming after *last_event_id* when given."""
+        headers = {"Last-Event-ID": str(last_event_id)} if last_event_id is not None else None
         response = await self._stream_request(
             "GET",
             "/v1/events",
+            headers=headers,
         )
         try:
             async for event in self._iter_stream_events(response):
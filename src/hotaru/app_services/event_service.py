@@ -1,83 +1,56 @@
-"""Event streaming application service."""
+"""Event streaming application service.
+
+Clients read bus events through the AppContext's ``EventHub``: events
+carry increasing ids and a pre-encoded body, and a client that reconnects
+with ``Last-Event-ID`` gets the events it missed replayed from the hub's
+ring.  A client whose queue overflows is disconnected so it can reconnect
+and resume.
+"""
 
 from __future__ import annotations
 
 import asyncio
-from typing import Any, AsyncIterator
-
-from ..core.bus import Bus
-
-
-def _extract_session_id(data: dict[str, Any]) -> str:
-    """Extract session_id from event data at any nesting level."""
-    direct = data.get("session_id")
-    if isinstance(direct, str) and direct:
-        return direct
-
-    info = data.get("info")
-    if isinstance(info, dict):
-        scoped = info.get("session_id")
-        if isinstance(scoped, str) and scoped:
-            return scoped
+from typing import Any, AsyncIterator, Optional
 
-    part = data.get("part")
-    if isinstance(part, dict):
-        scoped = part.get("session_id")
-        if isinstance(scoped, str) and scoped:
-            return scoped
+from ..runtime.event_hub import EventHub, make_envelope
+from ..util.log import Log
 
-    session = data.get("session")
-    if isinstance(session, dict):
-        scoped = session.get("id")
-        if isinstance(scoped, str) and scoped:
-            return scoped
+log = Log.create({"service": "event_service"})
 
-    return ""
+HEARTBEAT_SECONDS = 30.0
 
 
 class EventService:
     """Thin orchestration for bus event streaming."""
 
     @classmethod
-    async def stream(cls, bus: Bus) -> AsyncIterator[dict[str, Any]]:
-        queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
-
-        def on_event(event: Any) -> None:
-            if isinstance(event, dict):
-                event_type = str(event.get("type", "server.event"))
-                data = event.get("properties", event.get("data", {}))
-                if not isinstance(data, dict):
-                    data = {"value": data}
-            elif hasattr(event, "type") and hasattr(event, "properties"):
-                event_type = str(event.type)
-                data = event.properties if isinstance(event.properties, dict) else {}
-            elif hasattr(event, "model_dump"):
-                payload = event.model_dump()
-                event_type = str(payload.get("type", "server.event"))
-                data = payload.get("properties", {})
-                if not isinstance(data, dict):
-                    data = {"value": data}
-            else:
-                event_type = "server.event"
-                data = {}
-
-            envelope: dict[str, Any] = {"type": event_type, "data": data}
-            session_id = _extract_session_id(data)
-            if session_id:
-                envelope["session_id"] = session_id
-            queue.put_nowait(envelope)
-
-        unsubscribe = bus._raw_subscribe("*", on_event)
-
+    async def stream(
+        cls,
+        hub: EventHub,
+        *,
+        last_event_id: Optional[int] = None,
+        session_id: str = "",
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield envelopes for one client until it disconnects or overflows.
+
+        Envelopes carry the pre-encoded frame body under ``encoded``.
+        """
+        subscriber, resumed = hub.subscribe(last_event_id, session_id)
+        connected: dict[str, Any] = {}
+        if resumed is not None:
+            connected = {"last_event_id": last_event_id, "resumed": resumed}
         try:
-            yield {"type": "server.connected", "data": {}}
+            yield make_envelope(None, "server.connected", connected)
             while True:
-                try:
-                    event = await asyncio.wait_for(queue.get(), timeout=30.0)
-                    yield event
-                except asyncio.TimeoutError:
-                    yield {"type": "server.heartbeat", "data": {}}
+                event = await subscriber.get(HEARTBEAT_SECONDS)
+                if subscriber.overflowed:
+                    log.warn("event stream client fell behind, disconnecting", {"queue": hub.queue_size})
+                    return
+                if event is None:
+                    yield make_envelope(None, "server.heartbeat", {})
+                    continue
+                yield event
         except asyncio.CancelledError:
             return
         finally:
-            unsubscribe()
+            hub.unsubscribe(subscriber)
@@ -14,6 +14,7 @@ from ..runtime import AppContext
 from ..session import (
     PromptResult,
     Session,
+    SessionCacheStats,
     SessionCompaction,
     SessionPrompt,
 )
@@ -198,8 +199,17 @@ class SessionService:
         if not deleted:
             raise NotFoundError("Session", session_id)
         await app.clear_session(session_id)
+        SessionCacheStats.clear(session_id)
         return {"ok": True}
 
+    @classmethod
+    async def cache_stats(cls, session_id: str) -> dict[str, Any]:
+        session = await Session.get(session_id)
+        if not session:
+            raise NotFoundError("Session", session_id)
+        stats = SessionCacheStats.get(session_id)
+        return stats.to_dict() if stats else {}
+
     @classmethod
     async def list_messages(cls, session_id: str) -> list[dict[str, Any]]:
         session = await Session.get(session_id)
@@ -24,6 +24,10 @@ Example:
     unsubscribe()
 """
 
+import asyncio
+import bisect
+import time
+import traceback
 from contextvars import ContextVar, Token
 from typing import Any, Callable, Dict, List, TypeVar, Generic, Awaitable, Union, Optional
 from pydantic import BaseModel
@@ -52,30 +56,36 @@ class BusEvent(Generic[T]):
     Attributes:
         type: Unique event type identifier (e.g., "user.created")
         properties_type: Pydantic model class for event properties
+        concurrent: Whether async subscribers may run concurrently
     """
 
-    def __init__(self, event_type: str, properties_type: type[T]):
+    def __init__(self, event_type: str, properties_type: type[T], concurrent: bool = False):
         """Initialize an event definition.
 
         Args:
             event_type: Unique event type identifier
             properties_type: Pydantic model class for properties
+            concurrent: Await async subscribers together instead of one by one
         """
         self.type = event_type
         self.properties_type = properties_type
+        self.concurrent = concurrent
 
     @staticmethod
-    def define(event_type: str, properties_type: type[T]) -> 'BusEvent[T]':
+    def define(event_type: str, properties_type: type[T], concurrent: bool = False) -> 'BusEvent[T]':
         """Define and register a new event type.
 
         Args:
             event_type: Unique event type identifier (e.g., "user.created")
             properties_type: Pydantic model class for event properties
+            concurrent: Await async subscribers together instead of one by
+                one.  Only for notifications whose subscribers do not depend
+                on each other's side effects.
 
         Returns:
             BusEvent instance registered in the global registry
         """
-        event = BusEvent(event_type, properties_type)
+        event = BusEvent(event_type, properties_type, concurrent)
         _registry[event_type] = event
         return event
 
@@ -98,6 +108,44 @@ class EventPayload(BaseModel):
 # Type alias for subscription callbacks
 SubscriptionCallback = Callable[[EventPayload], Union[None, Awaitable[None]]]
 
+# Upper bounds (seconds) of the dispatch time histogram; the last bucket is open.
+HISTOGRAM_BOUNDS = (0.00001, 0.0001, 0.001, 0.01, 0.1, 1.0)
+
+
+class EventStats:
+    """Publish counters and dispatch time histogram of one event type."""
+
+    __slots__ = ("published", "skipped", "deliveries", "errors", "total", "max", "buckets")
+
+    def __init__(self) -> None:
+        self.published = 0
+        self.skipped = 0
+        self.deliveries = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(HISTOGRAM_BOUNDS) + 1)
+
+    def observe(self, elapsed: float) -> None:
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+        self.buckets[bisect.bisect_left(HISTOGRAM_BOUNDS, elapsed)] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        dispatched = self.published - self.skipped
+        labels = [f"le_{bound * 1000:g}ms" for bound in HISTOGRAM_BOUNDS] + ["inf"]
+        return {
+            "published": self.published,
+            "skipped": self.skipped,
+            "deliveries": self.deliveries,
+            "errors": self.errors,
+            "total_ms": self.total * 1000,
+            "mean_ms": self.total * 1000 / dispatched if dispatched else 0.0,
+            "max_ms": self.max * 1000,
+            "histogram": dict(zip(labels, self.buckets)),
+        }
+
 
 _bus_var: ContextVar['Bus'] = ContextVar('_bus_var')
 
@@ -111,6 +159,7 @@ class Bus:
 
     def __init__(self) -> None:
         self._subscriptions: Dict[str, List[SubscriptionCallback]] = {}
+        self._stats: Dict[str, EventStats] = {}
 
     @classmethod
     def _current(cls) -> 'Bus':
@@ -129,6 +178,25 @@ class Bus:
 
     @classmethod
     async def publish(cls, event: BusEvent[T], properties: T, *, propagate: bool = False) -> None:
+        bus = cls._current()
+        stats = bus._stats.get(event.type)
+        if stats is None:
+            stats = bus._stats[event.type] = EventStats()
+        stats.published += 1
+
+        typed = bus._subscriptions.get(event.type)
+        wildcard = bus._subscriptions.get("*")
+        # A started AppContext's EventHub subscribes to "*", so this only
+        # skips work on buses without one (scripts, tests); it is not a
+        # saving for streaming events in the server.
+        if not typed and not wildcard:
+            if not isinstance(properties, (event.properties_type, dict)):
+                raise TypeError(
+                    f"Properties must be instance of {event.properties_type.__name__}"
+                )
+            stats.skipped += 1
+            return
+
         if not isinstance(properties, event.properties_type):
             if isinstance(properties, dict):
                 properties = event.properties_type(**properties)
@@ -137,45 +205,70 @@ class Bus:
                     f"Properties must be instance of {event.properties_type.__name__}"
                 )
 
-        payload = EventPayload(
-            type=event.type,
-            properties=properties.model_dump()
-        )
-
-        bus = cls._current()
-        callbacks = []
-        for key in [event.type, "*"]:
-            callbacks.extend(bus._subscriptions.get(key, []))
+        # Snapshot the subscriber lists: callbacks may unsubscribe while running.
+        callbacks = typed + wildcard if typed and wildcard else list(typed or wildcard or ())
+        # Dumped once and shared by every subscriber.
+        payload = EventPayload(type=event.type, properties=properties.model_dump())
 
+        begin = time.perf_counter()
         errors: list[Exception] = []
+        pending: Optional[list[Awaitable[None]]] = [] if event.concurrent else None
         for callback in callbacks:
             try:
                 result = callback(payload)
                 if hasattr(result, '__await__'):
-                    await result
+                    if pending is None:
+                        await result
+                    else:
+                        pending.append(result)
             except Exception as e:
-                import traceback as tb
-                trace = tb.format_exc()
-                _get_log().error("subscription callback failed", {
-                    "error": str(e),
-                    "type": event.type,
-                    "traceback": trace,
-                })
-                if propagate:
-                    errors.append(e)
-                elif event.type != "bus.error":
-                    try:
-                        await cls.publish(BusError, BusErrorProps(
-                            source_event=event.type,
-                            error=str(e),
-                            traceback=trace,
-                        ))
-                    except Exception:
-                        _get_log().error("BusError handler failed, suppressing to avoid recursion")
+                await cls._callback_failed(bus, event, e, traceback.format_exc(), propagate, errors)
+        if pending:
+            for outcome in await asyncio.gather(*pending, return_exceptions=True):
+                if isinstance(outcome, Exception):
+                    trace = "".join(traceback.format_exception(outcome))
+                    await cls._callback_failed(bus, event, outcome, trace, propagate, errors)
+                elif isinstance(outcome, BaseException):
+                    raise outcome
+        stats.deliveries += len(callbacks)
+        stats.observe(time.perf_counter() - begin)
 
         if propagate and errors:
             raise ExceptionGroup(f"Bus.publish({event.type})", errors)
 
+    @classmethod
+    async def _callback_failed(
+        cls,
+        bus: 'Bus',
+        event: BusEvent[Any],
+        error: Exception,
+        trace: str,
+        propagate: bool,
+        errors: List[Exception],
+    ) -> None:
+        bus._stats[event.type].errors += 1
+        _get_log().error("subscription callback failed", {
+            "error": str(error),
+            "type": event.type,
+            "traceback": trace,
+        })
+        if propagate:
+            errors.append(error)
+        elif event.type != "bus.error":
+            try:
+                await cls.publish(BusError, BusErrorProps(
+                    source_event=event.type,
+                    error=str(error),
+                    traceback=trace,
+                ))
+            except Exception:
+                _get_log().error("BusError handler failed, suppressing to avoid recursion")
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Per event type publish counters and dispatch timings, busiest first."""
+        ordered = sorted(self._stats.items(), key=lambda item: item[1].published, reverse=True)
+        return {event_type: stats.snapshot() for event_type, stats in ordered}
+
     @classmethod
     def subscribe(
         cls,
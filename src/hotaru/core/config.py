@@ -1,14 +1,24 @@
 """Configuration management.
 
 Loads and merges configuration from multiple sources with proper precedence.
+Each source file (and markdown agent directory) is cached as a layer validated
+by mtime/size; merged results are cached per directory and dropped by
+``refresh()`` (or the background ``watch()`` poller) when a layer changes.
 """
 
+import asyncio
+import copy
 import json
 import os
+import stat
 from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from pydantic import BaseModel
+
+from .bus import Bus, BusEvent
 from .config_loader import deep_merge, load_json_file
 from .config_markdown import parse_markdown_config
 from .config_schema import (
@@ -26,8 +36,10 @@ from .config_schema import (
     ProviderConfig,
     ServerConfig,
     SkillsConfig,
+    ToolConcurrencyConfig,
     TuiConfig,
 )
+from .context import ContextNotFoundError
 from .global_paths import GlobalPath
 from ..permission.constants import permission_for_tool
 from ..util.log import Log
@@ -42,6 +54,8 @@ __all__ = [
     "Config",
     "ConfigError",
     "ConfigManager",
+    "ConfigUpdated",
+    "ConfigUpdatedProps",
     "CustomModelConfig",
     "ExperimentalConfig",
     "LoggingConfig",
@@ -52,6 +66,7 @@ __all__ = [
     "ProviderConfig",
     "ServerConfig",
     "SkillsConfig",
+    "ToolConcurrencyConfig",
     "TuiConfig",
 ]
 
@@ -108,6 +123,84 @@ def _load_agent_markdown_dir(root: str) -> Dict[str, Any]:
     return result
 
 
+_Signature = Optional[Tuple[Any, ...]]
+
+
+def _file_signature(path: str) -> _Signature:
+    """``(mtime_ns, size)`` of a config file, ``None`` when it is missing."""
+    try:
+        info = os.stat(path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(info.st_mode):
+        return None
+    return (info.st_mtime_ns, info.st_size)
+
+
+def _agent_tree_signature(root: str) -> _Signature:
+    """Signature of the markdown agent files under *root*.
+
+    ``None`` when *root* does not exist, so creating the directory counts as
+    a change too.
+    """
+    if not os.path.isdir(root):
+        return None
+    entries: List[Tuple[str, int, int]] = []
+    for subdir in ("agent", "agents"):
+        for dirpath, _dirnames, filenames in os.walk(os.path.join(root, subdir)):
+            for name in filenames:
+                if not name.endswith(".md"):
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    info = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((path, info.st_mtime_ns, info.st_size))
+    entries.sort()
+    return tuple(entries)
+
+
+@dataclass
+class _Layer:
+    """One parsed config source."""
+    signature: _Signature
+    data: Dict[str, Any]
+
+
+@dataclass
+class _Merged:
+    """Merged config of one directory and the source signatures it was built from."""
+    config: Config
+    directories: List[str]
+    files: Dict[str, _Signature] = field(default_factory=dict)
+    roots: Dict[str, _Signature] = field(default_factory=dict)
+    env: Optional[str] = None
+
+
+class ConfigUpdatedProps(BaseModel):
+    """Properties for config.updated event.
+
+    Attributes:
+        directories: Directories whose merged config was dropped
+        sources: Config files or markdown agent roots that changed
+    """
+    directories: List[str]
+    sources: List[str]
+
+
+# Fired when config sources change; dependents drop what they derived from config.
+ConfigUpdated = BusEvent.define("config.updated", ConfigUpdatedProps)
+
+
+async def _notify(directories: List[str], sources: List[str]) -> None:
+    try:
+        await Bus.publish(ConfigUpdated, ConfigUpdatedProps(directories=directories, sources=sources))
+    except RuntimeError:
+        # No bus bound (e.g. standalone scripts); nothing can be listening.
+        pass
+
+
 class ConfigError(Exception):
     """Configuration error."""
 
@@ -133,9 +226,17 @@ class ConfigManager:
     5. Managed config (enterprise, highest priority)
     """
 
+    # Seconds between two checks of the watched config sources.
+    WATCH_INTERVAL = 2.0
+
     def __init__(self) -> None:
-        self._cache: Optional[Config] = None
-        self._directories: List[str] = []
+        # Parsed layers keyed by source path; reused while the signature matches.
+        self._layers: Dict[str, _Layer] = {}
+        # Merged config per resolved directory; dropped by refresh().
+        self._merged: Dict[str, _Merged] = {}
+        self._resolved: Dict[str, str] = {}
+        self._primary: Optional[str] = None
+        self._watcher: Optional[asyncio.Task[None]] = None
 
     # -- ContextVar plumbing --
 
@@ -163,8 +264,10 @@ class ConfigManager:
     def reset(cls) -> None:
         """Reset cached configuration."""
         inst = cls.current()
-        inst._cache = None
-        inst._directories = []
+        inst._layers.clear()
+        inst._merged.clear()
+        inst._resolved.clear()
+        inst._primary = None
 
     @classmethod
     async def load(cls, directory: str = ".") -> Config:
@@ -172,27 +275,84 @@ class ConfigManager:
 
     @classmethod
     async def get(cls) -> Config:
+        """Config of the active instance directory, else the first one loaded."""
         inst = cls.current()
-        if inst._cache is None:
-            return await inst._load()
-        return inst._cache
+        return await inst._load(inst._scope_directory())
 
     @classmethod
     def directories(cls) -> List[str]:
-        return cls.current()._directories.copy()
+        inst = cls.current()
+        merged = inst._merged.get(inst._key(inst._scope_directory()))
+        return merged.directories.copy() if merged else []
 
     @classmethod
     async def update_global(cls, updates: Dict[str, Any]) -> Config:
         return await cls.current()._update_global(updates)
 
+    @classmethod
+    async def refresh(cls) -> List[str]:
+        """Drop merged configs whose sources changed; see :meth:`_refresh`."""
+        return await cls.current()._refresh()
+
     # -- Instance methods --
 
-    async def _load(self, directory: str = ".") -> Config:
-        if self._cache is not None:
-            return self._cache
+    def _key(self, directory: str) -> str:
+        if not os.path.isabs(directory):
+            # Relative paths follow the process cwd, so they are not memoized.
+            return str(Path(directory).resolve())
+        key = self._resolved.get(directory)
+        if key is None:
+            key = str(Path(directory).resolve())
+            self._resolved[directory] = key
+        return key
+
+    def _scope_directory(self) -> str:
+        from ..project.instance import Instance
+
+        try:
+            return Instance.directory()
+        except ContextNotFoundError:
+            return self._primary or "."
 
+    async def _load(self, directory: str = ".") -> Config:
+        key = self._key(directory)
+        merged = self._merged.get(key)
+        if merged is None:
+            merged = self._merge(key)
+            self._merged[key] = merged
+        if self._primary is None:
+            self._primary = key
+        return merged.config
+
+    def _read_file(self, filepath: str, seen: Dict[str, _Signature]) -> Dict[str, Any]:
+        signature = _file_signature(filepath)
+        seen[filepath] = signature
+        if signature is None:
+            self._layers.pop(filepath, None)
+            return {}
+        layer = self._layers.get(filepath)
+        if layer is None or layer.signature != signature:
+            layer = _Layer(signature, load_json_file(filepath))
+            self._layers[filepath] = layer
+        return copy.deepcopy(layer.data)
+
+    def _read_agents(self, root: str, seen: Dict[str, _Signature]) -> Dict[str, Any]:
+        signature = _agent_tree_signature(root)
+        seen[root] = signature
+        if signature is None:
+            self._layers.pop(root, None)
+            return {}
+        layer = self._layers.get(root)
+        if layer is None or layer.signature != signature:
+            layer = _Layer(signature, _load_agent_markdown_dir(root))
+            self._layers[root] = layer
+        return copy.deepcopy(layer.data)
+
+    def _merge(self, directory: str) -> '_Merged':
         result: Dict[str, Any] = {}
         directories: List[str] = []
+        files: Dict[str, _Signature] = {}
+        roots: Dict[str, _Signature] = {}
 
         # 1. Global config
         global_config_dir = GlobalPath.config()
@@ -200,50 +360,48 @@ class ConfigManager:
 
         for filename in ["config.json", "hotaru.json", "hotaru.jsonc"]:
             filepath = os.path.join(global_config_dir, filename)
-            data = load_json_file(filepath)
+            data = self._read_file(filepath, files)
             if data:
                 result = deep_merge(result, data)
                 log.info("loaded global config", {"path": filepath})
 
         # 2. Project config (search up from directory)
-        current = Path(directory).resolve()
+        current = Path(directory)
         project_configs = []
 
         while current != current.parent:
             for filename in ["hotaru.json", "hotaru.jsonc"]:
-                filepath = current / filename
-                if filepath.exists():
-                    project_configs.append(str(filepath))
+                project_configs.append(str(current / filename))
             current = current.parent
 
         # Apply in reverse order (root first, then more specific)
         for filepath in reversed(project_configs):
-            data = load_json_file(filepath)
+            data = self._read_file(filepath, files)
             if data:
                 result = deep_merge(result, data)
                 log.info("loaded project config", {"path": filepath})
 
         # 3. .hotaru directory configs
-        current = Path(directory).resolve()
+        current = Path(directory)
         hotaru_dirs = []
 
         while current != current.parent:
             hotaru_dir = current / ".hotaru"
+            hotaru_dirs.append(str(hotaru_dir))
             if hotaru_dir.is_dir():
-                hotaru_dirs.append(str(hotaru_dir))
                 directories.append(str(hotaru_dir))
             current = current.parent
 
         # Also check home directory
         home_hotaru = Path.home() / ".hotaru"
+        hotaru_dirs.append(str(home_hotaru))
         if home_hotaru.is_dir():
-            hotaru_dirs.append(str(home_hotaru))
             directories.append(str(home_hotaru))
 
         for hotaru_dir in reversed(hotaru_dirs):
             for filename in ["hotaru.json", "hotaru.jsonc"]:
                 filepath = os.path.join(hotaru_dir, filename)
-                data = load_json_file(filepath)
+                data = self._read_file(filepath, files)
                 if data:
                     result = deep_merge(result, data)
                     log.info("loaded .hotaru config", {"path": filepath})
@@ -255,10 +413,8 @@ class ConfigManager:
             resolved = str(Path(root).resolve())
             if resolved in markdown_roots:
                 return
-            if not Path(resolved).is_dir():
-                return
             markdown_roots.append(resolved)
-            if resolved not in directories:
+            if Path(resolved).is_dir() and resolved not in directories:
                 directories.append(resolved)
 
         # Global roots
@@ -268,7 +424,7 @@ class ConfigManager:
         add_markdown_root(str(Path(GlobalPath.home()) / ".hotaru"))
 
         # Project roots from repo root -> cwd
-        current = Path(directory).resolve()
+        current = Path(directory)
         ancestors: List[Path] = []
         while True:
             ancestors.append(current)
@@ -281,7 +437,7 @@ class ConfigManager:
             add_markdown_root(str(ancestor / ".hotaru"))
 
         for root in markdown_roots:
-            agent_data = _load_agent_markdown_dir(root)
+            agent_data = self._read_agents(root, roots)
             if not agent_data:
                 continue
             result.setdefault("agent", {})
@@ -300,13 +456,12 @@ class ConfigManager:
 
         # 5. Managed config (highest priority)
         managed_dir = os.environ.get("HOTARU_TEST_MANAGED_CONFIG_DIR") or _get_managed_config_dir()
-        if Path(managed_dir).exists():
-            for filename in ["hotaru.json", "hotaru.jsonc"]:
-                filepath = os.path.join(managed_dir, filename)
-                data = load_json_file(filepath)
-                if data:
-                    result = deep_merge(result, data)
-                    log.info("loaded managed config", {"path": filepath})
+        for filename in ["hotaru.json", "hotaru.jsonc"]:
+            filepath = os.path.join(managed_dir, filename)
+            data = self._read_file(filepath, files)
+            if data:
+                result = deep_merge(result, data)
+                log.info("loaded managed config", {"path": filepath})
 
         # Set defaults
         if result.get("tools"):
@@ -328,9 +483,83 @@ class ConfigManager:
         result.setdefault("command", {})
         result.setdefault("plugin", [])
 
-        self._directories = directories
-        self._cache = Config.model_validate(result)
-        return self._cache
+        return _Merged(
+            config=Config.model_validate(result),
+            directories=directories,
+            files=files,
+            roots=roots,
+            env=env_config,
+        )
+
+    def _changes(self) -> Tuple[List[str], List[str]]:
+        """Return (directories, sources) whose config inputs changed since merging.
+
+        Each source is stat'ed once, however many directories share it.
+        """
+        seen: Dict[str, _Signature] = {}
+        env = os.environ.get("HOTARU_CONFIG_CONTENT")
+        stale: List[str] = []
+        changed: List[str] = []
+
+        def check(path: str, signature: _Signature, probe: Callable[[str], _Signature]) -> bool:
+            if path not in seen:
+                seen[path] = probe(path)
+            if seen[path] == signature:
+                return False
+            if path not in changed:
+                changed.append(path)
+            return True
+
+        for key, merged in list(self._merged.items()):
+            dirty = merged.env != env
+            for path, signature in merged.files.items():
+                dirty = check(path, signature, _file_signature) or dirty
+            for root, signature in merged.roots.items():
+                dirty = check(root, signature, _agent_tree_signature) or dirty
+            if dirty:
+                stale.append(key)
+        return stale, changed
+
+    async def _refresh(self) -> List[str]:
+        """Drop merged configs whose sources changed and announce them.
+
+        Changed layers are re-parsed on the next load; unchanged ones are
+        reused.  Publishes :data:`ConfigUpdated` when anything was dropped.
+        """
+        stale, changed = await asyncio.to_thread(self._changes)
+        if not stale:
+            return []
+        for key in stale:
+            self._merged.pop(key, None)
+        for path in changed:
+            self._layers.pop(path, None)
+        log.info("config changed", {"directories": stale, "sources": changed})
+        await _notify(stale, changed)
+        return stale
+
+    def watch(self, interval: Optional[float] = None) -> None:
+        """Poll config sources in the background and refresh on change."""
+        if self._watcher and not self._watcher.done():
+            return
+        self._watcher = asyncio.create_task(self._poll(interval or self.WATCH_INTERVAL))
+
+    async def unwatch(self) -> None:
+        watcher, self._watcher = self._watcher, None
+        if watcher is None:
+            return
+        watcher.cancel()
+        try:
+            await watcher
+        except asyncio.CancelledError:
+            pass
+
+    async def _poll(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self._refresh()
+            except Exception as e:
+                log.warn("config refresh failed", {"error": str(e)})
 
     async def _update_global(self, updates: Dict[str, Any]) -> Config:
         filepath = os.path.join(GlobalPath.config(), "hotaru.json")
@@ -345,7 +574,10 @@ class ConfigManager:
 
         log.info("updated global config", {"path": filepath})
 
-        self._cache = None
-        self._directories = []
+        # Every directory merges the global layer.
+        stale = list(self._merged)
+        self._merged.clear()
+        self._layers.pop(filepath, None)
+        await _notify(stale, [filepath])
 
-        return await self._load()
+        return await self._load(self._primary or ".")
@@ -23,6 +23,9 @@ class McpLocalConfig(BaseModel):
     environment: Optional[Dict[str, str]] = None
     enabled: Optional[bool] = None
     timeout: Optional[int] = None
+    # Seconds before the cached tool list is fetched again; by default it is
+    # only refreshed on notifications/tools/list_changed or reconnect.
+    tools_ttl: Optional[float] = None
 
 
 class McpRemoteConfig(BaseModel):
@@ -33,6 +36,7 @@ class McpRemoteConfig(BaseModel):
     headers: Optional[Dict[str, str]] = None
     timeout: Optional[int] = None
     oauth: Optional[Union[bool, Dict[str, Any]]] = None
+    tools_ttl: Optional[float] = None
 
 
 McpConfig = Union[McpLocalConfig, McpRemoteConfig]
@@ -113,6 +117,9 @@ class ServerConfig(BaseModel):
     mdns: Optional[bool] = None
     mdns_domain: Optional[str] = Field(None, alias="mdnsDomain")
     cors: Optional[List[str]] = None
+    # Project instances kept alive at once, and seconds before an idle one is disposed.
+    max_instances: Optional[int] = Field(None, alias="maxInstances", ge=1)
+    instance_idle_ttl: Optional[float] = Field(None, alias="instanceIdleTtl", ge=0)
 
 
 class SkillsConfig(BaseModel):
@@ -126,6 +133,23 @@ class CompactionConfig(BaseModel):
     auto: Optional[bool] = None
     prune: Optional[bool] = None
     reserved: Optional[int] = None
+    tokenizer: Optional[Literal["estimate", "tiktoken", "chars"]] = None
+
+
+class ToolConcurrencyConfig(BaseModel):
+    """Scheduling of tool calls emitted in one assistant step.
+
+    Read-only tools run concurrently; every other tool is serialized.
+    ``serialize`` selects the rule per tool: ``exclusive`` waits for all
+    earlier calls and blocks later ones, ``path`` only orders calls that
+    touch overlapping paths.
+    """
+    enabled: bool = True
+    max_parallel: int = Field(8, ge=1)
+    read_only: List[str] = Field(default_factory=list)
+    serialize: Dict[str, Literal["exclusive", "path"]] = Field(default_factory=dict)
+
+    model_config = ConfigDict(extra="forbid")
 
 
 class TuiConfig(BaseModel):
@@ -152,6 +176,7 @@ class ExperimentalConfig(BaseModel):
     plan_mode: bool = False
     enable_exa: bool = False
     lsp_tool: bool = False
+    lsp_prewarm: bool = False
     primary_tools: List[str] = Field(default_factory=list)
 
     model_config = ConfigDict(extra="forbid")
@@ -183,6 +208,7 @@ class Config(BaseModel):
     tools: Optional[Dict[str, bool]] = None
     strict_permissions: Optional[bool] = None
     continue_loop_on_deny: bool = False
+    tool_concurrency: Optional[ToolConcurrencyConfig] = None
     experimental: ExperimentalConfig = Field(default_factory=ExperimentalConfig)
 
     server: Optional[ServerConfig] = None
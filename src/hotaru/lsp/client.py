@@ -7,6 +7,7 @@ using the JSON-RPC protocol over stdio.
 import asyncio
 import os
 import subprocess
+import time
 from contextvars import Context, copy_context
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
@@ -24,6 +25,18 @@ log = Log.create({"service": "lsp.client"})
 # Debounce time for diagnostics
 DIAGNOSTICS_DEBOUNCE_MS = 150
 
+# Open documents are closed after this long without a touch ...
+DOCUMENT_IDLE_SECONDS = 300.0
+# ... or, least recently touched first, beyond this many.
+MAX_OPEN_DOCUMENTS = 64
+
+# TextDocumentSyncKind
+SYNC_NONE = 0
+SYNC_FULL = 1
+SYNC_INCREMENTAL = 2
+
+_PREFIX_CHUNK = 4096
+
 
 @dataclass(slots=True)
 class _DiagWaiter:
@@ -31,6 +44,70 @@ class _DiagWaiter:
     task: asyncio.Task[None] | None = None
 
 
+@dataclass(slots=True)
+class _Document:
+    """Client-side mirror of a document opened on the server."""
+
+    uri: str
+    text: str
+    version: int
+    touched: float
+
+
+def _common_prefix(a: str, b: str) -> int:
+    limit = min(len(a), len(b))
+    start = 0
+    # Compare in chunks first so large identical regions stay in C.
+    while start + _PREFIX_CHUNK <= limit and a[start:start + _PREFIX_CHUNK] == b[start:start + _PREFIX_CHUNK]:
+        start += _PREFIX_CHUNK
+    while start < limit and a[start] == b[start]:
+        start += 1
+    return start
+
+
+def _common_suffix(a: str, b: str, limit: int) -> int:
+    size = 0
+    while size + _PREFIX_CHUNK <= limit and a[len(a) - size - _PREFIX_CHUNK:len(a) - size] == b[
+        len(b) - size - _PREFIX_CHUNK:len(b) - size
+    ]:
+        size += _PREFIX_CHUNK
+    while size < limit and a[len(a) - size - 1] == b[len(b) - size - 1]:
+        size += 1
+    return size
+
+
+def _position(text: str, offset: int) -> Dict[str, int]:
+    """LSP position (UTF-16 code units) of a string offset."""
+    line_start = text.rfind("\n", 0, offset) + 1
+    segment = text[line_start:offset]
+    character = len(segment)
+    if not segment.isascii():
+        character = len(segment.encode("utf-16-le")) // 2
+    return {"line": text.count("\n", 0, line_start), "character": character}
+
+
+def text_edit(old: str, new: str) -> Optional[Dict[str, Any]]:
+    """Single minimal range change turning *old* into *new*.
+
+    Returns ``None`` when the texts are equal.
+    """
+    if old == new:
+        return None
+    prefix = _common_prefix(old, new)
+    # Never split a CRLF pair.
+    if prefix and old[prefix - 1:prefix] == "\r":
+        prefix -= 1
+    suffix = _common_suffix(old, new, min(len(old), len(new)) - prefix)
+    end = len(old) - suffix
+    if suffix and old[end:end + 1] == "\n" and old[end - 1:end] == "\r":
+        end += 1
+        suffix -= 1
+    return {
+        "range": {"start": _position(old, prefix), "end": _position(old, end)},
+        "text": new[prefix:len(new) - suffix],
+    }
+
+
 class LSPDiagnostic(BaseModel):
     """LSP diagnostic information.
 
@@ -72,7 +149,8 @@ class LSPClient:
         self.server = server
         self.root = root
         self._diagnostics: Dict[str, List[LSPDiagnostic]] = {}
-        self._files: Dict[str, int] = {}  # path -> version
+        self._documents: Dict[str, _Document] = {}
+        self._sync_kind = SYNC_FULL
         self._request_id = 0
         self._pending_requests: Dict[int, asyncio.Future] = {}
         self._reader_task: Optional[asyncio.Task] = None
@@ -82,6 +160,8 @@ class LSPClient:
         self._initialized = False
         self._diag_waiters: Dict[str, List[_DiagWaiter]] = {}
         self._loop_context: Context | None = None
+        self.spawn_ms: Optional[float] = None
+        self.initialize_ms: Optional[float] = None
 
     async def initialize(self) -> bool:
         """Initialize the LSP connection.
@@ -111,7 +191,7 @@ class LSPClient:
         root_uri = self._path_to_uri(self.root)
 
         try:
-            await asyncio.wait_for(
+            result = await asyncio.wait_for(
                 self._send_request("initialize", {
                     "rootUri": root_uri,
                     "processId": self.server.process.pid,
@@ -120,6 +200,7 @@ class LSPClient:
                     ],
                     "initializationOptions": self.server.initialization,
                     "capabilities": {
+                        "general": {"positionEncodings": ["utf-16"]},
                         "window": {"workDoneProgress": True},
                         "workspace": {
                             "configuration": True,
@@ -133,6 +214,7 @@ class LSPClient:
                 }),
                 timeout=45.0
             )
+            self._sync_kind = self._negotiated_sync_kind(result)
 
             # Send initialized notification
             await self._send_notification("initialized", {})
@@ -144,7 +226,7 @@ class LSPClient:
                 })
 
             self._initialized = True
-            log.info("LSP client initialized", {"server_id": self.server_id})
+            log.info("LSP client initialized", {"server_id": self.server_id, "sync": self._sync_kind})
             return True
 
         except asyncio.TimeoutError:
@@ -157,6 +239,17 @@ class LSPClient:
             })
             return False
 
+    @staticmethod
+    def _negotiated_sync_kind(result: Any) -> int:
+        """TextDocumentSyncKind announced in an initialize result."""
+        capabilities = result.get("capabilities") if isinstance(result, dict) else None
+        sync = capabilities.get("textDocumentSync") if isinstance(capabilities, dict) else None
+        if isinstance(sync, dict):
+            sync = sync.get("change")
+        if sync in (SYNC_NONE, SYNC_FULL, SYNC_INCREMENTAL):
+            return sync
+        return SYNC_FULL
+
     async def _read_messages(self) -> None:
         """Read messages from the server."""
         if not self._stream_reader:
@@ -407,59 +500,100 @@ class LSPClient:
 
         return os.path.normpath(path)
 
-    async def open_file(self, path: str) -> None:
-        """Notify the server that a file was opened.
+    async def open_file(self, path: str, text: Optional[str] = None) -> bool:
+        """Open a file on the server, or sync its new content.
+
+        Already open documents are mirrored in memory: only the changed
+        range is sent (when the server syncs incrementally) and nothing is
+        sent when the content is unchanged.
 
         Args:
             path: File path
+            text: Current content, if the caller already has it; read from
+                disk otherwise
+
+        Returns:
+            Whether the server was notified
         """
         if not os.path.isabs(path):
             path = os.path.join(Instance.directory(), path)
+        path = os.path.normpath(path)
 
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                text = f.read()
-        except Exception as e:
-            log.error("Failed to read file", {"path": path, "error": str(e)})
-            return
+        if text is None:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    text = f.read()
+            except Exception as e:
+                log.error("Failed to read file", {"path": path, "error": str(e)})
+                if path in self._documents:
+                    await self.close_file(path)
+                return False
+
+        now = time.monotonic()
+        document = self._documents.get(path)
+
+        if document is not None:
+            document.touched = now
+            if document.text == text:
+                return False
+
+            change: Optional[Dict[str, Any]] = None
+            if self._sync_kind == SYNC_INCREMENTAL:
+                change = text_edit(document.text, text)
+            document.text = text
+            document.version += 1
+
+            await self._send_notification("workspace/didChangeWatchedFiles", {
+                "changes": [{"uri": document.uri, "type": 2}]  # Changed
+            })
+            await self._send_notification("textDocument/didChange", {
+                "textDocument": {"uri": document.uri, "version": document.version},
+                "contentChanges": [change or {"text": text}],
+            })
+            return True
+
+        await self._close_idle(now)
 
         extension = os.path.splitext(path)[1]
         language_id = LANGUAGE_EXTENSIONS.get(extension, "plaintext")
         uri = self._path_to_uri(path)
 
-        version = self._files.get(path)
-
-        if version is not None:
-            # File already open, send change notification
-            await self._send_notification("workspace/didChangeWatchedFiles", {
-                "changes": [{"uri": uri, "type": 2}]  # Changed
-            })
+        # New file, send open notification
+        await self._send_notification("workspace/didChangeWatchedFiles", {
+            "changes": [{"uri": uri, "type": 1}]  # Created
+        })
 
-            new_version = version + 1
-            self._files[path] = new_version
+        self._diagnostics.pop(path, None)
 
-            await self._send_notification("textDocument/didChange", {
-                "textDocument": {"uri": uri, "version": new_version},
-                "contentChanges": [{"text": text}],
-            })
-        else:
-            # New file, send open notification
-            await self._send_notification("workspace/didChangeWatchedFiles", {
-                "changes": [{"uri": uri, "type": 1}]  # Created
-            })
+        await self._send_notification("textDocument/didOpen", {
+            "textDocument": {
+                "uri": uri,
+                "languageId": language_id,
+                "version": 0,
+                "text": text,
+            },
+        })
 
-            self._diagnostics.pop(path, None)
+        self._documents[path] = _Document(uri=uri, text=text, version=0, touched=now)
+        return True
 
-            await self._send_notification("textDocument/didOpen", {
-                "textDocument": {
-                    "uri": uri,
-                    "languageId": language_id,
-                    "version": 0,
-                    "text": text,
-                },
-            })
+    async def close_file(self, path: str) -> None:
+        """Close an open document and forget its mirror."""
+        document = self._documents.pop(os.path.normpath(path), None)
+        if document is None:
+            return
+        await self._send_notification("textDocument/didClose", {
+            "textDocument": {"uri": document.uri},
+        })
 
-            self._files[path] = 0
+    async def _close_idle(self, now: float) -> None:
+        """Bound server memory: close idle documents and keep room for one more."""
+        by_age = sorted(self._documents.items(), key=lambda item: item[1].touched)
+        excess = len(by_age) + 1 - MAX_OPEN_DOCUMENTS
+        for index, (path, document) in enumerate(by_age):
+            if index >= excess and now - document.touched < DOCUMENT_IDLE_SECONDS:
+                break
+            await self.close_file(path)
 
     async def wait_for_diagnostics(self, path: str, timeout: float = 3.0) -> None:
         """Wait for diagnostics for a file.
@@ -6,7 +6,9 @@ connections and accessing their features.
 
 import asyncio
 import os
-from typing import Any, Callable, Dict, List, Literal, Optional, Set
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Literal, Optional, Set, Tuple
 from pydantic import BaseModel
 
 from ..core.bus import Bus, BusEvent
@@ -18,6 +20,10 @@ from .server import ALL_SERVERS, LSPServerInfo
 
 log = Log.create({"service": "lsp"})
 
+# A file without a project marker is looked up again after this many seconds,
+# so creating pyproject.toml/package.json later still starts its server.
+MISSING_ROOT_TTL = 5.0
+
 
 class LSPUpdatedProps(BaseModel):
     """Properties for LSP updated event."""
@@ -77,11 +83,15 @@ class LSPStatus(BaseModel):
         name: Server name
         root: Project root (relative path)
         status: Connection status
+        spawn_ms: Time taken to start the server process
+        initialize_ms: Time taken by the initialize handshake
     """
     id: str
     name: str
     root: str
     status: Literal["connected", "error"]
+    spawn_ms: Optional[float] = None
+    initialize_ms: Optional[float] = None
 
 
 class LSPState:
@@ -91,7 +101,10 @@ class LSPState:
         self.servers: Dict[str, LSPServerInfo] = {}
         self.broken: Set[str] = set()
         self.spawning: Dict[str, asyncio.Task] = {}
-
+        # (server id, instance directory, file directory) -> root
+        self.roots: Dict[Tuple[str, str, str], str] = {}
+        # Same key -> monotonic time a lookup found no root
+        self.missing_roots: Dict[Tuple[str, str, str], float] = {}
 
 
 class LSP:
@@ -104,6 +117,7 @@ class LSP:
     def __init__(self) -> None:
         self._state: Optional[LSPState] = None
         self._init_lock = asyncio.Lock()
+        self._prewarm_task: Optional[asyncio.Task[None]] = None
 
     async def _get_state(self) -> LSPState:
         """Get or initialize the LSP state.
@@ -273,10 +287,34 @@ class LSP:
                     name=server.id,
                     root=os.path.relpath(client.root, Instance.directory()),
                     status="connected",
+                    spawn_ms=client.spawn_ms,
+                    initialize_ms=client.initialize_ms,
                 ))
 
         return result
 
+    @staticmethod
+    async def _root(state: LSPState, server: LSPServerInfo, file: str) -> Optional[str]:
+        """Memoized ``server.root(file)``; roots only depend on the file's directory.
+
+        Misses are only remembered for ``MISSING_ROOT_TTL`` seconds.
+        """
+        instance_dir = Instance.directory()
+        path = file if os.path.isabs(file) else os.path.join(instance_dir, file)
+        key = (server.id, instance_dir, os.path.dirname(os.path.normpath(path)))
+        if key in state.roots:
+            return state.roots[key]
+        missed = state.missing_roots.get(key)
+        if missed is not None and time.monotonic() - missed < MISSING_ROOT_TTL:
+            return None
+        root = await server.root(file)
+        if root is None:
+            state.missing_roots[key] = time.monotonic()
+        else:
+            state.missing_roots.pop(key, None)
+            state.roots[key] = root
+        return root
+
     async def _get_clients(self, file: str) -> List[LSPClient]:
         """Get or create LSP clients for a file.
 
@@ -288,18 +326,19 @@ class LSP:
         """
         state = await self._get_state()
         extension = os.path.splitext(file)[1] or file
-        result: List[LSPClient] = []
         async def schedule(
             server: LSPServerInfo,
             root: str,
             key: str
         ) -> Optional[LSPClient]:
-            """Schedule spawning of an LSP server."""
+            """Spawn and initialize an LSP server."""
             try:
+                started = time.perf_counter()
                 handle = await server.spawn(root)
                 if not handle:
                     state.broken.add(key)
                     return None
+                spawned = time.perf_counter()
 
                 log.info("spawned LSP server", {"server_id": server.id})
 
@@ -308,11 +347,18 @@ class LSP:
                     server=handle,
                     root=root,
                 )
+                client.spawn_ms = (spawned - started) * 1000
 
                 if not await client.initialize():
                     state.broken.add(key)
                     handle.process.kill()
                     return None
+                client.initialize_ms = (time.perf_counter() - spawned) * 1000
+                log.info("initialized LSP server", {
+                    "server_id": server.id,
+                    "spawn_ms": round(client.spawn_ms, 1),
+                    "initialize_ms": round(client.initialize_ms, 1),
+                })
 
                 # Check if another client was created while we were spawning
                 existing = next(
@@ -325,6 +371,7 @@ class LSP:
                     return existing
 
                 state.clients.append(client)
+                await Bus.publish(LSPUpdated, LSPUpdatedProps())
                 return client
 
             except Exception as e:
@@ -333,14 +380,19 @@ class LSP:
                     "error": str(e)
                 })
                 return None
+            finally:
+                state.spawning.pop(key, None)
 
-        for server in state.servers.values():
-            # Check if server handles this extension
-            if server.extensions and extension not in server.extensions:
-                continue
+        # Check if server handles this extension
+        servers = [
+            server for server in state.servers.values()
+            if not server.extensions or extension in server.extensions
+        ]
+        # Find project roots
+        roots = await asyncio.gather(*(self._root(state, server, file) for server in servers))
 
-            # Find project root
-            root = await server.root(file)
+        slots: List[LSPClient | asyncio.Task] = []
+        for server, root in zip(servers, roots):
             if not root:
                 continue
 
@@ -355,29 +407,67 @@ class LSP:
                 None
             )
             if existing:
-                result.append(existing)
+                slots.append(existing)
                 continue
 
-            # Check for in-flight spawn
-            if key in state.spawning:
-                client = await state.spawning[key]
-                if client:
-                    result.append(client)
-                continue
+            # Join an in-flight spawn, or start one; servers spawn concurrently.
+            task = state.spawning.get(key)
+            if task is None:
+                task = asyncio.create_task(schedule(server, root, key))
+                state.spawning[key] = task
+            slots.append(task)
+
+        tasks = [slot for slot in slots if isinstance(slot, asyncio.Task)]
+        if tasks:
+            # Not gather: a cancelled caller must not cancel spawns other callers share.
+            await asyncio.wait(tasks)
+
+        result: List[LSPClient] = []
+        for slot in slots:
+            client = slot.result() if isinstance(slot, asyncio.Task) else slot
+            if client:
+                result.append(client)
+        return result
 
-            # Spawn new client
-            task = asyncio.create_task(schedule(server, root, key))
-            state.spawning[key] = task
+    def prewarm(self, directory: str) -> None:
+        """Start, in the background, the servers *directory*'s files will need.
+
+        One file per extension found in the project's file index is used to
+        resolve roots, so later touches find their clients already running.
+        """
+        if self._prewarm_task and not self._prewarm_task.done():
+            return
 
+        async def run() -> None:
+            from ..project.file_index import FileIndex
+
+            files = await FileIndex.for_path(Path(directory)).files()
+            samples: Dict[str, str] = {}
+            for rel in files:
+                extension = os.path.splitext(rel)[1]
+                if extension and extension not in samples:
+                    samples[extension] = os.path.join(directory, rel)
+            state = await self._get_state()
+            wanted = [
+                path for extension, path in samples.items()
+                if any(not server.extensions or extension in server.extensions for server in state.servers.values())
+            ]
+            started = time.perf_counter()
+            results = await asyncio.gather(*(self._get_clients(path) for path in wanted))
+            log.info("prewarmed LSP servers", {
+                "clients": len({id(client) for clients in results for client in clients}),
+                "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+            })
+
+        async def prewarm() -> None:
             try:
-                client = await task
-                if client:
-                    result.append(client)
-                    await Bus.publish(LSPUpdated, LSPUpdatedProps())
-            finally:
-                state.spawning.pop(key, None)
+                await Instance.provide(directory=directory, fn=run)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.warn("LSP prewarm failed", {"directory": directory, "error": str(e)})
 
-        return result
+        self._prewarm_task = asyncio.create_task(prewarm())
 
     async def has_clients(self, file: str) -> bool:
         """Check if any LSP servers can handle a file.
@@ -395,7 +485,7 @@ class LSP:
             if server.extensions and extension not in server.extensions:
                 continue
 
-            root = await server.root(file)
+            root = await self._root(state, server, file)
             if not root:
                 continue
 
@@ -410,13 +500,15 @@ class LSP:
     async def touch_file(
         self,
         file: str,
-        wait_for_diagnostics: bool = False
+        wait_for_diagnostics: bool = False,
+        content: Optional[str] = None,
     ) -> int:
         """Notify LSP servers that a file was modified.
 
         Args:
             file: File path
             wait_for_diagnostics: Whether to wait for diagnostics
+            content: New file content, when the caller already has it
 
         Returns:
             Number of connected clients that were notified.
@@ -429,8 +521,9 @@ class LSP:
                 wait_task = asyncio.create_task(client.wait_for_diagnostics(file))
 
             try:
-                await client.open_file(file)
-                if wait_task:
+                changed = await client.open_file(file, content)
+                # Unchanged content: the server has nothing new to report.
+                if wait_task and changed:
                     await wait_task
             finally:
                 if wait_task and not wait_task.done():
@@ -721,8 +814,39 @@ class LSP:
             lambda _client: {"textDocument": {"uri": uri}},
         )
 
+    async def release(self, directory: str) -> None:
+        """Shut down clients rooted inside *directory* once its instance is disposed."""
+        state = self._state
+        if state is None:
+            return
+        base = os.path.abspath(directory)
+        prefix = base.rstrip(os.sep) + os.sep
+
+        def inside(path: str) -> bool:
+            path = os.path.abspath(path)
+            return path == base or path.startswith(prefix)
+
+        released = [client for client in state.clients if inside(client.root)]
+        state.clients = [client for client in state.clients if client not in released]
+        state.roots = {key: root for key, root in state.roots.items() if key[1] != directory}
+        state.missing_roots = {key: at for key, at in state.missing_roots.items() if key[1] != directory}
+        for client in released:
+            try:
+                await client.shutdown()
+            except Exception as e:
+                log.error("Failed to shutdown LSP client", {"error": str(e)})
+        if released:
+            log.info("released LSP clients", {"directory": directory, "count": len(released)})
+
     async def shutdown(self) -> None:
         """Shutdown all LSP clients."""
+        if self._prewarm_task:
+            self._prewarm_task.cancel()
+            try:
+                await self._prewarm_task
+            except asyncio.CancelledError:
+                pass
+            self._prewarm_task = None
         if self._state:
             for client in self._state.clients:
                 try:
@@ -14,8 +14,9 @@ import asyncio
 import json
 import os
 import re
+import time
 from contextlib import AsyncExitStack
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Literal, Optional, Union
 from urllib.parse import parse_qs, urlparse
 
 from pydantic import BaseModel
@@ -30,6 +31,8 @@ log = Log.create({"service": "mcp"})
 # Default connection timeout in seconds
 DEFAULT_TIMEOUT = 30.0
 
+TOOLS_LIST_CHANGED = "notifications/tools/list_changed"
+
 
 class MCPResource(BaseModel):
     """MCP resource definition."""
@@ -203,6 +206,15 @@ class MCPClient:
         self.name = name
         self._session = None  # mcp.ClientSession
         self._cm_stack: Optional[AsyncExitStack] = None
+        # Called with the server name on notifications/tools/list_changed.
+        self.on_tools_changed: Optional[Callable[[str], None]] = None
+
+    async def _handle_message(self, message: Any) -> None:
+        """Session message handler; only tool list changes are of interest."""
+        notification = getattr(message, "root", message)
+        if getattr(notification, "method", None) == TOOLS_LIST_CHANGED and self.on_tools_changed:
+            self.on_tools_changed(self.name)
+
     async def connect_stdio(
         self,
         command: str,
@@ -230,7 +242,7 @@ class MCPClient:
 
         stack = AsyncExitStack()
         read, write = await stack.enter_async_context(stdio_client(params))
-        session = await stack.enter_async_context(ClientSession(read, write))
+        session = await stack.enter_async_context(ClientSession(read, write, message_handler=self._handle_message))
         await session.initialize()
 
         self._session = session
@@ -263,7 +275,7 @@ class MCPClient:
             http_client = await stack.enter_async_context(httpx.AsyncClient(**http_client_kwargs))
             transport_cm = streamable_http_client(url, http_client=http_client)
             read, write, _ = await stack.enter_async_context(transport_cm)
-            session = await stack.enter_async_context(ClientSession(read, write))
+            session = await stack.enter_async_context(ClientSession(read, write, message_handler=self._handle_message))
             await session.initialize()
 
             self._session = session
@@ -295,7 +307,7 @@ class MCPClient:
                 auth=oauth_auth,
             )
             read, write = await stack.enter_async_context(transport_cm)
-            session = await stack.enter_async_context(ClientSession(read, write))
+            session = await stack.enter_async_context(ClientSession(read, write, message_handler=self._handle_message))
             await session.initialize()
 
             self._session = session
@@ -401,11 +413,29 @@ class MCPClient:
         self._cm_stack = None
 
 
+class ServerTools:
+    """Cached tool list of one connected MCP server."""
+
+    def __init__(self, tools: Dict[str, Dict[str, Any]], ttl: Optional[float] = None) -> None:
+        self.tools = tools
+        self.ttl = ttl
+        self.fetched_at = time.monotonic()
+        self.stale = False
+
+    def expired(self) -> bool:
+        if self.stale:
+            return True
+        return bool(self.ttl) and time.monotonic() - self.fetched_at >= self.ttl
+
+
 class MCPState:
     """State container for MCP clients."""
     def __init__(self):
         self.clients: Dict[str, MCPClient] = {}
         self.status: Dict[str, MCPStatus] = {}
+        self.catalog: Dict[str, ServerTools] = {}
+        # Merged tool_id -> definition view of the catalog, rebuilt on change.
+        self.tools: Optional[Dict[str, Dict[str, Any]]] = None
 
 
 class PendingAuthFlow:
@@ -426,6 +456,25 @@ def _sanitize_name(name: str) -> str:
     return re.sub(r"[^a-zA-Z0-9_]", "_", name)
 
 
+def _tool_entries(
+    client_name: str,
+    tools: Iterable[MCPToolDefinition],
+    timeout: float,
+) -> Dict[str, Dict[str, Any]]:
+    """Tool definitions of one server keyed by their exposed tool ID."""
+    safe_client = _sanitize_name(client_name)
+    return {
+        f"{safe_client}_{_sanitize_name(tool.name)}": {
+            "name": tool.name,
+            "description": tool.description,
+            "input_schema": tool.input_schema,
+            "client": client_name,
+            "timeout": timeout,
+        }
+        for tool in tools
+    }
+
+
 class ToolsChangedProps(BaseModel):
     """Properties for tools changed event."""
     server: str
@@ -469,6 +518,8 @@ class MCP:
         self._init_lock = asyncio.Lock()
         self._pending_auth: Dict[str, PendingAuthFlow] = {}
         self._auth_locks: Dict[str, asyncio.Lock] = {}
+        self._refreshing: Dict[str, "asyncio.Future[None]"] = {}
+        self._changed: set[str] = set()
 
     def _auth_lock(self, mcp_name: str) -> asyncio.Lock:
         return self._auth_locks.setdefault(mcp_name, asyncio.Lock())
@@ -531,6 +582,7 @@ class MCP:
             state.status[name] = result["status"]
             if result.get("client"):
                 state.clients[name] = result["client"]
+                await self._store_tools(name, cfg_dict, result.get("tools") or [])
         except Exception as e:
             log.error("failed to initialize MCP client", {"name": name, "error": str(e)})
             state.status[name] = MCPStatusFailed(error=str(e))
@@ -601,15 +653,16 @@ class MCP:
         client: MCPClient | None = None
         try:
             client = MCPClient(name=name)
+            client.on_tools_changed = self._tools_list_changed
 
             async with asyncio.timeout(timeout):
                 await client.connect_remote(url, headers=headers, oauth_auth=oauth_auth)
 
             if client.connected:
-                # Verify connection by listing tools
+                # Verify connection by listing tools; the list seeds the catalog.
                 try:
                     async with asyncio.timeout(timeout):
-                        await client.list_tools()
+                        tools = await client.list_tools()
                 except asyncio.CancelledError as e:
                     if _is_external_cancellation():
                         raise
@@ -632,10 +685,10 @@ class MCP:
                     }
 
                 log.info("connected to remote MCP", {"name": name, "url": url})
-                await Bus.publish(ToolsChanged, ToolsChangedProps(server=name))
                 return {
                     "client": client,
-                    "status": MCPStatusConnected()
+                    "status": MCPStatusConnected(),
+                    "tools": tools,
                 }
             else:
                 return {
@@ -716,15 +769,16 @@ class MCP:
             args = command[1:] if len(command) > 1 else []
 
             client = MCPClient(name=name)
+            client.on_tools_changed = self._tools_list_changed
 
             async with asyncio.timeout(timeout):
                 await client.connect_stdio(command=cmd, args=args, cwd=cwd, env=env)
 
             if client.connected:
-                # Verify connection by listing tools
+                # Verify connection by listing tools; the list seeds the catalog.
                 try:
                     async with asyncio.timeout(timeout):
-                        await client.list_tools()
+                        tools = await client.list_tools()
                 except Exception as e:
                     log.error("failed to list tools after connect", {
                         "name": name, "error": str(e)
@@ -739,10 +793,10 @@ class MCP:
                     "name": name,
                     "command": command,
                 })
-                await Bus.publish(ToolsChanged, ToolsChangedProps(server=name))
                 return {
                     "client": client,
-                    "status": MCPStatusConnected()
+                    "status": MCPStatusConnected(),
+                    "tools": tools,
                 }
             else:
                 return {
@@ -817,6 +871,7 @@ class MCP:
             if name in state.clients:
                 await state.clients[name].close()
             state.clients[name] = result["client"]
+            await self._store_tools(name, cfg_dict, result.get("tools") or [])
 
     async def disconnect(self, name: str) -> None:
         """Disconnect from a specific MCP server."""
@@ -832,55 +887,121 @@ class MCP:
             del state.clients[name]
 
         state.status[name] = MCPStatusDisabled()
+        await self._drop_tools(name)
 
     async def tools(self) -> Dict[str, Dict[str, Any]]:
         """Get all tools from connected MCP servers.
 
+        Served from the tool catalog filled at connect time; only servers
+        that sent ``notifications/tools/list_changed`` or whose ``tools_ttl``
+        expired are asked again, concurrently.
+
         Returns:
             Dictionary of tool_id to tool definition dict with keys:
             name, description, input_schema, client, timeout
         """
         state = await self._get_state()
+        expired = [
+            name
+            for name in state.clients
+            if isinstance(state.status.get(name), MCPStatusConnected)
+            and (name not in state.catalog or state.catalog[name].expired())
+        ]
+        if expired:
+            # Shielded: a cancelled caller must not abort a shared refresh.
+            await asyncio.gather(*(asyncio.shield(self._refresh_task(name)) for name in expired))
+
+        if state.tools is None:
+            merged: Dict[str, Dict[str, Any]] = {}
+            for client_name in state.clients:
+                entry = state.catalog.get(client_name)
+                if entry is not None and isinstance(state.status.get(client_name), MCPStatusConnected):
+                    merged.update(entry.tools)
+            state.tools = merged
+        return dict(state.tools)
+
+    def _tools_list_changed(self, name: str) -> None:
+        """Handle a server's tools/list_changed notification."""
+        state = self._state
+        if state is None:
+            return
+        entry = state.catalog.get(name)
+        if entry is not None:
+            entry.stale = True
+        # Refresh in the background so subscribers learn about the change;
+        # tools() waits for the refresh if it is still running.
+        self._changed.add(name)
+        if name not in self._refreshing:
+            self._refresh_task(name)
+
+    def _refresh_task(self, name: str) -> "asyncio.Future[None]":
+        """Task fetching the tool list of *name*, shared while in flight."""
+        task = self._refreshing.get(name)
+        if task is None or task.done():
+            task = asyncio.ensure_future(self._fetch_tools(name))
+            self._refreshing[name] = task
+
+            def _done(t: "asyncio.Future[None]") -> None:
+                if self._refreshing.get(name) is t:
+                    del self._refreshing[name]
+                if not t.cancelled() and t.exception() is not None:
+                    log.error("tool catalog refresh failed", {"client": name, "error": str(t.exception())})
+
+            task.add_done_callback(_done)
+        return task
+
+    async def _fetch_tools(self, name: str) -> None:
+        state = self._state
+        client = state.clients.get(name) if state else None
+        if state is None or client is None:
+            return
         config = await ConfigManager.get()
-        mcp_config = config.mcp or {}
-
-        result: Dict[str, Dict[str, Any]] = {}
-
-        for client_name, client in list(state.clients.items()):
-            status = state.status.get(client_name)
-            if not isinstance(status, MCPStatusConnected):
-                continue
-
-            try:
-                tools = await client.list_tools()
-
-                mcp_entry = mcp_config.get(client_name)
-                cfg_dict = _get_mcp_config_dict(mcp_entry) if mcp_entry else None
-                timeout = (cfg_dict.get("timeout", DEFAULT_TIMEOUT) if cfg_dict else DEFAULT_TIMEOUT)
-
-                for tool in tools:
-                    safe_client = _sanitize_name(client_name)
-                    safe_tool = _sanitize_name(tool.name)
-                    tool_id = f"{safe_client}_{safe_tool}"
-
-                    result[tool_id] = {
-                        "name": tool.name,
-                        "description": tool.description,
-                        "input_schema": tool.input_schema,
-                        "client": client_name,
-                        "timeout": timeout,
-                    }
+        mcp_entry = (config.mcp or {}).get(name)
+        cfg_dict = _get_mcp_config_dict(mcp_entry) if mcp_entry else None
+        self._changed.discard(name)
+        try:
+            tools = await client.list_tools()
+        except Exception as e:
+            log.error("failed to get tools", {
+                "client": name,
+                "error": str(e)
+            })
+            if state.clients.get(name) is client:
+                state.status[name] = MCPStatusFailed(error=str(e))
+                del state.clients[name]
+                await self._drop_tools(name)
+            return
+        if state.clients.get(name) is client:
+            await self._store_tools(name, cfg_dict, tools)
+            if name in self._changed:
+                # The list changed again while it was being fetched.
+                state.catalog[name].stale = True
 
-            except Exception as e:
-                log.error("failed to get tools", {
-                    "client": client_name,
-                    "error": str(e)
-                })
-                state.status[client_name] = MCPStatusFailed(error=str(e))
-                if client_name in state.clients:
-                    del state.clients[client_name]
+    async def _store_tools(
+        self,
+        name: str,
+        cfg_dict: Optional[Dict[str, Any]],
+        tools: List[MCPToolDefinition],
+    ) -> None:
+        """Record the tool list of *name*; publish ToolsChanged if it differs."""
+        state = self._state
+        if state is None:
+            return
+        timeout = cfg_dict.get("timeout", DEFAULT_TIMEOUT) if cfg_dict else DEFAULT_TIMEOUT
+        entries = _tool_entries(name, tools, timeout)
+        previous = state.catalog.get(name)
+        state.catalog[name] = ServerTools(entries, ttl=(cfg_dict or {}).get("tools_ttl"))
+        if previous is not None and previous.tools == entries:
+            return
+        state.tools = None
+        await Bus.publish(ToolsChanged, ToolsChangedProps(server=name))
 
-        return result
+    async def _drop_tools(self, name: str) -> None:
+        state = self._state
+        if state is None or state.catalog.pop(name, None) is None:
+            return
+        state.tools = None
+        await Bus.publish(ToolsChanged, ToolsChangedProps(server=name))
 
     async def prompts(self) -> Dict[str, Dict[str, Any]]:
         """Get all prompts from connected MCP servers."""
@@ -1214,6 +1335,9 @@ class MCP:
 
     async def shutdown(self) -> None:
         """Shutdown all MCP clients."""
+        for task in list(self._refreshing.values()):
+            task.cancel()
+        self._refreshing.clear()
         if self._state:
             for client in self._state.clients.values():
                 try:
@@ -0,0 +1,307 @@
+"""Workspace file index shared by the glob, grep and ls tools.
+
+Walking the tree on every tool call re-reads ``node_modules``, build output
+and other ignored trees each time.  ``FileIndex`` keeps the file list of a
+directory tree in memory, honoring ``.gitignore``/``.ignore`` files at every
+level, and revalidates it with one ``stat`` per directory: only directories
+whose mtime (or ignore files) changed are listed again.
+
+Indexes are instance-scoped when an instance is active and kept in a small
+LRU otherwise.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import pathspec
+
+from ..core.context import ContextNotFoundError
+from ..util.log import Log
+from .instance import Instance
+
+log = Log.create({"service": "file_index"})
+
+IGNORE_FILES = (".gitignore", ".ignore")
+
+# Never indexed, with or without an ignore file.
+ALWAYS_IGNORED = frozenset({".git", "node_modules", "__pycache__"})
+
+_DETACHED_LIMIT = 8
+
+_Signature = Tuple[Optional[int], ...]
+# (directory the ignore file lives in, its rules, mtimes of its ignore files)
+_Matcher = Tuple[str, pathspec.PathSpec, _Signature]
+
+
+@dataclass
+class _Dir:
+    mtime_ns: int
+    ignore_sig: _Signature
+    rules: Tuple[Tuple[str, _Signature], ...]
+    spec: Optional[pathspec.PathSpec]
+    files: List[str]
+    dirs: List[str]
+
+
+def _rules(matchers: Sequence[_Matcher]) -> Tuple[Tuple[str, _Signature], ...]:
+    return tuple((base, sig) for base, _spec, sig in matchers)
+
+
+def _join(rel: str, name: str) -> str:
+    return f"{rel}/{name}" if rel else name
+
+
+def _ignored(rel: str, is_dir: bool, matchers: Sequence[_Matcher]) -> bool:
+    """Evaluate ignore rules from the outermost to the innermost ignore file."""
+    result = False
+    for base, spec, _sig in matchers:
+        if base:
+            if not rel.startswith(base + "/"):
+                continue
+            local = rel[len(base) + 1:]
+        else:
+            local = rel
+        check = spec.check_file(local + "/" if is_dir else local)
+        if check.include is not None:
+            result = check.include
+    return result
+
+
+class FileIndex:
+    """In-memory, gitignore-aware file list of one directory tree.
+
+    Subtrees are loaded lazily the first time they are queried.  Every
+    query revalidates the requested subtree before answering, so files
+    created or removed by tools are visible immediately.
+    """
+
+    def __init__(self, root: str) -> None:
+        self.root = os.path.abspath(root)
+        self._dirs: Dict[str, _Dir] = {}
+        self._sorted: Optional[List[str]] = None
+        self._lock = threading.Lock()
+        self.scans = 0
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def for_path(cls, path: Path, roots: Iterable[Optional[str]] = ()) -> "FileIndex":
+        """Index covering *path*, preferring the first of *roots* containing it.
+
+        Paths outside every root, or inside an ignored subtree of it, get an
+        index rooted at *path* itself.
+        """
+        target = os.path.abspath(str(path))
+        for root in roots:
+            if not root or root == os.sep:
+                continue
+            root = os.path.abspath(root)
+            if target != root and not target.startswith(root.rstrip(os.sep) + os.sep):
+                continue
+            index = cls._registry_get(root)
+            if not index.excludes(target):
+                return index
+        return cls._registry_get(target)
+
+    @classmethod
+    def _registry_get(cls, root: str) -> "FileIndex":
+        try:
+            registry = _instance_indexes()
+        except ContextNotFoundError:
+            registry = _detached
+        index = registry.get(root)
+        if index is None:
+            index = cls(root)
+            registry[root] = index
+        if registry is _detached:
+            _detached.move_to_end(root)
+            while len(_detached) > _DETACHED_LIMIT:
+                _detached.popitem(last=False)
+        return index
+
+    @classmethod
+    def reset(cls) -> None:
+        """Drop indexes that are not bound to an instance (for testing)."""
+        _detached.clear()
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def excludes(self, path: str) -> bool:
+        """Whether *path* (absolute) lies in an ignored part of this tree."""
+        rel = self._rel(path)
+        if not rel:
+            return False
+        parts = rel.split("/")
+        if any(part in ALWAYS_IGNORED for part in parts):
+            return True
+        matchers = self._ancestor_matchers(parts)
+        for depth in range(1, len(parts) + 1):
+            if _ignored("/".join(parts[:depth]), True, matchers):
+                return True
+        return False
+
+    async def files(self, under: Optional[Path] = None) -> List[str]:
+        """Relative paths (``/``-separated) of all indexed files below *under*.
+
+        Paths are relative to *under* (the index root by default) and sorted.
+        """
+        return await asyncio.to_thread(self.files_sync, under)
+
+    def files_sync(self, under: Optional[Path] = None) -> List[str]:
+        rel = self._rel(str(under)) if under is not None else ""
+        with self._lock:
+            self._sync(rel)
+            if self._sorted is None:
+                self._sorted = sorted(
+                    _join(dir_rel, name) for dir_rel, entry in self._dirs.items() for name in entry.files
+                )
+            ordered = self._sorted
+        if not rel:
+            return list(ordered)
+        prefix = rel + "/"
+        start = bisect.bisect_left(ordered, prefix)
+        end = bisect.bisect_left(ordered, rel + "0")  # "0" sorts right after "/"
+        return [path[len(prefix):] for path in ordered[start:end]]
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def _rel(self, path: str) -> str:
+        rel = os.path.relpath(os.path.abspath(path), self.root)
+        if rel == ".":
+            return ""
+        if rel == ".." or rel.startswith(".." + os.sep):
+            raise ValueError(f"{path} is outside of {self.root}")
+        return rel.replace(os.sep, "/")
+
+    def _ancestor_matchers(self, parts: Sequence[str]) -> List[_Matcher]:
+        """Ignore specs of the root and of each ancestor directory of *parts*."""
+        matchers: List[_Matcher] = []
+        for depth in range(len(parts)):
+            rel = "/".join(parts[:depth])
+            sig, spec = self._load_spec(os.path.join(self.root, *parts[:depth]))
+            if spec is not None:
+                matchers.append((rel, spec, sig))
+        return matchers
+
+    @staticmethod
+    def _ignore_sig(path: str) -> _Signature:
+        sig: List[Optional[int]] = []
+        for name in IGNORE_FILES:
+            try:
+                sig.append(os.stat(os.path.join(path, name)).st_mtime_ns)
+            except OSError:
+                sig.append(None)
+        return tuple(sig)
+
+    @classmethod
+    def _load_spec(cls, path: str) -> Tuple[_Signature, Optional[pathspec.PathSpec]]:
+        sig = cls._ignore_sig(path)
+        lines: List[str] = []
+        for name, mtime in zip(IGNORE_FILES, sig):
+            if mtime is None:
+                continue
+            try:
+                with open(os.path.join(path, name), "r", encoding="utf-8", errors="replace") as f:
+                    lines.extend(f.read().splitlines())
+            except OSError:
+                continue
+        spec = pathspec.GitIgnoreSpec.from_lines(lines) if lines else None
+        return sig, spec
+
+    def _scan(self, rel: str, path: str, mtime_ns: int, matchers: Sequence[_Matcher]) -> _Dir:
+        sig, spec = self._load_spec(path)
+        local = list(matchers)
+        if spec is not None:
+            local.append((rel, spec, sig))
+        files: List[str] = []
+        dirs: List[str] = []
+        try:
+            with os.scandir(path) as it:
+                for item in it:
+                    name = item.name
+                    child = _join(rel, name)
+                    try:
+                        is_dir = item.is_dir(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if is_dir:
+                        if name in ALWAYS_IGNORED or _ignored(child, True, local):
+                            continue
+                        dirs.append(name)
+                    elif item.is_file() and not _ignored(child, False, local):
+                        files.append(name)
+        except OSError as e:
+            log.debug("failed to list directory", {"path": path, "error": str(e)})
+        self.scans += 1
+        return _Dir(
+            mtime_ns=mtime_ns,
+            ignore_sig=sig,
+            rules=_rules(matchers),
+            spec=spec,
+            files=sorted(files),
+            dirs=sorted(dirs),
+        )
+
+    def _sync(self, start: str) -> None:
+        """Revalidate the subtree at *start*, rescanning changed directories.
+
+        A directory is listed again when its mtime, its own ignore files or
+        the ignore files of any ancestor changed.
+        """
+        parts = start.split("/") if start else []
+        changed = False
+        stack: List[Tuple[str, List[_Matcher]]] = [(start, self._ancestor_matchers(parts))]
+        seen = set()
+        while stack:
+            rel, matchers = stack.pop()
+            path = os.path.join(self.root, rel) if rel else self.root
+            try:
+                mtime_ns = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+            entry = self._dirs.get(rel)
+            if (
+                entry is None
+                or entry.mtime_ns != mtime_ns
+                or entry.ignore_sig != self._ignore_sig(path)
+                or entry.rules != _rules(matchers)
+            ):
+                entry = self._scan(rel, path, mtime_ns, matchers)
+                self._dirs[rel] = entry
+                changed = True
+            seen.add(rel)
+            if entry.spec is not None:
+                matchers = matchers + [(rel, entry.spec, entry.ignore_sig)]
+            for name in entry.dirs:
+                stack.append((_join(rel, name), matchers))
+
+        prefix = start + "/" if start else ""
+        stale = [rel for rel in self._dirs if rel not in seen and (rel == start or rel.startswith(prefix))]
+        for rel in stale:
+            del self._dirs[rel]
+        if changed or stale:
+            self._sorted = None
+
+
+_detached: "OrderedDict[str, FileIndex]" = OrderedDict()
+
+
+def _new_registry() -> Dict[str, FileIndex]:
+    return {}
+
+
+_instance_indexes = Instance.state(_new_registry)
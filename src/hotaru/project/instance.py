@@ -2,12 +2,16 @@
 
 Provides scoped execution context for project operations.
 Each instance represents an active working directory with its associated project.
+Instances are kept in an LRU cache; idle ones are disposed after a TTL or when
+the cache grows past its limit.
 """
 
 import asyncio
-from dataclasses import dataclass
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
 
 from ..core.bus import Bus, InstanceDisposed
 from ..core.context import Context
@@ -31,8 +35,42 @@ class InstanceContext:
 # Create the instance context
 _context: Context[InstanceContext] = Context.create("instance")
 
-# Cache of initialized instances
-_cache: Dict[str, asyncio.Task[InstanceContext]] = {}
+@dataclass
+class _Entry:
+    """Cached instance with the bookkeeping used for eviction."""
+    task: asyncio.Task[InstanceContext]
+    last_access: float = field(default_factory=time.monotonic)
+    # Calls currently running inside the instance; active entries are never evicted.
+    active: int = 0
+
+    def idle(self) -> bool:
+        return self.active == 0 and self.task.done()
+
+
+@dataclass
+class _Policy:
+    max_instances: int = 32
+    idle_ttl: float = 30 * 60.0
+    sweep_interval: float = 60.0
+
+
+@dataclass
+class _Stats:
+    hits: int = 0
+    created: int = 0
+    evicted_idle: int = 0
+    evicted_capacity: int = 0
+
+
+# Cache of initialized instances, least recently used first
+_cache: "OrderedDict[str, _Entry]" = OrderedDict()
+
+# Evicted instances whose disposal is still running
+_disposing: Dict[str, asyncio.Task[None]] = {}
+
+_policy = _Policy()
+_stats = _Stats()
+_sweeper: Optional[asyncio.Task[None]] = None
 
 # Track disposal state
 _disposal_all: Optional[asyncio.Task[None]] = None
@@ -83,9 +121,15 @@ class Instance:
         Returns:
             Result of fn
         """
-        existing = _cache.get(directory)
+        pending = _disposing.get(directory)
+        if pending is not None:
+            # An evicted instance must finish disposing before it is recreated,
+            # otherwise its disposal would tear down the new instance's state.
+            await asyncio.gather(asyncio.shield(pending), return_exceptions=True)
 
-        if not existing:
+        entry = _cache.get(directory)
+
+        if entry is None or (entry.task.done() and entry.task.exception() is not None):
             log.info("creating instance", {"directory": directory})
 
             async def create_context() -> InstanceContext:
@@ -101,11 +145,22 @@ class Instance:
 
                 return ctx
 
-            existing = asyncio.create_task(create_context())
-            _cache[directory] = existing
+            entry = _Entry(task=asyncio.create_task(create_context()))
+            _cache[directory] = entry
+            _stats.created += 1
+            cls._evict(time.monotonic())
+        else:
+            _cache.move_to_end(directory)
+            _stats.hits += 1
 
-        ctx = await existing
-        return await _context.provide(ctx, fn)
+        entry.active += 1
+        entry.last_access = time.monotonic()
+        try:
+            ctx = await entry.task
+            return await _context.provide(ctx, fn)
+        finally:
+            entry.active -= 1
+            entry.last_access = time.monotonic()
 
     @classmethod
     def directory(cls) -> str:
@@ -187,21 +242,25 @@ class Instance:
         async def do_dispose_all():
             log.info("disposing all instances")
 
+            await cls.unwatch()
+            if _disposing:
+                await asyncio.gather(*_disposing.values(), return_exceptions=True)
+
             entries = list(_cache.items())
 
-            for key, task in entries:
-                if _cache.get(key) is not task:
+            for key, entry in entries:
+                if _cache.get(key) is not entry:
                     continue
 
                 try:
-                    ctx = await task
+                    ctx = await entry.task
                 except Exception as error:
                     log.warn("instance dispose failed", {"key": key, "error": error})
-                    if _cache.get(key) is task:
+                    if _cache.get(key) is entry:
                         del _cache[key]
                     continue
 
-                if _cache.get(key) is not task:
+                if _cache.get(key) is not entry:
                     continue
 
                 await _context.provide(ctx, cls.dispose)
@@ -212,17 +271,137 @@ class Instance:
         finally:
             _disposal_all = None
 
+    @classmethod
+    def configure(
+        cls,
+        *,
+        max_instances: Optional[int] = None,
+        idle_ttl: Optional[float] = None,
+        sweep_interval: Optional[float] = None,
+    ) -> None:
+        """Set the eviction policy; ``None`` keeps the current value."""
+        if max_instances is not None:
+            _policy.max_instances = max(1, max_instances)
+        if idle_ttl is not None:
+            _policy.idle_ttl = idle_ttl
+        if sweep_interval is not None:
+            _policy.sweep_interval = sweep_interval
+
+    @classmethod
+    def sweep(cls) -> List[str]:
+        """Evict idle instances past the TTL or beyond the size limit.
+
+        Disposal runs in the background; returns the evicted directories.
+        """
+        return cls._evict(time.monotonic())
+
+    @classmethod
+    def _evict(cls, now: float) -> List[str]:
+        victims: List[Tuple[str, str]] = []
+        for key, entry in _cache.items():
+            if entry.idle() and now - entry.last_access >= _policy.idle_ttl:
+                victims.append((key, "idle"))
+
+        over = len(_cache) - len(victims) - _policy.max_instances
+        if over > 0:
+            chosen = {key for key, _ in victims}
+            for key, entry in _cache.items():
+                if over <= 0:
+                    break
+                if key in chosen or not entry.idle():
+                    continue
+                victims.append((key, "capacity"))
+                over -= 1
+
+        for key, reason in victims:
+            entry = _cache.pop(key)
+            if reason == "idle":
+                _stats.evicted_idle += 1
+            else:
+                _stats.evicted_capacity += 1
+            log.info("evicting instance", {"directory": key, "reason": reason})
+            task = asyncio.create_task(cls._dispose_entry(entry))
+            _disposing[key] = task
+            task.add_done_callback(
+                lambda done, key=key: _disposing.pop(key, None) if _disposing.get(key) is done else None
+            )
+        return [key for key, _ in victims]
+
+    @classmethod
+    async def _dispose_entry(cls, entry: _Entry) -> None:
+        if entry.task.cancelled() or entry.task.exception() is not None:
+            return
+        try:
+            await _context.provide(entry.task.result(), cls.dispose)
+        except Exception as error:
+            log.warn("instance eviction failed", {"error": str(error)})
+
+    @classmethod
+    def watch(cls) -> None:
+        """Periodically sweep idle instances in the background."""
+        global _sweeper
+
+        if _sweeper is not None and not _sweeper.done():
+            return
+
+        async def run() -> None:
+            while True:
+                await asyncio.sleep(_policy.sweep_interval)
+                cls.sweep()
+
+        _sweeper = asyncio.create_task(run())
+
+    @classmethod
+    async def unwatch(cls) -> None:
+        global _sweeper
+
+        sweeper, _sweeper = _sweeper, None
+        if sweeper is None:
+            return
+        sweeper.cancel()
+        try:
+            await sweeper
+        except asyncio.CancelledError:
+            pass
+
+    @classmethod
+    def metrics(cls) -> Dict[str, Any]:
+        """Live instance count, hit/creation/eviction counters and the active policy."""
+        return {
+            "live": len(_cache),
+            "active": sum(1 for entry in _cache.values() if entry.active),
+            "disposing": len(_disposing),
+            "hits": _stats.hits,
+            "created": _stats.created,
+            "evicted_idle": _stats.evicted_idle,
+            "evicted_capacity": _stats.evicted_capacity,
+            "max_instances": _policy.max_instances,
+            "idle_ttl": _policy.idle_ttl,
+        }
+
     @classmethod
     def reset_runtime_state(cls) -> None:
         """Reset in-memory instance cache for tests/runtime teardown."""
-        global _disposal_all
+        global _disposal_all, _sweeper, _policy, _stats
 
-        for task in _cache.values():
-            if task.done():
+        for entry in _cache.values():
+            if entry.task.done():
                 continue
-            task.cancel()
+            entry.task.cancel()
         _cache.clear()
 
+        for task in _disposing.values():
+            if not task.done():
+                task.cancel()
+        _disposing.clear()
+
+        if _sweeper is not None and not _sweeper.done():
+            _sweeper.cancel()
+        _sweeper = None
+
         if _disposal_all is not None and not _disposal_all.done():
             _disposal_all.cancel()
         _disposal_all = None
+
+        _policy = _Policy()
+        _stats = _Stats()
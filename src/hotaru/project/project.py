@@ -1,14 +1,18 @@
 """Project detection and management.
 
 Detects project boundaries from git repositories and manages project metadata.
+Git resolution (root commit, toplevel, common dir) is cached per directory and
+revalidated by the mtimes of ``HEAD`` and ``packed-refs``.
 """
 
 import asyncio
+import os
+import stat
 import subprocess
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Literal, Optional
+from typing import Dict, List, Literal, Optional, Tuple
 
 from pydantic import BaseModel, ConfigDict
 
@@ -99,6 +103,100 @@ def _find_git_dir(start: str) -> Optional[str]:
     return None
 
 
+_Signature = Tuple[Optional[int], ...]
+
+
+def _git_signature(git_dir: str) -> _Signature:
+    """Cheap change detector for the git state ``from_directory`` depends on.
+
+    The git directory's own mtime changes on every index write, so only a
+    ``.git`` file (linked worktrees) is stat'ed directly.
+    """
+    result: List[Optional[int]] = []
+    for path in (git_dir, os.path.join(git_dir, "HEAD"), os.path.join(git_dir, "packed-refs")):
+        try:
+            info = os.stat(path)
+        except OSError:
+            result.append(None)
+            continue
+        result.append(None if stat.S_ISDIR(info.st_mode) else info.st_mtime_ns)
+    return tuple(result)
+
+
+@dataclass
+class _Resolution:
+    """Git-derived part of a project lookup."""
+    git_dir: Optional[str]
+    signature: _Signature
+    project_id: str
+    vcs: Optional[Literal["git"]]
+    worktree: str
+    sandbox: str
+
+
+async def _resolve(directory: str, git_dir: Optional[str]) -> _Resolution:
+    if not git_dir:
+        # No git repository found
+        return _Resolution(None, (), "global", None, "/", "/")
+
+    sandbox = str(Path(git_dir).parent)
+
+    # Try to read cached project ID
+    hotaru_file = Path(git_dir) / "hotaru"
+    project_id: Optional[str] = None
+
+    if hotaru_file.exists():
+        try:
+            project_id = hotaru_file.read_text().strip()
+        except Exception:
+            pass
+
+    # Generate ID from root commit if not cached
+    if not project_id:
+        roots_output = await _run_git_command(
+            ["git", "rev-list", "--max-parents=0", "--all"],
+            sandbox
+        )
+
+        if roots_output:
+            roots = sorted([r.strip() for r in roots_output.split("\n") if r.strip()])
+            if roots:
+                project_id = roots[0]
+                # Cache the ID
+                try:
+                    hotaru_file.write_text(project_id)
+                except Exception:
+                    pass
+
+    vcs: Optional[Literal["git"]]
+    if not project_id:
+        project_id = "global"
+        vcs = None
+    else:
+        vcs = "git"
+
+    # Get the actual worktree root
+    toplevel = await _run_git_command(
+        ["git", "rev-parse", "--show-toplevel"],
+        sandbox
+    )
+    if toplevel:
+        sandbox = toplevel
+
+    # Get common git dir for worktree detection
+    common_dir = await _run_git_command(
+        ["git", "rev-parse", "--git-common-dir"],
+        sandbox
+    )
+    worktree = sandbox
+    if common_dir and common_dir != ".":
+        parent = Path(common_dir).parent
+        if str(parent) != ".":
+            worktree = str(parent)
+
+    return _Resolution(git_dir, _git_signature(git_dir), project_id, vcs, worktree, sandbox)
+
+
 class Project:
     """Project detection and management.
 
@@ -107,6 +205,8 @@ class Project:
     """
 
     _initialized_projects: Dict[str, int] = {}
+    # directory -> git resolution, shared by every caller in the process
+    _resolutions: Dict[str, _Resolution] = {}
 
     @staticmethod
     def _project_key(project_id: str) -> List[str]:
@@ -122,71 +222,29 @@ class Project:
         Returns:
             Tuple of (ProjectInfo, sandbox_directory)
         """
-        log.info("from_directory", {"directory": directory})
-
         git_dir = _find_git_dir(directory)
-
-        if git_dir:
-            sandbox = str(Path(git_dir).parent)
-
-            # Try to read cached project ID
-            hotaru_file = Path(git_dir) / "hotaru"
-            project_id: Optional[str] = None
-
-            if hotaru_file.exists():
-                try:
-                    project_id = hotaru_file.read_text().strip()
-                except Exception:
-                    pass
-
-            # Generate ID from root commit if not cached
-            if not project_id:
-                roots_output = await _run_git_command(
-                    ["git", "rev-list", "--max-parents=0", "--all"],
-                    sandbox
-                )
-
-                if roots_output:
-                    roots = sorted([r.strip() for r in roots_output.split("\n") if r.strip()])
-                    if roots:
-                        project_id = roots[0]
-                        # Cache the ID
-                        try:
-                            hotaru_file.write_text(project_id)
-                        except Exception:
-                            pass
-
-            if not project_id:
-                project_id = "global"
-                vcs = None
+        cached = Project._resolutions.get(directory)
+        if (
+            cached is not None
+            and cached.git_dir == git_dir
+            and (git_dir is None or cached.signature == _git_signature(git_dir))
+        ):
+            resolution = cached
+        else:
+            log.info("from_directory", {"directory": directory})
+            resolution = await _resolve(directory, git_dir)
+            if git_dir is not None and resolution.vcs is None:
+                # A repository without commits gets its id from the first
+                # commit, which only touches refs/heads/* and would not
+                # change the signature; resolve again next time.
+                Project._resolutions.pop(directory, None)
             else:
-                vcs = "git"
+                Project._resolutions[directory] = resolution
 
-            # Get the actual worktree root
-            toplevel = await _run_git_command(
-                ["git", "rev-parse", "--show-toplevel"],
-                sandbox
-            )
-            if toplevel:
-                sandbox = str(Path(sandbox).resolve() / Path(toplevel).name if not Path(toplevel).is_absolute() else toplevel)
-                sandbox = toplevel
-
-            # Get common git dir for worktree detection
-            common_dir = await _run_git_command(
-                ["git", "rev-parse", "--git-common-dir"],
-                sandbox
-            )
-            worktree = sandbox
-            if common_dir and common_dir != ".":
-                parent = Path(common_dir).parent
-                if str(parent) != ".":
-                    worktree = str(parent)
-        else:
-            # No git repository found
-            project_id = "global"
-            worktree = "/"
-            sandbox = "/"
-            vcs = None
+        project_id = resolution.project_id
+        vcs = resolution.vcs
+        worktree = resolution.worktree
+        sandbox = resolution.sandbox
 
         now = int(time.time() * 1000)
 
@@ -305,6 +363,7 @@ class Project:
     def reset_runtime_state() -> None:
         """Reset runtime-only in-memory state used by tests."""
         Project._initialized_projects.clear()
+        Project._resolutions.clear()
 
     @staticmethod
     async def add_sandbox(project_id: str, directory: str) -> Optional[ProjectInfo]:
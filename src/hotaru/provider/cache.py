@@ -0,0 +1,120 @@
+"""Prompt-cache breakpoint planning.
+
+Providers with explicit prompt caching cap how many cache points one request
+may carry (Anthropic and Bedrock allow four) and ignore prefixes below a
+minimum size.  ``PromptCache.plan`` spends that budget by cumulative token
+size instead of fixed positions:
+
+- the tool definitions, which rarely change within a session;
+- the system prompt, which covers tools plus instructions;
+- anchors in older history, placed where the running token total crosses a
+  stride boundary so they stay put while the conversation grows;
+- a rolling point on the newest message, which moves forward every turn.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .tokenizer import Tokenizer
+
+
+@dataclass(frozen=True)
+class CachePlan:
+    """Where a request carries cache breakpoints."""
+
+    tools: bool = False
+    system: bool = False
+    messages: Tuple[int, ...] = ()
+
+    @property
+    def count(self) -> int:
+        return int(self.tools) + int(self.system) + len(self.messages)
+
+
+class PromptCache:
+    """Chooses cache breakpoints within each provider's limits."""
+
+    HINTS: Dict[str, Dict[str, Any]] = {
+        "anthropic": {"cacheControl": {"type": "ephemeral"}},
+        "openrouter": {"cacheControl": {"type": "ephemeral"}},
+        "bedrock": {"cachePoint": {"type": "default"}},
+        "openai": {"cache_control": {"type": "ephemeral"}},
+    }
+    LIMITS: Dict[str, int] = {
+        "anthropic": 4,
+        "openrouter": 4,
+        "bedrock": 4,
+        "openai": 4,
+    }
+    # Prefixes shorter than this are not cached by any supported provider.
+    MIN_TOKENS = 1024
+    ANCHOR_STRIDE = 8192
+
+    @classmethod
+    def hint(cls, key: str) -> Optional[Dict[str, Any]]:
+        return cls.HINTS.get(key)
+
+    @classmethod
+    def limit(cls, key: str) -> int:
+        return cls.LIMITS.get(key, 0)
+
+    @staticmethod
+    def message_tokens(message: Dict[str, Any]) -> int:
+        content = message.get("content")
+        if isinstance(content, str):
+            text = content
+        elif content:
+            text = json.dumps(content, ensure_ascii=False)
+        else:
+            text = ""
+        tool_calls = message.get("tool_calls")
+        if tool_calls:
+            text += json.dumps(tool_calls, ensure_ascii=False)
+        return Tokenizer.count(text)
+
+    @classmethod
+    def plan(
+        cls,
+        messages: Sequence[Dict[str, Any]],
+        *,
+        key: str,
+        system_tokens: int = 0,
+        tool_tokens: int = 0,
+    ) -> CachePlan:
+        """Plan breakpoints for a request laid out as tools, system, messages."""
+        budget = cls.limit(key)
+        if budget <= 0:
+            return CachePlan()
+
+        tools = tool_tokens >= cls.MIN_TOKENS
+        budget -= int(tools)
+        prefix = tool_tokens + system_tokens
+        system = system_tokens > 0 and prefix >= cls.MIN_TOKENS and budget > 0
+        budget -= int(system)
+
+        ends: List[int] = []
+        running = prefix
+        for message in messages:
+            running += cls.message_tokens(message)
+            ends.append(running)
+
+        marked: List[int] = []
+        if ends and budget > 0 and ends[-1] >= cls.MIN_TOKENS:
+            marked.append(len(ends) - 1)
+            budget -= 1
+
+        # Anchor on the first message whose end crosses each stride boundary;
+        # appending history never moves these, so earlier writes keep hitting.
+        anchors: List[int] = []
+        previous = prefix
+        for idx, end in enumerate(ends[:-1]):
+            if end >= cls.MIN_TOKENS and end // cls.ANCHOR_STRIDE > previous // cls.ANCHOR_STRIDE:
+                anchors.append(idx)
+            previous = end
+        if budget > 0:
+            marked.extend(anchors[-budget:])
+
+        return CachePlan(tools=tools, system=system, messages=tuple(sorted(marked)))
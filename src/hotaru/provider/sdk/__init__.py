@@ -2,5 +2,6 @@
 
 from .anthropic import AnthropicSDK
 from .openai import OpenAISDK
+from .pool import PoolOptions, ProviderClients
 
-__all__ = ["AnthropicSDK", "OpenAISDK"]
+__all__ = ["AnthropicSDK", "OpenAISDK", "PoolOptions", "ProviderClients"]
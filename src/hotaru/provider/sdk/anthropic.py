@@ -2,8 +2,9 @@
 
 import json
 from dataclasses import dataclass, field
-from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Union
 
+import httpx
 from anthropic import AsyncAnthropic
 from anthropic.types import (
     ContentBlock,
@@ -63,23 +64,30 @@ class StreamResult:
 class AnthropicSDK:
     """Wrapper for Anthropic API with streaming support."""
 
-    def __init__(self, api_key: str, base_url: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
         """Initialize the Anthropic SDK.
 
         Args:
             api_key: Anthropic API key
             base_url: Optional custom base URL
+            http_client: Optional shared httpx client (connection pool)
         """
         self.client = AsyncAnthropic(
             api_key=api_key,
             base_url=base_url,
+            http_client=http_client,
         )
 
     async def stream(
         self,
         model: str,
         messages: List[Dict[str, Any]],
-        system: Optional[str] = None,
+        system: Optional[Union[str, List[Dict[str, Any]]]] = None,
         tools: Optional[List[Dict[str, Any]]] = None,
         tool_choice: Optional[Any] = None,
         max_tokens: int = ProviderTransform.OUTPUT_TOKEN_MAX,
@@ -93,7 +101,7 @@ class AnthropicSDK:
         Args:
             model: Model ID (e.g., "claude-sonnet-4-20250514")
             messages: List of messages in Anthropic format
-            system: System prompt
+            system: System prompt, or text blocks carrying cache_control
             tools: List of tool definitions
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature
@@ -292,7 +300,7 @@ class AnthropicSDK:
         self,
         model: str,
         messages: List[Dict[str, Any]],
-        system: Optional[str] = None,
+        system: Optional[Union[str, List[Dict[str, Any]]]] = None,
         tools: Optional[List[Dict[str, Any]]] = None,
         tool_choice: Optional[Any] = None,
         max_tokens: int = ProviderTransform.OUTPUT_TOKEN_MAX,
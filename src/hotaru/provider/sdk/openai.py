@@ -4,6 +4,7 @@ import json
 from dataclasses import dataclass, field
 from typing import Any, AsyncIterator, Dict, List, Optional
 
+import httpx
 from openai import AsyncOpenAI
 from openai.types.chat import (
     ChatCompletionChunk,
@@ -52,16 +53,23 @@ class StreamResult:
 class OpenAISDK:
     """Wrapper for OpenAI API with streaming support."""
 
-    def __init__(self, api_key: str, base_url: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
         """Initialize the OpenAI SDK.
 
         Args:
             api_key: OpenAI API key
             base_url: Optional custom base URL
+            http_client: Optional shared httpx client (connection pool)
         """
         self.client = AsyncOpenAI(
             api_key=api_key,
             base_url=base_url,
+            http_client=http_client,
         )
 
     @staticmethod
@@ -0,0 +1,290 @@
+"""Long-lived provider SDK clients with shared HTTP connection pools.
+
+Constructing ``AsyncOpenAI``/``AsyncAnthropic`` per stream call creates a
+fresh httpx pool, so every agent step pays a new TCP+TLS handshake.  The
+registry here keeps one SDK wrapper per (provider, base URL, API key) and
+reuses its keep-alive connections across turns and sessions.
+
+Pool tuning comes from the provider's ``options.pool`` config block::
+
+    "provider": {
+      "anthropic": {
+        "options": {"pool": {"maxConnections": 50, "keepaliveExpiry": 60, "http2": true}}
+      }
+    }
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import importlib.util
+from dataclasses import astuple, dataclass
+from typing import Any, AsyncIterator, Dict, Mapping, Optional, Tuple, Union
+
+import anthropic
+import httpx
+import openai
+
+from ...util.log import Log
+from .anthropic import AnthropicSDK
+from .openai import OpenAISDK
+
+log = Log.create({"service": "sdk.pool"})
+
+# (kind, provider id, base URL, API key hash, pool options)
+ClientKey = Tuple[str, str, str, str, Tuple[Any, ...]]
+SDK = Union[AnthropicSDK, OpenAISDK]
+
+# Keep idle connections across tool execution between agent steps;
+# httpx's 5s default expires them before the next request goes out.
+DEFAULT_KEEPALIVE_EXPIRY = 60.0
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE = 20
+DRAIN_TIMEOUT = 0.5
+DRAIN_MAX_BYTES = 64 * 1024
+
+
+@dataclass
+class PoolOptions:
+    """Connection pool settings for one provider."""
+
+    max_connections: int = DEFAULT_MAX_CONNECTIONS
+    max_keepalive: int = DEFAULT_MAX_KEEPALIVE
+    keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY
+    http2: bool = False
+
+    @classmethod
+    def from_options(cls, options: Optional[Mapping[str, Any]]) -> "PoolOptions":
+        raw = (options or {}).get("pool")
+        if not isinstance(raw, Mapping):
+            return cls()
+        result = cls()
+        if isinstance(raw.get("maxConnections"), int) and raw["maxConnections"] > 0:
+            result.max_connections = raw["maxConnections"]
+        if isinstance(raw.get("maxKeepaliveConnections"), int) and raw["maxKeepaliveConnections"] >= 0:
+            result.max_keepalive = raw["maxKeepaliveConnections"]
+        if isinstance(raw.get("keepaliveExpiry"), (int, float)) and raw["keepaliveExpiry"] >= 0:
+            result.keepalive_expiry = float(raw["keepaliveExpiry"])
+        if isinstance(raw.get("http2"), bool):
+            result.http2 = raw["http2"]
+        return result
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+@dataclass
+class _Entry:
+    sdk: SDK
+    http: httpx.AsyncClient
+    loop: asyncio.AbstractEventLoop
+
+
+class _Counters:
+    """Connection-level counters fed by httpcore trace events."""
+
+    __slots__ = ("requests", "connections")
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.connections = 0
+
+    async def trace(self, event: str, _info: Dict[str, Any]) -> None:
+        if event == "connection.connect_tcp.complete":
+            self.connections += 1
+
+    async def on_request(self, request: httpx.Request) -> None:
+        self.requests += 1
+        request.extensions["trace"] = self.trace
+
+
+class _DrainOnClose(httpx.AsyncByteStream):
+    """Response stream that reads a short unread tail before closing."""
+
+    def __init__(self, stream: httpx.AsyncByteStream) -> None:
+        self._stream = stream
+        self._iterator: Optional[AsyncIterator[bytes]] = None
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        self._iterator = self._stream.__aiter__()
+        async for chunk in self._iterator:
+            yield chunk
+
+    async def aclose(self) -> None:
+        iterator, self._iterator = self._iterator, None
+        if iterator is not None:
+            try:
+                async with asyncio.timeout(DRAIN_TIMEOUT):
+                    remaining = DRAIN_MAX_BYTES
+                    async for chunk in iterator:
+                        remaining -= len(chunk)
+                        if remaining < 0:
+                            break
+            except (Exception, TimeoutError):
+                pass
+        await self._stream.aclose()
+
+
+class _DrainingTransport(httpx.AsyncHTTPTransport):
+    """Pool transport that drains a short unread response tail on close.
+
+    SDK stream iterators stop at the ``[DONE]``/``message_stop`` event and
+    close the response before the HTTP/1.1 end-of-message is consumed, which
+    makes httpcore drop the connection instead of returning it to the pool.
+    Draining the few remaining bytes keeps the connection reusable.
+
+    The drain runs inside ``aclose``: closing a stream that was aborted
+    mid-response waits up to ``DRAIN_TIMEOUT`` (or ``DRAIN_MAX_BYTES``)
+    before the connection is dropped as before.
+    """
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await super().handle_async_request(request)
+        if isinstance(response.stream, httpx.AsyncByteStream):
+            response.stream = _DrainOnClose(response.stream)
+        return response
+
+
+def _key_hash(api_key: str) -> str:
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+class ProviderClients:
+    """Registry of pooled provider SDK clients.
+
+    Clients are bound to the event loop that created them; a lookup from a
+    different loop replaces the stale entry and closes it on its own loop.
+    ``AppContext.shutdown`` closes every pool through :meth:`close_all`.
+    """
+
+    _clients: Dict[ClientKey, _Entry] = {}
+    _counters = _Counters()
+    _created = 0
+    _reused = 0
+    _warned_http2 = False
+
+    @classmethod
+    def anthropic(
+        cls,
+        *,
+        provider_id: str,
+        api_key: str,
+        base_url: Optional[str] = None,
+        options: Optional[Mapping[str, Any]] = None,
+    ) -> AnthropicSDK:
+        """Return the shared Anthropic SDK wrapper for this provider/key."""
+        return cls._get("anthropic", provider_id, api_key, base_url, options)  # type: ignore[return-value]
+
+    @classmethod
+    def openai(
+        cls,
+        *,
+        provider_id: str,
+        api_key: str,
+        base_url: Optional[str] = None,
+        options: Optional[Mapping[str, Any]] = None,
+    ) -> OpenAISDK:
+        """Return the shared OpenAI-compatible SDK wrapper for this provider/key."""
+        return cls._get("openai", provider_id, api_key, base_url, options)  # type: ignore[return-value]
+
+    @classmethod
+    def _get(
+        cls,
+        kind: str,
+        provider_id: str,
+        api_key: str,
+        base_url: Optional[str],
+        options: Optional[Mapping[str, Any]],
+    ) -> SDK:
+        loop = asyncio.get_running_loop()
+        pool = PoolOptions.from_options(options)
+        key = (kind, provider_id, base_url or "", _key_hash(api_key), astuple(pool))
+        entry = cls._clients.get(key)
+        if entry is not None and entry.loop is loop and not entry.http.is_closed:
+            cls._reused += 1
+            return entry.sdk
+
+        http = cls._http_client(kind, pool)
+        if kind == "anthropic":
+            sdk: SDK = AnthropicSDK(api_key=api_key, base_url=base_url, http_client=http)
+        else:
+            sdk = OpenAISDK(api_key=api_key, base_url=base_url, http_client=http)
+        if entry is not None:
+            cls._discard(entry, provider_id)
+        cls._clients[key] = _Entry(sdk=sdk, http=http, loop=loop)
+        cls._created += 1
+        log.info("created provider client", {"provider_id": provider_id, "kind": kind})
+        return sdk
+
+    @staticmethod
+    def _discard(entry: _Entry, provider_id: str) -> None:
+        """Close a replaced client's pool on the event loop that owns it."""
+        if entry.http.is_closed:
+            return
+        if entry.loop.is_running():
+            log.debug("closing client bound to another event loop", {"provider_id": provider_id})
+            asyncio.run_coroutine_threadsafe(entry.http.aclose(), entry.loop)
+        else:
+            # A stopped loop cannot run aclose(); its sockets go with the client.
+            log.debug("dropping client of a stopped event loop", {"provider_id": provider_id})
+
+    @classmethod
+    def _http_client(cls, kind: str, pool: PoolOptions) -> httpx.AsyncClient:
+        http2 = pool.http2
+        if http2 and not _http2_available():
+            if not cls._warned_http2:
+                log.warn("http2 requested but the 'h2' package is not installed; using HTTP/1.1")
+                cls._warned_http2 = True
+            http2 = False
+        factory = anthropic.DefaultAsyncHttpxClient if kind == "anthropic" else openai.DefaultAsyncHttpxClient
+        return factory(
+            transport=_DrainingTransport(limits=pool.limits(), http2=http2),
+            event_hooks={"request": [cls._counters.on_request]},
+        )
+
+    @classmethod
+    def stats(cls) -> Dict[str, int]:
+        """Client and connection reuse counters."""
+        requests = cls._counters.requests
+        connections = cls._counters.connections
+        return {
+            "clients": len(cls._clients),
+            "clients_created": cls._created,
+            "clients_reused": cls._reused,
+            "requests": requests,
+            "connections_opened": connections,
+            "connections_reused": max(requests - connections, 0),
+        }
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """Close every pooled HTTP client owned by the running event loop."""
+        loop = asyncio.get_running_loop()
+        for key, entry in list(cls._clients.items()):
+            if entry.loop is not loop:
+                # Clients of a finished loop cannot be awaited from here.
+                if entry.loop.is_closed():
+                    cls._clients.pop(key, None)
+                continue
+            cls._clients.pop(key, None)
+            try:
+                await entry.http.aclose()
+            except Exception as e:
+                log.warn("failed to close provider client", {"error": str(e)})
+
+    @classmethod
+    def reset(cls) -> None:
+        """Forget all clients and counters (for testing)."""
+        cls._clients = {}
+        cls._counters = _Counters()
+        cls._created = 0
+        cls._reused = 0
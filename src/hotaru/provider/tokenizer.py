@@ -0,0 +1,175 @@
+"""Token counting for context accounting.
+
+``Tokenizer.count`` is what the session loop uses to size transcripts,
+system prompts and tool definitions.  The active counter is pluggable:
+
+- ``estimate`` (default) splits text the way BPE pre-tokenizers do (words,
+  camelCase pieces, digit groups, symbol runs, whitespace) and charges
+  CJK and other non-Latin scripts per character, so code and CJK
+  transcripts are not undercounted the way a flat ``chars / 4`` is.
+- ``tiktoken`` uses the real BPE encoding when the package is installed
+  and its vocabulary is available locally.
+- ``chars`` is the plain ``chars / 4`` fallback.
+"""
+
+from __future__ import annotations
+
+import re
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+from ..util.log import Log
+
+log = Log.create({"service": "tokenizer"})
+
+CHARS_PER_TOKEN = 4
+
+_PIECES = re.compile(
+    r"(?P<cjk>[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff\uff00-\uffef]+)"
+    r"|(?P<word>[A-Z]?[a-z]+|[A-Z]+(?![a-z]))"
+    r"|(?P<digits>[0-9]+)"
+    r"|(?P<letters>[^\W\d_]+)"
+    r"|(?P<space>\s+)"
+    r"|(?P<symbol>[^\w\s]+|_+)"
+)
+
+
+class TokenCounter(ABC):
+    """Counts the tokens a model would see for a piece of text."""
+
+    name = "base"
+
+    @abstractmethod
+    def count(self, text: str) -> int:
+        """Number of tokens in *text*."""
+
+
+class CharCounter(TokenCounter):
+    """``chars / 4``; cheap, but undercounts code and CJK text."""
+
+    name = "chars"
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        return max(0, round(len(text) / CHARS_PER_TOKEN))
+
+
+class EstimateCounter(TokenCounter):
+    """BPE-shaped estimate that needs no vocabulary."""
+
+    name = "estimate"
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        total = 0
+        for match in _PIECES.finditer(text):
+            kind = match.lastgroup
+            size = match.end() - match.start()
+            if kind == "word":
+                # Long runs (hashes, base64, minified code) split poorly.
+                total += 1 + (size - 1) // 8 if size <= 16 else size // CHARS_PER_TOKEN
+            elif kind == "space":
+                # A single space is merged into the following word.
+                if size > 1 or match.group() != " ":
+                    total += 1 + (size - 1) // 16
+            elif kind == "cjk":
+                total += size
+            elif kind == "digits":
+                total += (size + 2) // 3
+            elif kind == "letters":
+                total += (size + 2) // 3
+            else:
+                total += (size + 1) // 2
+        return total
+
+
+class TiktokenCounter(TokenCounter):
+    """Exact counts from a tiktoken encoding."""
+
+    name = "tiktoken"
+
+    def __init__(self, encoding: str = "o200k_base") -> None:
+        import tiktoken
+
+        self._encoding = tiktoken.get_encoding(encoding)
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        return len(self._encoding.encode(text, disallowed_special=()))
+
+
+class Tokenizer:
+    """Process-wide token counting service."""
+
+    # Repeated large texts (system prompt, tool schemas) are counted once.
+    CACHE_SIZE = 64
+    CACHE_MIN_CHARS = 1024
+
+    _factories: Dict[str, Callable[[], TokenCounter]] = {
+        CharCounter.name: CharCounter,
+        EstimateCounter.name: EstimateCounter,
+        TiktokenCounter.name: TiktokenCounter,
+    }
+    _counter: Optional[TokenCounter] = None
+    # Name passed to use(); differs from the active counter's name after a
+    # fallback, so callers do not retry a counter that failed to load.
+    _requested: Optional[str] = None
+    _cache: "OrderedDict[str, int]" = OrderedDict()
+
+    @classmethod
+    def register(cls, name: str, factory: Callable[[], TokenCounter]) -> None:
+        """Make a counter available to :meth:`use` under *name*."""
+        cls._factories[name] = factory
+
+    @classmethod
+    def use(cls, counter: "TokenCounter | str | None") -> TokenCounter:
+        """Switch the active counter; ``None`` restores the default.
+
+        A named counter that fails to load (e.g. tiktoken without its
+        vocabulary) falls back to the estimate.
+        """
+        requested = counter if isinstance(counter, str) else None
+        if isinstance(counter, str):
+            factory = cls._factories.get(counter)
+            if factory is None:
+                raise ValueError(f"Unknown tokenizer: {counter}")
+            try:
+                counter = factory()
+            except Exception as e:
+                log.warn("tokenizer unavailable, using estimate", {"tokenizer": counter, "error": str(e)})
+                counter = EstimateCounter()
+        cls._requested = requested
+        cls._counter = counter
+        cls._cache.clear()
+        return cls.counter()
+
+    @classmethod
+    def requested(cls) -> Optional[str]:
+        """The counter name last passed to :meth:`use`, if any."""
+        return cls._requested
+
+    @classmethod
+    def counter(cls) -> TokenCounter:
+        if cls._counter is None:
+            cls._counter = EstimateCounter()
+        return cls._counter
+
+    @classmethod
+    def count(cls, text: Optional[str]) -> int:
+        if not text:
+            return 0
+        if len(text) < cls.CACHE_MIN_CHARS:
+            return cls.counter().count(text)
+        cached = cls._cache.get(text)
+        if cached is not None:
+            cls._cache.move_to_end(text)
+            return cached
+        tokens = cls.counter().count(text)
+        cls._cache[text] = tokens
+        if len(cls._cache) > cls.CACHE_SIZE:
+            cls._cache.popitem(last=False)
+        return tokens
@@ -9,7 +9,10 @@ from __future__ import annotations
 import copy
 import json
 import re
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from .cache import CachePlan, PromptCache
+from .tokenizer import Tokenizer
 
 _EMPTY_ASSISTANT_PLACEHOLDER = "Done."
 _REASONING_TEXT_FIELD = "reasoning_text"
@@ -18,6 +21,7 @@ _INTERRUPTED_TOOL_ERROR = "[Tool execution was interrupted]"
 _COMPACTED_TOOL_RESULT = "[Old tool result content cleared]"
 _COMPACTION_USER_TEXT = "What did we do so far?"
 _SUBTASK_USER_TEXT = "The following tool was executed by the user"
+_ANTHROPIC_CACHE_CONTROL = {"type": "ephemeral"}
 
 
 class ProviderTransform:
@@ -282,6 +286,27 @@ class ProviderTransform:
             out.append(copied)
         return out
 
+    @classmethod
+    def cache_plan(
+        cls,
+        messages: List[Dict[str, Any]],
+        *,
+        provider_id: str,
+        api_type: str = "openai",
+        system: Optional[str] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+    ) -> CachePlan:
+        """Choose cache breakpoints for the request's tools, system prompt and messages."""
+        key = cls.sdk_key(provider_id=provider_id, api_type=api_type)
+        if not PromptCache.hint(key):
+            return CachePlan()
+        return PromptCache.plan(
+            messages,
+            key=key,
+            system_tokens=Tokenizer.count(system or ""),
+            tool_tokens=Tokenizer.count(json.dumps(tools, ensure_ascii=False)) if tools else 0,
+        )
+
     @classmethod
     def apply_cache_controls(
         cls,
@@ -289,28 +314,23 @@ class ProviderTransform:
         *,
         provider_id: str,
         api_type: str = "openai",
+        plan: Optional[CachePlan] = None,
     ) -> List[Dict[str, Any]]:
-        """Inject provider cache hints on selected messages."""
+        """Inject provider cache hints on the messages selected by ``plan``."""
         if not messages:
             return []
 
         out = [dict(msg) for msg in messages if isinstance(msg, dict)]
-        heads = [idx for idx, msg in enumerate(out) if msg.get("role") == "system"][:2]
-        tails = list(range(max(len(out) - 2, 0), len(out)))
-        target_indexes = sorted(set(heads + tails))
-
-        cache_by_provider = {
-            "anthropic": {"cacheControl": {"type": "ephemeral"}},
-            "openrouter": {"cacheControl": {"type": "ephemeral"}},
-            "bedrock": {"cachePoint": {"type": "default"}},
-            "openai": {"cache_control": {"type": "ephemeral"}},
-        }
         key = cls.sdk_key(provider_id=provider_id, api_type=api_type)
-        cache_opt = cache_by_provider.get(key)
+        cache_opt = PromptCache.hint(key)
         if not cache_opt:
             return out
+        if plan is None:
+            plan = cls.cache_plan(out, provider_id=provider_id, api_type=api_type)
 
-        for idx in target_indexes:
+        for idx in plan.messages:
+            if idx >= len(out):
+                continue
             msg = out[idx]
             opts = msg.get("provider_options")
             if not isinstance(opts, dict):
@@ -463,11 +483,14 @@ class ProviderTransform:
                     out.append({"role": "assistant", "content": _EMPTY_ASSISTANT_PLACEHOLDER})
 
         out = cls.remap_provider_options(out, provider_id=provider_id, api_type=api_type)
-        out = cls.apply_cache_controls(out, provider_id=provider_id, api_type=api_type)
         return out
 
     @staticmethod
-    def anthropic_tools(tools: Optional[List[Dict[str, Any]]]) -> Optional[List[Dict[str, Any]]]:
+    def anthropic_tools(
+        tools: Optional[List[Dict[str, Any]]],
+        *,
+        cache: bool = False,
+    ) -> Optional[List[Dict[str, Any]]]:
         """Convert OpenAI tool definition format to Anthropic input_schema format."""
         if not tools:
             return None
@@ -484,8 +507,29 @@ class ProviderTransform:
                     "input_schema": dict(fn.get("parameters") or {"type": "object", "properties": {}}),
                 }
             )
+        if cache and converted:
+            converted[-1]["cache_control"] = dict(_ANTHROPIC_CACHE_CONTROL)
         return converted
 
+    @staticmethod
+    def anthropic_system(
+        system: Optional[str],
+        *,
+        cache: bool = False,
+    ) -> Optional[Union[str, List[Dict[str, Any]]]]:
+        """Return the Anthropic system payload, as a cached text block when requested."""
+        if not system or not cache:
+            return system
+        return [{"type": "text", "text": system, "cache_control": dict(_ANTHROPIC_CACHE_CONTROL)}]
+
+    @staticmethod
+    def _anthropic_cached(msg: Dict[str, Any]) -> bool:
+        opts = msg.get("provider_options")
+        if not isinstance(opts, dict):
+            return False
+        anthropic = opts.get("anthropic")
+        return isinstance(anthropic, dict) and "cacheControl" in anthropic
+
     @classmethod
     def anthropic_messages(cls, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Convert OpenAI-style conversation messages to Anthropic format."""
@@ -495,6 +539,7 @@ class ProviderTransform:
                 continue
             role = raw.get("role")
             content = raw.get("content")
+            cached = cls._anthropic_cached(raw)
 
             if role == "system":
                 # Anthropic system is sent separately.
@@ -510,6 +555,8 @@ class ProviderTransform:
                     "content": str(content or ""),
                     "is_error": False,
                 }
+                if cached:
+                    block["cache_control"] = dict(_ANTHROPIC_CACHE_CONTROL)
                 if out and out[-1].get("role") == "user" and isinstance(out[-1].get("content"), list):
                     out[-1]["content"].append(block)
                 else:
@@ -543,6 +590,8 @@ class ProviderTransform:
                 if not blocks:
                     # Anthropic rejects empty assistant content.
                     continue
+                if cached:
+                    blocks[-1]["cache_control"] = dict(_ANTHROPIC_CACHE_CONTROL)
                 out.append({"role": "assistant", "content": blocks})
                 continue
 
@@ -550,6 +599,10 @@ class ProviderTransform:
                 text = str(content or "")
                 if not text:
                     continue
+                if cached:
+                    block = {"type": "text", "text": text, "cache_control": dict(_ANTHROPIC_CACHE_CONTROL)}
+                    out.append({"role": "user", "content": [block]})
+                    continue
                 out.append({"role": "user", "content": text})
                 continue
 
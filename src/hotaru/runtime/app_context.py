@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import asyncio
+import os
 from collections.abc import Awaitable, Callable
 from contextvars import Token
 from typing import Literal, TypedDict
 
-from ..core.bus import Bus, EventPayload
-from ..core.config import ConfigManager
+from ..core.bus import Bus, EventPayload, InstanceDisposed
+from ..core.config import ConfigManager, ConfigUpdated
 from ..util.log import Log
 from .app_runtime import AppRuntime
 
@@ -43,6 +44,8 @@ class AppContext(AppRuntime):
         "_bus_token",
         "_config_token",
         "_command_event_unsubscribe",
+        "_config_event_unsubscribe",
+        "_instance_event_unsubscribe",
         "started",
         "health",
     )
@@ -52,9 +55,29 @@ class AppContext(AppRuntime):
         self._bus_token: Token[Bus] | None = None
         self._config_token: Token[ConfigManager] | None = None
         self._command_event_unsubscribe: Callable[[], None] | None = None
+        self._config_event_unsubscribe: Callable[[], None] | None = None
+        self._instance_event_unsubscribe: Callable[[], None] | None = None
         self.started = False
         self.health = self._failed_health("runtime not started")
 
+    @staticmethod
+    async def _project_directory() -> str:
+        """Directory of the active instance's project, else of the process cwd.
+
+        A git project resolves to its worktree root so prewarming covers the
+        whole project; anything else stays at the directory itself.
+        """
+        from ..core.context import ContextNotFoundError
+        from ..project import Instance, Project
+
+        try:
+            directory, worktree, vcs = Instance.directory(), Instance.worktree(), Instance.project().vcs
+        except ContextNotFoundError:
+            directory = os.getcwd()
+            project, worktree = await Project.from_directory(directory)
+            vcs = project.vcs
+        return worktree if vcs else directory
+
     async def startup(self) -> None:
         if self.started:
             return
@@ -64,6 +87,8 @@ class AppContext(AppRuntime):
             self._bus_token = Bus.provide(self.bus)
         if self._config_token is None:
             self._config_token = ConfigManager.provide(self.config)
+        self.transcripts.bind(self.bus)
+        self.events.bind()
 
         # Phase B: Config + Storage
         await self.config.load()
@@ -98,6 +123,8 @@ class AppContext(AppRuntime):
             raise RuntimeError(f"critical startup dependency failed: {detail}")
         if self.health["status"] == "degraded":
             log.warn("runtime started in degraded mode", {"subsystems": subsystems})
+        if subsystems["lsp"]["status"] == "ready" and (await ConfigManager.get()).experimental.lsp_prewarm:
+            self.lsp.prewarm(await self._project_directory())
 
         # Phase E: Skills + Agents (parallel)
         await asyncio.gather(
@@ -117,11 +144,23 @@ class AppContext(AppRuntime):
                 return
             await Project.set_initialized(project_id)
 
+        def _on_config_updated(payload: EventPayload) -> None:
+            # Agents and custom tools are derived from config; rebuild lazily.
+            self.agents.reset()
+            self.tools.reset()
+
+        async def _on_instance_disposed(payload: EventPayload) -> None:
+            directory = payload.properties.get("directory")
+            if isinstance(directory, str) and directory:
+                await self.lsp.release(directory)
+
         try:
             self._command_event_unsubscribe = Bus.subscribe(
                 CommandEvent.Executed,
                 _on_command_executed,
             )
+            self._config_event_unsubscribe = Bus.subscribe(ConfigUpdated, _on_config_updated)
+            self._instance_event_unsubscribe = Bus.subscribe(InstanceDisposed, _on_instance_disposed)
             self.started = True
         except asyncio.CancelledError:
             await self._rollback_startup(subsystems)
@@ -217,6 +256,8 @@ class AppContext(AppRuntime):
 
     async def shutdown(self) -> None:
         from ..project import Instance
+        from ..provider.sdk.pool import ProviderClients
+        from ..session.session import Session
         from ..storage import Storage
 
         await self.runner.shutdown()
@@ -225,17 +266,28 @@ class AppContext(AppRuntime):
             self.lsp.shutdown(),
             self.permission.shutdown(),
             self.question.shutdown(),
+            ProviderClients.close_all(),
             return_exceptions=True,
         )
         await Instance.dispose_all()
+        await Session.flush_deltas()
         Storage.close()
         errors = [r for r in results if isinstance(r, BaseException)]
         if self._command_event_unsubscribe:
             self._command_event_unsubscribe()
             self._command_event_unsubscribe = None
+        if self._config_event_unsubscribe:
+            self._config_event_unsubscribe()
+            self._config_event_unsubscribe = None
+        if self._instance_event_unsubscribe:
+            self._instance_event_unsubscribe()
+            self._instance_event_unsubscribe = None
+        await self.config.unwatch()
         self.skills.reset()
         self.agents.reset()
         self.tools.reset()
+        self.transcripts.reset()
+        self.events.reset()
         self.bus.clear()
         if self._bus_token is not None:
             Bus.restore(self._bus_token)
@@ -11,8 +11,10 @@ from ..lsp import LSP
 from ..mcp import MCP
 from ..permission import Permission
 from ..question import Question
+from ..session.transcript_cache import TranscriptCache
 from ..skill import Skill
 from ..tool.registry import ToolRegistry
+from .event_hub import EventHub
 from .runner import SessionRuntime
 
 
@@ -51,6 +53,8 @@ class AppRuntime:
         "mcp",
         "lsp",
         "runner",
+        "transcripts",
+        "events",
     )
 
     def __init__(self) -> None:
@@ -67,6 +71,8 @@ class AppRuntime:
         self.mcp = MCP()
         self.lsp = LSP()
         self.runner = SessionRuntime(self.clear_session)
+        self.transcripts = TranscriptCache()
+        self.events = EventHub(self.bus)
 
     async def clear_session(self, session_id: str) -> None:
         await self.permission.clear_session(session_id)
@@ -0,0 +1,266 @@
+"""Per-AppContext fan-out of bus events to event stream clients.
+
+``EventHub`` numbers bus events with increasing ids, encodes each one once
+for all clients, and keeps the most recent events in a replay ring so a
+reconnecting client can resume after its ``Last-Event-ID``; the ring is
+bounded by event count and by encoded size.  Every client reads from a
+bounded ``EventSubscriber`` queue that only admits its session's events;
+consecutive
+``message.part.delta`` events for the same part are merged while they
+wait, and a client that still falls too far behind is marked overflowed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Optional, Set
+
+from ..core.bus import Bus
+
+REPLAY_SIZE = 2048
+REPLAY_BYTES = 8 * 1024 * 1024
+QUEUE_SIZE = 512
+
+PART_DELTA = "message.part.delta"
+
+
+def _extract_session_id(data: dict[str, Any]) -> str:
+    """Extract session_id from event data at any nesting level."""
+    direct = data.get("session_id")
+    if isinstance(direct, str) and direct:
+        return direct
+
+    info = data.get("info")
+    if isinstance(info, dict):
+        scoped = info.get("session_id")
+        if isinstance(scoped, str) and scoped:
+            return scoped
+
+    part = data.get("part")
+    if isinstance(part, dict):
+        scoped = part.get("session_id")
+        if isinstance(scoped, str) and scoped:
+            return scoped
+
+    session = data.get("session")
+    if isinstance(session, dict):
+        scoped = session.get("id")
+        if isinstance(scoped, str) and scoped:
+            return scoped
+
+    return ""
+
+
+def _event_type_and_data(event: Any) -> tuple[str, dict[str, Any]]:
+    if isinstance(event, dict):
+        event_type = str(event.get("type", "server.event"))
+        data = event.get("properties", event.get("data", {}))
+        if not isinstance(data, dict):
+            data = {"value": data}
+    elif hasattr(event, "type") and hasattr(event, "properties"):
+        event_type = str(event.type)
+        data = event.properties if isinstance(event.properties, dict) else {}
+    elif hasattr(event, "model_dump"):
+        payload = event.model_dump()
+        event_type = str(payload.get("type", "server.event"))
+        data = payload.get("properties", {})
+        if not isinstance(data, dict):
+            data = {"value": data}
+    else:
+        event_type = "server.event"
+        data = {}
+    return event_type, data
+
+
+def encode_event(envelope: dict[str, Any]) -> str:
+    """JSON body of an SSE frame for *envelope*."""
+    body: dict[str, Any] = {
+        "type": envelope["type"],
+        "data": envelope["data"],
+        "timestamp": envelope.get("timestamp", int(time.time() * 1000)),
+    }
+    if envelope.get("session_id"):
+        body["session_id"] = envelope["session_id"]
+    if envelope.get("id") is not None:
+        body["id"] = envelope["id"]
+    return json.dumps(body)
+
+
+def make_envelope(event_id: Optional[int], event_type: str, data: dict[str, Any]) -> dict[str, Any]:
+    envelope: dict[str, Any] = {
+        "id": event_id,
+        "type": event_type,
+        "data": data,
+        "timestamp": int(time.time() * 1000),
+    }
+    session_id = _extract_session_id(data)
+    if session_id:
+        envelope["session_id"] = session_id
+    envelope["encoded"] = encode_event(envelope)
+    return envelope
+
+
+def matches_session(envelope: dict[str, Any], session_id: str) -> bool:
+    """Whether a client filtered to *session_id* should receive *envelope*."""
+    if not session_id:
+        return True
+    event_type = str(envelope.get("type") or "")
+    if event_type in {"server.connected", "server.heartbeat"}:
+        return True
+    if event_type.startswith("pty."):
+        return True
+    return envelope.get("session_id") == session_id
+
+
+def _delta_key(envelope: dict[str, Any]) -> Optional[tuple[Any, ...]]:
+    if envelope["type"] != PART_DELTA:
+        return None
+    data = envelope["data"]
+    return (data.get("session_id"), data.get("message_id"), data.get("part_id"), data.get("field"))
+
+
+class EventSubscriber:
+    """Bounded queue of envelopes for one stream client."""
+
+    def __init__(self, limit: int, session_id: str = "") -> None:
+        self.limit = limit
+        self.session_id = session_id
+        self.overflowed = False
+        self.merged = 0
+        self._queue: Deque[dict[str, Any]] = deque()
+        self._wakeup = asyncio.Event()
+        # Deltas merged into the queue tail, joined and encoded once on seal.
+        self._tail_chunks: Optional[list[str]] = None
+        self._tail_id: Optional[int] = None
+
+    def push(self, envelope: dict[str, Any]) -> None:
+        if self.overflowed or not matches_session(envelope, self.session_id):
+            return
+        key = _delta_key(envelope)
+        if key is not None and self._queue and _delta_key(self._queue[-1]) == key:
+            if self._tail_chunks is None:
+                self._tail_chunks = [str(self._queue[-1]["data"].get("delta") or "")]
+            self._tail_chunks.append(str(envelope["data"].get("delta") or ""))
+            self._tail_id = envelope["id"]
+            self.merged += 1
+            return
+        self._seal_tail()
+        if len(self._queue) >= self.limit:
+            self.overflowed = True
+            self._queue.clear()
+        else:
+            self._queue.append(envelope)
+        self._wakeup.set()
+
+    def _seal_tail(self) -> None:
+        if self._tail_chunks is None:
+            return
+        data = dict(self._queue[-1]["data"])
+        data["delta"] = "".join(self._tail_chunks)
+        self._queue[-1] = make_envelope(self._tail_id, PART_DELTA, data)
+        self._tail_chunks = None
+
+    def pending(self) -> list[dict[str, Any]]:
+        """Queued envelopes, with merged deltas sealed."""
+        self._seal_tail()
+        return list(self._queue)
+
+    async def get(self, timeout: float) -> Optional[dict[str, Any]]:
+        """Next envelope, or None after *timeout* seconds without one."""
+        if not self._queue and not self.overflowed:
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                return None
+        if not self._queue:
+            return None
+        if len(self._queue) == 1:
+            self._seal_tail()
+        return self._queue.popleft()
+
+
+class EventHub:
+    """Per-AppContext fan-out of bus events to stream clients."""
+
+    def __init__(
+        self,
+        bus: Bus,
+        *,
+        replay: int = REPLAY_SIZE,
+        replay_bytes: int = REPLAY_BYTES,
+        queue_size: int = QUEUE_SIZE,
+    ) -> None:
+        self.bus = bus
+        self.queue_size = queue_size
+        self.replay = replay
+        self.replay_bytes = replay_bytes
+        self._ring: Deque[dict[str, Any]] = deque()
+        self._ring_bytes = 0
+        self._subscribers: Set[EventSubscriber] = set()
+        self._last_id = 0
+        self._unsubscribe: Optional[Callable[[], None]] = None
+
+    @property
+    def last_id(self) -> int:
+        return self._last_id
+
+    def bind(self) -> None:
+        """Start recording bus events (idempotent)."""
+        if self._unsubscribe is None:
+            self._unsubscribe = self.bus._raw_subscribe("*", self._on_event)
+
+    def reset(self) -> None:
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+        self._ring.clear()
+        self._ring_bytes = 0
+
+    def _on_event(self, event: Any) -> None:
+        event_type, data = _event_type_and_data(event)
+        self._last_id += 1
+        envelope = make_envelope(self._last_id, event_type, data)
+        self._remember(envelope)
+        for subscriber in self._subscribers:
+            subscriber.push(envelope)
+
+    def _remember(self, envelope: dict[str, Any]) -> None:
+        self._ring.append(envelope)
+        self._ring_bytes += len(envelope["encoded"])
+        while len(self._ring) > 1 and (
+            len(self._ring) > self.replay or self._ring_bytes > self.replay_bytes
+        ):
+            self._ring_bytes -= len(self._ring.popleft()["encoded"])
+
+    def subscribe(
+        self,
+        last_event_id: Optional[int] = None,
+        session_id: str = "",
+    ) -> tuple[EventSubscriber, Optional[bool]]:
+        """Register a client; replay events after *last_event_id* when given.
+
+        With *session_id*, the client only queues that session's events
+        (plus server and pty events), so other sessions' traffic cannot
+        overflow it.
+
+        Returns the subscriber and, for resuming clients, whether every
+        missed event could be replayed.
+        """
+        self.bind()
+        subscriber = EventSubscriber(self.queue_size, session_id)
+        resumed: Optional[bool] = None
+        if last_event_id is not None:
+            oldest = self._ring[0]["id"] if self._ring else self._last_id + 1
+            resumed = last_event_id >= oldest - 1 and last_event_id <= self._last_id
+            for envelope in self._ring:
+                if envelope["id"] > last_event_id:
+                    subscriber.push(envelope)
+        self._subscribers.add(subscriber)
+        return subscriber, resumed
+
+    def unsubscribe(self, subscriber: EventSubscriber) -> None:
+        self._subscribers.discard(subscriber)
@@ -8,6 +8,8 @@ from typing import AsyncIterator
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from ..core.config import ConfigManager
+from ..project import Instance
 from ..runtime import AppContext
 from .errors import register_error_handlers
 from .middleware import AccessLogMiddleware, RequestContextMiddleware
@@ -30,6 +32,13 @@ def create_app(
     @asynccontextmanager
     async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
         await ctx.startup()
+        # A long-running server picks up config edits without a restart.
+        ctx.config.watch()
+        server = (await ConfigManager.get()).server
+        if server:
+            Instance.configure(max_instances=server.max_instances, idle_ttl=server.instance_idle_ttl)
+        # Directories seen through request headers must not pin instances forever.
+        Instance.watch()
         try:
             yield
         finally:
@@ -6,11 +6,12 @@ import json
 import time
 from typing import AsyncIterator
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query
 from fastapi.responses import StreamingResponse
 
 from ...app_services import EventService
 from ...runtime import AppContext
+from ...runtime.event_hub import matches_session
 from ..deps import resolve_app_context
 from ..schemas import SseEnvelope
 
@@ -25,16 +26,25 @@ def _event_session_id(event: dict[str, object]) -> str:
     return ""
 
 
-def _matches_session_filter(event: dict[str, object], session_id: str) -> bool:
-    if not session_id:
-        return True
+def _sse_frame(event: dict[str, object]) -> str:
+    """SSE frame for an envelope, reusing the body EventService encoded once."""
+    encoded = event.get("encoded")
+    if not isinstance(encoded, str):
+        event_session_id = _event_session_id(event)
+        return _sse_data(event, session_id=event_session_id if event_session_id else None)
+    event_id = event.get("id")
+    if event_id is None:
+        return f"data: {encoded}\n\n"
+    return f"data: {encoded}\nid: {event_id}\n\n"
 
-    event_type = str(event.get("type") or "")
-    if event_type in {"server.connected", "server.heartbeat"}:
-        return True
-    if event_type.startswith("pty."):
-        return True
-    return _event_session_id(event) == session_id
+
+def _parse_event_id(value: str | None) -> int | None:
+    if not value:
+        return None
+    try:
+        return int(value.strip())
+    except ValueError:
+        return None
 
 
 def _sse_data(event: dict[str, object], *, session_id: str | None = None) -> str:
@@ -67,16 +77,20 @@ def _sse_response(iterator: AsyncIterator[str]) -> StreamingResponse:
 async def stream_events(
     ctx: AppContext = Depends(resolve_app_context),
     session_id: str = Query(default=""),
+    last_event_id: str | None = Header(default=None, alias="Last-Event-ID"),
 ) -> StreamingResponse:
-    stream = EventService.stream(ctx.bus)
+    stream = EventService.stream(
+        ctx.events,
+        last_event_id=_parse_event_id(last_event_id),
+        session_id=session_id,
+    )
 
     async def event_generator() -> AsyncIterator[str]:
         try:
             async for event in stream:
-                if not _matches_session_filter(event, session_id):
+                if not matches_session(event, session_id):
                     continue
-                event_session_id = _event_session_id(event)
-                yield _sse_data(event, session_id=event_session_id if event_session_id else None)
+                yield _sse_frame(event)
         except Exception as exc:
             yield _sse_data({"type": "error", "data": {"error": str(exc)}})
 
@@ -9,6 +9,7 @@ from ...app_services.errors import NotFoundError
 from ...runtime import AppContext
 from ..deps import resolve_app_context, resolve_request_directory
 from ..schemas import (
+    SessionCacheResponse,
     SessionCompactRequest,
     SessionCreateRequest,
     SessionDeleteMessagesRequest,
@@ -68,6 +69,11 @@ async def delete_session(
     return await SessionService.delete(session_id, app=ctx)
 
 
+@router.get("/{session_id}/cache", response_model=SessionCacheResponse)
+async def session_cache(session_id: str) -> dict[str, object]:
+    return await SessionService.cache_stats(session_id)
+
+
 @router.get("/{session_id}/messages", response_model=list[SessionListMessageResponse])
 async def list_messages(session_id: str) -> list[dict[str, object]]:
     return await SessionService.list_messages(session_id)
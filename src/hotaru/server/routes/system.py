@@ -7,9 +7,18 @@ from fastapi.responses import FileResponse, HTMLResponse, Response
 
 from ...app_services.errors import NotFoundError
 from ...core.global_paths import GlobalPath
+from ...project import Instance
 from ...runtime import AppContext
 from ..deps import resolve_app_context, resolve_request_directory
-from ..schemas import HealthResponse, PathsResponse, SkillResponse, WebHealthResponse, WebReadyResponse
+from ..schemas import (
+    BusEventMetricsResponse,
+    HealthResponse,
+    InstanceMetricsResponse,
+    PathsResponse,
+    SkillResponse,
+    WebHealthResponse,
+    WebReadyResponse,
+)
 from ..webui import web_asset_path, web_dist_path, web_index_response
 
 router = APIRouter(tags=["system"])
@@ -61,6 +70,16 @@ async def get_paths(cwd: str = Depends(resolve_request_directory)) -> PathsRespo
     )
 
 
+@router.get("/v1/instances", response_model=InstanceMetricsResponse)
+async def instance_metrics() -> InstanceMetricsResponse:
+    return InstanceMetricsResponse(**Instance.metrics())
+
+
+@router.get("/v1/bus/metrics", response_model=dict[str, BusEventMetricsResponse])
+async def bus_metrics(ctx: AppContext = Depends(resolve_app_context)) -> dict[str, BusEventMetricsResponse]:
+    return {event_type: BusEventMetricsResponse(**stats) for event_type, stats in ctx.bus.metrics().items()}
+
+
 @router.get("/v1/skill", response_model=list[SkillResponse])
 async def list_skills(ctx: AppContext = Depends(resolve_app_context)) -> list[SkillResponse]:
     skills = await ctx.skills.list()
@@ -37,6 +37,29 @@ class PathsResponse(BaseModel):
     cwd: str
 
 
+class InstanceMetricsResponse(BaseModel):
+    live: int
+    active: int
+    disposing: int
+    hits: int
+    created: int
+    evicted_idle: int
+    evicted_capacity: int
+    max_instances: int
+    idle_ttl: float
+
+
+class BusEventMetricsResponse(BaseModel):
+    published: int
+    skipped: int
+    deliveries: int
+    errors: int
+    total_ms: float
+    mean_ms: float
+    max_ms: float
+    histogram: dict[str, int]
+
+
 class SkillResponse(BaseModel):
     name: str
     description: str
@@ -130,6 +153,16 @@ class SessionRestoreMessagesResponse(BaseModel):
     restored: int
 
 
+class SessionCacheResponse(BaseModel):
+    steps: int = 0
+    input: int = 0
+    cache_read: int = 0
+    cache_write: int = 0
+    read_ratio: float = 0.0
+    write_ratio: float = 0.0
+    last_read_ratio: float = 0.0
+
+
 class SessionListMessageResponse(BaseModel):
     id: str
     role: str
@@ -41,6 +41,7 @@ _EXPORTS: Dict[str, Tuple[str, str]] = {
     "SessionPrompt": (".prompting", "SessionPrompt"),
     "PromptResult": (".prompting", "PromptResult"),
     "SessionCompaction": (".compaction", "SessionCompaction"),
+    "SessionCacheStats": (".cache_stats", "SessionCacheStats"),
     "SessionSummary": (".summary", "SessionSummary"),
     "StreamObserver": (".turn_runner", "StreamObserver"),
     "CallbackObserver": (".turn_runner", "CallbackObserver"),
@@ -0,0 +1,80 @@
+"""Per-session prompt-cache telemetry.
+
+Every finished step reports how much of its prompt was read from the
+provider's cache and how much was written to it.  ``SessionCacheStats``
+keeps running totals per session so the effect of cache breakpoint
+placement can be observed without replaying stored messages.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from .message_store import TokenUsage
+
+
+@dataclass
+class CacheTotals:
+    steps: int = 0
+    input: int = 0
+    cache_read: int = 0
+    cache_write: int = 0
+    last_read_ratio: float = 0.0
+
+    @property
+    def prompt(self) -> int:
+        # Same convention as SessionCompaction.is_overflow: cached tokens are
+        # reported separately from uncached input.
+        return self.input + self.cache_read + self.cache_write
+
+    def to_dict(self) -> Dict[str, Any]:
+        prompt = self.prompt
+        return {
+            "steps": self.steps,
+            "input": self.input,
+            "cache_read": self.cache_read,
+            "cache_write": self.cache_write,
+            "read_ratio": self.cache_read / prompt if prompt else 0.0,
+            "write_ratio": self.cache_write / prompt if prompt else 0.0,
+            "last_read_ratio": self.last_read_ratio,
+        }
+
+
+class SessionCacheStats:
+    """Bounded per-session cache read/write totals."""
+
+    MAX_SESSIONS = 256
+
+    _sessions: "OrderedDict[str, CacheTotals]" = OrderedDict()
+
+    @classmethod
+    def record(cls, session_id: str, tokens: TokenUsage) -> CacheTotals:
+        totals = cls._sessions.pop(session_id, None) or CacheTotals()
+        cls._sessions[session_id] = totals
+        while len(cls._sessions) > cls.MAX_SESSIONS:
+            cls._sessions.popitem(last=False)
+
+        step = CacheTotals(
+            input=int(tokens.input or 0),
+            cache_read=int(tokens.cache_read or 0),
+            cache_write=int(tokens.cache_write or 0),
+        )
+        totals.steps += 1
+        totals.input += step.input
+        totals.cache_read += step.cache_read
+        totals.cache_write += step.cache_write
+        totals.last_read_ratio = step.cache_read / step.prompt if step.prompt else 0.0
+        return totals
+
+    @classmethod
+    def get(cls, session_id: str) -> Optional[CacheTotals]:
+        return cls._sessions.get(session_id)
+
+    @classmethod
+    def clear(cls, session_id: Optional[str] = None) -> None:
+        if session_id is None:
+            cls._sessions.clear()
+            return
+        cls._sessions.pop(session_id, None)
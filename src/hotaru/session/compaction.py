@@ -2,37 +2,62 @@
 
 from __future__ import annotations
 
+import json
 import time
-from typing import Optional
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
 
 from ..agent import Agent
 from ..core.config import ConfigManager
 from ..core.id import Identifier
 from ..provider.provider import ProcessedModelInfo
+from ..provider.tokenizer import Tokenizer
 from ..util.log import Log
 from .message_store import MessageInfo, MessageTime, ModelRef, TokenUsage
-from .message_store import CompactionPart, ToolPart
+from .message_store import CompactionPart, ToolPart, WithParts, part_tokens, transcript_tokens
 from .session import Session
 
 log = Log.create({"service": "session.compaction"})
 
 
+@dataclass
+class ContextProjection:
+    """Projected input size of the next request, in tokens."""
+
+    system: int = 0
+    tools: int = 0
+    messages: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.system + self.tools + self.messages
+
+
 class SessionCompaction:
     COMPACTION_BUFFER = 20_000
     PRUNE_MINIMUM = 20_000
     PRUNE_PROTECT = 40_000
     PRUNE_PROTECTED_TOOLS = {"skill"}
-    CHARS_PER_TOKEN = 4
 
     @classmethod
     def estimate_tokens(cls, text: str) -> int:
-        """Fast token estimate used for compaction decisions."""
-        if not text:
-            return 0
-        return max(0, round(len(text) / cls.CHARS_PER_TOKEN))
+        """Token count used for compaction decisions."""
+        return Tokenizer.count(text)
+
+    @classmethod
+    def usable(cls, *, cfg: Any, model: ProcessedModelInfo) -> int:
+        """Input tokens available before compaction should kick in."""
+        reserved_cfg = cfg.compaction.reserved if cfg.compaction else None
+        if isinstance(reserved_cfg, int) and reserved_cfg >= 0:
+            reserved = reserved_cfg
+        else:
+            reserved = min(cls.COMPACTION_BUFFER, model.limit.output)
+        usable = (model.limit.input - reserved) if model.limit.input else (model.limit.context - model.limit.output)
+        return max(usable, 1)
 
     @classmethod
     async def is_overflow(cls, *, tokens: TokenUsage, model: ProcessedModelInfo) -> bool:
+        """Check provider-reported usage of the last step against the limit."""
         cfg = await ConfigManager.get()
         if cfg.compaction and cfg.compaction.auto is False:
             return False
@@ -47,13 +72,44 @@ class SessionCompaction:
             + tokens.cache_read
             + tokens.cache_write
         )
-        reserved_cfg = cfg.compaction.reserved if cfg.compaction else None
-        if isinstance(reserved_cfg, int) and reserved_cfg >= 0:
-            reserved = reserved_cfg
-        else:
-            reserved = min(cls.COMPACTION_BUFFER, model.limit.output)
-        usable = (model.limit.input - reserved) if model.limit.input else (model.limit.context - model.limit.output)
-        return count >= max(usable, 1)
+        return count >= cls.usable(cfg=cfg, model=model)
+
+    @classmethod
+    async def project(
+        cls,
+        *,
+        messages: Sequence[WithParts],
+        system_prompt: Optional[str] = None,
+        tool_definitions: Optional[List[Dict[str, Any]]] = None,
+    ) -> ContextProjection:
+        """Project the input size of a request built from *messages*.
+
+        *messages* should be the compaction-filtered transcript; part counts
+        come from the ``token_count`` stamped on each part at write time.
+        """
+        cfg = await ConfigManager.get()
+        name = cfg.compaction.tokenizer if cfg.compaction else None
+        if name and name != Tokenizer.requested():
+            Tokenizer.use(name)
+
+        tools = 0
+        for definition in tool_definitions or []:
+            tools += Tokenizer.count(json.dumps(definition, sort_keys=True, ensure_ascii=False))
+        return ContextProjection(
+            system=Tokenizer.count(system_prompt),
+            tools=tools,
+            messages=transcript_tokens(messages),
+        )
+
+    @classmethod
+    async def will_overflow(cls, *, projection: ContextProjection, model: ProcessedModelInfo) -> bool:
+        """Check a projected request size against the model limit."""
+        cfg = await ConfigManager.get()
+        if cfg.compaction and cfg.compaction.auto is False:
+            return False
+        if model.limit.context <= 0:
+            return False
+        return projection.total >= cls.usable(cfg=cfg, model=model)
 
     @classmethod
     async def create(
@@ -89,16 +145,18 @@ class SessionCompaction:
         return msg_id
 
     @classmethod
-    async def prune(cls, *, session_id: str) -> None:
+    async def prune(cls, *, session_id: str, messages: Optional[Sequence[WithParts]] = None) -> int:
         """Mark stale historical tool outputs as compacted.
         
         only very old tool outputs are compacted, and recent context is kept.
+        Pass *messages* to reuse an already loaded transcript.
+        Returns the number of tokens freed.
         """
         cfg = await ConfigManager.get()
         if cfg.compaction and cfg.compaction.prune is False:
-            return
+            return 0
 
-        msgs = await Session.messages(session_id=session_id)
+        msgs = messages if messages is not None else await Session.messages(session_id=session_id)
         total = 0
         pruned = 0
         candidates: list[ToolPart] = []
@@ -121,20 +179,23 @@ class SessionCompaction:
                 if part.state.time.compacted:
                     break
 
-                estimate = cls.estimate_tokens(part.state.output or "")
+                estimate = part_tokens(part)
                 total += estimate
                 if total > cls.PRUNE_PROTECT:
                     pruned += estimate
                     candidates.append(part)
 
         if pruned <= cls.PRUNE_MINIMUM:
-            return
+            return 0
 
         now = int(time.time() * 1000)
         for part in candidates:
+            # Copy first: *messages* may be a shared cached transcript.
+            part = part.model_copy(deep=True)
             part.state.time.compacted = now
             await Session.update_part(part)
         log.info("pruned tool outputs", {"count": len(candidates), "tokens": pruned})
+        return pruned
 
     @classmethod
     async def compact_agent_name(cls, agents: Agent) -> str:
@@ -72,14 +72,17 @@ MessageUpdated = BusEvent(
     properties_type=MessageUpdatedProperties,
 )
 
+# Streaming notifications: subscribers are independent observers.
 MessagePartUpdated = BusEvent(
     event_type="message.part.updated",
     properties_type=MessagePartUpdatedProperties,
+    concurrent=True,
 )
 
 MessagePartDelta = BusEvent(
     event_type="message.part.delta",
     properties_type=MessagePartDeltaProperties,
+    concurrent=True,
 )
 
 SessionStatus = BusEvent(
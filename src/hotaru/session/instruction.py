@@ -2,13 +2,20 @@
 
 Loads rule files from project/global locations and optional instruction files
 configured in ``hotaru.json`` (including remote URLs).
+
+Resolved paths, file contents and remote bodies are cached: paths are reused
+while the mtimes of the searched directories are unchanged, files are
+revalidated by mtime/size and URLs by ETag/Last-Modified once their TTL runs
+out.
 """
 
 import asyncio
 import glob
 import os
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import httpx
 
@@ -113,9 +120,79 @@ def _resolve_relative_instruction(instruction: str, directory: str, worktree: Op
     return _glob_up(instruction, config_dir, config_dir)
 
 
+_Signature = Tuple[Optional[int], ...]
+
+
+def _mtime(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _dir_signature(start: str, stop: Optional[str], extra: List[str]) -> _Signature:
+    """mtimes of every directory a path lookup walks.
+
+    Creating or removing a rule file changes its directory's mtime, so an
+    unchanged signature means the lookup would find the same files.
+    """
+    result: List[Optional[int]] = []
+    current = Path(start)
+    stop_path = Path(stop).resolve() if stop else None
+    while True:
+        result.append(_mtime(str(current)))
+        if stop_path and current == stop_path:
+            break
+        parent = current.parent
+        if parent == current:
+            break
+        current = parent
+    result.extend(_mtime(item) for item in extra)
+    return tuple(result)
+
+
+@dataclass
+class _Paths:
+    signature: _Signature
+    paths: List[str]
+    checked: float
+
+
+@dataclass
+class _File:
+    mtime: int
+    size: int
+    content: str
+
+
+@dataclass
+class _Remote:
+    content: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    checked: float
+
+
 class InstructionPrompt:
     """Rule/instruction resolver used by session system prompts."""
 
+    # Recursive instruction globs can match below the walked directories, so
+    # resolved paths are also re-resolved after this many seconds.
+    PATHS_TTL = 30.0
+    # Remote instructions are revalidated at most this often.
+    REMOTE_TTL = 300.0
+
+    _paths: Dict[tuple, _Paths] = {}
+    _files: Dict[str, _File] = {}
+    _remote: Dict[str, _Remote] = {}
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Drop every cached path, file and remote instruction."""
+        cls._paths.clear()
+        cls._files.clear()
+        cls._remote.clear()
+
     @classmethod
     async def system_paths(
         cls,
@@ -125,6 +202,39 @@ class InstructionPrompt:
         """Resolve local and global instruction file paths."""
         cwd = str(Path(directory or os.getcwd()).resolve())
         config = await ConfigManager.load(cwd)
+        profile_dir = os.environ.get("HOTARU_CONFIG_DIR")
+        global_dirs = [
+            profile_dir or "",
+            str(GlobalPath.config()),
+            str(Path(GlobalPath.home()) / ".claude"),
+        ]
+        key = (
+            cwd,
+            worktree,
+            tuple(config.instructions or []),
+            tuple(global_dirs),
+            _disable_project_config(),
+            _disable_claude_code(),
+            _disable_claude_prompt(),
+        )
+        signature = _dir_signature(cwd, worktree, [item for item in global_dirs if item])
+        now = time.monotonic()
+        cached = cls._paths.get(key)
+        if cached and cached.signature == signature and now - cached.checked < cls.PATHS_TTL:
+            return list(cached.paths)
+
+        paths = cls._resolve_paths(cwd, worktree, config.instructions or [], profile_dir)
+        cls._paths[key] = _Paths(signature=signature, paths=paths, checked=now)
+        return list(paths)
+
+    @classmethod
+    def _resolve_paths(
+        cls,
+        cwd: str,
+        worktree: Optional[str],
+        instructions: List[str],
+        profile_dir: Optional[str],
+    ) -> List[str]:
         paths: List[str] = []
 
         # 1) Local rule files traversing upward from cwd.
@@ -140,7 +250,6 @@ class InstructionPrompt:
 
         # 2) Global fallback rules.
         global_candidates: List[Path] = []
-        profile_dir = os.environ.get("HOTARU_CONFIG_DIR")
         if profile_dir:
             global_candidates.append(Path(profile_dir) / "AGENTS.md")
         global_candidates.append(Path(GlobalPath.config()) / "AGENTS.md")
@@ -153,7 +262,7 @@ class InstructionPrompt:
                 break
 
         # 3) Additional instruction files from config.instructions.
-        for instruction in config.instructions or []:
+        for instruction in instructions:
             if instruction.startswith(("http://", "https://")):
                 continue
 
@@ -193,33 +302,84 @@ class InstructionPrompt:
         blocks: List[str] = []
 
         for filepath in paths:
-            try:
-                content = Path(filepath).read_text(encoding="utf-8")
-            except Exception:
-                content = ""
+            content = cls._read(filepath)
             if content:
                 blocks.append(f"Instructions from: {filepath}\n{content}")
 
         urls = [i for i in (config.instructions or []) if i.startswith(("http://", "https://"))]
         if urls:
+            for item in await cls._fetch_all(urls):
+                if item:
+                    blocks.append(item)
+
+        return blocks
+
+    @classmethod
+    def _read(cls, filepath: str) -> str:
+        try:
+            info = os.stat(filepath)
+        except OSError:
+            cls._files.pop(filepath, None)
+            return ""
+        cached = cls._files.get(filepath)
+        if cached and cached.mtime == info.st_mtime_ns and cached.size == info.st_size:
+            return cached.content
+        try:
+            content = Path(filepath).read_text(encoding="utf-8")
+        except Exception:
+            content = ""
+        cls._files[filepath] = _File(mtime=info.st_mtime_ns, size=info.st_size, content=content)
+        return content
+
+    @classmethod
+    async def _fetch_all(cls, urls: List[str]) -> List[str]:
+        now = time.monotonic()
+        stale = [url for url in urls if url not in cls._remote or now - cls._remote[url].checked >= cls.REMOTE_TTL]
+        if stale:
             try:
                 async with httpx.AsyncClient(timeout=5.0, follow_redirects=True) as client:
-                    async def fetch(url: str) -> str:
-                        try:
-                            response = await client.get(url)
-                        except Exception:
-                            return ""
-                        if not response.is_success:
-                            return ""
-                        text = response.text
-                        return f"Instructions from: {url}\n{text}" if text else ""
-
-                    fetched = await asyncio.gather(*[fetch(url) for url in urls])
-                    for item in fetched:
-                        if item:
-                            blocks.append(item)
+                    await asyncio.gather(*[cls._revalidate(client, url) for url in stale])
             except Exception:
                 # Remote fetch failures should not block sessions.
                 pass
 
-        return blocks
+        result: List[str] = []
+        for url in urls:
+            cached = cls._remote.get(url)
+            if cached and cached.content:
+                result.append(f"Instructions from: {url}\n{cached.content}")
+        return result
+
+    @classmethod
+    async def _revalidate(cls, client: httpx.AsyncClient, url: str) -> None:
+        cached = cls._remote.get(url)
+        headers: Dict[str, str] = {}
+        if cached and cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached and cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+        try:
+            response = await client.get(url, headers=headers)
+        except Exception:
+            # Keep serving the last good body (or nothing); retry after the TTL.
+            cls._failed(url, cached)
+            return
+        if response.status_code == 304 and cached:
+            cached.checked = time.monotonic()
+            return
+        if not response.is_success:
+            cls._failed(url, None)
+            return
+        cls._remote[url] = _Remote(
+            content=response.text,
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+            checked=time.monotonic(),
+        )
+
+    @classmethod
+    def _failed(cls, url: str, cached: Optional[_Remote]) -> None:
+        """Remember a failed fetch so the URL is not retried before the TTL."""
+        if cached is None:
+            cached = cls._remote[url] = _Remote(content="", etag=None, last_modified=None, checked=0.0)
+        cached.checked = time.monotonic()
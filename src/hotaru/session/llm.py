@@ -8,9 +8,10 @@ from dataclasses import dataclass, field
 from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Union
 
 from ..provider import Provider
+from ..provider.cache import CachePlan
 from ..provider.transform import ProviderTransform
-from ..provider.sdk.anthropic import AnthropicSDK, ToolCall
-from ..provider.sdk.openai import OpenAISDK
+from ..provider.sdk.anthropic import ToolCall
+from ..provider.sdk.pool import ProviderClients
 from .retry import SessionRetry
 from ..util.log import Log
 
@@ -75,6 +76,7 @@ class _PreparedStreamRequest:
     max_tokens: int
     temperature: Optional[float]
     top_p: Optional[float]
+    cache: CachePlan = field(default_factory=CachePlan)
 
 
 class LLM:
@@ -187,6 +189,20 @@ class LLM:
             api_type=api_type,
             provider_options=provider.options,
         )
+        system = cls._join_system_prompt(stream_input.system)
+        cache = ProviderTransform.cache_plan(
+            messages,
+            provider_id=stream_input.provider_id,
+            api_type=api_type,
+            system=system,
+            tools=tools,
+        )
+        messages = ProviderTransform.apply_cache_controls(
+            messages,
+            provider_id=stream_input.provider_id,
+            api_type=api_type,
+            plan=cache,
+        )
 
         base_options = ProviderTransform.options(
             model=model,
@@ -240,11 +256,12 @@ class LLM:
             api_type=api_type,
             messages=messages,
             tools=tools,
-            system=cls._join_system_prompt(stream_input.system),
+            system=system,
             options=merged_options or None,
             max_tokens=max_tokens,
             temperature=temperature,
             top_p=top_p,
+            cache=cache,
         )
 
     @classmethod
@@ -300,13 +317,15 @@ class LLM:
                 if prepared.api_type == "anthropic":
                     # Use Anthropic SDK
                     prepared_messages = ProviderTransform.anthropic_messages(prepared.messages)
-                    prepared_tools = ProviderTransform.anthropic_tools(prepared.tools)
+                    prepared_tools = ProviderTransform.anthropic_tools(prepared.tools, cache=prepared.cache.tools)
                     async for chunk in cls._stream_anthropic(
+                        provider_id=input.provider_id,
+                        provider_options=provider.options,
                         api_key=api_key,
                         model=prepared.model_api_id,
                         messages=prepared_messages,
                         base_url=prepared.base_url,
-                        system=prepared.system,
+                        system=ProviderTransform.anthropic_system(prepared.system, cache=prepared.cache.system),
                         tools=prepared_tools,
                         tool_choice=input.tool_choice,
                         max_tokens=prepared.max_tokens,
@@ -319,6 +338,8 @@ class LLM:
                 else:
                     # Default to OpenAI-compatible (works for most providers)
                     async for chunk in cls._stream_openai(
+                        provider_id=input.provider_id,
+                        provider_options=provider.options,
                         api_key=api_key,
                         base_url=prepared.base_url,
                         model=prepared.model_api_id,
@@ -360,16 +381,23 @@ class LLM:
         model: str,
         messages: List[Dict[str, Any]],
         base_url: Optional[str] = None,
-        system: Optional[str] = None,
+        system: Optional[Union[str, List[Dict[str, Any]]]] = None,
         tools: Optional[List[Dict[str, Any]]] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         max_tokens: int = ProviderTransform.OUTPUT_TOKEN_MAX,
         temperature: Optional[float] = None,
         top_p: Optional[float] = None,
         options: Optional[Dict[str, Any]] = None,
+        provider_id: str = "anthropic",
+        provider_options: Optional[Dict[str, Any]] = None,
     ) -> AsyncIterator[StreamChunk]:
         """Stream from Anthropic API."""
-        sdk = AnthropicSDK(api_key=api_key, base_url=base_url)
+        sdk = ProviderClients.anthropic(
+            provider_id=provider_id,
+            api_key=api_key,
+            base_url=base_url,
+            options=provider_options,
+        )
 
         async for chunk in sdk.stream(
             model=model,
@@ -410,9 +438,16 @@ class LLM:
         temperature: Optional[float] = None,
         top_p: Optional[float] = None,
         options: Optional[Dict[str, Any]] = None,
+        provider_id: str = "openai",
+        provider_options: Optional[Dict[str, Any]] = None,
     ) -> AsyncIterator[StreamChunk]:
         """Stream from OpenAI-compatible API."""
-        sdk = OpenAISDK(api_key=api_key, base_url=base_url)
+        sdk = ProviderClients.openai(
+            provider_id=provider_id,
+            api_key=api_key,
+            base_url=base_url,
+            options=provider_options,
+        )
 
         # Prepend system message if provided
         if system:
@@ -7,11 +7,13 @@ Storage is implemented in :mod:`hotaru.session.session`.
 """
 
 from __future__ import annotations
+import json
 from dataclasses import dataclass
 from typing import Any, Dict, Iterable, List, Literal, Optional, Sequence, Union
 
 from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
+from ..provider.tokenizer import Tokenizer
 from ..provider.transform import ProviderTransform
 
 Role = Literal["user", "assistant", "tool", "system"]
@@ -92,6 +94,7 @@ class TextPart(PartBase):
     ignored: bool = False
     time: Optional[PartTime] = None
     metadata: Optional[Dict[str, Any]] = None
+    token_count: Optional[int] = None
 
 
 class ReasoningPart(PartBase):
@@ -99,6 +102,7 @@ class ReasoningPart(PartBase):
     text: str
     time: PartTime
     metadata: Optional[Dict[str, Any]] = None
+    token_count: Optional[int] = None
 
 
 class FilePart(PartBase):
@@ -152,6 +156,7 @@ class ToolPart(PartBase):
     call_id: str
     state: ToolState
     metadata: Optional[Dict[str, Any]] = None
+    token_count: Optional[int] = None
 
 
 class CompactionPart(PartBase):
@@ -182,6 +187,67 @@ Part = Union[
 
 PART_ADAPTER = TypeAdapter(Part)
 
+# Role/framing tokens each provider message costs on top of its content.
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def count_part_tokens(part: Part) -> int:
+    """Count the tokens *part* contributes to provider input.
+
+    Mirrors what :meth:`ProviderTransform.from_structured_messages` sends:
+    ignored text is skipped and compacted tool output is replaced by its
+    placeholder.
+    """
+    if isinstance(part, (TextPart, ReasoningPart)):
+        if isinstance(part, TextPart) and part.ignored:
+            return 0
+        return Tokenizer.count(part.text)
+    if isinstance(part, ToolPart):
+        state = part.state
+        result = ProviderTransform.tool_result_message(
+            tool_call_id=part.call_id,
+            status=state.status,
+            output=state.output,
+            error=state.error,
+            compacted=bool(state.time.compacted),
+            error_fallback="",
+        )
+        args = state.raw or json.dumps(state.input)
+        return (
+            Tokenizer.count(part.tool)
+            + Tokenizer.count(args)
+            + Tokenizer.count(result["content"])
+            + MESSAGE_OVERHEAD_TOKENS
+        )
+    return 0
+
+
+def part_tokens(part: Part) -> int:
+    """Return the token count stored on *part*, counting it if missing."""
+    cached = getattr(part, "token_count", None)
+    if cached is not None:
+        return cached
+    return count_part_tokens(part)
+
+
+def with_token_count(part: Part) -> Part:
+    """Stamp *part* with its token count before it is written."""
+    if hasattr(part, "token_count"):
+        part.token_count = count_part_tokens(part)
+    return part
+
+
+def transcript_tokens(messages: Iterable[WithParts]) -> int:
+    """Sum cached part token counts over a (filtered) transcript."""
+    total = 0
+    for msg in messages:
+        if msg.info.role not in ("user", "assistant"):
+            continue
+        total += MESSAGE_OVERHEAD_TOKENS
+        for part in msg.parts:
+            total += part_tokens(part)
+    return total
+
 
 @dataclass(frozen=True)
 class WithParts:
@@ -244,6 +310,30 @@ def filter_compacted(messages: Sequence[WithParts]) -> List[WithParts]:
     return list(messages[start_index:])
 
 
+def find_pending_compaction(messages: Sequence[WithParts]) -> Optional[tuple[str, CompactionPart]]:
+    """Return the newest compaction request that has no finished summary yet.
+
+    Returns:
+        Tuple of (user message id, compaction part) or None
+    """
+    summarized_user_ids = {
+        msg.info.parent_id
+        for msg in messages
+        if msg.info.role == "assistant" and msg.info.summary is True and bool(msg.info.finish) and msg.info.parent_id
+    }
+
+    for msg in reversed(messages):
+        if msg.info.role != "user":
+            continue
+        compaction = next((part for part in msg.parts if isinstance(part, CompactionPart)), None)
+        if compaction is None:
+            continue
+        if msg.info.id in summarized_user_ids:
+            continue
+        return msg.info.id, compaction
+    return None
+
+
 def parse_part(data: Dict[str, Any]) -> Part:
     """Parse a persisted dict into a concrete Part instance."""
     return PART_ADAPTER.validate_python(data)
@@ -0,0 +1,104 @@
+"""Write-behind buffer for streamed part deltas.
+
+Streaming appends one small delta per token to a text/reasoning part.
+Persisting every delta costs a full read-modify-write of the growing part,
+so deltas accumulate here and the part is flushed to storage on a
+time/size cadence instead.  ``Session`` owns the single buffer instance.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+BufferKey = Tuple[str, str]
+
+
+@dataclass
+class PendingPart:
+    """In-memory copy of a part with deltas not yet persisted."""
+
+    data: Dict[str, Any]
+    dirty_bytes: int = 0
+    last_flush: float = field(default_factory=time.monotonic)
+
+    @property
+    def dirty(self) -> bool:
+        return self.dirty_bytes > 0
+
+
+class PartDeltaBuffer:
+    """Accumulate part deltas in memory and decide when to flush them.
+
+    A part is due for flushing once ``flush_interval`` seconds have passed
+    since its last flush or ``flush_bytes`` characters are pending.  The
+    buffer never touches storage itself; callers persist ``PendingPart.data``
+    and then call :meth:`mark_flushed`.
+    """
+
+    def __init__(
+        self,
+        *,
+        flush_interval: float = 0.5,
+        flush_bytes: int = 16 * 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.flush_interval = flush_interval
+        self.flush_bytes = flush_bytes
+        self._clock = clock
+        self._parts: Dict[BufferKey, PendingPart] = {}
+
+    def get(self, session_id: str, part_id: str) -> Optional[PendingPart]:
+        return self._parts.get((session_id, part_id))
+
+    def load(self, session_id: str, part_id: str, data: Dict[str, Any]) -> PendingPart:
+        pending = PendingPart(data=data, last_flush=self._clock())
+        self._parts[(session_id, part_id)] = pending
+        return pending
+
+    def append(self, pending: PendingPart, field_name: str, delta: str) -> None:
+        pending.data[field_name] = str(pending.data.get(field_name, "")) + delta
+        # The stored count is stale now; the closing update_part recounts.
+        pending.data.pop("token_count", None)
+        pending.dirty_bytes += len(delta)
+
+    def due(self, pending: PendingPart) -> bool:
+        if not pending.dirty:
+            return False
+        if pending.dirty_bytes >= self.flush_bytes:
+            return True
+        return self._clock() - pending.last_flush >= self.flush_interval
+
+    def mark_flushed(self, pending: PendingPart) -> None:
+        pending.dirty_bytes = 0
+        pending.last_flush = self._clock()
+
+    def discard(self, session_id: str, part_id: str) -> Optional[PendingPart]:
+        return self._parts.pop((session_id, part_id), None)
+
+    def dirty(self, session_id: Optional[str] = None) -> List[Tuple[BufferKey, PendingPart]]:
+        """Return buffered parts with unflushed deltas, optionally for one session."""
+        return [
+            (key, pending)
+            for key, pending in self._parts.items()
+            if pending.dirty and (session_id is None or key[0] == session_id)
+        ]
+
+    def overlay(self, session_id: str) -> Dict[str, Dict[str, Any]]:
+        """Return the buffered part data for a session keyed by part id."""
+        return {
+            part_id: pending.data
+            for (sid, part_id), pending in self._parts.items()
+            if sid == session_id
+        }
+
+    def drop_session(self, session_id: str) -> None:
+        for key in [key for key in self._parts if key[0] == session_id]:
+            del self._parts[key]
+
+    def clear(self) -> None:
+        self._parts.clear()
+
+    def __len__(self) -> int:
+        return len(self._parts)
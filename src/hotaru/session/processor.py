@@ -14,6 +14,7 @@ from .doom_loop import DoomLoopDetector
 from .llm import StreamInput
 from .processor_types import ProcessorResult, ToolCallState
 from .tool_executor import ToolExecutor
+from .tool_scheduler import ToolPolicy
 from .turn_preparer import TurnPreparer
 from .turn_runner import CallbackObserver, StreamObserver, TurnRunner
 
@@ -65,6 +66,7 @@ class SessionProcessor:
         self._last_assistant_agent: Optional[str] = None
         self._allowed_tools: Optional[Set[str]] = None
         self._continue_loop_on_deny = False
+        self._tool_policy = ToolPolicy()
 
         self.agentflow = agentflow or AgentFlow()
         self.resolver = ToolResolver(app=self.app)
@@ -90,11 +92,9 @@ class SessionProcessor:
         self.turnrun = turnrun or TurnRunner(host=self)
 
     async def load_history(self) -> None:
-        from .message_store import filter_compacted, to_model_messages
-        from .session import Session
+        from .message_store import to_model_messages
 
-        stored = await Session.messages(session_id=self.session_id)
-        filtered = filter_compacted(stored)
+        filtered = await self.app.transcripts.filtered(self.session_id)
         self.messages = to_model_messages(filtered)
 
         for msg in reversed(filtered):
@@ -196,6 +196,7 @@ class SessionProcessor:
 
         self.turn += 1
         self._continue_loop_on_deny = await self.turnprep.load_continue_loop_on_deny()
+        self._tool_policy = await self.turnprep.load_tool_policy()
         await self._sync_agent_from_session()
 
         log.info(
@@ -450,6 +451,9 @@ class SessionProcessor:
     def continue_loop_on_deny(self) -> bool:
         return self._continue_loop_on_deny
 
+    def tool_policy(self) -> ToolPolicy:
+        return self._tool_policy
+
     async def _execute_mcp_tool(
         self,
         tool_id: str,
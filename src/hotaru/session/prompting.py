@@ -22,9 +22,9 @@ from ..tool.resolver import ToolResolver
 from ..tool.schema import strictify_schema
 from ..util.log import Log
 from ..runtime import AppContext
+from .cache_stats import SessionCacheStats
 from .compaction import SessionCompaction
 from .message_store import (
-    CompactionPart,
     MessageInfo,
     MessageTime,
     ModelRef,
@@ -140,12 +140,8 @@ def _normalize_finish_reason(reason: Optional[str]) -> Optional[str]:
     return "unknown"
 
 
-async def _latest_user_id(session_id: str) -> Optional[str]:
-    structured = await Session.messages(session_id=session_id)
-    for msg in reversed(structured):
-        if msg.info.role == "user":
-            return msg.info.id
-    return None
+async def _latest_user_id(app: AppContext, session_id: str) -> Optional[str]:
+    return await app.transcripts.latest_user_id(session_id)
 
 
 async def _persist_user_message(
@@ -414,6 +410,8 @@ class SessionPrompt:
         auto_compaction: bool = True,
     ) -> PromptResult:
         """Run outer loop by repeatedly calling processor.process_step."""
+        # Files may have changed outside any tool since the last turn.
+        SnapshotTracker.reconcile(session_id)
         processor = SessionProcessorFactory.build(
             app=app,
             session_id=session_id,
@@ -433,7 +431,7 @@ class SessionPrompt:
         if initial_user_content is not None:
             direct_result = await processor.try_direct_subagent_mention(initial_user_content)
         if direct_result is not None:
-            parent_id = await _latest_user_id(session_id) or user_message_id
+            parent_id = await _latest_user_id(app, session_id) or user_message_id
             final_assistant_id = assistant_message_id or Identifier.ascending("message")
             assistant_agent = processor.last_assistant_agent()
             await _persist_assistant_message(
@@ -479,7 +477,7 @@ class SessionPrompt:
         aggregate = ProcessorResult(status="continue", text="", usage={})
         final_assistant_id = ""
         first_assistant = True
-        current_user_id = user_message_id or await _latest_user_id(session_id)
+        current_user_id = user_message_id or await _latest_user_id(app, session_id)
 
         main_model: Optional[ProcessedModelInfo] = None
         try:
@@ -488,8 +486,10 @@ class SessionPrompt:
             log.warn("failed to resolve model for usage/cost checks", {"error": str(e)})
             main_model = None
 
+        # Set after a compaction so the preflight check cannot compact twice in a row.
+        compacted_last = False
         while aggregate.status == "continue":
-            pending_compaction = await cls._pending_compaction(session_id=session_id)
+            pending_compaction = await cls._pending_compaction(app=app, session_id=session_id)
             if pending_compaction is not None:
                 compaction = await cls._run_compaction(
                     app=app,
@@ -516,6 +516,7 @@ class SessionPrompt:
 
                 current_user_id = compaction.continue_user_id or current_user_id
                 aggregate.status = "continue" if compaction.auto_continued else "stop"
+                compacted_last = True
                 continue
 
             resolved_tools = await cls.resolve_tools(
@@ -533,6 +534,47 @@ class SessionPrompt:
             if output_format and output_format.get("type") == "json_schema":
                 tool_choice = "required"
 
+            if auto_compaction and resume_history and main_model is not None and not compacted_last:
+                try:
+                    should_compact = await cls._preflight_overflow(
+                        app=app,
+                        processor=processor,
+                        session_id=session_id,
+                        model=main_model,
+                        system_prompt=system_prompt,
+                        tool_definitions=resolved_tools,
+                    )
+                except Exception as e:
+                    log.warn("context projection failed", {"error": str(e)})
+                    should_compact = False
+                if should_compact:
+                    compaction = await cls._run_compaction(
+                        app=app,
+                        processor=processor,
+                        session_id=session_id,
+                        agent=agent,
+                        provider_id=provider_id,
+                        model_id=model_id,
+                        cwd=cwd,
+                        worktree=worktree,
+                        system_prompt=system_prompt,
+                        auto=True,
+                        compaction_user_id=None,
+                        create_request=True,
+                        append_prompt_to_memory=True,
+                    )
+                    compacted_last = True
+                    final_assistant_id = compaction.summary_assistant_id or final_assistant_id
+                    _accumulate_usage(aggregate.usage, compaction.usage)
+                    if compaction.error:
+                        aggregate.status = "error"
+                        aggregate.error = compaction.error
+                        break
+                    current_user_id = compaction.continue_user_id or current_user_id
+                    aggregate.status = "continue" if compaction.auto_continued else "stop"
+                    continue
+            compacted_last = False
+
             step, step_tokens, step_cost = await cls._process_step_with_tracking(
                 processor=processor,
                 session_id=session_id,
@@ -622,7 +664,7 @@ class SessionPrompt:
                     log.warn("compaction overflow check failed", {"error": str(e)})
 
             if not should_compact:
-                current_user_id = await _latest_user_id(session_id) or current_user_id
+                current_user_id = await _latest_user_id(app, session_id) or current_user_id
                 aggregate.status = "continue"
                 continue
 
@@ -651,9 +693,13 @@ class SessionPrompt:
 
             current_user_id = compaction.continue_user_id or current_user_id
             aggregate.status = "continue" if compaction.auto_continued else "stop"
+            compacted_last = True
 
         try:
-            await SessionCompaction.prune(session_id=session_id)
+            await SessionCompaction.prune(
+                session_id=session_id,
+                messages=await app.transcripts.messages(session_id),
+            )
         except Exception as e:
             log.debug("compaction prune skipped", {"error": str(e)})
 
@@ -1014,9 +1060,15 @@ class SessionPrompt:
                 )
             except Exception as e:
                 log.debug("failed to finalize text part", {"error": str(e)})
+        try:
+            await Session.flush_deltas(session_id)
+        except Exception as e:
+            log.debug("failed to flush part deltas", {"error": str(e)})
 
         tokens = _usage_to_tokens(step.usage)
         cost = _usage_cost(tokens=tokens, model=model_info)
+        cache = SessionCacheStats.record(session_id, tokens)
+        log.debug("prompt cache", {"session_id": session_id, **cache.to_dict()})
         step_end_snapshot: Optional[str] = None
         try:
             step_end_snapshot = await SnapshotTracker.track(
@@ -1276,25 +1328,55 @@ class SessionPrompt:
         )
 
     @classmethod
-    async def _pending_compaction(cls, *, session_id: str) -> Optional[_PendingCompaction]:
-        messages = await Session.messages(session_id=session_id)
-        if not messages:
-            return None
+    async def _preflight_overflow(
+        cls,
+        *,
+        app: AppContext,
+        processor: SessionProcessor,
+        session_id: str,
+        model: ProcessedModelInfo,
+        system_prompt: Optional[str],
+        tool_definitions: Optional[List[Dict[str, Any]]],
+    ) -> bool:
+        """Return True when the next request would overflow even after pruning.
 
-        summarized_user_ids = {
-            msg.info.parent_id
-            for msg in messages
-            if msg.info.role == "assistant" and msg.info.summary is True and bool(msg.info.finish) and msg.info.parent_id
-        }
-        summarized_user_ids = {item for item in summarized_user_ids if item}
+        Pruning is tried first; if it frees anything the in-memory history is
+        reloaded so the request actually shrinks.
+        """
 
-        for msg in reversed(messages):
-            if msg.info.role != "user":
-                continue
-            compaction = next((part for part in msg.parts if isinstance(part, CompactionPart)), None)
-            if compaction is None:
-                continue
-            if msg.info.id in summarized_user_ids:
-                continue
-            return _PendingCompaction(user_id=msg.info.id, auto=bool(compaction.auto))
-        return None
+        async def _project() -> bool:
+            projection = await SessionCompaction.project(
+                messages=await app.transcripts.filtered(session_id),
+                system_prompt=system_prompt,
+                tool_definitions=tool_definitions,
+            )
+            log.debug(
+                "projected context",
+                {
+                    "session_id": session_id,
+                    "system": projection.system,
+                    "tools": projection.tools,
+                    "messages": projection.messages,
+                    "total": projection.total,
+                },
+            )
+            return await SessionCompaction.will_overflow(projection=projection, model=model)
+
+        if not await _project():
+            return False
+        freed = await SessionCompaction.prune(
+            session_id=session_id,
+            messages=await app.transcripts.messages(session_id),
+        )
+        if not freed:
+            return True
+        await processor.load_history()
+        return await _project()
+
+    @classmethod
+    async def _pending_compaction(cls, *, app: AppContext, session_id: str) -> Optional[_PendingCompaction]:
+        pending = await app.transcripts.pending_compaction(session_id)
+        if pending is None:
+            return None
+        user_id, compaction = pending
+        return _PendingCompaction(user_id=user_id, auto=bool(compaction.auto))
@@ -35,7 +35,8 @@ from .events import (
 from .message_store import MessageInfo as StoredMessageInfo
 from .message_store import Part as StoredMessagePart
 from .message_store import WithParts as StoredMessageWithParts
-from .message_store import parse_part
+from .message_store import parse_part, with_token_count
+from .part_buffer import PartDeltaBuffer, PendingPart
 
 log = Log.create({"service": "session"})
 
@@ -91,6 +92,9 @@ class Session:
     _message_store_key = staticmethod(StorageKey.message)
     _part_key = staticmethod(StorageKey.part)
 
+    # Streamed text/reasoning deltas are buffered and written behind.
+    _deltas = PartDeltaBuffer()
+
     @classmethod
     async def _touch_session(cls, session_id: str) -> None:
         """Update session.updated timestamp."""
@@ -250,13 +254,12 @@ class Session:
         Returns:
             List of sessions, newest first
         """
-        keys = await Storage.list(StorageKey.session_prefix(project_id))
+        rows = await Storage.scan(StorageKey.session_prefix(project_id))
         sessions: List[SessionInfo] = []
-        for key in keys:
+        for _key, data in rows:
             try:
-                data = await Storage.read(key)
                 sessions.append(SessionInfo.model_validate(data))
-            except (NotFoundError, Exception):
+            except Exception:
                 continue
         return sorted(sessions, key=lambda s: s.time.updated, reverse=True)
 
@@ -334,6 +337,7 @@ class Session:
                 await cls.delete(s.id, project_id=session.project_id)
 
         # Delete all messages for this session
+        cls._deltas.drop_session(session_id)
         stored_msg_keys = await Storage.list(StorageKey.message_prefix(session_id))
         part_keys = await Storage.list(StorageKey.part_prefix(session_id))
         ops = [Storage.delete(key) for key in stored_msg_keys]
@@ -378,7 +382,13 @@ class Session:
 
     @classmethod
     async def update_part(cls, part: StoredMessagePart) -> StoredMessagePart:
-        """Upsert a structured message part record."""
+        """Upsert a structured message part record.
+
+        A full upsert supersedes any buffered deltas for the same part.
+        The part's token count is computed here, once per write.
+        """
+        cls._deltas.discard(part.session_id, part.id)
+        with_token_count(part)
         await Storage.write(
             cls._part_key(part.session_id, part.id),
             part.model_dump(),
@@ -400,19 +410,28 @@ class Session:
         field: str,
         delta: str,
     ) -> Optional[StoredMessagePart]:
-        """Append string delta to a part field (e.g. text/reasoning)."""
-        key = cls._part_key(session_id, part_id)
-        try:
-            raw = await Storage.update(
-                key,
-                lambda d: d.__setitem__(field, str(d.get(field, "")) + delta),
-            )
-        except NotFoundError:
-            return None
-        part = parse_part(raw)
-        if getattr(part, "message_id", None) != message_id:
+        """Append string delta to a part field (e.g. text/reasoning).
+
+        Events are published immediately, but the part is only written to
+        storage when the buffer cadence is due; ``update_part`` on close and
+        ``flush_deltas`` at step finish persist whatever is still pending.
+        """
+        pending = cls._deltas.get(session_id, part_id)
+        if pending is None:
+            try:
+                raw = await Storage.read(cls._part_key(session_id, part_id))
+            except NotFoundError:
+                return None
+            if not isinstance(raw, dict) or raw.get("message_id") != message_id:
+                return None
+            pending = cls._deltas.load(session_id, part_id, raw)
+        elif pending.data.get("message_id") != message_id:
             return None
-        await cls._touch_session(session_id)
+
+        cls._deltas.append(pending, field, delta)
+        part = parse_part(pending.data)
+        if cls._deltas.due(pending):
+            await cls._flush_pending(session_id, part_id, pending)
         await Bus.publish(
             MessagePartDelta,
             MessagePartDeltaProperties(
@@ -423,53 +442,88 @@ class Session:
                 delta=delta,
             ),
         )
-        await Bus.publish(
-            MessagePartUpdated,
-            MessagePartUpdatedProperties(part=part.model_dump(mode="json")),
-        )
+        # No per-delta message.part.updated: subscribers rebuild streaming
+        # parts from the deltas, and the finished part is published by
+        # update_part.
         return part
 
+    @classmethod
+    async def _flush_pending(cls, session_id: str, part_id: str, pending: PendingPart) -> None:
+        await Storage.write(cls._part_key(session_id, part_id), pending.data)
+        cls._deltas.mark_flushed(pending)
+        await cls._touch_session(session_id)
+
+    @classmethod
+    async def flush_deltas(cls, session_id: Optional[str] = None) -> int:
+        """Persist buffered part deltas, for one session or all sessions.
+
+        Returns:
+            Number of parts written
+        """
+        dirty = cls._deltas.dirty(session_id)
+        for (sid, part_id), pending in dirty:
+            try:
+                await cls._flush_pending(sid, part_id, pending)
+            except Exception as e:
+                log.warn("failed to flush part deltas", {
+                    "session_id": sid,
+                    "part_id": part_id,
+                    "error": str(e),
+                })
+        return len(dirty)
+
+    @classmethod
+    def _overlay_pending(cls, session_id: str, parts: List[StoredMessagePart]) -> List[StoredMessagePart]:
+        """Replace stored parts with their buffered, more recent versions."""
+        buffered = cls._deltas.overlay(session_id)
+        if not buffered:
+            return parts
+        return [
+            parse_part(buffered[part.id]) if part.id in buffered else part
+            for part in parts
+        ]
+
     @classmethod
     async def parts(cls, session_id: str, message_id: str) -> List[StoredMessagePart]:
         """List structured message parts for a message, ordered by part id."""
-        keys = await Storage.list(StorageKey.part_prefix(session_id))
+        rows = await Storage.scan(StorageKey.part_prefix(session_id), message_id=message_id)
         result: List[StoredMessagePart] = []
-        for key in keys:
+        for _key, data in rows:
             try:
-                data = await Storage.read(key)
-                part = parse_part(data)
+                result.append(parse_part(data))
             except Exception:
                 continue
-            if part.message_id == message_id:
-                result.append(part)
         result.sort(key=lambda p: p.id)
-        return result
+        return cls._overlay_pending(session_id, result)
 
     @classmethod
     async def messages(cls, *, session_id: str) -> List[StoredMessageWithParts]:
-        """List structured messages with all their parts."""
-        message_keys = await Storage.list(StorageKey.message_prefix(session_id))
+        """List structured messages with all their parts.
+
+        Loads the whole session in two queries: one for message infos and
+        one for every part.
+        """
+        message_rows = await Storage.scan(StorageKey.message_prefix(session_id))
         infos: List[StoredMessageInfo] = []
-        for key in message_keys:
+        for _key, data in message_rows:
             try:
-                data = await Storage.read(key)
                 info = StoredMessageInfo.model_validate(data)
             except Exception:
                 continue
             infos.append(info)
         infos.sort(key=lambda i: i.id)
 
-        part_keys = await Storage.list(StorageKey.part_prefix(session_id))
+        part_rows = await Storage.scan(StorageKey.part_prefix(session_id))
         by_message: Dict[str, List[StoredMessagePart]] = {}
-        for key in part_keys:
+        for _key, data in part_rows:
             try:
-                data = await Storage.read(key)
                 part = parse_part(data)
             except Exception:
                 continue
             by_message.setdefault(part.message_id, []).append(part)
-        for parts in by_message.values():
+        for message_id, parts in by_message.items():
             parts.sort(key=lambda p: p.id)
+            by_message[message_id] = cls._overlay_pending(session_id, parts)
 
         return [StoredMessageWithParts(info=info, parts=by_message.get(info.id, [])) for info in infos]
 
@@ -502,13 +556,10 @@ class Session:
             return 0
 
         ops = [Storage.delete(cls._message_store_key(session_id, message_id)) for message_id in message_ids]
-        part_keys = await Storage.list(StorageKey.part_prefix(session_id))
-        for key in part_keys:
-            try:
-                part_data = await Storage.read(key)
-            except NotFoundError:
-                continue
-            if part_data.get("message_id") in message_ids:
+        for message_id in message_ids:
+            rows = await Storage.scan(StorageKey.part_prefix(session_id), message_id=message_id)
+            for key, _data in rows:
+                cls._deltas.discard(session_id, key[-1])
                 ops.append(Storage.delete(key))
 
         session_data["time"]["updated"] = int(time.time() * 1000)
@@ -592,4 +643,5 @@ class Session:
     @classmethod
     def reset(cls) -> None:
         """Reset storage cache (for testing)."""
+        cls._deltas.clear()
         Storage.reset()
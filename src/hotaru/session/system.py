@@ -4,9 +4,11 @@ Provides system prompts for different AI providers and models.
 """
 
 import platform
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from ..core.config import ConfigManager
 from ..provider.provider import ProcessedModelInfo
@@ -33,12 +35,32 @@ _PROMPT_GEMINI = _load_prompt("gemini.txt", _DEFAULT_PROMPT)
 _PROMPT_TRINITY = _load_prompt("trinity.txt", _DEFAULT_PROMPT)
 
 
+@dataclass
+class _Memo:
+    instructions: List[str]
+    directories: List[str]
+    prompt: str
+
+
 class SystemPrompt:
     """System prompt generator.
 
     Generates appropriate system prompts based on the model and environment.
     """
 
+    # Assembled prompt per (model, directory, worktree, ...).  It is reused
+    # until the instruction blocks or config directories change, which also
+    # pins the environment date so the request prefix stays byte-identical
+    # across midnight and provider prompt caches stay warm.
+    CACHE_SIZE = 32
+    _prompts: "OrderedDict[Tuple, _Memo]" = OrderedDict()
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Forget assembled prompts and cached instructions."""
+        cls._prompts.clear()
+        InstructionPrompt.invalidate()
+
     @classmethod
     def get_default(cls) -> str:
         """Get the default system prompt."""
@@ -151,6 +173,27 @@ class SystemPrompt:
         Returns:
             Complete system prompt string
         """
+        # Load project/global custom instructions (AGENTS.md, config.instructions, etc.)
+        instructions = await InstructionPrompt.system(directory=directory, worktree=worktree)
+        directories = ConfigManager.directories()
+
+        key = (
+            model.provider_id,
+            model.id,
+            model.api_id,
+            model.name,
+            directory,
+            worktree,
+            is_git,
+            tuple(additional_instructions or ()),
+        )
+        cached = cls._prompts.get(key)
+        if cached and cached.instructions == instructions and cached.directories == directories:
+            cls._prompts.move_to_end(key)
+            return cached.prompt
+        if cached:
+            log.info("system prompt changed", {"directory": directory, "model": model.id})
+
         parts = []
 
         # Add base prompt
@@ -159,11 +202,14 @@ class SystemPrompt:
         # Add environment info
         parts.append(cls.environment(model, directory, is_git))
 
-        # Load project/global custom instructions (AGENTS.md, config.instructions, etc.)
-        parts.extend(await InstructionPrompt.system(directory=directory, worktree=worktree))
+        parts.extend(instructions)
 
         # Add additional instructions
         if additional_instructions:
             parts.extend(additional_instructions)
 
-        return "\n\n".join(parts)
+        prompt = "\n\n".join(parts)
+        cls._prompts[key] = _Memo(instructions=instructions, directories=directories, prompt=prompt)
+        if len(cls._prompts) > cls.CACHE_SIZE:
+            cls._prompts.popitem(last=False)
+        return prompt
@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional
 from ..core.id import Identifier
 from ..permission import CorrectedError, DeniedError, RejectedError
 from ..question.question import RejectedError as QuestionRejectedError
+from ..snapshot import SnapshotTracker
 from ..tool import ToolContext
 from ..tool.resolver import ToolResolver
 from ..util.log import Log
@@ -217,3 +218,6 @@ class ToolExecutor:
                 },
             )
             return {"error": str(e)}
+        finally:
+            # MCP servers may change the workspace in ways we cannot see.
+            SnapshotTracker.mark_unknown()
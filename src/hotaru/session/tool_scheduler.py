@@ -0,0 +1,200 @@
+"""Concurrent scheduling of the tool calls in one assistant step.
+
+Each tool call starts as soon as its input is complete, while the model
+stream keeps being consumed.  Read-only tools run alongside each other;
+mutating tools are serialized according to ``ToolPolicy``.  Results are
+handed back in call order regardless of completion order.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Literal, Mapping, Optional
+
+from ..core.config import ToolConcurrencyConfig
+from ..util.log import Log
+from .processor_types import ToolCallState
+
+log = Log.create({"service": "session.tool_scheduler"})
+
+Mode = Literal["shared", "path", "exclusive"]
+
+READ_ONLY_TOOLS: FrozenSet[str] = frozenset({"read", "glob", "grep", "ls", "lsp", "webfetch"})
+_PATH_KEYS = ("filePath", "file_path", "path")
+
+
+@dataclass(frozen=True)
+class ToolPolicy:
+    """Which tool calls may overlap.
+
+    ``shared`` tools (read-only) never conflict with each other.  ``path``
+    tools conflict with calls touching an overlapping path, and
+    ``exclusive`` tools conflict with everything.  Unknown tools (MCP,
+    bash, task, ...) are exclusive unless configured otherwise.
+    """
+
+    enabled: bool = True
+    max_parallel: int = 8
+    read_only: FrozenSet[str] = READ_ONLY_TOOLS
+    serialize: Mapping[str, Literal["exclusive", "path"]] = field(default_factory=dict)
+
+    @classmethod
+    def from_config(cls, config: Optional[ToolConcurrencyConfig]) -> "ToolPolicy":
+        if config is None:
+            return cls()
+        return cls(
+            enabled=config.enabled,
+            max_parallel=config.max_parallel,
+            read_only=READ_ONLY_TOOLS | frozenset(config.read_only),
+            serialize=dict(config.serialize),
+        )
+
+    def mode(self, tool_name: str) -> Mode:
+        if not self.enabled:
+            return "exclusive"
+        configured = self.serialize.get(tool_name)
+        if configured:
+            return configured
+        if tool_name in self.read_only:
+            return "shared"
+        return "exclusive"
+
+
+def _call_path(tool_input: Dict[str, Any]) -> Optional[str]:
+    for key in _PATH_KEYS:
+        value = tool_input.get(key)
+        if isinstance(value, str) and value:
+            return os.path.normpath(value)
+    return None
+
+
+def _paths_overlap(a: Optional[str], b: Optional[str]) -> bool:
+    if a is None or b is None or os.path.isabs(a) != os.path.isabs(b):
+        return True
+    if a == b:
+        return True
+    return a.startswith(b.rstrip(os.sep) + os.sep) or b.startswith(a.rstrip(os.sep) + os.sep)
+
+
+@dataclass
+class _Call:
+    tc: ToolCallState
+    mode: Mode
+    path: Optional[str]
+    task: Optional[asyncio.Task[Dict[str, Any]]] = None
+    # Set once the finisher has handled this call's result (or skipped it).
+    finished: asyncio.Event = field(default_factory=asyncio.Event)
+
+    def conflicts(self, other: "_Call") -> bool:
+        if "exclusive" in (self.mode, other.mode):
+            return True
+        if self.mode == "shared" and other.mode == "shared":
+            return False
+        return _paths_overlap(self.path, other.path)
+
+
+class ToolScheduler:
+    """Run tool calls concurrently and finish them in call order.
+
+    ``execute`` runs one call; ``finish`` records its result and returns
+    True to stop the step (e.g. a permission denial), which cancels every
+    call that has not been finished yet.
+    """
+
+    def __init__(
+        self,
+        *,
+        policy: ToolPolicy,
+        execute: Callable[[ToolCallState], Awaitable[Dict[str, Any]]],
+        finish: Callable[[ToolCallState, Dict[str, Any]], Awaitable[bool]],
+    ) -> None:
+        self.policy = policy
+        self._execute = execute
+        self._finish = finish
+        self._limit = asyncio.Semaphore(max(1, policy.max_parallel))
+        self._calls: List[_Call] = []
+        self._queue: asyncio.Queue[Optional[_Call]] = asyncio.Queue()
+        self._finisher: Optional[asyncio.Task[None]] = None
+        self._error: Optional[BaseException] = None
+        self.stopped = False
+
+    def submit(self, tc: ToolCallState) -> None:
+        """Schedule *tc* behind every earlier call it conflicts with."""
+        if self.stopped:
+            return
+        call = _Call(tc=tc, mode=self.policy.mode(tc.name), path=_call_path(tc.input or {}))
+        deps = [earlier for earlier in self._calls if earlier.conflicts(call)]
+        call.task = asyncio.create_task(self._run(call, deps))
+        self._calls.append(call)
+        if self._finisher is None:
+            self._finisher = asyncio.create_task(self._finish_in_order())
+        self._queue.put_nowait(call)
+
+    async def _run(self, call: _Call, deps: List[_Call]) -> Dict[str, Any]:
+        # Wait for the finisher, not just the task: a conflicting call must
+        # not start before an earlier result (e.g. a denial) stopped the step.
+        for dep in deps:
+            await dep.finished.wait()
+        if self.stopped:
+            return {}
+        async with self._limit:
+            return await self._execute(call.tc)
+
+    async def _finish_in_order(self) -> None:
+        while True:
+            call = await self._queue.get()
+            if call is None or call.task is None:
+                return
+            try:
+                tool_result = await call.task
+                # Calls skipped or cut short by an earlier stop are not finished.
+                stop = self.stopped or await self._finish(call.tc, tool_result)
+            except asyncio.CancelledError:
+                # A call cancelled by an earlier stop; keep draining the queue.
+                if self.stopped and not asyncio.current_task().cancelling():
+                    call.finished.set()
+                    continue
+                raise
+            except Exception as e:
+                self._error = e
+                stop = True
+            if stop and not self.stopped:
+                self.stopped = True
+                self._cancel_pending()
+            call.finished.set()
+
+    def _cancel_pending(self) -> None:
+        for call in self._calls:
+            if call.task is not None and not call.task.done():
+                call.task.cancel()
+
+    async def join(self) -> None:
+        """Wait until every submitted call is finished; re-raise tool errors."""
+        if self._finisher is None:
+            return
+        self._queue.put_nowait(None)
+        await self._finisher
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    async def settle(self) -> None:
+        """Let calls that already started finish after the stream failed."""
+        try:
+            await self.join()
+        except Exception as e:
+            log.warn("tool call failed after stream error", {"error": str(e)})
+
+    async def cancel(self) -> None:
+        """Abort all unfinished calls (used when the step is torn down)."""
+        self.stopped = True
+        self._cancel_pending()
+        if self._finisher is not None and not self._finisher.done():
+            self._finisher.cancel()
+        tasks = [call.task for call in self._calls if call.task is not None]
+        if self._finisher is not None:
+            tasks.append(self._finisher)
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,252 @@
+"""In-memory session transcript cache.
+
+The prompt loop needs the session history several times per step (history
+load, latest user message, pending compaction, pruning).  Reading it from
+storage each time re-validates every part, so the cache keeps recently used
+transcripts in memory and keeps them coherent from the message bus events
+that ``Session`` already publishes for every write.
+"""
+
+from __future__ import annotations
+
+import bisect
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+from ..core.bus import Bus, EventPayload
+from ..util.log import Log
+from .events import (
+    MessagePartDelta,
+    MessagePartUpdated,
+    MessageUpdated,
+    SessionDeleted,
+    SessionUpdated,
+)
+from .message_store import (
+    CompactionPart,
+    MessageInfo,
+    Part,
+    WithParts,
+    filter_compacted,
+    find_pending_compaction,
+    parse_part,
+    to_model_messages,
+)
+
+log = Log.create({"service": "session.transcript"})
+
+
+class _Transcript:
+    """Cached messages and parts of one session."""
+
+    __slots__ = ("infos", "order", "parts", "version", "_snapshot", "_filtered")
+
+    def __init__(self, messages: List[WithParts]) -> None:
+        self.infos: Dict[str, MessageInfo] = {}
+        self.order: List[str] = []
+        self.parts: Dict[str, Dict[str, Part]] = {}
+        self.version = 0
+        self._snapshot: Optional[List[WithParts]] = None
+        self._filtered: Optional[List[WithParts]] = None
+        for msg in messages:
+            self.infos[msg.info.id] = msg.info
+            self.order.append(msg.info.id)
+            self.parts[msg.info.id] = {part.id: part for part in msg.parts}
+        self.order.sort()
+
+    def touch(self) -> None:
+        self.version += 1
+        self._snapshot = None
+        self._filtered = None
+
+    def put_info(self, info: MessageInfo) -> None:
+        if info.id not in self.infos:
+            bisect.insort(self.order, info.id)
+        self.infos[info.id] = info
+        self.touch()
+
+    def put_part(self, part: Part) -> None:
+        self.parts.setdefault(part.message_id, {})[part.id] = part
+        self.touch()
+
+    def append_delta(self, message_id: str, part_id: str, field: str, delta: str) -> None:
+        part = self.parts.get(message_id, {}).get(part_id)
+        if part is None:
+            return
+        current = getattr(part, field, None)
+        if not isinstance(current, str):
+            return
+        update: Dict[str, Any] = {field: current + delta}
+        if getattr(part, "token_count", None) is not None:
+            update["token_count"] = None
+        self.parts[message_id][part_id] = part.model_copy(update=update)
+        self.touch()
+
+    def messages(self) -> List[WithParts]:
+        if self._snapshot is None:
+            self._snapshot = [
+                WithParts(
+                    info=self.infos[message_id],
+                    parts=sorted(self.parts.get(message_id, {}).values(), key=lambda p: p.id),
+                )
+                for message_id in self.order
+            ]
+        return self._snapshot
+
+    def filtered(self) -> List[WithParts]:
+        if self._filtered is None:
+            self._filtered = filter_compacted(self.messages())
+        return self._filtered
+
+
+class TranscriptCache:
+    """Per-AppContext LRU cache of session transcripts.
+
+    Transcripts are loaded lazily through ``Session.messages`` and then
+    updated from ``MessageUpdated``/``MessagePartUpdated``/``MessagePartDelta``
+    events.  Session updates and deletions drop the cached transcript.  An
+    unbound cache (no bus) passes every call through to storage.
+
+    Returned lists are shared snapshots; callers must not mutate them.
+    """
+
+    def __init__(self, capacity: int = 16) -> None:
+        self.capacity = capacity
+        self._entries: OrderedDict[str, _Transcript] = OrderedDict()
+        self._unsubscribers: List[Callable[[], None]] = []
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def bound(self) -> bool:
+        return bool(self._unsubscribers)
+
+    def bind(self, bus: Bus) -> None:
+        """Start tracking bus events; transcripts are cached from here on."""
+        if self.bound:
+            return
+        handlers = {
+            MessageUpdated.type: self._on_message_updated,
+            MessagePartUpdated.type: self._on_part_updated,
+            MessagePartDelta.type: self._on_part_delta,
+            SessionUpdated.type: self._on_session_changed,
+            SessionDeleted.type: self._on_session_changed,
+        }
+        self._unsubscribers = [bus._raw_subscribe(event_type, handler) for event_type, handler in handlers.items()]
+
+    def reset(self) -> None:
+        for unsubscribe in self._unsubscribers:
+            unsubscribe()
+        self._unsubscribers = []
+        self._entries.clear()
+
+    def invalidate(self, session_id: str) -> None:
+        self._entries.pop(session_id, None)
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def _entry(self, session_id: str) -> Optional[_Transcript]:
+        if not self.bound:
+            return None
+        entry = self._entries.get(session_id)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(session_id)
+            return entry
+
+        from .session import Session
+
+        self.misses += 1
+        entry = _Transcript(await Session.messages(session_id=session_id))
+        self._entries[session_id] = entry
+        while len(self._entries) > self.capacity:
+            evicted, _ = self._entries.popitem(last=False)
+            log.debug("evicted transcript", {"session_id": evicted})
+        return entry
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    async def messages(self, session_id: str) -> List[WithParts]:
+        """All messages of a session with their parts, ordered by id."""
+        entry = await self._entry(session_id)
+        if entry is None:
+            from .session import Session
+
+            return await Session.messages(session_id=session_id)
+        return entry.messages()
+
+    async def filtered(self, session_id: str) -> List[WithParts]:
+        """Messages after the newest completed compaction boundary."""
+        entry = await self._entry(session_id)
+        if entry is None:
+            return filter_compacted(await self.messages(session_id))
+        return entry.filtered()
+
+    async def model_messages(self, session_id: str, *, interleaved_field: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Provider input messages built from the filtered transcript."""
+        return to_model_messages(await self.filtered(session_id), interleaved_field=interleaved_field)
+
+    async def latest_user_id(self, session_id: str) -> Optional[str]:
+        entry = await self._entry(session_id)
+        if entry is None:
+            messages = await self.messages(session_id)
+            for msg in reversed(messages):
+                if msg.info.role == "user":
+                    return msg.info.id
+            return None
+        for message_id in reversed(entry.order):
+            if entry.infos[message_id].role == "user":
+                return message_id
+        return None
+
+    async def pending_compaction(self, session_id: str) -> Optional[tuple[str, CompactionPart]]:
+        """Newest compaction request without a finished summary, if any."""
+        return find_pending_compaction(await self.messages(session_id))
+
+    # ------------------------------------------------------------------
+    # Event handlers
+    # ------------------------------------------------------------------
+
+    def _on_message_updated(self, payload: EventPayload) -> None:
+        info = payload.properties.get("info")
+        if not isinstance(info, dict):
+            return
+        entry = self._entries.get(str(info.get("session_id") or ""))
+        if entry is None:
+            return
+        entry.put_info(MessageInfo.model_validate(info))
+
+    def _on_part_updated(self, payload: EventPayload) -> None:
+        part = payload.properties.get("part")
+        if not isinstance(part, dict):
+            return
+        entry = self._entries.get(str(part.get("session_id") or ""))
+        if entry is None:
+            return
+        entry.put_part(parse_part(part))
+
+    def _on_part_delta(self, payload: EventPayload) -> None:
+        props = payload.properties
+        entry = self._entries.get(str(props.get("session_id") or ""))
+        if entry is None:
+            return
+        entry.append_delta(
+            str(props.get("message_id") or ""),
+            str(props.get("part_id") or ""),
+            str(props.get("field") or ""),
+            str(props.get("delta") or ""),
+        )
+
+    def _on_session_changed(self, payload: EventPayload) -> None:
+        props = payload.properties
+        session = props.get("session")
+        if isinstance(session, dict):
+            self.invalidate(str(session.get("id") or ""))
+            return
+        self.invalidate(str(props.get("session_id") or ""))
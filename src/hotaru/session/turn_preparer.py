@@ -8,6 +8,7 @@ from typing import Any, Callable, Awaitable, Dict, List, Optional, Set, Union
 
 from ..tool.resolver import ToolResolver
 from .llm import StreamInput
+from .tool_scheduler import ToolPolicy
 
 _MAX_STEPS_PROMPT_PATH = Path(__file__).parent / "prompt" / "max-steps.txt"
 _MAX_STEPS_PROMPT = _MAX_STEPS_PROMPT_PATH.read_text(encoding="utf-8").strip()
@@ -48,6 +49,15 @@ class TurnPreparer:
         except Exception:
             return False
 
+    async def load_tool_policy(self) -> ToolPolicy:
+        try:
+            from ..core.config import ConfigManager
+
+            config = await ConfigManager.get()
+            return ToolPolicy.from_config(config.tool_concurrency)
+        except Exception:
+            return ToolPolicy()
+
     async def prepare(
         self,
         *,
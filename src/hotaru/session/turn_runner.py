@@ -9,6 +9,7 @@ from typing import Any, Awaitable, Callable, Dict, List, Optional, Protocol, run
 from ..util.log import Log
 from .llm import LLM, StreamInput
 from .processor_types import ProcessorResult, ToolCallState
+from .tool_scheduler import ToolPolicy, ToolScheduler
 
 log = Log.create({"service": "session.turn_runner"})
 
@@ -146,9 +147,16 @@ class TurnHost(Protocol):
 
     def continue_loop_on_deny(self) -> bool: ...
 
+    def tool_policy(self) -> ToolPolicy: ...
+
 
 class TurnRunner:
-    """Consume model stream and coordinate per-chunk callbacks."""
+    """Consume model stream and coordinate per-chunk callbacks.
+
+    Tool calls are handed to a ``ToolScheduler`` as soon as their input is
+    complete, so the stream keeps draining while tools run; results are
+    recorded in call order.
+    """
 
     def __init__(self, *, host: TurnHost) -> None:
         self.host = host
@@ -174,6 +182,46 @@ class TurnRunner:
             return text
         return "".join(clean)
 
+    async def _finish_tool(
+        self,
+        tc: ToolCallState,
+        tool_result: Dict[str, Any],
+        obs: StreamObserver,
+        result: ProcessorResult,
+    ) -> bool:
+        """Record a finished tool call; return True when the step must stop."""
+        blocked = False
+        tc.end_time = int(time.time() * 1000)
+
+        if tool_result.get("error"):
+            tc.status = "error"
+            tc.error = tool_result["error"]
+            if tool_result.get("blocked") and not self.host.continue_loop_on_deny():
+                blocked = True
+        else:
+            tc.status = "completed"
+            tc.output = tool_result.get("output", "")
+            tc.title = str(tool_result.get("title") or "") or None
+            tc.attachments = tool_result.get("attachments", [])
+            tc.metadata = dict(tool_result.get("metadata", {}) or {})
+            self.host.apply_mode_switch_metadata(tc.metadata)
+
+        await self.host.emit_tool_update(obs, tc)
+
+        result.tool_calls.append(tc)
+        callback_metadata = dict(tool_result.get("metadata", {}))
+        if tc.attachments:
+            callback_metadata["attachments"] = tc.attachments
+        await obs.on_tool_end(
+            tc.name,
+            tc.id,
+            tc.output,
+            tc.error,
+            tool_result.get("title", ""),
+            callback_metadata,
+        )
+        return blocked
+
     async def run(
         self,
         *,
@@ -184,9 +232,22 @@ class TurnRunner:
         obs = observer or _NULL
         result = ProcessorResult(status="continue")
         current_tool_calls: Dict[str, ToolCallState] = {}
-        blocked = False
         reasoning_fragments: List[str] = []
 
+        async def _execute(tc: ToolCallState) -> Dict[str, Any]:
+            return await self.host.execute_tool(
+                tool_name=tc.name,
+                tool_input=tc.input,
+                tc=tc,
+                observer=obs,
+                assistant_message_id=assistant_message_id,
+            )
+
+        async def _finish(tc: ToolCallState, tool_result: Dict[str, Any]) -> bool:
+            return await self._finish_tool(tc, tool_result, obs, result)
+
+        scheduler = ToolScheduler(policy=self.host.tool_policy(), execute=_execute, finish=_finish)
+
         try:
             async for chunk in LLM.stream(stream_input):
                 if chunk.type == "text" and chunk.text:
@@ -222,46 +283,7 @@ class TurnRunner:
 
                         await obs.on_tool_start(tc.name, tc.id, tc.input)
                         await self.host.emit_tool_update(obs, tc)
-
-                        tool_result = await self.host.execute_tool(
-                            tool_name=tc.name,
-                            tool_input=tc.input,
-                            tc=tc,
-                            observer=obs,
-                            assistant_message_id=assistant_message_id,
-                        )
-                        tc.end_time = int(time.time() * 1000)
-
-                        if tool_result.get("error"):
-                            tc.status = "error"
-                            tc.error = tool_result["error"]
-                            if tool_result.get("blocked") and not self.host.continue_loop_on_deny():
-                                blocked = True
-                        else:
-                            tc.status = "completed"
-                            tc.output = tool_result.get("output", "")
-                            tc.title = str(tool_result.get("title") or "") or None
-                            tc.attachments = tool_result.get("attachments", [])
-                            tc.metadata = dict(tool_result.get("metadata", {}) or {})
-                            self.host.apply_mode_switch_metadata(tc.metadata)
-
-                        await self.host.emit_tool_update(obs, tc)
-
-                        result.tool_calls.append(tc)
-                        callback_metadata = dict(tool_result.get("metadata", {}))
-                        if tc.attachments:
-                            callback_metadata["attachments"] = tc.attachments
-                        await obs.on_tool_end(
-                            tc.name,
-                            tc.id,
-                            tc.output,
-                            tc.error,
-                            tool_result.get("title", ""),
-                            callback_metadata,
-                        )
-                        if blocked:
-                            result.status = "stop"
-                            break
+                        scheduler.submit(tc)
 
                 elif chunk.type == "reasoning_start":
                     await obs.on_reasoning_start(
@@ -297,7 +319,15 @@ class TurnRunner:
                     result.error = chunk.error
                     break
 
+                if scheduler.stopped:
+                    break
+
+            await scheduler.join()
+            if scheduler.stopped and result.status == "continue":
+                result.status = "stop"
+
         except Exception as e:
+            await scheduler.settle()
             if self.host.recoverable_error(e):
                 log.warn(
                     "recoverable turn processing error",
@@ -319,5 +349,8 @@ class TurnRunner:
                 )
                 raise
 
+        finally:
+            await scheduler.cancel()
+
         result.reasoning_text = "".join(reasoning_fragments)
         return result
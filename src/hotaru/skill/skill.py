@@ -136,6 +136,8 @@ class Skill:
     def __init__(self) -> None:
         self._cache: Optional[Dict[str, SkillInfo]] = None
         self._directories: Optional[Set[str]] = None
+        # Bumped on reset so dependents (e.g. cached tool descriptions) refresh.
+        self.version = 0
 
     async def init(self) -> None:
         """Eagerly initialize skills during startup."""
@@ -266,4 +268,5 @@ class Skill:
     def reset(self) -> None:
         self._cache = None
         self._directories = None
+        self.version += 1
         log.info("skill cache reset")
@@ -1,12 +1,21 @@
-"""Git-backed workspace snapshot tracking."""
+"""Git-backed workspace snapshot tracking.
+
+Each session snapshots the worktree into its own git dir.  Re-indexing the
+whole tree (``git add -A .``) at every step is a full stat scan, so the
+tracker keeps, per session, the paths the file tools reported as changed
+and only re-adds those.  Changes it cannot see (bash commands, MCP tools,
+the first snapshot of a session, a new user turn) and a periodic timer
+trigger a full reconcile instead.
+"""
 
 from __future__ import annotations
 
 import asyncio
 import os
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Set
 
 from ..core.config import ConfigManager
 from ..core.global_paths import GlobalPath
@@ -14,6 +23,17 @@ from ..util.log import Log
 
 log = Log.create({"service": "snapshot"})
 
+# Re-index the whole worktree at least this often.
+FULL_RECONCILE_SECONDS = 300.0
+# Beyond this many pending paths a full reconcile is cheaper.
+MAX_DIRTY_PATHS = 2000
+# Paths per git invocation, to stay well below the argv limit.
+_PATH_BATCH = 500
+# A split index rewrites only the changed entries instead of the whole
+# index; the untracked cache lets ``add -A`` skip unchanged directories
+# when looking for new files.
+_INDEX_OPTIONS = ["-c", "core.splitIndex=true", "-c", "core.untrackedCache=true"]
+
 
 @dataclass(frozen=True)
 class PatchResult:
@@ -23,9 +43,61 @@ class PatchResult:
     files: List[str]
 
 
+@dataclass
+class _IndexState:
+    """What a session's snapshot index is missing since its last sync.
+
+    ``dirty`` holds paths relative to ``cwd``: git runs there and reads
+    pathspecs relative to it, and ``add -A .`` only covers that subtree.
+    """
+
+    worktree: str
+    cwd: str
+    dirty: Set[str] = field(default_factory=set)
+    full: bool = True
+    reconciled: float = 0.0
+
+
 class SnapshotTracker:
     """Track and diff workspace trees using an isolated git dir."""
 
+    _states: Dict[str, _IndexState] = {}
+
+    @classmethod
+    def mark_changed(cls, paths: Iterable[str]) -> None:
+        """Record files a tool wrote, moved or deleted."""
+        resolved = [os.path.realpath(path) for path in paths]
+        for state in cls._states.values():
+            if state.full:
+                continue
+            for path in resolved:
+                rel = os.path.relpath(path, state.cwd)
+                if rel == ".." or rel.startswith(".." + os.sep):
+                    continue
+                state.dirty.add(Path(rel).as_posix())
+            if len(state.dirty) > MAX_DIRTY_PATHS:
+                state.full = True
+                state.dirty.clear()
+
+    @classmethod
+    def mark_unknown(cls) -> None:
+        """Record changes to unknown paths: every session reconciles fully next time."""
+        for state in cls._states.values():
+            state.full = True
+            state.dirty.clear()
+
+    @classmethod
+    def reconcile(cls, session_id: str) -> None:
+        """Make the next snapshot of *session_id* re-index the whole worktree."""
+        state = cls._states.get(session_id)
+        if state is not None:
+            state.full = True
+            state.dirty.clear()
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._states.clear()
+
     @classmethod
     async def track(cls, *, session_id: str, cwd: str, worktree: str) -> Optional[str]:
         """Record the current workspace tree and return the tree hash."""
@@ -39,7 +111,7 @@ class SnapshotTracker:
         if not initialized:
             return None
 
-        await cls._add_all(git_dir=git_dir, worktree=worktree, cwd=cwd)
+        await cls._sync_index(session_id=session_id, git_dir=git_dir, worktree=worktree, cwd=cwd)
         result = await cls._run_git(
             ["write-tree"],
             git_dir=git_dir,
@@ -65,7 +137,7 @@ class SnapshotTracker:
         if not git_dir.exists():
             return PatchResult(hash=base_hash, files=[])
 
-        await cls._add_all(git_dir=git_dir, worktree=worktree, cwd=cwd)
+        await cls._sync_index(session_id=session_id, git_dir=git_dir, worktree=worktree, cwd=cwd)
         result = await cls._run_git(
             ["-c", "core.quotepath=false", "diff", "--no-ext-diff", "--name-only", base_hash, "--", "."],
             git_dir=git_dir,
@@ -105,7 +177,7 @@ class SnapshotTracker:
         if not git_dir.exists():
             return ""
 
-        await cls._add_all(git_dir=git_dir, worktree=worktree, cwd=cwd)
+        await cls._sync_index(session_id=session_id, git_dir=git_dir, worktree=worktree, cwd=cwd)
         args = ["-c", "core.quotepath=false", "diff", "--no-ext-diff", from_hash]
         if to_hash:
             args.append(to_hash)
@@ -171,13 +243,77 @@ class SnapshotTracker:
         return True
 
     @classmethod
-    async def _add_all(cls, *, git_dir: Path, worktree: str, cwd: str) -> None:
-        await cls._run_git(
-            ["add", "-A", "."],
+    async def _sync_index(cls, *, session_id: str, git_dir: Path, worktree: str, cwd: str) -> None:
+        """Bring the snapshot index up to date with the worktree."""
+        root = str(Path(worktree).resolve())
+        base = str(Path(cwd).resolve())
+        state = cls._states.get(session_id)
+        if state is None or state.worktree != root or state.cwd != base:
+            state = cls._states[session_id] = _IndexState(worktree=root, cwd=base)
+
+        now = time.monotonic()
+        if state.full or now - state.reconciled >= FULL_RECONCILE_SECONDS:
+            # Cleared before running git: paths marked meanwhile are re-added next time.
+            state.full = False
+            state.dirty.clear()
+            if await cls._add_all(git_dir=git_dir, worktree=worktree, cwd=cwd):
+                state.reconciled = now
+            else:
+                state.full = True
+            return
+
+        if not state.dirty:
+            return
+        paths = sorted(state.dirty)
+        state.dirty.clear()
+        if not await cls._add_paths(paths, git_dir=git_dir, worktree=worktree, cwd=cwd):
+            log.warn("incremental snapshot update failed, reconciling", {"paths": len(paths)})
+            state.full = not await cls._add_all(git_dir=git_dir, worktree=worktree, cwd=cwd)
+
+    @classmethod
+    async def _add_all(cls, *, git_dir: Path, worktree: str, cwd: str) -> bool:
+        result = await cls._run_git(
+            [*_INDEX_OPTIONS, "add", "-A", "."],
             git_dir=git_dir,
             worktree=worktree,
             cwd=cwd,
         )
+        return result is not None and result.exit_code == 0
+
+    @classmethod
+    async def _add_paths(cls, paths: List[str], *, git_dir: Path, worktree: str, cwd: str) -> bool:
+        """Update the index entries of *paths* (relative to *cwd*) only."""
+        root = Path(cwd).resolve()
+        present: List[str] = []
+        missing: List[str] = []
+        for path in paths:
+            (present if os.path.lexists(root / path) else missing).append(path)
+        for start in range(0, len(present), _PATH_BATCH):
+            result = await cls._run_git(
+                [
+                    *_INDEX_OPTIONS, "--literal-pathspecs", "-c", "advice.addIgnoredFile=false",
+                    "add", "-A", "--", *present[start:start + _PATH_BATCH],
+                ],
+                git_dir=git_dir,
+                worktree=worktree,
+                cwd=cwd,
+            )
+            # Exit code 1: some paths are ignored, the others were added.
+            if result is None or result.exit_code not in (0, 1):
+                return False
+        for start in range(0, len(missing), _PATH_BATCH):
+            result = await cls._run_git(
+                [
+                    *_INDEX_OPTIONS, "--literal-pathspecs",
+                    "rm", "--cached", "-r", "-q", "--ignore-unmatch", "--", *missing[start:start + _PATH_BATCH],
+                ],
+                git_dir=git_dir,
+                worktree=worktree,
+                cwd=cwd,
+            )
+            if result is None or result.exit_code != 0:
+                return False
+        return True
 
     @classmethod
     async def _run_git(
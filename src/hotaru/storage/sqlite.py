@@ -73,6 +73,61 @@ def _table(key: list[str]) -> str:
 
 _TABLES = ("sessions", "session_index", "messages", "parts", "permission_approval", "kv")
 
+# Denormalized lookup columns kept alongside ``data`` for indexed queries.
+_COLUMNS: dict[str, tuple[str, ...]] = {
+    "messages": ("session_id", "message_id"),
+    "parts": ("session_id", "message_id", "part_id", "type"),
+}
+
+_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS messages_by_session ON messages (session_id, message_id)",
+    "CREATE INDEX IF NOT EXISTS parts_by_message ON parts (session_id, message_id, part_id)",
+)
+
+_SCHEMA_VERSION = 1
+
+
+def _columns(table: str, key: list[str], content: Any) -> tuple[Any, ...]:
+    """Derive the lookup column values for a row from its key and content."""
+    if table == "messages":
+        # message_store/<session_id>/<message_id>
+        return (
+            key[1] if len(key) > 1 else None,
+            key[2] if len(key) > 2 else None,
+        )
+    if table == "parts":
+        # part/<session_id>/<part_id>
+        body = content if isinstance(content, dict) else {}
+        return (
+            key[1] if len(key) > 1 else None,
+            body.get("message_id"),
+            key[2] if len(key) > 2 else None,
+            body.get("type"),
+        )
+    return ()
+
+
+def _upsert(db: sqlite3.Connection, key: list[str], content: Any, *, replace: bool = True) -> None:
+    table = _table(key)
+    extra = _COLUMNS.get(table, ())
+    names = ", ".join(("key", "data") + extra)
+    marks = ", ".join("?" for _ in range(2 + len(extra)))
+    verb = "INSERT OR REPLACE" if replace else "INSERT OR IGNORE"
+    db.execute(
+        f"{verb} INTO {table} ({names}) VALUES ({marks})",
+        (_encode_key(key), json.dumps(content, ensure_ascii=False), *_columns(table, key, content)),
+    )
+
+
+def _prefix_range(prefix: list[str]) -> tuple[str, str]:
+    """Key range covering every key under *prefix*.
+
+    A half-open range on the primary key uses the index, unlike ``LIKE``,
+    and does not treat ``_`` in ids as a wildcard.
+    """
+    encoded = _encode_key(prefix)
+    return encoded + "/", encoded + "0"  # "0" sorts right after "/"
+
 
 class Storage:
     """SQLite-backed storage with WAL mode.
@@ -112,6 +167,7 @@ class Storage:
                     )
                 """)
             cls._db.commit()
+            cls._migrate_schema()
             cls._migrate_json(data)
             cls._ready = True
             return cls._path
@@ -148,10 +204,7 @@ class Storage:
     @classmethod
     async def write(cls, key: list[str], content: Any) -> None:
         db = cls._conn()
-        db.execute(
-            f"INSERT OR REPLACE INTO {_table(key)} (key, data) VALUES (?, ?)",
-            (_encode_key(key), json.dumps(content, ensure_ascii=False)),
-        )
+        _upsert(db, key, content)
         db.commit()
 
     @classmethod
@@ -169,10 +222,7 @@ class Storage:
                 raise NotFoundError(key)
             data = json.loads(row[0])
             fn(data)
-            db.execute(
-                f"INSERT OR REPLACE INTO {table} (key, data) VALUES (?, ?)",
-                (encoded, json.dumps(data, ensure_ascii=False)),
-            )
+            _upsert(db, key, data)
             db.execute("COMMIT")
         except NotFoundError:
             raise
@@ -200,10 +250,7 @@ class Storage:
             encoded = _encode_key(op.key)
             table = _table(op.key)
             if op.type == "put":
-                db.execute(
-                    f"INSERT OR REPLACE INTO {table} (key, data) VALUES (?, ?)",
-                    (encoded, json.dumps(op.content, ensure_ascii=False)),
-                )
+                _upsert(db, op.key, op.content)
             elif op.type == "delete":
                 db.execute(f"DELETE FROM {table} WHERE key = ?", (encoded,))
         db.commit()
@@ -215,16 +262,83 @@ class Storage:
                     log.warn("transaction effect failed", {"error": str(exc)})
 
     @classmethod
-    async def list(cls, prefix: list[str]) -> list[list[str]]:
+    async def scan(cls, prefix: list[str], **where: str) -> list[tuple[list[str], Any]]:
+        """Load every record under *prefix* in a single query, ordered by key.
+
+        Keyword filters match the indexed lookup columns of the namespace
+        (e.g. ``message_id`` for parts) instead of decoding each record.
+
+        Returns:
+            List of ``(key, content)`` pairs
+        """
         db = cls._conn()
-        encoded = _encode_key(prefix)
         table = _table(prefix)
+        allowed = _COLUMNS.get(table, ())
+        unknown = [name for name in where if name not in allowed]
+        if unknown:
+            raise ValueError(f"Unsupported filter for {table}: {', '.join(unknown)}")
+        clauses = ["key >= ?", "key < ?"]
+        params: list[Any] = list(_prefix_range(prefix))
+        for name, value in where.items():
+            clauses.append(f"{name} = ?")
+            params.append(value)
         rows = db.execute(
-            f"SELECT key FROM {table} WHERE key LIKE ? ORDER BY key",
-            (encoded + "/%",),
+            f"SELECT key, data FROM {table} WHERE {' AND '.join(clauses)} ORDER BY key",
+            params,
+        ).fetchall()
+        return [(_decode_key(row[0]), json.loads(row[1])) for row in rows]
+
+    @classmethod
+    async def list(cls, prefix: list[str]) -> list[list[str]]:
+        db = cls._conn()
+        rows = db.execute(
+            f"SELECT key FROM {_table(prefix)} WHERE key >= ? AND key < ? ORDER BY key",
+            _prefix_range(prefix),
         ).fetchall()
         return [_decode_key(row[0]) for row in rows]
 
+    # ------------------------------------------------------------------
+    # Schema migration
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def _migrate_schema(cls) -> None:
+        """Add lookup columns and indexes to key/value tables created by older versions."""
+        db = cls._db
+        version = db.execute("PRAGMA user_version").fetchone()[0]
+        if version >= _SCHEMA_VERSION:
+            return
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            # Another process may have migrated while we waited for the lock.
+            if db.execute("PRAGMA user_version").fetchone()[0] >= _SCHEMA_VERSION:
+                db.execute("COMMIT")
+                return
+            for table, columns in _COLUMNS.items():
+                existing = {row[1] for row in db.execute(f"PRAGMA table_info({table})")}
+                for column in columns:
+                    if column not in existing:
+                        db.execute(f"ALTER TABLE {table} ADD COLUMN {column} TEXT")
+                rows = db.execute(f"SELECT key, data FROM {table}").fetchall()
+                names = ", ".join(f"{column} = ?" for column in columns)
+                updates = []
+                for encoded, raw in rows:
+                    try:
+                        content = json.loads(raw)
+                    except ValueError:
+                        content = None
+                    updates.append((*_columns(table, _decode_key(encoded), content), encoded))
+                db.executemany(f"UPDATE {table} SET {names} WHERE key = ?", updates)
+                if updates:
+                    log.info("backfilled storage lookup columns", {"table": table, "count": len(updates)})
+            for statement in _INDEXES:
+                db.execute(statement)
+            db.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            db.execute("COMMIT")
+        except Exception:
+            db.execute("ROLLBACK")
+            raise
+
     # ------------------------------------------------------------------
     # JSON migration
     # ------------------------------------------------------------------
@@ -252,10 +366,7 @@ class Storage:
                         content = json.load(f)
                 except Exception:
                     continue
-                cls._db.execute(
-                    f"INSERT OR IGNORE INTO {_table(key)} (key, data) VALUES (?, ?)",
-                    (_encode_key(key), json.dumps(content, ensure_ascii=False)),
-                )
+                _upsert(cls._db, key, content, replace=False)
                 count += 1
         if count > 0:
             cls._db.commit()
@@ -17,6 +17,7 @@ from ..patch import (
     derive_new_contents_from_chunks,
     parse_patch,
 )
+from ..snapshot import SnapshotTracker
 from .edit import trim_diff
 from .external_directory import assert_external_directory
 from .lsp_feedback import append_lsp_error_feedback
@@ -206,6 +207,9 @@ async def apply_patch_execute(params: ApplyPatchParams, ctx: ToolContext) -> Too
             change.file_path.unlink()
         elif change.change_type == "delete":
             change.file_path.unlink()
+    SnapshotTracker.mark_changed(
+        str(path) for change in changes for path in (change.file_path, change.move_path) if path is not None
+    )
 
     summary = []
     for change in changes:
@@ -227,6 +231,7 @@ async def apply_patch_execute(params: ApplyPatchParams, ctx: ToolContext) -> Too
             output,
             target,
             include_project_files=False,
+            content=change.new_content,
         )
         diagnostics.update(per_file)
 
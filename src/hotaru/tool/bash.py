@@ -6,21 +6,28 @@ import shlex
 import shutil
 import sys
 from pathlib import Path
-from typing import Optional, Set
+from typing import Optional, Set, Tuple
 
 from pydantic import BaseModel, Field
 
 from ..permission.arity import BashArity
+from ..snapshot import SnapshotTracker
 from ..util.log import Log
 from .external_directory import assert_external_directory
 from .tool import PermissionSpec, Tool, ToolContext, ToolResult
-from .truncation import Truncate
+from .truncation import OutputSpool, Truncate
 
 log = Log.create({"service": "bash"})
 
 MAX_METADATA_LENGTH = 30_000
 DEFAULT_TIMEOUT = 2 * 60 * 1000  # 2 minutes in ms
 
+READ_CHUNK_BYTES = 64 * 1024
+# Minimum interval between live output updates, in seconds.
+METADATA_INTERVAL = 0.2
+# Time allowed for pipes to close after the command was killed.
+KILL_GRACE = 1.0
+
 
 class BashParams(BaseModel):
     """Parameters for the Bash tool."""
@@ -266,6 +273,78 @@ async def bash_permissions(params: BashParams, ctx: ToolContext) -> list[Permiss
     return specs
 
 
+async def _pump(stream: Optional[asyncio.StreamReader], spool: OutputSpool, changed: asyncio.Event) -> None:
+    if stream is None:
+        return
+    while True:
+        chunk = await stream.read(READ_CHUNK_BYTES)
+        if not chunk:
+            return
+        spool.write(chunk)
+        changed.set()
+
+
+def _kill(proc: asyncio.subprocess.Process) -> None:
+    if proc.returncode is None:
+        try:
+            proc.kill()
+        except ProcessLookupError:
+            pass
+
+
+async def _stream_output(
+    proc: asyncio.subprocess.Process,
+    spool: OutputSpool,
+    ctx: ToolContext,
+    description: str,
+    timeout_sec: float,
+) -> Tuple[bool, bool]:
+    """Read stdout and stderr into *spool* until the command exits.
+
+    Publishes the latest output through ``ctx.metadata`` at most every
+    ``METADATA_INTERVAL`` seconds.  Returns ``(timed_out, aborted)``.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout_sec
+    changed = asyncio.Event()
+    readers = [
+        asyncio.create_task(_pump(proc.stdout, spool, changed)),
+        asyncio.create_task(_pump(proc.stderr, spool, changed)),
+    ]
+    finished = asyncio.ensure_future(asyncio.gather(*readers, proc.wait()))
+    timed_out = aborted = False
+    try:
+        while not finished.done():
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                timed_out = True
+                break
+            await asyncio.wait([finished], timeout=min(METADATA_INTERVAL, remaining))
+            if changed.is_set() and not finished.done():
+                changed.clear()
+                ctx.metadata(metadata={
+                    "output": spool.preview(MAX_METADATA_LENGTH),
+                    "description": description,
+                })
+            if ctx.aborted:
+                aborted = True
+                break
+        if not finished.done():
+            _kill(proc)
+            # Background children may keep the pipes open after the shell died.
+            await asyncio.wait([finished], timeout=KILL_GRACE)
+    finally:
+        if not finished.done():
+            _kill(proc)
+            finished.cancel()
+            for reader in readers:
+                reader.cancel()
+            await asyncio.gather(finished, *readers, return_exceptions=True)
+        if proc.returncode is None:
+            await proc.wait()
+    return timed_out, aborted or ctx.aborted
+
+
 async def bash_execute(params: BashParams, ctx: ToolContext) -> ToolResult:
     """Execute the bash tool."""
     cwd = str(_resolve_cwd(params, ctx))
@@ -304,34 +383,15 @@ async def bash_execute(params: BashParams, ctx: ToolContext) -> ToolResult:
                 cwd=cwd,
             )
 
-        timed_out = False
-        aborted = False
-
+        spool = OutputSpool()
         try:
-            stdout, stderr = await asyncio.wait_for(
-                proc.communicate(),
-                timeout=timeout_sec
-            )
-        except asyncio.TimeoutError:
-            timed_out = True
-            proc.kill()
-            stdout, stderr = await proc.communicate()
-
-        if ctx.aborted:
-            aborted = True
-            try:
-                proc.kill()
-            except Exception:
-                pass
-
-        # Combine output
-        output = ""
-        if stdout:
-            output += stdout.decode("utf-8", errors="replace")
-        if stderr:
-            if output:
-                output += "\n"
-            output += stderr.decode("utf-8", errors="replace")
+            timed_out, aborted = await _stream_output(proc, spool, ctx, params.description, timeout_sec)
+        finally:
+            spool.close()
+            # The command may have changed any file.
+            SnapshotTracker.mark_unknown()
+
+        output = spool.text()
 
         # Add metadata about termination
         result_metadata = []
@@ -348,14 +408,20 @@ async def bash_execute(params: BashParams, ctx: ToolContext) -> ToolResult:
         if len(display_output) > MAX_METADATA_LENGTH:
             display_output = display_output[:MAX_METADATA_LENGTH] + "\n\n..."
 
+        metadata = {
+            "output": display_output,
+            "exit": proc.returncode,
+            "description": params.description,
+        }
+        if spool.spilled:
+            # The output is already cut down and saved; skip auto-truncation.
+            metadata["truncated"] = True
+            metadata["output_path"] = str(spool.output_path)
+
         return ToolResult(
             title=params.description,
             output=output,
-            metadata={
-                "output": display_output,
-                "exit": proc.returncode,
-                "description": params.description,
-            }
+            metadata=metadata,
         )
 
     except Exception as e:
@@ -0,0 +1,363 @@
+"""Matching engine for the edit tool.
+
+``replace`` tries a chain of replacers, from exact to increasingly fuzzy,
+to locate ``old_string`` in a file.  All replacers share one ``LineIndex``
+of the content (line offsets, stripped and whitespace-normalized lines,
+line positions by stripped text), so each is linear in the file size
+instead of re-splitting the content and re-summing line lengths.  Fuzzy
+block scoring ranks anchor pairs by a cheap length bound, stops once no
+remaining pair can beat the best one, uses a banded, early-exit edit
+distance, and scores at most ``MAX_ANCHOR_CANDIDATES`` pairs.
+
+The matcher is CPU-bound; the edit tool runs it off the event loop.
+"""
+
+from __future__ import annotations
+
+import bisect
+import re
+from typing import Callable, Dict, Generator, List, Optional
+
+# Similarity thresholds for fuzzy matching
+SINGLE_CANDIDATE_THRESHOLD = 0.0
+MULTIPLE_CANDIDATES_THRESHOLD = 0.3
+
+# Anchor (first/last line) pairs fully scored by the block anchor replacer,
+# taken in order of their length-based similarity bound.
+MAX_ANCHOR_CANDIDATES = 1000
+
+_WHITESPACE = re.compile(r"\s+")
+# Absorbs float rounding when comparing similarity bounds.
+_EPSILON = 1e-9
+
+
+def _normalize(text: str) -> str:
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def levenshtein(a: str, b: str, limit: Optional[int] = None) -> int:
+    """Levenshtein distance between *a* and *b*.
+
+    With *limit*, only a band of width ``2 * limit + 1`` is computed and
+    ``limit + 1`` is returned as soon as the distance must exceed it.
+    """
+    # Common prefix and suffix never contribute to the distance.
+    start = 0
+    shortest = min(len(a), len(b))
+    while start < shortest and a[start] == b[start]:
+        start += 1
+    end_a, end_b = len(a), len(b)
+    while end_a > start and end_b > start and a[end_a - 1] == b[end_b - 1]:
+        end_a -= 1
+        end_b -= 1
+    a, b = a[start:end_a], b[start:end_b]
+    if len(a) < len(b):
+        a, b = b, a
+    if limit is not None and len(a) - len(b) > limit:
+        return limit + 1
+    if not b:
+        return len(a)
+
+    # Cells outside the band are at least ``band + 1`` away; clamp them there.
+    band = len(a) if limit is None else limit
+    outside = band + 1
+    previous = [j if j <= band else outside for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        low = max(1, i - band)
+        high = min(len(b), i + band)
+        current = [outside] * (len(b) + 1)
+        if i <= band:
+            current[0] = i
+        char = a[i - 1]
+        row_min = current[0]
+        for j in range(low, high + 1):
+            value = previous[j - 1] + (char != b[j - 1])
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if current[j - 1] + 1 < value:
+                value = current[j - 1] + 1
+            current[j] = value
+            if value < row_min:
+                row_min = value
+        if limit is not None and row_min > limit:
+            return limit + 1
+        previous = current
+    distance = previous[len(b)]
+    if limit is not None and distance > limit:
+        return limit + 1
+    return distance
+
+
+class LineIndex:
+    """Line-level views of one file's content, computed on first use."""
+
+    def __init__(self, content: str) -> None:
+        self.content = content
+        self.lines = content.split("\n")
+        self._offsets: Optional[List[int]] = None
+        self._stripped: Optional[List[str]] = None
+        self._normalized: Optional[List[str]] = None
+        self._positions: Optional[Dict[str, List[int]]] = None
+
+    @property
+    def offsets(self) -> List[int]:
+        """Start offset of every line."""
+        if self._offsets is None:
+            offsets = [0] * len(self.lines)
+            position = 0
+            for index, line in enumerate(self.lines):
+                offsets[index] = position
+                position += len(line) + 1
+            self._offsets = offsets
+        return self._offsets
+
+    @property
+    def stripped(self) -> List[str]:
+        if self._stripped is None:
+            self._stripped = [line.strip() for line in self.lines]
+        return self._stripped
+
+    @property
+    def normalized(self) -> List[str]:
+        if self._normalized is None:
+            self._normalized = [_normalize(line) for line in self.lines]
+        return self._normalized
+
+    def positions(self, stripped: str) -> List[int]:
+        """Ascending indexes of the lines whose stripped text is *stripped*."""
+        if self._positions is None:
+            positions: Dict[str, List[int]] = {}
+            for index, line in enumerate(self.stripped):
+                positions.setdefault(line, []).append(index)
+            self._positions = positions
+        return self._positions.get(stripped, [])
+
+    def block(self, start: int, end: int) -> str:
+        """Content of lines ``start`` through ``end`` (inclusive)."""
+        return self.content[self.offsets[start]:self.offsets[end] + len(self.lines[end])]
+
+
+# Replacer type
+Replacer = Generator[str, None, None]
+
+
+def simple_replacer(index: LineIndex, find: str) -> Replacer:
+    """Direct string match."""
+    yield find
+
+
+def line_trimmed_replacer(index: LineIndex, find: str) -> Replacer:
+    """Match with trimmed line comparison."""
+    search_lines = find.split("\n")
+
+    if search_lines and search_lines[-1] == "":
+        search_lines.pop()
+
+    if not search_lines:
+        yield ""
+        return
+
+    search = [line.strip() for line in search_lines]
+    stripped = index.stripped
+    last_start = len(stripped) - len(search)
+    for i in index.positions(search[0]):
+        if i > last_start:
+            break
+        if all(stripped[i + j] == search[j] for j in range(1, len(search))):
+            yield index.block(i, i + len(search) - 1)
+
+
+def _similarity_bound(stripped: List[str], search: List[str], start: int, lines_to_check: int) -> float:
+    """Upper bound of ``_block_similarity`` from line lengths alone."""
+    if lines_to_check <= 0:
+        return 1.0
+    total = 0.0
+    for j in range(1, lines_to_check + 1):
+        a, b = len(stripped[start + j]), len(search[j])
+        if a or b:
+            total += 1 - abs(a - b) / max(a, b)
+    return total / lines_to_check
+
+
+def _block_similarity(
+    stripped: List[str],
+    search: List[str],
+    start: int,
+    lines_to_check: int,
+    needed: float,
+) -> Optional[float]:
+    """Mean similarity of the middle lines of a candidate block.
+
+    Returns None as soon as the summed similarity can no longer reach
+    *needed* (each unscored line counts as a perfect match).
+    """
+    total = 0.0
+    for j in range(1, lines_to_check + 1):
+        # Best case for this and every later line.
+        slack = total + 1 + (lines_to_check - j) - needed
+        orig = stripped[start + j]
+        wanted = search[j]
+        max_len = max(len(orig), len(wanted))
+        if max_len == 0:
+            if slack - 1 < -_EPSILON:
+                return None
+            continue
+        if slack < -_EPSILON:
+            return None
+        limit: Optional[int] = max(0, int(max_len * slack + _EPSILON))
+        if limit >= max_len:
+            limit = None
+        dist = levenshtein(orig, wanted, limit)
+        if limit is not None and dist > limit:
+            return None
+        total += 1 - dist / max_len
+    return total / lines_to_check
+
+
+def block_anchor_replacer(index: LineIndex, find: str) -> Replacer:
+    """Match using first/last line anchors with fuzzy middle."""
+    search_lines = find.split("\n")
+
+    if len(search_lines) < 3:
+        return
+
+    if search_lines and search_lines[-1] == "":
+        search_lines.pop()
+
+    first_line = search_lines[0].strip()
+    last_line = search_lines[-1].strip()
+
+    ends = index.positions(last_line)
+    candidates = []
+    for i in index.positions(first_line):
+        k = bisect.bisect_left(ends, i + 2)
+        if k < len(ends):
+            candidates.append((i, ends[k]))
+
+    if not candidates:
+        return
+
+    if len(candidates) == 1:
+        start, end = candidates[0]
+        yield index.block(start, end)
+        return
+
+    # Multiple candidates - find best match.  Score the most promising
+    # first so later ones are pruned early; ties go to the earliest block.
+    stripped = index.stripped
+    search = [line.strip() for line in search_lines]
+    search_size = len(search)
+    ranked = []
+    for position, (start, end) in enumerate(candidates):
+        lines_to_check = min(search_size - 2, end - start - 1)
+        bound = _similarity_bound(stripped, search, start, lines_to_check)
+        ranked.append((-bound, position, start, end, lines_to_check))
+    ranked.sort()
+
+    best_match = None
+    best_position = len(candidates)
+    max_similarity = -1.0
+
+    for negative_bound, position, start, end, lines_to_check in ranked[:MAX_ANCHOR_CANDIDATES]:
+        if -negative_bound < max_similarity - _EPSILON:
+            break
+
+        if lines_to_check <= 0:
+            similarity = 1.0
+        else:
+            similarity = _block_similarity(
+                stripped, search, start, lines_to_check, max_similarity * lines_to_check
+            )
+            if similarity is None:
+                continue
+
+        if similarity > max_similarity or (similarity == max_similarity and position < best_position):
+            max_similarity = similarity
+            best_match = (start, end)
+            best_position = position
+
+    if max_similarity >= MULTIPLE_CANDIDATES_THRESHOLD and best_match:
+        start, end = best_match
+        yield index.block(start, end)
+
+
+def whitespace_normalized_replacer(index: LineIndex, find: str) -> Replacer:
+    """Match with normalized whitespace."""
+    normalized_find = _normalize(find)
+    lines = index.lines
+    normalized = index.normalized
+
+    for i, line in enumerate(normalized):
+        if line == normalized_find:
+            yield lines[i]
+
+    # Multi-line matches
+    size = len(find.split("\n"))
+    if size > 1:
+        for i in range(len(lines) - size + 1):
+            head = normalized[i]
+            if head and not normalized_find.startswith(head):
+                continue
+            if " ".join(line for line in normalized[i:i + size] if line) == normalized_find:
+                yield "\n".join(lines[i:i + size])
+
+
+def trimmed_boundary_replacer(index: LineIndex, find: str) -> Replacer:
+    """Match with trimmed boundaries."""
+    trimmed = find.strip()
+    if trimmed == find:
+        return
+
+    if trimmed in index.content:
+        yield trimmed
+
+
+REPLACERS: List[Callable[[LineIndex, str], Replacer]] = [
+    simple_replacer,
+    line_trimmed_replacer,
+    block_anchor_replacer,
+    whitespace_normalized_replacer,
+    trimmed_boundary_replacer,
+]
+
+
+def replace(content: str, old_string: str, new_string: str, replace_all: bool = False) -> str:
+    """Replace old_string with new_string in content.
+
+    Tries multiple matching strategies in order of specificity.
+    """
+    if old_string == new_string:
+        raise ValueError("old_string and new_string must be different")
+
+    not_found = True
+    index = LineIndex(content)
+    # A search text gives the same outcome each time; check it once.
+    tried = set()
+
+    for replacer_fn in REPLACERS:
+        for search in replacer_fn(index, old_string):
+            if search in tried:
+                continue
+            tried.add(search)
+            position = content.find(search)
+            if position == -1:
+                continue
+
+            not_found = False
+
+            if replace_all:
+                return content.replace(search, new_string)
+
+            last_position = content.rfind(search)
+            if position != last_position:
+                continue
+
+            return content[:position] + new_string + content[position + len(search):]
+
+    if not_found:
+        raise ValueError("old_string not found in content")
+
+    raise ValueError(
+        "Found multiple matches for old_string. "
+        "Provide more surrounding lines in old_string to identify the correct match."
+    )
@@ -1,12 +1,12 @@
 """Glob tool for finding files by pattern."""
 
-import os
 from fnmatch import fnmatch
 from pathlib import Path
 from typing import List, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
+from ..project.file_index import FileIndex
 from ..util.log import Log
 from .external_directory import assert_external_directory
 from .tool import PermissionSpec, Tool, ToolContext, ToolResult
@@ -29,9 +29,19 @@ class GlobParams(BaseModel):
     )
 
 
-def _match_glob(root: Path, pattern: str, limit: int = 100) -> List[Tuple[Path, float]]:
-    """Match files against a glob pattern.
+def _match_segments(rel_path: str, pattern: str) -> bool:
+    """Match *rel_path* against a non-recursive glob, one path segment at a time."""
+    parts = rel_path.split("/")
+    segments = pattern.replace("\\", "/").strip("/").split("/")
+    if len(parts) != len(segments):
+        return False
+    return all(fnmatch(part, segment) for part, segment in zip(parts, segments))
 
+
+def _match_glob(root: Path, candidates: List[str], pattern: str, limit: int = 100) -> List[Tuple[Path, float]]:
+    """Match indexed files under *root* against a glob pattern.
+
+    *candidates* are the indexed paths relative to *root*.
     Returns list of (path, mtime) tuples.
     """
     results: List[Tuple[Path, float]] = []
@@ -40,62 +50,42 @@ def _match_glob(root: Path, pattern: str, limit: int = 100) -> List[Tuple[Path,
     if "**" in pattern:
         # Split pattern at **
         parts = pattern.split("**")
-        prefix = parts[0].rstrip("/\\")
+        prefix = parts[0].replace("\\", "/").strip("/")
         suffix = parts[1].lstrip("/\\") if len(parts) > 1 else ""
 
-        search_root = root / prefix if prefix else root
-
-        if not search_root.exists():
-            return results
-
-        for dirpath, dirnames, filenames in os.walk(search_root):
-            # Skip hidden directories
-            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
-
-            for filename in filenames:
-                if filename.startswith("."):
-                    continue
-
-                filepath = Path(dirpath) / filename
-
-                # Check suffix pattern
-                if suffix:
-                    rel_path = str(filepath.relative_to(search_root))
-                    if not fnmatch(rel_path, f"*{suffix}") and not fnmatch(filename, suffix):
-                        continue
+        def matches(rel_path: str) -> bool:
+            if prefix:
+                if not rel_path.startswith(prefix + "/"):
+                    return False
+                rel_path = rel_path[len(prefix) + 1:]
+            # Skip hidden files and directories
+            if any(part.startswith(".") for part in rel_path.split("/")):
+                return False
+            if not suffix:
+                return True
+            return fnmatch(rel_path, f"*{suffix}") or fnmatch(rel_path.rsplit("/", 1)[-1], suffix)
+
+    elif "/" in pattern or "\\" in pattern:
+        # Pattern includes directory
+        def matches(rel_path: str) -> bool:
+            return not rel_path.rsplit("/", 1)[-1].startswith(".") and _match_segments(rel_path, pattern)
 
-                try:
-                    mtime = filepath.stat().st_mtime
-                    results.append((filepath, mtime))
-                    if len(results) >= limit:
-                        return results
-                except (OSError, PermissionError):
-                    continue
     else:
-        # Simple pattern without **
-        if "/" in pattern or "\\" in pattern:
-            # Pattern includes directory
-            for filepath in root.glob(pattern):
-                if filepath.is_file() and not filepath.name.startswith("."):
-                    try:
-                        mtime = filepath.stat().st_mtime
-                        results.append((filepath, mtime))
-                        if len(results) >= limit:
-                            return results
-                    except (OSError, PermissionError):
-                        continue
-        else:
-            # Pattern is just filename
-            for filepath in root.iterdir():
-                if filepath.is_file() and fnmatch(filepath.name, pattern):
-                    if not filepath.name.startswith("."):
-                        try:
-                            mtime = filepath.stat().st_mtime
-                            results.append((filepath, mtime))
-                            if len(results) >= limit:
-                                return results
-                        except (OSError, PermissionError):
-                            continue
+        # Pattern is just filename
+        def matches(rel_path: str) -> bool:
+            return "/" not in rel_path and not rel_path.startswith(".") and fnmatch(rel_path, pattern)
+
+    for rel_path in candidates:
+        if not matches(rel_path):
+            continue
+        filepath = root / rel_path
+        try:
+            mtime = filepath.stat().st_mtime
+        except (OSError, PermissionError):
+            continue
+        results.append((filepath, mtime))
+        if len(results) >= limit:
+            break
 
     return results
 
@@ -112,7 +102,9 @@ async def glob_execute(params: GlobParams, ctx: ToolContext) -> ToolResult:
         raise ValueError(f"Path is not a directory: {search_path}")
 
     limit = 100
-    files = _match_glob(search_path, params.pattern, limit + 1)
+    index = FileIndex.for_path(search_path, roots=(ctx.worktree, ctx.cwd))
+    candidates = await index.files(search_path)
+    files = _match_glob(search_path, candidates, params.pattern, limit + 1)
 
     # Check if truncated
     truncated = len(files) > limit
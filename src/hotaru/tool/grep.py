@@ -3,13 +3,14 @@
 import asyncio
 import os
 import re
-import shutil
-from pathlib import Path
-from typing import List, Optional, Tuple
+from pathlib import Path, PurePath, PurePosixPath
+from typing import Dict, List, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
+from ..project.file_index import FileIndex
 from ..util.log import Log
+from . import grep_engine
 from .external_directory import assert_external_directory
 from .tool import PermissionSpec, Tool, ToolContext, ToolResult
 
@@ -17,8 +18,6 @@ log = Log.create({"service": "grep"})
 
 DESCRIPTION = (Path(__file__).parent / "grep.txt").read_text(encoding="utf-8")
 
-MAX_LINE_LENGTH = 2000
-
 
 class GrepParams(BaseModel):
     """Parameters for the Grep tool."""
@@ -27,32 +26,7 @@ class GrepParams(BaseModel):
     include: Optional[str] = Field(None, description='File pattern to include in the search (e.g. "*.py", "*.{ts,tsx}")')
 
 
-def _search_file(
-    filepath: Path,
-    pattern: re.Pattern,
-    max_matches: int = 100
-) -> List[Tuple[int, str]]:
-    """Search a file for pattern matches.
-
-    Returns list of (line_number, line_text) tuples.
-    """
-    matches = []
-    try:
-        with open(filepath, "r", encoding="utf-8", errors="replace") as f:
-            for line_num, line in enumerate(f, 1):
-                if pattern.search(line):
-                    # Truncate long lines
-                    if len(line) > MAX_LINE_LENGTH:
-                        line = line[:MAX_LINE_LENGTH] + "..."
-                    matches.append((line_num, line.rstrip()))
-                    if len(matches) >= max_matches:
-                        break
-    except (OSError, PermissionError, UnicodeDecodeError):
-        pass
-    return matches
-
-
-def _should_include(filepath: Path, include_pattern: Optional[str]) -> bool:
+def _should_include(filepath: PurePath, include_pattern: Optional[str]) -> bool:
     """Check if a file matches the include pattern."""
     if not include_pattern:
         return True
@@ -74,6 +48,19 @@ def _should_include(filepath: Path, include_pattern: Optional[str]) -> bool:
     return fnmatch(filepath.name, include_pattern)
 
 
+def _candidates(index: FileIndex, search_path: Path, include: Optional[str]) -> List[str]:
+    """Indexed files under *search_path* that grep should search."""
+    root = str(search_path)
+    files: List[str] = []
+    for rel_path in index.files_sync(search_path):
+        # Skip hidden files and directories
+        if rel_path.startswith(".") or "/." in rel_path:
+            continue
+        if _should_include(PurePosixPath(rel_path), include):
+            files.append(os.path.join(root, rel_path))
+    return files
+
+
 async def grep_execute(params: GrepParams, ctx: ToolContext) -> ToolResult:
     """Execute the grep tool."""
     if not params.pattern:
@@ -98,41 +85,20 @@ async def grep_execute(params: GrepParams, ctx: ToolContext) -> ToolResult:
 
     if search_path.is_file():
         # Search single file
-        if _should_include(search_path, params.include):
-            mtime = search_path.stat().st_mtime
-            for line_num, line_text in _search_file(search_path, pattern):
-                all_matches.append((search_path, mtime, line_num, line_text))
-                if len(all_matches) >= limit:
-                    break
+        files = [str(search_path)] if _should_include(search_path, params.include) else []
     else:
-        # Search directory recursively
-        for dirpath, dirnames, filenames in os.walk(search_path):
-            # Skip hidden directories
-            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
-
-            for filename in filenames:
-                if filename.startswith("."):
-                    continue
-
-                filepath = Path(dirpath) / filename
-
-                if not _should_include(filepath, params.include):
-                    continue
-
-                try:
-                    mtime = filepath.stat().st_mtime
-                    for line_num, line_text in _search_file(filepath, pattern, limit - len(all_matches)):
-                        all_matches.append((filepath, mtime, line_num, line_text))
-                        if len(all_matches) >= limit:
-                            break
-                except (OSError, PermissionError):
-                    continue
-
-                if len(all_matches) >= limit:
-                    break
-
-            if len(all_matches) >= limit:
-                break
+        # Search indexed files recursively
+        index = FileIndex.for_path(search_path, roots=(ctx.worktree, ctx.cwd))
+        files = await asyncio.to_thread(_candidates, index, search_path, params.include)
+
+    mtimes: Dict[str, float] = {}
+    for match in await grep_engine.search(files, pattern, limit=limit, aborted=lambda: ctx.aborted):
+        if match.path not in mtimes:
+            try:
+                mtimes[match.path] = os.stat(match.path).st_mtime
+            except OSError:
+                continue
+        all_matches.append((Path(match.path), mtimes[match.path], match.line_number, match.text))
 
     # Check truncation
     truncated = len(all_matches) >= limit
@@ -0,0 +1,267 @@
+"""Content search engine for the grep tool.
+
+Searches run off the event loop: through ``rg --json`` when ripgrep is on
+PATH, otherwise through a thread pool scanning files in chunks.  Both
+backends search an explicit list of candidate files (from the workspace
+file index), stop at the match limit, skip binary files and honor
+``ToolContext.aborted``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import re
+import shutil
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from ..util.log import Log
+
+log = Log.create({"service": "grep.engine"})
+
+MAX_LINE_LENGTH = 2000
+
+# Bytes inspected for a NUL byte before a file is treated as binary.
+BINARY_SNIFF_BYTES = 8192
+
+# rg is run over batches of explicit paths to stay well under ARG_MAX.
+RG_BATCH_CHARS = 512 * 1024
+
+# JSON lines for long (e.g. minified) matching lines exceed asyncio's 64 KiB default.
+RG_LINE_LIMIT = 16 * 1024 * 1024
+
+# Files per worker chunk and concurrent chunks for the Python scanner.
+SCAN_CHUNK_FILES = 128
+SCAN_WORKERS = 4
+
+
+@dataclass
+class Match:
+    path: str
+    line_number: int
+    text: str
+
+
+class _RipgrepFailed(Exception):
+    """ripgrep could not run the search (e.g. unsupported regex syntax)."""
+
+
+def _clip(line: str) -> str:
+    if len(line) > MAX_LINE_LENGTH:
+        line = line[:MAX_LINE_LENGTH] + "..."
+    return line.rstrip()
+
+
+def rg_path() -> Optional[str]:
+    return shutil.which("rg")
+
+
+async def search(
+    files: Sequence[str],
+    pattern: re.Pattern[str],
+    *,
+    limit: int,
+    aborted: Callable[[], bool] = lambda: False,
+) -> List[Match]:
+    """Return up to *limit* matching lines, in *files* order then line order."""
+    if not files or limit <= 0:
+        return []
+    rg = rg_path()
+    if rg:
+        try:
+            return await _search_rg(rg, files, pattern.pattern, limit=limit, aborted=aborted)
+        except _RipgrepFailed as e:
+            log.debug("ripgrep failed, using python scanner", {"error": str(e)})
+    return await _search_python(files, pattern, limit=limit, aborted=aborted)
+
+
+# ---------------------------------------------------------------------------
+# ripgrep backend
+# ---------------------------------------------------------------------------
+
+
+def _batches(files: Sequence[str]) -> Iterator[List[str]]:
+    batch: List[str] = []
+    size = 0
+    for path in files:
+        if batch and size + len(path) > RG_BATCH_CHARS:
+            yield batch
+            batch, size = [], 0
+        batch.append(path)
+        size += len(path) + 1
+    if batch:
+        yield batch
+
+
+def _is_binary(path: str) -> bool:
+    try:
+        with open(path, "rb") as f:
+            return b"\0" in f.read(BINARY_SNIFF_BYTES)
+    except OSError:
+        return True
+
+
+def _rg_text(value: Dict[str, Any]) -> str:
+    if "text" in value:
+        return str(value["text"])
+    return base64.b64decode(value.get("bytes", "")).decode("utf-8", errors="replace")
+
+
+async def _search_rg(
+    rg: str,
+    files: Sequence[str],
+    pattern: str,
+    *,
+    limit: int,
+    aborted: Callable[[], bool],
+) -> List[Match]:
+    matches: List[Match] = []
+    for batch in _batches(files):
+        if aborted() or len(matches) >= limit:
+            break
+        remaining = limit - len(matches)
+        try:
+            # --sort path runs single-threaded, which keeps results in argument
+            # order; --max-count stops rg inside a file with many hits.
+            proc = await asyncio.create_subprocess_exec(
+                rg, "--json", "--no-config", "--no-ignore", "--hidden", "--sort", "path",
+                "--max-count", str(remaining), "--regexp", pattern, "--", *batch,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                limit=RG_LINE_LIMIT,
+            )
+        except OSError as e:
+            raise _RipgrepFailed(str(e)) from e
+        found = len(matches)
+        stopped = False
+        pending: List[Match] = []
+        skipped: Optional[str] = None
+        try:
+            assert proc.stdout is not None
+            async for raw in proc.stdout:
+                if aborted():
+                    stopped = True
+                    break
+                event = json.loads(raw)
+                kind = event.get("type")
+                data = event.get("data", {})
+                if kind == "match":
+                    path = _rg_text(data["path"])
+                    if path == skipped:
+                        continue
+                    pending.append(
+                        Match(
+                            path=path,
+                            line_number=int(data.get("line_number") or 0),
+                            text=_clip(_rg_text(data["lines"])),
+                        )
+                    )
+                    if len(matches) + len(pending) < limit:
+                        continue
+                    # The limit is reached before rg reports whether the file
+                    # is binary; sniff it the way the python scanner does.
+                    if await asyncio.to_thread(_is_binary, path):
+                        skipped = path
+                        pending = []
+                        continue
+                    matches.extend(pending)
+                    stopped = True
+                    break
+                elif kind == "end":
+                    # Matches are only kept once the file is known not to be binary.
+                    if data.get("binary_offset") is None and _rg_text(data["path"]) != skipped:
+                        matches.extend(pending)
+                    pending = []
+                    if len(matches) >= limit:
+                        stopped = True
+                        break
+        finally:
+            if stopped and proc.returncode is None:
+                try:
+                    proc.kill()
+                except ProcessLookupError:
+                    pass
+            _, stderr = await proc.communicate()
+        # Exit code 2 with partial results means unreadable files; without
+        # any output the search itself failed (e.g. regex parse error).
+        if not stopped and proc.returncode not in (0, 1) and len(matches) == found:
+            raise _RipgrepFailed(stderr.decode("utf-8", errors="replace").strip())
+    return matches[:limit]
+
+
+# ---------------------------------------------------------------------------
+# Python backend
+# ---------------------------------------------------------------------------
+
+
+def _scan_file(path: str, pattern: re.Pattern[str], limit: int, stop: threading.Event) -> List[Match]:
+    found: List[Match] = []
+    try:
+        with open(path, "rb") as f:
+            if b"\0" in f.read(BINARY_SNIFF_BYTES):
+                return found
+            f.seek(0)
+            for line_number, raw in enumerate(f, 1):
+                line = raw.decode("utf-8", errors="replace")
+                if pattern.search(line):
+                    found.append(Match(path=path, line_number=line_number, text=_clip(line)))
+                    if len(found) >= limit or stop.is_set():
+                        break
+    except OSError:
+        pass
+    return found
+
+
+def _scan_chunk(
+    files: Sequence[str],
+    pattern: re.Pattern[str],
+    limit: int,
+    stop: threading.Event,
+) -> List[Match]:
+    found: List[Match] = []
+    for path in files:
+        if stop.is_set() or len(found) >= limit:
+            break
+        found.extend(_scan_file(path, pattern, limit - len(found), stop))
+    return found
+
+
+async def _search_python(
+    files: Sequence[str],
+    pattern: re.Pattern[str],
+    *,
+    limit: int,
+    aborted: Callable[[], bool],
+) -> List[Match]:
+    stop = threading.Event()
+    chunks = [files[i:i + SCAN_CHUNK_FILES] for i in range(0, len(files), SCAN_CHUNK_FILES)]
+    results: List[Optional[List[Match]]] = [None] * len(chunks)
+    matches: List[Match] = []
+    next_chunk = 0
+    running: Dict[asyncio.Task[List[Match]], int] = {}
+    merged = 0
+    try:
+        while merged < len(chunks):
+            while next_chunk < len(chunks) and len(running) < SCAN_WORKERS and not stop.is_set():
+                task = asyncio.create_task(asyncio.to_thread(_scan_chunk, chunks[next_chunk], pattern, limit, stop))
+                running[task] = next_chunk
+                next_chunk += 1
+            if not running:
+                break
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                results[running.pop(task)] = task.result()
+            # Merge completed chunks in file order.
+            while merged < len(chunks) and results[merged] is not None:
+                matches.extend(results[merged] or [])
+                merged += 1
+            if len(matches) >= limit or aborted():
+                stop.set()
+    finally:
+        stop.set()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+    return matches[:limit]
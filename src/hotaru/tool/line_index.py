@@ -0,0 +1,175 @@
+"""Line-offset index for reading windows of large text files.
+
+The read tool pages through files by line number.  Instead of loading and
+splitting the whole file on every call, ``read_window`` seeks close to the
+requested line using a sparse index of ``(line, byte offset)`` checkpoints
+(one per scanned chunk) and streams only the requested lines.  Indexes are
+cached per path and dropped when the file's mtime or size changes; they are
+extended lazily, so reading the head of a huge file never scans its tail.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import BinaryIO, List, Optional, Tuple
+
+# Bytes scanned per step while extending an index; one checkpoint per chunk.
+SCAN_CHUNK = 1024 * 1024
+
+# Block size used to skip from a checkpoint to the requested line.
+SKIP_BLOCK = 64 * 1024
+
+MAX_INDEXES = 32
+
+
+@dataclass
+class LineIndex:
+    """Checkpoints of known line starts for one version of a file."""
+
+    signature: Tuple[int, int]
+    lines: array = field(default_factory=lambda: array("q", [0]))
+    offsets: array = field(default_factory=lambda: array("q", [0]))
+    newlines: int = 0
+    scanned: int = 0
+    complete: bool = False
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def extend(self, f: BinaryIO, line: int) -> None:
+        """Scan forward until *line* (0-based) is at or before a checkpoint, or EOF."""
+        if self.complete or self.newlines >= line:
+            return
+        f.seek(self.scanned)
+        while self.newlines < line:
+            chunk = f.read(SCAN_CHUNK)
+            if not chunk:
+                self.complete = True
+                return
+            count = chunk.count(b"\n")
+            if count:
+                self.newlines += count
+                self.lines.append(self.newlines)
+                self.offsets.append(self.scanned + chunk.rfind(b"\n") + 1)
+            self.scanned += len(chunk)
+
+    def seek(self, f: BinaryIO, line: int) -> bool:
+        """Position *f* at the start of *line*; False when the file has fewer lines."""
+        with self.lock:
+            self.extend(f, line)
+            idx = bisect_right(self.lines, line) - 1
+            remaining = line - self.lines[idx]
+            offset = self.offsets[idx]
+        f.seek(offset)
+        while remaining:
+            start = f.tell()
+            block = f.read(SKIP_BLOCK)
+            if not block:
+                return False
+            count = block.count(b"\n")
+            if count < remaining:
+                remaining -= count
+                continue
+            pos = -1
+            for _ in range(remaining):
+                pos = block.find(b"\n", pos + 1)
+            f.seek(start + pos + 1)
+            remaining = 0
+        return True
+
+
+@dataclass
+class Window:
+    lines: List[str]
+    eof: bool
+    truncated_by_bytes: bool
+    total: Optional[int] = None
+
+
+_indexes: "OrderedDict[str, LineIndex]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def _signature(f: BinaryIO) -> Tuple[int, int]:
+    stat = os.fstat(f.fileno())
+    return stat.st_mtime_ns, stat.st_size
+
+
+def index_for(path: str, f: BinaryIO) -> LineIndex:
+    signature = _signature(f)
+    with _lock:
+        index = _indexes.pop(path, None)
+        if index is None or index.signature != signature:
+            index = LineIndex(signature=signature)
+        _indexes[path] = index
+        while len(_indexes) > MAX_INDEXES:
+            _indexes.popitem(last=False)
+    return index
+
+
+def invalidate(path: Optional[str] = None) -> None:
+    with _lock:
+        if path is None:
+            _indexes.clear()
+        else:
+            _indexes.pop(path, None)
+
+
+def _read_line(f: BinaryIO, max_bytes: int) -> Tuple[bytes, bool]:
+    """Read one line, keeping at most *max_bytes*; returns (prefix, ended_with_newline)."""
+    data = f.readline(max_bytes)
+    if data.endswith(b"\n") or len(data) < max_bytes:
+        return data, data.endswith(b"\n")
+    # Overlong line: drop the rest without buffering it.
+    while True:
+        block = f.read(SKIP_BLOCK)
+        if not block:
+            return data, False
+        pos = block.find(b"\n")
+        if pos >= 0:
+            f.seek(pos + 1 - len(block), os.SEEK_CUR)
+            return data, True
+
+
+def read_window(
+    path: str,
+    f: BinaryIO,
+    *,
+    start: int,
+    limit: int,
+    max_bytes: int,
+    max_line_length: int,
+) -> Window:
+    """Read up to *limit* lines from 0-based line *start*.
+
+    Lines follow ``str.split("\\n")`` semantics: a trailing newline yields a
+    final empty line, and an empty file has one empty line.
+    """
+    index = index_for(path, f)
+    if not index.seek(f, start):
+        raise ValueError(f"Offset {start + 1} is out of range for this file ({index.newlines + 1} lines)")
+
+    out: List[str] = []
+    current_bytes = 0
+    # UTF-8 needs at most four bytes per character.
+    line_cap = max_line_length * 4 + 2
+    while len(out) < limit:
+        data, ended = _read_line(f, line_cap)
+        if data.endswith(b"\n"):
+            data = data[:-2] if data.endswith(b"\r\n") else data[:-1]
+        line = data.decode("utf-8", errors="replace")
+        if len(line) > max_line_length:
+            line = line[:max_line_length] + "..."
+
+        line_bytes = len(line.encode("utf-8")) + (1 if out else 0)
+        if current_bytes + line_bytes > max_bytes:
+            return Window(lines=out, eof=False, truncated_by_bytes=True)
+        out.append(line)
+        current_bytes += line_bytes
+
+        if not ended:
+            return Window(lines=out, eof=True, truncated_by_bytes=False, total=start + len(out))
+    return Window(lines=out, eof=False, truncated_by_bytes=False)
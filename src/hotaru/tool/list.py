@@ -1,12 +1,12 @@
 """List tool for displaying directory trees."""
 
-import os
 from fnmatch import fnmatch
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import Dict, List, Optional, Set
 
 from pydantic import BaseModel, Field
 
+from ..project.file_index import FileIndex
 from .external_directory import assert_external_directory
 from .tool import PermissionSpec, Tool, ToolContext, ToolResult
 
@@ -149,28 +149,28 @@ async def list_execute(params: ListParams, ctx: ToolContext) -> ToolResult:
     ignore_patterns = IGNORE_PATTERNS + (params.ignore or [])
     collected: List[str] = []
 
-    for dirpath, dirnames, filenames in os.walk(search_path):
+    index = FileIndex.for_path(search_path, roots=(ctx.worktree, ctx.cwd))
+    candidates = await index.files(search_path)
+    # Shallow entries first so a truncated listing still shows the top levels.
+    candidates.sort(key=lambda rel: (rel.count("/"), rel))
+    ignored_dirs: Dict[str, bool] = {}
+
+    def _dir_ignored(rel_dir: str) -> bool:
+        if rel_dir not in ignored_dirs:
+            parent = rel_dir.rsplit("/", 1)[0] if "/" in rel_dir else ""
+            ignored_dirs[rel_dir] = (bool(parent) and _dir_ignored(parent)) or _matches_ignore(
+                rel_dir, True, ignore_patterns
+            )
+        return ignored_dirs[rel_dir]
+
+    for rel in candidates:
         if ctx.aborted:
             break
-
-        rel_dir = Path(dirpath).relative_to(search_path)
-        rel_dir_str = "." if str(rel_dir) == "." else _normalize(str(rel_dir))
-
-        filtered_dirs = []
-        for dirname in dirnames:
-            rel = dirname if rel_dir_str == "." else f"{rel_dir_str}/{dirname}"
-            if not _matches_ignore(rel, True, ignore_patterns):
-                filtered_dirs.append(dirname)
-        dirnames[:] = filtered_dirs
-
-        for filename in filenames:
-            rel = filename if rel_dir_str == "." else f"{rel_dir_str}/{filename}"
-            if _matches_ignore(rel, False, ignore_patterns):
-                continue
-            collected.append(rel)
-            if len(collected) >= LIMIT:
-                break
-
+        if "/" in rel and _dir_ignored(rel.rsplit("/", 1)[0]):
+            continue
+        if _matches_ignore(rel, False, ignore_patterns):
+            continue
+        collected.append(rel)
         if len(collected) >= LIMIT:
             break
 
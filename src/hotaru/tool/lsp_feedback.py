@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import os
-from typing import Dict, List, Tuple, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from ..util.log import Log
 
@@ -27,15 +27,19 @@ async def append_lsp_error_feedback(
     output: str,
     file_path: str,
     include_project_files: bool = False,
+    content: Optional[str] = None,
 ) -> Tuple[str, Dict[str, List["LSPDiagnostic"]]]:
     """Append LSP diagnostics to tool output.
 
+    ``content`` is the file's new text when the tool already has it, which
+    spares the language server clients a disk read.
+
     Returns updated output and the diagnostics map. If diagnostics collection
     fails, output is returned unchanged and diagnostics is empty.
     """
     try:
         has_clients = await lsp.has_clients(file_path)
-        connected_clients = await lsp.touch_file(file_path, wait_for_diagnostics=True)
+        connected_clients = await lsp.touch_file(file_path, wait_for_diagnostics=True, content=content)
         diagnostics = await lsp.diagnostics()
     except Exception as e:
         log.warn("failed to collect LSP diagnostics", {"file": file_path, "error": str(e)})
@@ -14,6 +14,7 @@ from pydantic import BaseModel, ConfigDict, Field
 from ..core.id import Identifier
 from ..util.log import Log
 from .external_directory import assert_external_directory
+from .line_index import Window, read_window
 from .tool import PermissionSpec, Tool, ToolContext, ToolResult
 
 if TYPE_CHECKING:
@@ -26,6 +27,7 @@ DESCRIPTION = (Path(__file__).parent / "read.txt").read_text(encoding="utf-8")
 DEFAULT_READ_LIMIT = 2000
 MAX_LINE_LENGTH = 2000
 MAX_BYTES = 50 * 1024  # 50 KB
+BINARY_SNIFF_BYTES = 4096
 
 # Binary file extensions
 BINARY_EXTENSIONS = {
@@ -45,32 +47,36 @@ class ReadParams(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
 
-def _is_binary_file(filepath: Path) -> bool:
-    """Check if a file is binary."""
+def _is_binary(filepath: Path, head: bytes) -> bool:
+    """Check if a file is binary from its extension and first bytes."""
     ext = filepath.suffix.lower()
     if ext in BINARY_EXTENSIONS:
         return True
+    if not head:
+        return False
 
-    # Check file content for binary data
-    try:
-        with open(filepath, "rb") as f:
-            chunk = f.read(4096)
-            if not chunk:
-                return False
-
-            # Check for null bytes
-            if b"\x00" in chunk:
-                return True
-
-            # Check for high ratio of non-printable characters
-            non_printable = sum(1 for b in chunk if b < 9 or (b > 13 and b < 32))
-            if len(chunk) > 0 and non_printable / len(chunk) > 0.3:
-                return True
-
-    except Exception:
-        pass
+    # Check for null bytes
+    if b"\x00" in head:
+        return True
 
-    return False
+    # Check for high ratio of non-printable characters
+    non_printable = sum(1 for b in head if b < 9 or (b > 13 and b < 32))
+    return non_printable / len(head) > 0.3
+
+
+def _read_text_window(filepath: Path, start: int, limit: int) -> Window:
+    """Sniff and read one window of a text file through a single handle."""
+    with open(filepath, "rb") as f:
+        if _is_binary(filepath, f.read(BINARY_SNIFF_BYTES)):
+            raise ValueError(f"Cannot read binary file: {filepath}")
+        return read_window(
+            str(filepath),
+            f,
+            start=start,
+            limit=limit,
+            max_bytes=MAX_BYTES,
+            max_line_length=MAX_LINE_LENGTH,
+        )
 
 
 async def _warm_lsp(lsp: LSP, file_path: str) -> None:
@@ -197,39 +203,14 @@ async def read_execute(params: ReadParams, ctx: ToolContext) -> ToolResult:
             }]
         )
 
-    # Check for binary file
-    if _is_binary_file(filepath):
-        raise ValueError(f"Cannot read binary file: {filepath}")
-
     # Read text file
     limit = params.limit or DEFAULT_READ_LIMIT
     offset = params.offset or 1
     if offset < 1:
         raise ValueError("offset must be greater than or equal to 1")
-    start = offset - 1
-
-    text = filepath.read_text(encoding="utf-8", errors="replace")
-    lines = text.split("\n")
-    if start >= len(lines):
-        raise ValueError(f"Offset {offset} is out of range for this file ({len(lines)} lines)")
-
-    # Read lines with limits
-    raw: list[str] = []
-    current_bytes = 0
-    truncated_by_bytes = False
-
-    for i in range(start, min(len(lines), start + limit)):
-        line = lines[i]
-        if len(line) > MAX_LINE_LENGTH:
-            line = line[:MAX_LINE_LENGTH] + "..."
-
-        line_bytes = len(line.encode("utf-8")) + (1 if raw else 0)
-        if current_bytes + line_bytes > MAX_BYTES:
-            truncated_by_bytes = True
-            break
 
-        raw.append(line)
-        current_bytes += line_bytes
+    window = await asyncio.to_thread(_read_text_window, filepath, offset - 1, limit)
+    raw = window.lines
 
     # Format output with line numbers
     content_lines = [
@@ -241,17 +222,15 @@ async def read_execute(params: ReadParams, ctx: ToolContext) -> ToolResult:
     output = f"<path>{filepath}</path>\n<type>file</type>\n<content>\n"
     output += "\n".join(content_lines)
 
-    total_lines = len(lines)
     last_read_line = offset + len(raw) - 1
-    has_more_lines = total_lines > last_read_line
-    truncated = has_more_lines or truncated_by_bytes
+    truncated = not window.eof
 
-    if truncated_by_bytes:
+    if window.truncated_by_bytes:
         output += f"\n\n(Output truncated at {MAX_BYTES} bytes. Use 'offset' parameter to read beyond line {last_read_line})"
-    elif has_more_lines:
+    elif not window.eof:
         output += f"\n\n(File has more lines. Use 'offset' parameter to read beyond line {last_read_line})"
     else:
-        output += f"\n\n(End of file - total {total_lines} lines)"
+        output += f"\n\n(End of file - total {window.total} lines)"
 
     output += "\n</content>"
     asyncio.create_task(_warm_lsp(ctx.app.lsp, str(filepath)))
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import importlib.util
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from ..core.config import ConfigManager
 from ..util.log import Log
@@ -37,6 +37,11 @@ from .write import WriteTool
 
 log = Log.create({"service": "tool.registry"})
 
+# Tools whose description depends on the caller agent and the skill/agent registries.
+_DYNAMIC_DESCRIPTIONS = frozenset({"skill", "task"})
+
+_ListKey = Tuple[Optional[str], Optional[str], Optional[str]]
+
 
 class ToolRegistry:
     """Central registry for all available tools."""
@@ -44,6 +49,11 @@ class ToolRegistry:
     def __init__(self) -> None:
         self._tools: Optional[Dict[str, ToolInfo]] = None
         self._initialized: bool = False
+        # Definition cache; entries are shared between steps and must not be mutated.
+        self._schemas: Dict[str, Tuple[ToolInfo, Dict[str, Any]]] = {}
+        self._definitions: Dict[Tuple[str, Optional[str]], Dict[str, Any]] = {}
+        self._lists: Dict[_ListKey, List[Dict[str, Any]]] = {}
+        self._stamp: Optional[Tuple[Any, ...]] = None
 
     async def init(self) -> None:
         """Eagerly initialize the tool registry during startup."""
@@ -212,6 +222,7 @@ class ToolRegistry:
 
     def register(self, tool: ToolInfo) -> None:
         self._all()[tool.id] = tool
+        self._invalidate_definitions()
 
     async def execute(self, tool_id: str, args: Any, ctx: ToolContext) -> ToolResult:
         tool = self.get(tool_id)
@@ -235,42 +246,94 @@ class ToolRegistry:
         provider_id: Optional[str] = None,
         model_id: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
-        tools = self._all()
-        definitions = []
+        """Function definitions of the tools enabled for this provider/model.
+
+        Results are cached per (provider, model, caller agent) until the
+        registry, the config, the skills or the agents change, so repeated
+        steps get identical definitions.  The returned list is fresh, but
+        its definition dicts are shared and must not be mutated.
+        """
+        config = await ConfigManager.get()
+        stamp = (config, app.skills.version, app.agents.version)
+        if self._stamp is None or self._stamp[0] is not config or self._stamp[1:] != stamp[1:]:
+            self._invalidate_definitions()
+            self._stamp = stamp
 
-        for tool in tools.values():
+        key = (provider_id, model_id, caller_agent)
+        cached = self._lists.get(key)
+        if cached is not None:
+            return list(cached)
+
+        definitions = []
+        complete = True
+        for tool in self._all().values():
             if not await self._tool_enabled(tool_id=tool.id, provider_id=provider_id, model_id=model_id):
                 continue
+            definition = await self._definition(tool, app=app, caller_agent=caller_agent)
+            if definition is None:
+                complete = False
+                definition = self._build_definition(tool, tool.description)
+            definitions.append(definition)
 
-            schema = tool.parameters_type.model_json_schema()
-            schema.pop("title", None)
-            schema = strictify_schema(schema)
+        if complete:
+            self._lists[key] = definitions
+        return list(definitions)
 
-            description = tool.description
-            if tool.id == "skill":
-                try:
+    async def _definition(
+        self,
+        tool: ToolInfo,
+        *,
+        app: AppContext,
+        caller_agent: Optional[str],
+    ) -> Optional[Dict[str, Any]]:
+        """Cached definition of *tool*; None if its description failed to build."""
+        dynamic = tool.id in _DYNAMIC_DESCRIPTIONS
+        key = (tool.id, caller_agent if dynamic else None)
+        definition = self._definitions.get(key)
+        if definition is not None:
+            return definition
+
+        description = tool.description
+        if dynamic:
+            try:
+                if tool.id == "skill":
                     description = await build_skill_description(caller_agent, skills=app.skills, agents=app.agents)
-                except Exception:
-                    pass
-            elif tool.id == "task":
-                try:
+                else:
                     description = await build_task_description(caller_agent=caller_agent, agents=app.agents)
-                except Exception:
-                    pass
-
-            definitions.append(
-                {
-                    "type": "function",
-                    "function": {
-                        "name": tool.id,
-                        "description": description,
-                        "parameters": schema,
-                    },
-                }
-            )
-
-        return definitions
+            except Exception as e:
+                log.warn("failed to build tool description", {"tool": tool.id, "error": str(e)})
+                return None
+
+        definition = self._definitions[key] = self._build_definition(tool, description)
+        return definition
+
+    def _build_definition(self, tool: ToolInfo, description: str) -> Dict[str, Any]:
+        return {
+            "type": "function",
+            "function": {
+                "name": tool.id,
+                "description": description,
+                "parameters": self._schema(tool),
+            },
+        }
+
+    def _schema(self, tool: ToolInfo) -> Dict[str, Any]:
+        cached = self._schemas.get(tool.id)
+        if cached is not None and cached[0] is tool:
+            return cached[1]
+        schema = tool.parameters_type.model_json_schema()
+        schema.pop("title", None)
+        schema = strictify_schema(schema)
+        self._schemas[tool.id] = (tool, schema)
+        return schema
+
+    def _invalidate_definitions(self) -> None:
+        self._definitions.clear()
+        self._lists.clear()
+        self._stamp = None
 
     def reset(self) -> None:
         self._tools = None
         self._initialized = False
+        self._schemas.clear()
+        self._invalidate_definitions()
@@ -6,7 +6,7 @@ Handles truncation of large tool outputs to fit within context limits.
 import asyncio
 import os
 from pathlib import Path
-from typing import Dict, Literal, Optional, TypedDict, Union
+from typing import BinaryIO, Dict, Literal, Optional, TypedDict, Union
 
 from ..core.global_paths import GlobalPath
 from ..core.id import Identifier
@@ -49,6 +49,23 @@ def _get_output_dir() -> Path:
     return output_dir
 
 
+def _hint(output_path: Path, has_task_tool: bool) -> str:
+    if has_task_tool:
+        return (
+            f"The tool call succeeded but the output was truncated. "
+            f"Full output saved to: {output_path}\n"
+            f"Use the Task tool to have explore agent process this file with "
+            f"Grep and Read (with offset/limit). Do NOT read the full file yourself - "
+            f"delegate to save context."
+        )
+    return (
+        f"The tool call succeeded but the output was truncated. "
+        f"Full output saved to: {output_path}\n"
+        f"Use Grep to search the full content or Read with offset/limit "
+        f"to view specific sections."
+    )
+
+
 class Truncate:
     """Output truncation utilities."""
 
@@ -159,22 +176,7 @@ class Truncate:
         except Exception as e:
             log.error("failed to save truncated output", {"error": str(e)})
 
-        # Build hint message
-        if has_task_tool:
-            hint = (
-                f"The tool call succeeded but the output was truncated. "
-                f"Full output saved to: {output_path}\n"
-                f"Use the Task tool to have explore agent process this file with "
-                f"Grep and Read (with offset/limit). Do NOT read the full file yourself - "
-                f"delegate to save context."
-            )
-        else:
-            hint = (
-                f"The tool call succeeded but the output was truncated. "
-                f"Full output saved to: {output_path}\n"
-                f"Use Grep to search the full content or Read with offset/limit "
-                f"to view specific sections."
-            )
+        hint = _hint(output_path, has_task_tool)
 
         if direction == "head":
             message = f"{preview}\n\n...{removed} {unit} truncated...\n\n{hint}"
@@ -188,6 +190,97 @@ class Truncate:
         }
 
 
+class OutputSpool:
+    """Bounded capture of output that arrives in chunks.
+
+    Output is kept in memory until it exceeds ``max_bytes``.  From then on
+    the full stream is written to a ``tool-output`` file and only the first
+    and last ``max_bytes // 2`` bytes stay in memory, so memory use does not
+    grow with the size of the output.
+    """
+
+    def __init__(self, max_bytes: int = MAX_BYTES, max_lines: int = MAX_LINES) -> None:
+        self.max_bytes = max_bytes
+        self.max_lines = max_lines
+        self.total_bytes = 0
+        self.output_path: Optional[Path] = None
+        self._buffer = bytearray()
+        self._head = b""
+        self._tail = bytearray()
+        self._file: Optional[BinaryIO] = None
+
+    @property
+    def spilled(self) -> bool:
+        return self.output_path is not None
+
+    def write(self, chunk: bytes) -> None:
+        if not chunk:
+            return
+        self.total_bytes += len(chunk)
+        if self.output_path is None:
+            self._buffer += chunk
+            if len(self._buffer) > self.max_bytes:
+                self._spill()
+            return
+        self._append(chunk)
+        self._tail += chunk
+        del self._tail[:-(self.max_bytes // 2)]
+
+    def _spill(self) -> None:
+        half = self.max_bytes // 2
+        self.output_path = _get_output_dir() / Identifier.ascending("tool")
+        try:
+            self._file = open(self.output_path, "wb")
+        except OSError as e:
+            log.error("failed to save truncated output", {"error": str(e)})
+        self._append(bytes(self._buffer))
+        self._head = bytes(self._buffer[:half])
+        self._tail = bytearray(self._buffer[-half:])
+        self._buffer = bytearray()
+
+    def _append(self, chunk: bytes) -> None:
+        if self._file is None:
+            return
+        try:
+            self._file.write(chunk)
+        except OSError as e:
+            log.error("failed to save truncated output", {"error": str(e)})
+            self._file.close()
+            self._file = None
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def preview(self, max_chars: int) -> str:
+        """Most recent output, at most *max_chars* characters."""
+        data = self._tail if self.spilled else self._buffer
+        text = bytes(data[-max_chars * 4:]).decode("utf-8", errors="replace")
+        if self.spilled or len(text) > max_chars:
+            return "...\n\n" + text[-max_chars:]
+        return text
+
+    def text(self, has_task_tool: bool = False) -> str:
+        """Captured output; once spilled, head and tail around a truncation hint."""
+        if self.output_path is None:
+            return self._buffer.decode("utf-8", errors="replace")
+        self.close()
+        half_lines = self.max_lines // 2
+        head_lines = self._head.decode("utf-8", errors="replace").split("\n")
+        tail_lines = self._tail.decode("utf-8", errors="replace").split("\n")
+        # Drop the partial lines at the cut points.
+        if len(head_lines) > 1:
+            head_lines.pop()
+        if len(tail_lines) > 1:
+            tail_lines.pop(0)
+        head = "\n".join(head_lines[:half_lines])
+        tail = "\n".join(tail_lines[-half_lines:])
+        removed = self.total_bytes - len(head.encode("utf-8")) - len(tail.encode("utf-8"))
+        hint = _hint(self.output_path, has_task_tool)
+        return f"{head}\n\n...{removed} bytes truncated...\n\n{hint}\n\n{tail}"
+
+
 # Background cleanup task
 _cleanup_task: Optional[asyncio.Task] = None
 
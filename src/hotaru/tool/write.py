@@ -5,6 +5,7 @@ from typing import Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from ..snapshot import SnapshotTracker
 from ..util.log import Log
 from .external_directory import assert_external_directory
 from .lsp_feedback import append_lsp_error_feedback
@@ -54,6 +55,7 @@ async def write_execute(params: WriteParams, ctx: ToolContext) -> ToolResult:
 
     # Write the file
     filepath.write_text(params.content, encoding="utf-8")
+    SnapshotTracker.mark_changed([str(filepath)])
 
     output = "Wrote file successfully."
     output, diagnostics = await append_lsp_error_feedback(
@@ -61,6 +63,7 @@ async def write_execute(params: WriteParams, ctx: ToolContext) -> ToolResult:
         output=output,
         file_path=str(filepath),
         include_project_files=True,
+        content=params.content,
     )
 
     return ToolResult(
@@ -41,6 +41,7 @@ class SDKContext:
         self._api_client = api_client or self._build_default_api_client(self._cwd)
         self._event_task: asyncio.Task[None] | None = None
         self._event_stream_ready = asyncio.Event()
+        self._last_event_id: int | None = None
 
     @staticmethod
     def _build_default_api_client(cwd: str) -> HotaruAPIClient:
@@ -61,6 +62,12 @@ class SDKContext:
     def _supports_event_stream(self) -> bool:
         return hasattr(self._api_client, "stream_events")
 
+    def _open_event_stream(self) -> Any:
+        # Resume after the last delivered event so nothing is lost across reconnects.
+        if self._last_event_id is None:
+            return self._api_client.stream_events()
+        return self._api_client.stream_events(last_event_id=self._last_event_id)
+
     def _emit_connection_state(
         self,
         state: str,
@@ -85,9 +92,12 @@ class SDKContext:
         while True:
             self._event_stream_ready.clear()
             try:
-                async for event in self._api_client.stream_events():
+                async for event in self._open_event_stream():
                     if not isinstance(event, dict):
                         continue
+                    event_id = event.get("id")
+                    if isinstance(event_id, int):
+                        self._last_event_id = event_id
                     if not self._event_stream_ready.is_set():
                         if attempt > 0:
                             log.info("event stream recovered", {"attempt": attempt})
@@ -4,8 +4,10 @@ This module provides synchronized state management for sessions,
 messages, providers, agents, and other data from the backend.
 """
 
+import asyncio
+import bisect
 from dataclasses import dataclass, field
-from typing import Optional, Dict, List, Any, Callable, Set
+from typing import Optional, Dict, List, Any, Callable, Set, Tuple
 from contextvars import ContextVar
 
 from ...util.log import Log
@@ -77,11 +79,24 @@ class SyncContext:
     methods for accessing and updating data.
     """
 
+    # Streaming notifications are coalesced into one flush per frame.
+    FRAME_INTERVAL = 1 / 60
+
     def __init__(self) -> None:
         """Initialize sync context."""
         self._data = SyncData()
         self._listeners: Dict[str, List[Callable[[Any], None]]] = {}
         self._synced_sessions: Set[str] = set()
+        # message id -> message payload
+        self._message_index: Dict[str, Dict[str, Any]] = {}
+        # message id -> (parts list the index was built from, part id -> part)
+        self._part_index: Dict[str, Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]] = {}
+        # part id -> field -> (part, chunks) of deltas not yet joined
+        self._text_buffers: Dict[str, Dict[str, Tuple[Dict[str, Any], List[str]]]] = {}
+        # session id -> (changed message ids, changed part ids), insertion ordered
+        self._changed: Dict[str, Tuple[Dict[str, None], Dict[str, None]]] = {}
+        self._dirty_parts: Dict[str, Tuple[str, str, Dict[str, Any]]] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
 
     @staticmethod
     def _session_sort_key(session: Dict[str, Any]) -> int:
@@ -99,6 +114,7 @@ class SyncContext:
     @property
     def data(self) -> SyncData:
         """Get the synchronized data."""
+        self._flush_text()
         return self._data
 
     @property
@@ -233,6 +249,7 @@ class SyncContext:
         Returns:
             List of messages
         """
+        self._flush_text()
         return self._data.messages.get(session_id, [])
 
     def set_messages(self, session_id: str, messages: List[Dict[str, Any]]) -> None:
@@ -242,6 +259,13 @@ class SyncContext:
             session_id: Session ID
             messages: List of messages
         """
+        self._flush_text()
+        for previous in self._data.messages.get(session_id, []):
+            previous_id = str(previous.get("id") or "")
+            if self._message_index.get(previous_id) is previous:
+                del self._message_index[previous_id]
+                self._part_index.pop(previous_id, None)
+
         normalized: List[Dict[str, Any]] = []
         for message in messages:
             if not isinstance(message, dict):
@@ -251,6 +275,7 @@ class SyncContext:
             message_id = str(payload.get("id") or "")
             if message_id:
                 self._data.parts[message_id] = payload["parts"]
+                self._message_index[message_id] = payload
 
         self._data.messages[session_id] = normalized
         self._synced_sessions.add(session_id)
@@ -291,15 +316,52 @@ class SyncContext:
             payload["metadata"] = dict(metadata)
         return payload
 
+    @classmethod
+    def _insert_sorted(cls, items: List[Dict[str, Any]], item: Dict[str, Any]) -> None:
+        """Insert *item* by id; streams almost always append at the end."""
+        key = cls._message_sort_key(item)
+        if not items or cls._message_sort_key(items[-1]) <= key:
+            items.append(item)
+        else:
+            bisect.insort(items, item, key=cls._message_sort_key)
+
+    @classmethod
+    def _position(cls, items: List[Dict[str, Any]], item: Dict[str, Any]) -> int:
+        """Index of *item* (by identity) in an id-sorted list, or -1."""
+        index = bisect.bisect_left(items, cls._message_sort_key(item), key=cls._message_sort_key)
+        while index < len(items) and cls._message_sort_key(items[index]) == cls._message_sort_key(item):
+            if items[index] is item:
+                return index
+            index += 1
+        for index, current in enumerate(items):
+            if current is item:
+                return index
+        return -1
+
+    def _message_parts(self, message: Dict[str, Any]) -> List[Dict[str, Any]]:
+        parts = message.setdefault("parts", [])
+        if not isinstance(parts, list):
+            parts = []
+            message["parts"] = parts
+        message_id = str(message.get("id") or "")
+        self._data.parts[message_id] = parts
+        return parts
+
+    def _parts_by_id(self, message_id: str, parts: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Part id index of *parts*, rebuilt whenever the list object changes."""
+        indexed = self._part_index.get(message_id)
+        if indexed is None or indexed[0] is not parts:
+            by_id = {str(part.get("id")): part for part in parts if isinstance(part, dict) and part.get("id")}
+            indexed = (parts, by_id)
+            self._part_index[message_id] = indexed
+        return indexed[1]
+
     def _ensure_message_payload(self, session_id: str, message_id: str, role: str = "assistant") -> Dict[str, Any]:
         """Ensure a message shell exists so part-first streams can render incrementally."""
-        if session_id not in self._data.messages:
-            self._data.messages[session_id] = []
-
-        messages = self._data.messages[session_id]
-        for message in messages:
-            if str(message.get("id") or "") == message_id:
-                return message
+        messages = self._data.messages.setdefault(session_id, [])
+        existing = self._message_index.get(message_id)
+        if existing is not None:
+            return existing
 
         shell = {
             "id": message_id,
@@ -311,8 +373,8 @@ class SyncContext:
             },
             "parts": [],
         }
-        messages.append(shell)
-        messages.sort(key=self._message_sort_key)
+        self._insert_sorted(messages, shell)
+        self._message_index[message_id] = shell
         self._data.parts[message_id] = shell["parts"]
         return shell
 
@@ -329,14 +391,10 @@ class SyncContext:
             return
 
         messages = self._data.messages.setdefault(session_id, [])
-        existing_index = -1
-        for i, current in enumerate(messages):
-            if str(current.get("id") or "") == message_id:
-                existing_index = i
-                break
-
-        if existing_index >= 0:
-            existing = messages[existing_index]
+        existing = self._message_index.get(message_id)
+        existing_index = self._position(messages, existing) if existing is not None else -1
+
+        if existing is not None and existing_index >= 0:
             merged = dict(existing)
             merged.update(payload)
             if "metadata" not in payload and "metadata" in existing:
@@ -346,8 +404,8 @@ class SyncContext:
             messages[existing_index] = merged
             payload = merged
         else:
-            messages.append(payload)
-            messages.sort(key=self._message_sort_key)
+            self._insert_sorted(messages, payload)
+        self._message_index[message_id] = payload
 
         parts_ref = payload.get("parts")
         if not isinstance(parts_ref, list):
@@ -356,8 +414,7 @@ class SyncContext:
         self._data.parts[message_id] = parts_ref
 
         self._notify(SyncEvent.MESSAGE_UPDATED, {"session_id": session_id, "message": payload})
-        self._notify("messages", {"session_id": session_id, "messages": messages})
-        self._notify(SyncEvent.MESSAGES_UPDATED, {"session_id": session_id, "messages": messages})
+        self._mark_changed(session_id, message_id)
 
     # Part methods
     def get_parts(self, message_id: str) -> List[Dict[str, Any]]:
@@ -369,6 +426,7 @@ class SyncContext:
         Returns:
             List of parts
         """
+        self._flush_text()
         return self._data.parts.get(message_id, [])
 
     def set_parts(self, message_id: str, parts: List[Dict[str, Any]]) -> None:
@@ -399,40 +457,27 @@ class SyncContext:
             return
 
         message = self._ensure_message_payload(session_id, message_id, role=role)
-        parts = message.setdefault("parts", [])
-        if not isinstance(parts, list):
-            parts = []
-            message["parts"] = parts
-        self._data.parts[message_id] = parts
+        parts = self._message_parts(message)
+        by_id = self._parts_by_id(message_id, parts)
         part_id = part.get("id")
+        added = dict(part)
 
-        # Update existing or append
-        for i, p in enumerate(parts):
-            if p.get("id") == part_id:
-                parts[i] = dict(part)
-                self._notify(
-                    SyncEvent.PART_UPDATED,
-                    {"session_id": session_id, "message_id": message_id, "part": parts[i]},
-                )
-                self._notify("messages", {"session_id": session_id, "messages": self._data.messages[session_id]})
-                self._notify(
-                    SyncEvent.MESSAGES_UPDATED,
-                    {"session_id": session_id, "messages": self._data.messages[session_id]},
-                )
-                return
+        # The full part supersedes any buffered deltas.
+        self._text_buffers.pop(str(part_id), None)
+        current = by_id.get(str(part_id)) if part_id else None
+        index = self._position(parts, current) if current is not None else -1
+        if index >= 0:
+            parts[index] = added
+        else:
+            self._insert_sorted(parts, added)
+        if part_id:
+            by_id[str(part_id)] = added
 
-        added = dict(part)
-        parts.append(added)
-        parts.sort(key=self._message_sort_key)
         self._notify(
             SyncEvent.PART_UPDATED,
             {"session_id": session_id, "message_id": message_id, "part": added},
         )
-        self._notify("messages", {"session_id": session_id, "messages": self._data.messages[session_id]})
-        self._notify(
-            SyncEvent.MESSAGES_UPDATED,
-            {"session_id": session_id, "messages": self._data.messages[session_id]},
-        )
+        self._mark_changed(session_id, message_id, str(part_id or ""))
 
     def apply_part_delta(
         self,
@@ -443,22 +488,18 @@ class SyncContext:
         field: str,
         delta: str,
     ) -> None:
-        """Apply part delta updates from runtime events."""
+        """Apply part delta updates from runtime events.
+
+        Deltas are buffered per part and joined once per frame, and their
+        notifications are coalesced (see :meth:`flush`).
+        """
         if not session_id or not message_id or not part_id or not field:
             return
         message = self._ensure_message_payload(session_id, message_id, role="assistant")
-        parts = message.setdefault("parts", [])
-        if not isinstance(parts, list):
-            parts = []
-            message["parts"] = parts
-        self._data.parts[message_id] = parts
-
-        target: Optional[Dict[str, Any]] = None
-        for part in parts:
-            if str(part.get("id") or "") == part_id:
-                target = part
-                break
+        parts = self._message_parts(message)
+        by_id = self._parts_by_id(message_id, parts)
 
+        target = by_id.get(part_id)
         if target is None:
             target = {
                 "id": part_id,
@@ -467,28 +508,75 @@ class SyncContext:
                 "type": "text",
                 field: "",
             }
-            parts.append(target)
-            parts.sort(key=self._message_sort_key)
+            self._insert_sorted(parts, target)
+            by_id[part_id] = target
 
-        existing = target.get(field)
-        target[field] = f"{existing if isinstance(existing, str) else ''}{delta}"
+        buffers = self._text_buffers.setdefault(part_id, {})
+        buffered = buffers.get(field)
+        if buffered is None or buffered[0] is not target:
+            existing = target.get(field)
+            buffered = (target, [existing if isinstance(existing, str) else ""])
+            buffers[field] = buffered
+        buffered[1].append(delta)
 
-        self._notify(
-            SyncEvent.PART_UPDATED,
-            {"session_id": session_id, "message_id": message_id, "part": target},
-        )
-        self._notify("messages", {"session_id": session_id, "messages": self._data.messages[session_id]})
-        self._notify(
-            SyncEvent.MESSAGES_UPDATED,
-            {"session_id": session_id, "messages": self._data.messages[session_id]},
-        )
+        self._dirty_parts[part_id] = (session_id, message_id, target)
+        self._mark_changed(session_id, message_id, part_id)
 
     def _find_message(self, message_id: str) -> Optional[Dict[str, Any]]:
-        for messages in self._data.messages.values():
-            for message in messages:
-                if str(message.get("id") or "") == message_id:
-                    return message
-        return None
+        return self._message_index.get(message_id)
+
+    # Change coalescing
+    def _flush_text(self) -> None:
+        """Join buffered deltas into their part fields."""
+        if not self._text_buffers:
+            return
+        buffers, self._text_buffers = self._text_buffers, {}
+        for fields in buffers.values():
+            for name, (part, chunks) in fields.items():
+                part[name] = "".join(chunks)
+
+    def _mark_changed(self, session_id: str, message_id: str, part_id: str = "") -> None:
+        message_ids, part_ids = self._changed.setdefault(session_id, ({}, {}))
+        message_ids[message_id] = None
+        if part_id:
+            part_ids[part_id] = None
+        if self._flush_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+        self._flush_handle = loop.call_later(self.FRAME_INTERVAL, self.flush)
+
+    def flush(self) -> None:
+        """Publish pending message changes.
+
+        Streaming updates are coalesced per frame: each changed session
+        gets one ``MESSAGES_UPDATED`` (and legacy ``messages``) notification
+        whose payload lists the changed ``message_ids`` and ``part_ids``,
+        and each part that received deltas gets one ``PART_UPDATED``.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._flush_text()
+        dirty_parts, self._dirty_parts = self._dirty_parts, {}
+        changed, self._changed = self._changed, {}
+        for session_id, message_id, part in dirty_parts.values():
+            self._notify(
+                SyncEvent.PART_UPDATED,
+                {"session_id": session_id, "message_id": message_id, "part": part},
+            )
+        for session_id, (message_ids, part_ids) in changed.items():
+            payload = {
+                "session_id": session_id,
+                "messages": self._data.messages.get(session_id, []),
+                "message_ids": list(message_ids),
+                "part_ids": list(part_ids),
+            }
+            self._notify("messages", payload)
+            self._notify(SyncEvent.MESSAGES_UPDATED, payload)
 
     def apply_runtime_event(self, event_type: str, data: Dict[str, Any]) -> None:
         """Reduce runtime SDK events into the sync store."""
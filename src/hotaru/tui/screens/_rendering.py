@@ -1,9 +1,10 @@
 """Message rendering helpers for the session screen."""
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from ..context import use_local
+from ..widgets.timeline import BlockSpec
 
 
 def render_part(
@@ -150,3 +151,72 @@ def should_hide_tool(part: Dict[str, Any], *, show_details: bool) -> bool:
     status = state.get("status")
     error = state.get("error")
     return status == "completed" and not error
+
+
+def message_blocks(
+    message: Dict[str, Any],
+    *,
+    show_tool_details: bool,
+    show_thinking: bool,
+    show_assistant_metadata: bool,
+    show_timestamps: bool,
+    on_open_session: Optional[Callable[[str], None]] = None,
+) -> List[BlockSpec]:
+    """Describe the widgets rendering one message in the timeline."""
+    message_id = str(message.get("id", ""))
+    prefix = f"history-{message_id}"
+    info = message.get("info", {})
+    timestamp = message_timestamp(info, show=show_timestamps)
+    is_user = message.get("role", "") == "user"
+    if is_user:
+        bubble = BlockSpec(
+            key=f"{prefix}-bubble",
+            kind="bubble",
+            props={"content": extract_text(message), "role": "user", "agent": None, "timestamp": timestamp},
+            classes="message user-message",
+        )
+    else:
+        bubble = BlockSpec(
+            key=f"{prefix}-bubble",
+            kind="bubble",
+            props={
+                "content": "",
+                "role": "assistant",
+                "agent": assistant_label(info, show_metadata=show_assistant_metadata),
+                "timestamp": timestamp,
+            },
+            classes="message assistant-message",
+        )
+    blocks = [bubble]
+
+    for idx, part in enumerate(message.get("parts", [])):
+        if not isinstance(part, dict):
+            continue
+        part_type = part.get("type")
+        if is_user and part_type in {"text", "reasoning"}:
+            continue
+        part_id = str(part.get("id") or f"{prefix}-{idx}")
+        if part_type == "tool":
+            if should_hide_tool(part, show_details=show_tool_details):
+                continue
+            blocks.append(
+                BlockSpec(
+                    key=part_id,
+                    kind="tool",
+                    props={"part": part, "show_details": show_tool_details, "on_open_session": on_open_session},
+                    classes="message tool-display",
+                )
+            )
+            continue
+        content = render_part(part, show_thinking=show_thinking, show_tool_details=show_tool_details)
+        if not content:
+            continue
+        blocks.append(
+            BlockSpec(
+                key=part_id,
+                kind="text",
+                props={"content": content, "part_id": part_id},
+                classes="message assistant-message",
+            )
+        )
+    return blocks
@@ -2,7 +2,7 @@
 
 import asyncio
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from textual.app import ComposeResult
 from textual.binding import Binding
@@ -16,23 +16,16 @@ from ..header_usage import compute_session_header_usage
 from ..state import ScreenSubscriptions, select_runtime_status
 from ..widgets import (
     AppFooter,
-    AssistantTextPart,
-    MessageBubble,
+    BlockSpec,
+    MessageTimeline,
     PromptHints,
     PromptInput,
     PromptMeta,
     SessionHeaderBar,
     Spinner,
-    ToolDisplay,
 )
 from ._helpers import _INTERRUPT_WINDOW_SECONDS, build_slash_commands
-from ._rendering import (
-    assistant_label,
-    extract_text,
-    message_timestamp,
-    render_part,
-    should_hide_tool,
-)
+from ._rendering import message_blocks
 from ._messaging import MessagingMixin
 
 
@@ -117,6 +110,7 @@ class SessionScreen(MessagingMixin, Screen):
         self._loading_spinner: Optional[Spinner] = None
         self._history_refresh_scheduled = False
         self._history_refresh_running = False
+        self._render_flags: Optional[Tuple[bool, bool, bool, bool]] = None
         self._show_tool_details = bool(use_kv().get("tool_details_visibility", True))
         self._show_thinking = bool(use_kv().get("thinking_visibility", True))
         self._show_assistant_metadata = bool(use_kv().get("assistant_metadata_visibility", True))
@@ -136,7 +130,7 @@ class SessionScreen(MessagingMixin, Screen):
         yield SessionHeaderBar(id="session-header")
 
         # Messages
-        yield ScrollableContainer(id="messages-container")
+        yield MessageTimeline(id="messages-container")
 
         # Prompt area
         yield Container(
@@ -216,8 +210,6 @@ class SessionScreen(MessagingMixin, Screen):
         self._history_refresh_running = True
         try:
             await self._load_session_history(sync_if_needed=False)
-            container = self.query_one("#messages-container", ScrollableContainer)
-            container.scroll_end()
         finally:
             self._history_refresh_running = False
 
@@ -236,106 +228,31 @@ class SessionScreen(MessagingMixin, Screen):
         if sync_if_needed and not sync.is_session_synced(self.session_id):
             await sync.sync_session(self.session_id, sdk)
 
-        container = self.query_one("#messages-container", ScrollableContainer)
-        container.remove_children()
+        timeline = self.query_one("#messages-container", MessageTimeline)
+        flags = (
+            self._show_tool_details,
+            self._show_thinking,
+            self._show_assistant_metadata,
+            self._show_timestamps,
+        )
+        if flags != self._render_flags:
+            self._render_flags = flags
+            timeline.invalidate()
         self._loading_spinner = None
 
-        for message in sync.get_messages(self.session_id):
-            await self._mount_message_from_history(message, container)
-
-        container.scroll_end(animate=False)
+        await timeline.sync(sync.get_messages(self.session_id), self._message_blocks)
         self._refresh_header()
 
-    async def _mount_message_from_history(
-        self, message: Dict[str, Any], container: ScrollableContainer
-    ) -> None:
-        """Render a persisted message in the message timeline."""
-        role = message.get("role", "")
-        timestamp = message_timestamp(message.get("info"), show=self._show_timestamps)
-        if role == "user":
-            text = extract_text(message)
-            await container.mount(
-                MessageBubble(
-                    content=text,
-                    role="user",
-                    timestamp=timestamp,
-                    classes="message user-message",
-                )
-            )
-            await self._mount_structured_parts(
-                message=message,
-                container=container,
-                prefix=f"history-{message.get('id', '')}",
-                include_text=False,
-            )
-            return
-
-        info = message.get("info", {})
-        agent = assistant_label(info, show_metadata=self._show_assistant_metadata)
-        await container.mount(
-            MessageBubble(
-                content="",
-                role="assistant",
-                agent=agent,
-                timestamp=timestamp,
-                classes="message assistant-message",
-            )
-        )
-
-        await self._mount_structured_parts(
-            message=message,
-            container=container,
-            prefix=f"history-{message.get('id', '')}",
-            include_text=True,
+    def _message_blocks(self, message: Dict[str, Any]) -> List[BlockSpec]:
+        return message_blocks(
+            message,
+            show_tool_details=self._show_tool_details,
+            show_thinking=self._show_thinking,
+            show_assistant_metadata=self._show_assistant_metadata,
+            show_timestamps=self._show_timestamps,
+            on_open_session=self._open_task_session,
         )
 
-
-    async def _mount_structured_parts(
-        self,
-        *,
-        message: Dict[str, Any],
-        container: ScrollableContainer,
-        prefix: str,
-        include_text: bool,
-    ) -> None:
-        parts = message.get("parts", [])
-        for idx, part in enumerate(parts):
-            if not isinstance(part, dict):
-                continue
-
-            part_type = part.get("type")
-            if not include_text and part_type in {"text", "reasoning"}:
-                continue
-            if part_type == "tool":
-                if should_hide_tool(part, show_details=self._show_tool_details):
-                    continue
-                await container.mount(
-                    ToolDisplay(
-                        part=part,
-                        show_details=self._show_tool_details,
-                        on_open_session=self._open_task_session,
-                        classes="message tool-display",
-                    )
-                )
-                continue
-
-            content = render_part(
-                part,
-                show_thinking=self._show_thinking,
-                show_tool_details=self._show_tool_details,
-            )
-            if not content:
-                continue
-            part_id = str(part.get("id") or f"{prefix}-{idx}")
-            await container.mount(
-                AssistantTextPart(
-                    content=content,
-                    part_id=part_id,
-                    classes="message assistant-message",
-                )
-            )
-
-
     def _refresh_header(self) -> None:
         """Refresh session title and context info."""
         header = self.query_one("#session-header", SessionHeaderBar)
@@ -15,14 +15,18 @@ from .layout import (
     SessionListItem,
 )
 from .message import AssistantTextPart, MessageBubble
+from .timeline import BlockSpec, MessageBlock, MessageTimeline
 
 __all__ = [
     "AppFooter",
     "AssistantTextPart",
+    "BlockSpec",
     "CodeBlock",
     "DiffDisplay",
     "Logo",
+    "MessageBlock",
     "MessageBubble",
+    "MessageTimeline",
     "PromptHints",
     "PromptInput",
     "PromptMeta",
@@ -56,6 +56,7 @@ class ToolDisplay(Static):
 
     def set_part(self, part: Dict[str, Any]) -> None:
         self.part = part
+        self.refresh(layout=True)
 
     def render(self) -> Text:
         theme = ThemeManager.get_theme()
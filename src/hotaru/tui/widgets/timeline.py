@@ -0,0 +1,326 @@
+"""Message timeline: keyed, windowed rendering of a session transcript.
+
+Re-mounting every message on each streamed token makes long sessions
+unusable.  ``MessageTimeline`` instead reconciles by key: each message is
+one ``MessageBlock`` whose part widgets are updated in place, and only
+messages whose parts changed are re-rendered.  At most ``window`` messages
+are mounted at a time; the rest are represented by two spacers sized from
+measured (or estimated) heights and are materialized as they scroll into
+view.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from textual.containers import ScrollableContainer
+from textual.message import Message
+from textual.widget import Widget
+from textual.widgets import Static
+
+from .display import ToolDisplay
+from .message import AssistantTextPart, MessageBubble
+
+_WIDGETS: Dict[str, type] = {
+    "bubble": MessageBubble,
+    "text": AssistantTextPart,
+    "tool": ToolDisplay,
+}
+
+
+@dataclass
+class BlockSpec:
+    """One widget of a rendered message.
+
+    ``kind`` selects the widget class (``bubble``, ``text`` or ``tool``) and
+    ``props`` its constructor arguments, which are also the attributes
+    updated in place when the spec changes.
+    """
+
+    key: str
+    kind: str
+    props: Dict[str, Any] = field(default_factory=dict)
+    classes: str = ""
+
+    def same(self, other: "BlockSpec") -> bool:
+        if self.key != other.key or self.kind != other.kind or self.classes != other.classes:
+            return False
+        if self.props.keys() != other.props.keys():
+            return False
+        for name, value in self.props.items():
+            previous = other.props[name]
+            if value is previous:
+                continue
+            # Parts are replaced, not mutated, when they change.
+            if isinstance(value, dict) or value != previous:
+                return False
+        return True
+
+    def build(self) -> Widget:
+        return _WIDGETS[self.kind](**self.props, classes=self.classes)
+
+    def apply(self, widget: Widget) -> None:
+        for name, value in self.props.items():
+            if name == "part" and isinstance(widget, ToolDisplay):
+                widget.set_part(value)
+            else:
+                setattr(widget, name, value)
+        widget.refresh(layout=True)
+
+    def estimate_height(self, width: int) -> int:
+        """Rough rendered height, used until the widget has been measured."""
+        text = str(self.props.get("content") or "")
+        lines = sum(1 + len(line) // max(width, 20) for line in text.split("\n")) if text else 1
+        if self.kind == "bubble":
+            lines += 2 if self.props.get("role") == "user" else 1
+        elif self.kind == "tool":
+            lines = 2
+        # Every timeline widget carries the ``message`` class (margin-bottom: 1).
+        return lines + 1
+
+
+Signature = Tuple[Any, ...]
+
+
+def message_signature(message: Dict[str, Any]) -> Signature:
+    """Cheap fingerprint of a sync-store message.
+
+    Holds references to the message, its info and its parts (which are
+    replaced when updated) plus text lengths (which grow in place while
+    streaming).
+    """
+    items: List[Any] = [message, message.get("info")]
+    parts = message.get("parts")
+    if isinstance(parts, list):
+        for part in parts:
+            items.append(part)
+            text = part.get("text") if isinstance(part, dict) else None
+            items.append(len(text) if isinstance(text, str) else -1)
+    return tuple(items)
+
+
+def _same_signature(a: Signature, b: Signature) -> bool:
+    if len(a) != len(b):
+        return False
+    for x, y in zip(a, b):
+        if x is y:
+            continue
+        if isinstance(x, int) and isinstance(y, int) and x == y:
+            continue
+        return False
+    return True
+
+
+class MessageBlock(Widget):
+    """All widgets of one message, reconciled against new specs by key."""
+
+    DEFAULT_CSS = """
+    MessageBlock {
+        height: auto;
+        layout: vertical;
+    }
+    """
+
+    class Resized(Message):
+        def __init__(self, block: "MessageBlock", height: int) -> None:
+            super().__init__()
+            self.block = block
+            self.height = height
+
+    def __init__(self, key: str, specs: List[BlockSpec]) -> None:
+        super().__init__()
+        self.key = key
+        self.specs = specs
+
+    def compose(self):
+        for spec in self.specs:
+            yield spec.build()
+
+    async def update_specs(self, specs: List[BlockSpec]) -> None:
+        old, self.specs = self.specs, specs
+        children = list(self.children)
+        shared = 0
+        while (
+            shared < len(old)
+            and shared < len(specs)
+            and shared < len(children)
+            and old[shared].key == specs[shared].key
+            and old[shared].kind == specs[shared].kind
+        ):
+            shared += 1
+        for widget, before, after in zip(children[:shared], old[:shared], specs[:shared]):
+            if not after.same(before):
+                after.apply(widget)
+        if children[shared:]:
+            await self.remove_children(children[shared:])
+        if specs[shared:]:
+            await self.mount_all([spec.build() for spec in specs[shared:]])
+
+    def on_resize(self) -> None:
+        self.post_message(self.Resized(self, self.outer_size.height))
+
+
+class MessageTimeline(ScrollableContainer):
+    """Scrollable transcript that keeps a bounded window of messages mounted."""
+
+    DEFAULT_CSS = """
+    MessageTimeline > .timeline-spacer {
+        height: 0;
+    }
+    """
+
+    WINDOW = 40
+
+    def __init__(self, *, window: int = WINDOW, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.window = max(1, window)
+        self._order: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._specs: Dict[str, List[BlockSpec]] = {}
+        self._signatures: Dict[str, Signature] = {}
+        self._heights: Dict[str, int] = {}
+        self._blocks: Dict[str, MessageBlock] = {}
+        self._start = 0
+        self._end = 0
+        self._top = Static(classes="timeline-spacer")
+        self._bottom = Static(classes="timeline-spacer")
+        self._lock = asyncio.Lock()
+        self._window_check_pending = False
+
+    def compose(self):
+        yield self._top
+        yield self._bottom
+
+    @property
+    def mounted_messages(self) -> int:
+        return len(self._blocks)
+
+    def invalidate(self) -> None:
+        """Re-render every message on the next :meth:`sync` (e.g. after a display toggle)."""
+        self._signatures.clear()
+
+    async def sync(
+        self,
+        messages: Sequence[Dict[str, Any]],
+        render: Callable[[Dict[str, Any]], List[BlockSpec]],
+    ) -> None:
+        """Reconcile the timeline with *messages*; only changed messages are rendered."""
+        async with self._lock:
+            follow = not self._order or self.is_vertical_scroll_end
+            order: List[str] = []
+            changed = set()
+            for position, message in enumerate(messages):
+                key = str(message.get("id") or f"message-{position}")
+                order.append(key)
+                signature = message_signature(message)
+                previous = self._signatures.get(key)
+                if previous is not None and _same_signature(previous, signature):
+                    continue
+                self._signatures[key] = signature
+                self._specs[key] = render(message)
+                changed.add(key)
+
+            live = set(order)
+            for store in (self._specs, self._signatures, self._heights):
+                for key in [key for key in store if key not in live]:
+                    del store[key]
+            anchor = self._order[self._start] if self._start < len(self._order) else None
+            self._order = order
+            self._index = {key: i for i, key in enumerate(order)}
+
+            if follow or anchor not in self._index:
+                start = max(0, len(order) - self.window)
+            else:
+                start = min(self._index[anchor], max(0, len(order) - self.window))
+            await self._materialize(start, min(len(order), start + self.window), changed)
+        if follow:
+            self.scroll_end(animate=False)
+
+    async def _materialize(self, start: int, end: int, changed: Iterable[str] = ()) -> None:
+        self._start, self._end = start, end
+        window = self._order[start:end]
+        wanted = set(window)
+        keep = {self._top, self._bottom, *(block for key, block in self._blocks.items() if key in wanted)}
+        stale = [child for child in self.children if child not in keep]
+        for key in [key for key in self._blocks if key not in wanted]:
+            del self._blocks[key]
+        if stale:
+            # Also drops transient widgets (spinners, shell output) mounted by the screen.
+            await self.remove_children(stale)
+
+        changed = set(changed)
+        after: Widget = self._top
+        pending: List[MessageBlock] = []
+        for key in window:
+            block = self._blocks.get(key)
+            if block is None:
+                block = self._blocks[key] = MessageBlock(key, self._specs[key])
+                pending.append(block)
+                continue
+            if pending:
+                await self.mount_all(pending, after=after)
+                after, pending = pending[-1], []
+            if key in changed:
+                await block.update_specs(self._specs[key])
+            after = block
+        if pending:
+            await self.mount_all(pending, after=after)
+        self._size_spacers()
+
+    def _height(self, key: str) -> int:
+        height = self._heights.get(key)
+        if height is None:
+            width = self.size.width or 80
+            height = sum(spec.estimate_height(width) for spec in self._specs.get(key, []))
+        return height
+
+    def _size_spacers(self) -> None:
+        self._top.styles.height = sum(self._height(key) for key in self._order[: self._start])
+        self._bottom.styles.height = sum(self._height(key) for key in self._order[self._end:])
+
+    def on_message_block_resized(self, event: MessageBlock.Resized) -> None:
+        event.stop()
+        block = event.block
+        if self._blocks.get(block.key) is not block or event.height <= 0:
+            return
+        previous = self._height(block.key)
+        self._heights[block.key] = event.height
+        delta = event.height - previous
+        # Keep the visible content in place when a block above it changes height.
+        if delta and not self.is_vertical_scroll_end and block.virtual_region.y + previous <= self.scroll_y:
+            self.scroll_to(y=self.scroll_y + delta, animate=False, immediate=True)
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        super().watch_scroll_y(old_value, new_value)
+        if not self._window_check_pending and self._order:
+            self._window_check_pending = True
+            self.call_after_refresh(self._check_window)
+
+    def _visible_range(self) -> Tuple[int, int]:
+        top = self.scroll_y
+        bottom = top + max(self.size.height, 1)
+        offset = 0
+        first: Optional[int] = None
+        last = len(self._order)
+        for index, key in enumerate(self._order):
+            height = self._height(key)
+            if first is None and offset + height > top:
+                first = index
+            if offset >= bottom:
+                last = index
+                break
+            offset += height
+        return (first if first is not None else max(0, len(self._order) - 1)), last
+
+    async def _check_window(self) -> None:
+        self._window_check_pending = False
+        async with self._lock:
+            first, last = self._visible_range()
+            margin = max(1, self.window // 4)
+            inside_top = first >= self._start + margin or self._start == 0
+            inside_bottom = last <= self._end - margin or self._end == len(self._order)
+            if inside_top and inside_bottom:
+                return
+            span = max(self.window, last - first)
+            start = max(0, min(first - (span - (last - first)) // 2, len(self._order) - span))
+            await self._materialize(start, min(len(self._order), start + span))
@@ -5,11 +5,14 @@ from tests.helpers import create_test_app_context
 REQUIRED_PATHS: dict[str, set[str]] = {
     "/v1/path": {"get"},
     "/v1/skill": {"get"},
+    "/v1/instances": {"get"},
+    "/v1/bus/metrics": {"get"},
     "/v1/sessions": {"get", "post"},
     "/v1/sessions/{session_id}": {"get", "patch", "delete"},
     "/v1/sessions/{session_id}/messages": {"get", "post", "delete"},
     "/v1/sessions/{session_id}/interrupt": {"post"},
     "/v1/sessions/{session_id}/compact": {"post"},
+    "/v1/sessions/{session_id}/cache": {"get"},
     "/v1/sessions/{session_id}/messages/restore": {"post"},
     "/v1/providers": {"get"},
     "/v1/providers/{provider_id}/models": {"get"},
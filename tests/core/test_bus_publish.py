@@ -0,0 +1,79 @@
+import asyncio
+from typing import List
+
+import pytest
+from pydantic import BaseModel
+
+from hotaru.core.bus import Bus, BusEvent
+
+
+class _Props(BaseModel):
+    value: int
+
+
+Plain = BusEvent.define("test.bus.plain", _Props)
+Fanout = BusEvent.define("test.bus.fanout", _Props, concurrent=True)
+
+
+@pytest.mark.anyio
+async def test_publish_without_subscribers_skips_dispatch(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail(*args, **kwargs):
+        raise AssertionError("payload built without subscribers")
+
+    monkeypatch.setattr(_Props, "model_dump", fail)
+
+    await Bus.publish(Plain, _Props(value=1))
+    with pytest.raises(TypeError):
+        await Bus.publish(Plain, "bogus")  # type: ignore[arg-type]
+
+    stats = Bus._current().metrics()["test.bus.plain"]
+    assert stats["published"] == 2
+    assert stats["skipped"] == 1
+    assert stats["deliveries"] == 0
+
+
+@pytest.mark.anyio
+async def test_subscribers_share_one_payload() -> None:
+    seen: List[object] = []
+    unsubscribe = Bus.subscribe(Plain, seen.append)
+    unsubscribe_all = Bus.subscribe_all(seen.append)
+
+    await Bus.publish(Plain, {"value": 2})
+
+    assert len(seen) == 2 and seen[0] is seen[1]
+    assert seen[0].properties == {"value": 2}
+    stats = Bus._current().metrics()["test.bus.plain"]
+    assert stats["deliveries"] == 2
+    assert sum(stats["histogram"].values()) == 1
+    unsubscribe()
+    unsubscribe_all()
+
+
+@pytest.mark.anyio
+async def test_concurrent_event_awaits_async_subscribers_together() -> None:
+    order: List[str] = []
+
+    def slow(name: str):
+        async def callback(payload) -> None:
+            order.append(f"{name}-start")
+            await asyncio.sleep(0.01)
+            if name == "b":
+                raise RuntimeError("boom")
+            order.append(f"{name}-end")
+
+        return callback
+
+    for event in (Plain, Fanout):
+        Bus.subscribe(event, slow("a"))
+        Bus.subscribe(event, slow("b"))
+
+    await Bus.publish(Plain, _Props(value=1))
+    assert order == ["a-start", "a-end", "b-start"]
+
+    order.clear()
+    await Bus.publish(Fanout, _Props(value=1))
+    assert order == ["a-start", "b-start", "a-end"]
+
+    with pytest.raises(ExceptionGroup):
+        await Bus.publish(Fanout, _Props(value=1), propagate=True)
+    assert Bus._current().metrics()["test.bus.fanout"]["errors"] == 2
@@ -0,0 +1,123 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from hotaru.core.bus import Bus
+from hotaru.core.config import ConfigManager, ConfigUpdated
+from hotaru.core.global_paths import GlobalPath
+
+
+def _isolate(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    global_dir = tmp_path / "global-config"
+    home_dir = tmp_path / "home"
+    global_dir.mkdir(parents=True, exist_ok=True)
+    home_dir.mkdir(parents=True, exist_ok=True)
+
+    monkeypatch.setenv("HOME", str(home_dir))
+    monkeypatch.setenv("HOTARU_TEST_MANAGED_CONFIG_DIR", str(tmp_path / "managed-config"))
+    monkeypatch.delenv("HOTARU_CONFIG_CONTENT", raising=False)
+    monkeypatch.setattr(GlobalPath, "config", classmethod(lambda cls: str(global_dir)))
+    monkeypatch.setattr(GlobalPath, "home", classmethod(lambda cls: str(home_dir)))
+    ConfigManager.provide(ConfigManager())
+
+
+def _write(path: Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    before = path.stat().st_mtime_ns if path.exists() else 0
+    path.write_text(json.dumps(data), encoding="utf-8")
+    # Make sure the mtime moves even on coarse-grained filesystems.
+    after = max(path.stat().st_mtime_ns, before + 1_000_000_000)
+    os.utime(path, ns=(after, after))
+
+
+@pytest.mark.anyio
+async def test_load_caches_config_per_directory(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    _isolate(monkeypatch, tmp_path)
+    _write(tmp_path / "a" / "hotaru.json", {"username": "alice"})
+    _write(tmp_path / "b" / "hotaru.json", {"username": "bob"})
+
+    first = await ConfigManager.load(str(tmp_path / "a"))
+    second = await ConfigManager.load(str(tmp_path / "b"))
+
+    assert first.username == "alice"
+    assert second.username == "bob"
+    assert await ConfigManager.load(str(tmp_path / "a")) is first
+    # Outside an instance, get() keeps serving the first directory loaded.
+    assert await ConfigManager.get() is first
+
+
+@pytest.mark.anyio
+async def test_refresh_reloads_changed_directory_and_publishes_event(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    _isolate(monkeypatch, tmp_path)
+    config_file = tmp_path / "a" / "hotaru.json"
+    _write(config_file, {"username": "alice"})
+    _write(tmp_path / "b" / "hotaru.json", {"username": "bob"})
+    untouched = await ConfigManager.load(str(tmp_path / "b"))
+    await ConfigManager.load(str(tmp_path / "a"))
+
+    events = []
+    Bus.subscribe(ConfigUpdated, lambda payload: events.append(payload.properties))
+
+    assert await ConfigManager.refresh() == []
+    assert events == []
+
+    _write(config_file, {"username": "carol"})
+    stale = await ConfigManager.refresh()
+
+    assert stale == [str((tmp_path / "a").resolve())]
+    assert events == [{"directories": stale, "sources": [str(config_file.resolve())]}]
+    assert (await ConfigManager.load(str(tmp_path / "a"))).username == "carol"
+    assert await ConfigManager.load(str(tmp_path / "b")) is untouched
+
+
+@pytest.mark.anyio
+async def test_refresh_detects_new_project_config(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    _isolate(monkeypatch, tmp_path)
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+
+    assert (await ConfigManager.load(str(project_dir))).default_agent is None
+
+    _write(project_dir / "hotaru.json", {"default_agent": "plan"})
+    await ConfigManager.refresh()
+
+    assert (await ConfigManager.load(str(project_dir))).default_agent == "plan"
+
+
+@pytest.mark.anyio
+async def test_unchanged_layers_are_not_reparsed(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    _isolate(monkeypatch, tmp_path)
+    _write(Path(GlobalPath.config()) / "hotaru.json", {"username": "global"})
+    _write(tmp_path / "a" / "hotaru.json", {"default_agent": "build"})
+    _write(tmp_path / "b" / "hotaru.json", {"default_agent": "plan"})
+
+    import hotaru.core.config as config_module
+
+    parsed: list[str] = []
+    original = config_module.load_json_file
+
+    def counting_load(filepath: str):
+        parsed.append(filepath)
+        return original(filepath)
+
+    monkeypatch.setattr(config_module, "load_json_file", counting_load)
+
+    await ConfigManager.load(str(tmp_path / "a"))
+    await ConfigManager.load(str(tmp_path / "b"))
+
+    global_file = str(Path(GlobalPath.config()) / "hotaru.json")
+    assert parsed.count(global_file) == 1
@@ -12,6 +12,7 @@ def test_config_defaults_are_typed_models() -> None:
     assert config.experimental.batch_tool is False
     assert config.experimental.enable_exa is False
     assert config.experimental.lsp_tool is False
+    assert config.experimental.lsp_prewarm is False
     assert config.experimental.plan_mode is False
     assert config.experimental.primary_tools == []
     assert config.permission_memory_scope == PermissionMemoryScope.SESSION
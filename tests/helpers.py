@@ -11,7 +11,9 @@ from hotaru.core.bus import Bus
 from hotaru.core.config import ConfigManager
 from hotaru.project import Instance, State
 from hotaru.runtime import AppContext
+from hotaru.runtime.event_hub import EventHub
 from hotaru.runtime.runner import SessionRuntime
+from hotaru.session.transcript_cache import TranscriptCache
 
 
 def _stub() -> SimpleNamespace:
@@ -19,7 +21,7 @@ def _stub() -> SimpleNamespace:
     async def _noop(*_a: object, **_kw: object) -> None:
         pass
 
-    return SimpleNamespace(init=_noop, shutdown=_noop, reset=lambda: None, clear_session=_noop)
+    return SimpleNamespace(init=_noop, shutdown=_noop, reset=lambda: None, clear_session=_noop, version=0)
 
 
 def _agent_stub(**overrides: Any) -> SimpleNamespace:
@@ -31,7 +33,7 @@ def _agent_stub(**overrides: Any) -> SimpleNamespace:
         return "build"
 
     return SimpleNamespace(
-        init=_noop, shutdown=_noop, reset=lambda: None, clear_session=_noop,
+        init=_noop, shutdown=_noop, reset=lambda: None, clear_session=_noop, version=0,
         get=overrides.get("get", _noop),
         list=overrides.get("list", _noop),
         default_agent=overrides.get("default_agent", _default_agent),
@@ -96,6 +98,8 @@ def fake_app(**overrides: Any) -> AppContext:
         },
     )
     app.runner = overrides.pop("runner", SessionRuntime(app.clear_session))
+    app.transcripts = overrides.pop("transcripts", TranscriptCache())
+    app.events = overrides.pop("events", EventHub(bus))
     for key, value in overrides.items():
         object.__setattr__(app, key, value)
     return app
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from hotaru.lsp import client as client_module
+from hotaru.lsp.client import SYNC_FULL, SYNC_INCREMENTAL, LSPClient, text_edit
+
+
+def _client(tmp_path: Path, sent: list[tuple[str, dict[str, Any]]]) -> LSPClient:
+    server = SimpleNamespace(process=SimpleNamespace(), initialization={})
+    client = LSPClient(server_id="pyright", server=server, root=str(tmp_path))
+
+    async def record(method: str, params: dict[str, Any]) -> None:
+        sent.append((method, params))
+
+    client._send_notification = record  # type: ignore[method-assign]
+    return client
+
+
+def _apply(text: str, change: dict[str, Any]) -> str:
+    lines = text.split("\n")
+
+    def offset(position: dict[str, int]) -> int:
+        head = sum(len(line) + 1 for line in lines[: position["line"]])
+        units = lines[position["line"]].encode("utf-16-le")[: position["character"] * 2]
+        return head + len(units.decode("utf-16-le"))
+
+    start, end = offset(change["range"]["start"]), offset(change["range"]["end"])
+    return text[:start] + change["text"] + text[end:]
+
+
+@pytest.mark.parametrize(
+    ("old", "new"),
+    [
+        ("a = 1\nb = 2\n", "a = 1\nb = 3\n"),
+        ("x = '🙂'\ny = 1\n", "x = '🙂'\ny = 12\n"),
+        ("one\r\ntwo\r\n", "one\r\nzwei\r\ntwo\r\n"),
+        ("keep\n" * 5000 + "tail", "keep\n" * 2500 + "new\n" + "keep\n" * 2500 + "tail"),
+        ("abc", ""),
+        ("", "abc"),
+    ],
+)
+def test_text_edit_is_minimal_and_applies(old: str, new: str) -> None:
+    change = text_edit(old, new)
+    assert change is not None
+    assert _apply(old, change) == new
+    assert len(change["text"]) <= max(len(new) - len(old), 0) + 5
+
+
+def test_text_edit_of_equal_texts_is_none() -> None:
+    assert text_edit("same", "same") is None
+
+
+def test_initialize_result_selects_sync_kind() -> None:
+    assert LSPClient._negotiated_sync_kind({"capabilities": {"textDocumentSync": 2}}) == SYNC_INCREMENTAL
+    assert LSPClient._negotiated_sync_kind({"capabilities": {"textDocumentSync": {"change": 1}}}) == SYNC_FULL
+    assert LSPClient._negotiated_sync_kind({"capabilities": {}}) == SYNC_FULL
+
+
+@pytest.mark.anyio
+async def test_open_file_sends_ranges_and_skips_unchanged(tmp_path: Path) -> None:
+    sent: list[tuple[str, dict[str, Any]]] = []
+    client = _client(tmp_path, sent)
+    client._sync_kind = SYNC_INCREMENTAL
+    path = tmp_path / "main.py"
+    path.write_text("a = 1\nb = 2\n", encoding="utf-8")
+
+    assert await client.open_file(str(path)) is True
+    assert [method for method, _ in sent] == ["workspace/didChangeWatchedFiles", "textDocument/didOpen"]
+
+    sent.clear()
+    assert await client.open_file(str(path), "a = 1\nb = 2\n") is False
+    assert sent == []
+
+    assert await client.open_file(str(path), "a = 1\nb = 3\n") is True
+    method, params = sent[-1]
+    assert method == "textDocument/didChange"
+    assert params["textDocument"]["version"] == 1
+    assert params["contentChanges"] == [
+        {"range": {"start": {"line": 1, "character": 4}, "end": {"line": 1, "character": 5}}, "text": "3"}
+    ]
+
+    client._sync_kind = SYNC_FULL
+    await client.open_file(str(path), "a = 1\n")
+    assert sent[-1][1]["contentChanges"] == [{"text": "a = 1\n"}]
+
+
+@pytest.mark.anyio
+async def test_idle_and_excess_documents_are_closed(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    sent: list[tuple[str, dict[str, Any]]] = []
+    client = _client(tmp_path, sent)
+    monkeypatch.setattr(client_module, "MAX_OPEN_DOCUMENTS", 3)
+    now = [1000.0]
+    monkeypatch.setattr(client_module.time, "monotonic", lambda: now[0])
+
+    for name in ["a", "b", "c", "d"]:
+        await client.open_file(str(tmp_path / f"{name}.py"), f"{name} = 1\n")
+        now[0] += 1
+    closed = [params["textDocument"]["uri"] for method, params in sent if method == "textDocument/didClose"]
+    assert [uri.rsplit("/", 1)[-1] for uri in closed] == ["a.py"]
+
+    # Touching an open document keeps it; long idle ones are closed on the next open.
+    await client.open_file(str(tmp_path / "b.py"), "b = 1\n")
+    now[0] += client_module.DOCUMENT_IDLE_SECONDS
+    await client.open_file(str(tmp_path / "e.py"), "e = 1\n")
+    assert sorted(Path(path).name for path in client._documents) == ["e.py"]
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+import hotaru.lsp.lsp as lsp_module
+from hotaru.lsp.client import LSPClient
+from hotaru.lsp.lsp import LSP, LSPState
+from hotaru.lsp.server import LSPServerInfo
+from hotaru.project.instance import Instance
+
+SPAWN_DELAY = 0.1
+
+
+class _Process:
+    pid = 1
+
+    def kill(self) -> None:
+        pass
+
+    def terminate(self) -> None:
+        pass
+
+    def wait(self, timeout: Optional[float] = None) -> int:
+        return 0
+
+
+def _server(server_id: str, root: str, root_calls: List[str], spawned: List[str]) -> LSPServerInfo:
+    async def find_root(file: str) -> Optional[str]:
+        root_calls.append(file)
+        return root
+
+    async def spawn(root: str, env: Dict[str, str], initialization: Dict[str, Any]) -> Any:
+        spawned.append(server_id)
+        await asyncio.sleep(SPAWN_DELAY)
+        return SimpleNamespace(process=_Process(), initialization=initialization)
+
+    return LSPServerInfo(server_id=server_id, extensions=[".ts"], root=find_root, spawn=spawn)
+
+
+def _lsp(tmp_path: Path, root_calls: List[str], spawned: List[str]) -> LSP:
+    lsp = LSP()
+    lsp._state = LSPState()
+    for server_id in ["typescript", "eslint", "oxlint"]:
+        lsp._state.servers[server_id] = _server(server_id, str(tmp_path), root_calls, spawned)
+    return lsp
+
+
+@pytest.fixture(autouse=True)
+def _fast_initialize(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def initialize(self: LSPClient) -> bool:
+        await asyncio.sleep(SPAWN_DELAY)
+        return True
+
+    monkeypatch.setattr(LSPClient, "initialize", initialize)
+
+
+@pytest.mark.anyio
+async def test_matching_servers_spawn_concurrently(tmp_path: Path) -> None:
+    root_calls: List[str] = []
+    spawned: List[str] = []
+    lsp = _lsp(tmp_path, root_calls, spawned)
+    (tmp_path / "src").mkdir()
+
+    async def run() -> Any:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        first, second = await asyncio.gather(
+            lsp._get_clients(str(tmp_path / "src" / "a.ts")),
+            lsp._get_clients(str(tmp_path / "src" / "b.ts")),
+        )
+        elapsed = loop.time() - started
+        await lsp._get_clients(str(tmp_path / "src" / "c.ts"))
+        return first, second, elapsed, await lsp.status()
+
+    first, second, elapsed, status = await Instance.provide(directory=str(tmp_path), fn=run)
+
+    # Three servers, spawned and initialized at once rather than one by one.
+    assert elapsed < 3 * 2 * SPAWN_DELAY
+    assert [client.server_id for client in first] == ["typescript", "eslint", "oxlint"]
+    assert first == second
+    assert sorted(spawned) == ["eslint", "oxlint", "typescript"]
+    # One root lookup per server and directory.
+    assert len(root_calls) == 3
+    assert all(item.spawn_ms and item.initialize_ms for item in status)
+
+
+@pytest.mark.anyio
+async def test_prewarm_starts_servers_for_project_files(tmp_path: Path) -> None:
+    root_calls: List[str] = []
+    spawned: List[str] = []
+    lsp = _lsp(tmp_path, root_calls, spawned)
+    (tmp_path / "main.ts").write_text("export {}\n", encoding="utf-8")
+    (tmp_path / "notes.md").write_text("# notes\n", encoding="utf-8")
+
+    lsp.prewarm(str(tmp_path))
+    assert lsp._prewarm_task is not None
+    await lsp._prewarm_task
+
+    assert sorted(spawned) == ["eslint", "oxlint", "typescript"]
+    assert len(lsp._state.clients) == 3
+    await lsp.shutdown()
+
+
+@pytest.mark.anyio
+async def test_missing_root_is_looked_up_again_after_ttl(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    roots: List[Optional[str]] = [None]
+    root_calls: List[str] = []
+    spawned: List[str] = []
+
+    async def find_root(file: str) -> Optional[str]:
+        root_calls.append(file)
+        return roots[-1]
+
+    async def spawn(root: str, env: Dict[str, str], initialization: Dict[str, Any]) -> Any:
+        spawned.append(root)
+        return SimpleNamespace(process=_Process(), initialization=initialization)
+
+    lsp = LSP()
+    lsp._state = LSPState()
+    lsp._state.servers["typescript"] = LSPServerInfo(
+        server_id="typescript", extensions=[".ts"], root=find_root, spawn=spawn
+    )
+    file = str(tmp_path / "main.ts")
+
+    async def run() -> Any:
+        before = await lsp._get_clients(file)
+        await lsp._get_clients(file)
+        calls_while_cached = len(root_calls)
+        roots.append(str(tmp_path))
+        monkeypatch.setattr(lsp_module, "MISSING_ROOT_TTL", 0.0)
+        after = await lsp._get_clients(file)
+        return before, calls_while_cached, after
+
+    before, calls_while_cached, after = await Instance.provide(directory=str(tmp_path), fn=run)
+
+    assert before == []
+    assert calls_while_cached == 1
+    assert [client.server_id for client in after] == ["typescript"]
+    assert spawned == [str(tmp_path)]
+    await lsp.shutdown()
@@ -15,11 +15,12 @@ class _FakeClient:
         self.wait_started.set()
         await asyncio.sleep(0.01)
 
-    async def open_file(self, _path: str) -> None:
+    async def open_file(self, _path: str, _text: str | None = None) -> bool:
         # Yield once so any pre-scheduled wait task can run.
         await asyncio.sleep(0)
         self.open_observed_wait_started = self.wait_started.is_set()
         await asyncio.sleep(0.01)
+        return True
 
 
 @pytest.mark.anyio
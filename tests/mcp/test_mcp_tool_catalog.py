@@ -0,0 +1,119 @@
+import asyncio
+from typing import List, Optional
+
+import pytest
+from mcp import types
+
+from hotaru.core.bus import Bus
+from hotaru.core.config import Config, ConfigManager
+from hotaru.mcp.mcp import (
+    MCP,
+    MCPClient,
+    MCPState,
+    MCPStatusConnected,
+    MCPToolDefinition,
+    ToolsChanged,
+)
+
+
+class FakeClient:
+    def __init__(self, name: str, tools: List[str], delay: float = 0.0) -> None:
+        self.name = name
+        self.tool_names = tools
+        self.delay = delay
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+
+    async def list_tools(self) -> List[MCPToolDefinition]:
+        self.calls += 1
+        self.active += 1
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        return [MCPToolDefinition(name=name, description=f"{name} tool") for name in self.tool_names]
+
+
+async def _manager(monkeypatch: pytest.MonkeyPatch, clients: List[FakeClient], ttl: Optional[float] = None) -> MCP:
+    config = Config.model_validate(
+        {"mcp": {client.name: {"type": "local", "command": ["echo"], "tools_ttl": ttl} for client in clients}}
+    )
+
+    async def fake_get(cls):
+        return config
+
+    monkeypatch.setattr(ConfigManager, "get", classmethod(fake_get))
+    mcp = MCP()
+    mcp._state = MCPState()
+    for client in clients:
+        mcp._state.clients[client.name] = client  # type: ignore[assignment]
+        mcp._state.status[client.name] = MCPStatusConnected()
+        cfg = config.mcp[client.name].model_dump()
+        await mcp._store_tools(client.name, cfg, await client.list_tools())
+    return mcp
+
+
+@pytest.mark.anyio
+async def test_tools_are_served_from_catalog(monkeypatch: pytest.MonkeyPatch) -> None:
+    one = FakeClient("one", ["read"])
+    two = FakeClient("two-srv", ["search"])
+    mcp = await _manager(monkeypatch, [one, two])
+
+    for _ in range(3):
+        tools = await mcp.tools()
+
+    assert list(tools) == ["one_read", "two_srv_search"]
+    assert tools["two_srv_search"]["client"] == "two-srv"
+    assert one.calls == 1
+    assert two.calls == 1
+
+
+@pytest.mark.anyio
+async def test_list_changed_refreshes_catalog_and_publishes(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = FakeClient("one", ["read"])
+    mcp = await _manager(monkeypatch, [client])
+    events: List[str] = []
+    unsubscribe = Bus.subscribe(ToolsChanged, lambda payload: events.append(payload.properties["server"]))
+
+    client.tool_names = ["read", "write"]
+    mcp._tools_list_changed("one")
+    tools = await mcp.tools()
+
+    assert sorted(tools) == ["one_read", "one_write"]
+    assert client.calls == 2
+    assert events == ["one"]
+
+    # An unchanged list does not publish again.
+    mcp._tools_list_changed("one")
+    await mcp.tools()
+    assert client.calls == 3
+    assert events == ["one"]
+    unsubscribe()
+
+
+@pytest.mark.anyio
+async def test_expired_catalogs_refresh_concurrently(monkeypatch: pytest.MonkeyPatch) -> None:
+    clients = [FakeClient(f"s{i}", ["t"], delay=0.05) for i in range(4)]
+    mcp = await _manager(monkeypatch, clients, ttl=0.01)
+    await asyncio.sleep(0.02)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    await mcp.tools()
+
+    assert loop.time() - started < 0.15
+    assert [client.calls for client in clients] == [2, 2, 2, 2]
+
+
+@pytest.mark.anyio
+async def test_client_reports_tool_list_changed_notification() -> None:
+    changed: List[str] = []
+    client = MCPClient("demo")
+    client.on_tools_changed = changed.append
+
+    await client._handle_message(types.ToolListChangedNotification())
+    await client._handle_message(types.PromptListChangedNotification())
+    await client._handle_message(RuntimeError("transport"))
+
+    assert changed == ["demo"]
@@ -0,0 +1,98 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from hotaru.project.file_index import FileIndex
+from hotaru.tool.glob import GlobParams, glob_execute
+from hotaru.tool.grep import GrepParams, grep_execute
+from hotaru.tool.tool import ToolContext
+from tests.helpers import fake_app
+
+
+@pytest.fixture(autouse=True)
+def _reset_indexes():
+    FileIndex.reset()
+    yield
+    FileIndex.reset()
+
+
+def _write(path: Path, text: str = "x\n") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def _bump_mtime(path: Path) -> None:
+    # Directory mtimes can have coarse resolution; make changes visible.
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_file_index_honors_nested_ignore_files(tmp_path: Path) -> None:
+    _write(tmp_path / ".gitignore", "*.log\nbuild/\n!keep.log\n")
+    _write(tmp_path / "src" / "main.py")
+    _write(tmp_path / "src" / "debug.log")
+    _write(tmp_path / "keep.log")
+    _write(tmp_path / "build" / "out.js")
+    _write(tmp_path / "node_modules" / "pkg" / "index.js")
+    _write(tmp_path / "vendor" / ".ignore", "generated/\n")
+    _write(tmp_path / "vendor" / "generated" / "big.py")
+    _write(tmp_path / "vendor" / "lib.py")
+
+    index = FileIndex(str(tmp_path))
+
+    assert index.files_sync() == [".gitignore", "keep.log", "src/main.py", "vendor/.ignore", "vendor/lib.py"]
+    assert index.files_sync(tmp_path / "vendor") == [".ignore", "lib.py"]
+    assert index.excludes(str(tmp_path / "build" / "nested"))
+    assert not index.excludes(str(tmp_path / "src"))
+
+
+def test_file_index_rescans_only_changed_directories(tmp_path: Path) -> None:
+    for name in ("a", "b", "c"):
+        _write(tmp_path / name / "file.py")
+    index = FileIndex(str(tmp_path))
+    assert len(index.files_sync()) == 3
+    assert index.scans == 4
+
+    assert len(index.files_sync()) == 3
+    assert index.scans == 4
+
+    _write(tmp_path / "b" / "new.py")
+    _bump_mtime(tmp_path / "b")
+    assert "b/new.py" in index.files_sync()
+    assert index.scans == 5
+
+    (tmp_path / "c" / "file.py").unlink()
+    (tmp_path / "c").rmdir()
+    _bump_mtime(tmp_path)
+    assert index.files_sync() == ["a/file.py", "b/file.py", "b/new.py"]
+
+    _write(tmp_path / ".gitignore", "a/\n")
+    assert index.files_sync() == [".gitignore", "b/file.py", "b/new.py"]
+
+
+@pytest.mark.anyio
+async def test_glob_and_grep_skip_ignored_trees(tmp_path: Path) -> None:
+    _write(tmp_path / ".gitignore", "dist/\n")
+    _write(tmp_path / "src" / "app.py", "needle = 1\n")
+    _write(tmp_path / "dist" / "app.py", "needle = 2\n")
+    _write(tmp_path / "node_modules" / "x" / "app.py", "needle = 3\n")
+    ctx = ToolContext(
+        app=fake_app(),
+        session_id="session_test",
+        message_id="message_test",
+        agent="build",
+        cwd=str(tmp_path),
+        worktree=str(tmp_path),
+    )
+
+    globbed = await glob_execute(GlobParams(pattern="**/*.py"), ctx)
+    assert globbed.output == str(tmp_path / "src" / "app.py")
+
+    grepped = await grep_execute(GrepParams(pattern="needle"), ctx)
+    assert grepped.metadata["matches"] == 1
+    assert str(tmp_path / "src" / "app.py") in grepped.output
+
+    # An explicit path into an ignored tree is still searchable.
+    explicit = await grep_execute(GrepParams(pattern="needle", path=str(tmp_path / "dist")), ctx)
+    assert explicit.metadata["matches"] == 1
@@ -0,0 +1,90 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from hotaru.core.bus import Bus, InstanceDisposed
+from hotaru.project.instance import Instance
+from hotaru.project.state import State
+
+
+@pytest.fixture(autouse=True)
+def _isolated_instances(monkeypatch: pytest.MonkeyPatch):
+    async def fake_from_directory(cls, directory: str):
+        return SimpleNamespace(id="global"), directory
+
+    monkeypatch.setattr("hotaru.project.instance.Project.from_directory", classmethod(fake_from_directory))
+    Instance.reset_runtime_state()
+    State.reset_runtime_state()
+    yield
+    Instance.reset_runtime_state()
+    State.reset_runtime_state()
+
+
+async def _touch(directory: str) -> str:
+    return await Instance.provide(directory=directory, fn=Instance.directory)
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.anyio
+async def test_least_recently_used_instance_is_evicted_over_capacity() -> None:
+    disposed: list[str] = []
+    Bus.subscribe(InstanceDisposed, lambda payload: disposed.append(payload.properties["directory"]))
+    Instance.configure(max_instances=2)
+
+    await _touch("/a")
+    await _touch("/b")
+    await _touch("/a")
+    await _touch("/c")
+    await _settle()
+
+    assert disposed == ["/b"]
+    metrics = Instance.metrics()
+    assert metrics["live"] == 2
+    assert metrics["evicted_capacity"] == 1
+    assert metrics["hits"] == 1
+    assert metrics["created"] == 3
+
+
+@pytest.mark.anyio
+async def test_idle_instances_are_swept_and_their_state_disposed() -> None:
+    closed: list[str] = []
+
+    async def close(value: str) -> None:
+        closed.append(value)
+
+    resource = Instance.state(lambda: "resource", close)
+    await Instance.provide(directory="/idle", fn=resource)
+    Instance.configure(idle_ttl=0.0)
+
+    assert Instance.sweep() == ["/idle"]
+    await _settle()
+
+    assert closed == ["resource"]
+    assert Instance.metrics()["live"] == 0
+    assert Instance.metrics()["evicted_idle"] == 1
+
+
+@pytest.mark.anyio
+async def test_active_instance_is_not_evicted() -> None:
+    Instance.configure(idle_ttl=0.0)
+    release = asyncio.Event()
+    started = asyncio.Event()
+
+    async def hold() -> None:
+        started.set()
+        await release.wait()
+
+    task = asyncio.create_task(Instance.provide(directory="/busy", fn=hold))
+    await started.wait()
+
+    assert Instance.sweep() == []
+    assert Instance.metrics()["active"] == 1
+
+    release.set()
+    await task
+    assert Instance.sweep() == ["/busy"]
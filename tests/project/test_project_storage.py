@@ -1,9 +1,11 @@
+import os
 from pathlib import Path
 
 import pytest
 
 from hotaru.core.global_paths import GlobalPath
 from hotaru.project import Project
+from hotaru.project import project as project_module
 from hotaru.storage import Storage
 
 
@@ -100,3 +102,67 @@ async def test_set_initialized_creates_record_if_missing(
 
     stored = await Storage.read(["project", "missing-project"])
     assert stored["time"]["initialized"] is not None
+
+
+@pytest.mark.anyio
+async def test_from_directory_caches_git_resolution(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    _setup_storage(monkeypatch, tmp_path)
+
+    workspace = tmp_path / "repo"
+    (workspace / ".git").mkdir(parents=True)
+    (workspace / ".git" / "hotaru").write_text("abc123")
+    head = workspace / ".git" / "HEAD"
+    head.write_text("ref: refs/heads/main\n")
+    calls: list[list[str]] = []
+
+    async def fake_git(cmd: list[str], cwd: str) -> str | None:
+        calls.append(cmd)
+        return str(workspace) if "--show-toplevel" in cmd else ".git"
+
+    monkeypatch.setattr(project_module, "_run_git_command", fake_git)
+
+    first, sandbox = await Project.from_directory(str(workspace))
+    second, _ = await Project.from_directory(str(workspace))
+
+    assert first.id == second.id == "abc123"
+    assert first.vcs == "git"
+    assert sandbox == str(workspace)
+    assert len(calls) == 2
+
+    # A checkout rewrites HEAD and invalidates the cached resolution.
+    info = head.stat()
+    os.utime(head, ns=(info.st_atime_ns, info.st_mtime_ns + 1_000_000))
+    await Project.from_directory(str(workspace))
+    assert len(calls) == 4
+
+
+@pytest.mark.anyio
+async def test_from_directory_resolves_again_until_first_commit(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    _setup_storage(monkeypatch, tmp_path)
+
+    workspace = tmp_path / "repo"
+    (workspace / ".git").mkdir(parents=True)
+    (workspace / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+    roots: list[str] = []
+
+    async def fake_git(cmd: list[str], cwd: str) -> str | None:
+        if "rev-list" in cmd:
+            return "\n".join(roots) or None
+        return str(workspace) if "--show-toplevel" in cmd else ".git"
+
+    monkeypatch.setattr(project_module, "_run_git_command", fake_git)
+
+    empty, _ = await Project.from_directory(str(workspace))
+    assert empty.id == "global"
+    assert empty.vcs is None
+
+    roots.append("def456")
+    committed, _ = await Project.from_directory(str(workspace))
+    assert committed.id == "def456"
+    assert committed.vcs == "git"
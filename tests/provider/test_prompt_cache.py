@@ -0,0 +1,106 @@
+from hotaru.provider.cache import CachePlan, PromptCache
+from hotaru.provider.tokenizer import Tokenizer
+from hotaru.provider.transform import ProviderTransform
+
+_CHUNK = "word " * 3000
+
+
+def _history(count: int) -> list[dict]:
+    roles = ("user", "assistant")
+    return [{"role": roles[idx % 2], "content": _CHUNK} for idx in range(count)]
+
+
+def test_plan_skips_prefixes_below_minimum_size() -> None:
+    plan = PromptCache.plan(
+        [{"role": "user", "content": "hi"}],
+        key="anthropic",
+        system_tokens=10,
+        tool_tokens=10,
+    )
+
+    assert plan == CachePlan()
+
+
+def test_plan_respects_provider_breakpoint_limit() -> None:
+    plan = PromptCache.plan(
+        _history(40),
+        key="anthropic",
+        system_tokens=2_000,
+        tool_tokens=3_000,
+    )
+
+    assert plan.tools is True
+    assert plan.system is True
+    assert plan.count == PromptCache.limit("anthropic")
+    assert plan.messages[-1] == 39
+
+
+def test_plan_keeps_history_anchors_while_rolling_point_advances() -> None:
+    history = _history(12)
+    before = PromptCache.plan(history, key="anthropic", system_tokens=2_000)
+    history.append({"role": "user", "content": "next"})
+    after = PromptCache.plan(history, key="anthropic", system_tokens=2_000)
+
+    assert before.messages[-1] == 11
+    assert after.messages[-1] == 12
+    assert set(before.messages[:-1]) <= set(after.messages)
+
+
+def test_plan_is_empty_for_providers_without_cache_hints() -> None:
+    plan = ProviderTransform.cache_plan(
+        _history(4),
+        provider_id="mistral",
+        api_type="openai",
+        system="x" * 10_000,
+    )
+
+    assert plan == CachePlan()
+
+
+def test_apply_cache_controls_marks_planned_messages_only() -> None:
+    messages = _history(3)
+    plan = CachePlan(messages=(2,))
+
+    marked = ProviderTransform.apply_cache_controls(
+        messages,
+        provider_id="anthropic",
+        api_type="anthropic",
+        plan=plan,
+    )
+
+    assert "provider_options" not in marked[0]
+    assert "provider_options" not in marked[1]
+    assert marked[2]["provider_options"]["anthropic"] == {"cacheControl": {"type": "ephemeral"}}
+
+
+def test_anthropic_conversion_carries_cache_control() -> None:
+    hint = {"anthropic": {"cacheControl": {"type": "ephemeral"}}}
+    messages = [
+        {"role": "user", "content": "open file", "provider_options": hint},
+        {
+            "role": "assistant",
+            "content": None,
+            "tool_calls": [{"id": "call_1", "function": {"name": "read", "arguments": "{}"}}],
+        },
+        {"role": "tool", "tool_call_id": "call_1", "content": "data", "provider_options": hint},
+    ]
+    tools = [{"type": "function", "function": {"name": "read", "parameters": {}}}]
+
+    converted = ProviderTransform.anthropic_messages(messages)
+    converted_tools = ProviderTransform.anthropic_tools(tools, cache=True)
+    system = ProviderTransform.anthropic_system("sys", cache=True)
+
+    assert converted[0]["content"][0]["cache_control"] == {"type": "ephemeral"}
+    assert "cache_control" not in converted[1]["content"][0]
+    assert converted[2]["content"][0]["cache_control"] == {"type": "ephemeral"}
+    assert converted_tools is not None
+    assert converted_tools[-1]["cache_control"] == {"type": "ephemeral"}
+    assert system == [{"type": "text", "text": "sys", "cache_control": {"type": "ephemeral"}}]
+    assert ProviderTransform.anthropic_system("sys") == "sys"
+
+
+def test_message_tokens_include_tool_calls() -> None:
+    call = {"role": "assistant", "content": None, "tool_calls": [{"id": "c", "function": {"name": "read"}}]}
+
+    assert PromptCache.message_tokens({"role": "user", "content": _CHUNK}) == Tokenizer.count(_CHUNK)
+    assert PromptCache.message_tokens(call) > 0
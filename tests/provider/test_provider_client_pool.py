@@ -0,0 +1,145 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+from hotaru.provider.sdk.pool import PoolOptions, ProviderClients
+
+_CHUNKS = [
+    {
+        "id": "c",
+        "object": "chat.completion.chunk",
+        "created": 0,
+        "model": "m",
+        "choices": [{"index": 0, "delta": {"role": "assistant", "content": "hi"}, "finish_reason": None}],
+    },
+    {
+        "id": "c",
+        "object": "chat.completion.chunk",
+        "created": 0,
+        "model": "m",
+        "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+    },
+]
+_BODY = ("".join(f"data: {json.dumps(chunk)}\n\n" for chunk in _CHUNKS) + "data: [DONE]\n\n").encode()
+
+
+async def _start_stub_server() -> tuple[asyncio.AbstractServer, str, list[int]]:
+    """Keep-alive HTTP/1.1 server answering every request with a short SSE stream."""
+    connections: list[int] = []
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connections.append(1)
+        while True:
+            try:
+                head = await reader.readuntil(b"\r\n\r\n")
+            except (asyncio.IncompleteReadError, ConnectionError):
+                break
+            length = 0
+            for line in head.decode().split("\r\n"):
+                if line.lower().startswith("content-length:"):
+                    length = int(line.split(":", 1)[1])
+            await reader.readexactly(length)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\ncontent-type: text/event-stream\r\n"
+                + b"content-length: %d\r\n\r\n" % len(_BODY)
+                + _BODY
+            )
+            await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    return server, f"http://127.0.0.1:{port}/v1", connections
+
+
+@pytest.fixture(autouse=True)
+def _reset_pool():
+    ProviderClients.reset()
+    yield
+    ProviderClients.reset()
+
+
+@pytest.mark.anyio
+async def test_pooled_client_reuses_connection_across_streams() -> None:
+    server, base_url, connections = await _start_stub_server()
+    try:
+        texts = []
+        for _ in range(3):
+            sdk = ProviderClients.openai(provider_id="stub", api_key="k", base_url=base_url)
+            async for chunk in sdk.stream(model="m", messages=[{"role": "user", "content": "x"}]):
+                if chunk.type == "text":
+                    texts.append(chunk.text)
+        assert texts == ["hi", "hi", "hi"]
+        assert len(connections) == 1
+
+        stats = ProviderClients.stats()
+        assert stats["clients_created"] == 1
+        assert stats["clients_reused"] == 2
+        assert stats["requests"] == 3
+        assert stats["connections_opened"] == 1
+        assert stats["connections_reused"] == 2
+    finally:
+        await ProviderClients.close_all()
+        server.close()
+        await server.wait_closed()
+    assert ProviderClients.stats()["clients"] == 0
+
+
+@pytest.mark.anyio
+async def test_clients_are_keyed_by_provider_url_and_key() -> None:
+    first = ProviderClients.anthropic(provider_id="anthropic", api_key="a")
+    assert ProviderClients.anthropic(provider_id="anthropic", api_key="a") is first
+    assert ProviderClients.anthropic(provider_id="anthropic", api_key="b") is not first
+    assert ProviderClients.anthropic(provider_id="anthropic", api_key="a", base_url="http://proxy") is not first
+    assert ProviderClients.openai(provider_id="anthropic", api_key="a") is not first
+    await ProviderClients.close_all()
+
+
+@pytest.mark.anyio
+async def test_clients_with_different_pool_options_are_not_shared() -> None:
+    small = {"pool": {"maxConnections": 4}}
+    first = ProviderClients.openai(provider_id="stub", api_key="k", options=small)
+    assert ProviderClients.openai(provider_id="stub", api_key="k", options=small) is first
+    assert ProviderClients.openai(provider_id="stub", api_key="k", options={"pool": {"maxConnections": 8}}) is not first
+    assert ProviderClients.openai(provider_id="stub", api_key="k") is not first
+    await ProviderClients.close_all()
+
+
+@pytest.mark.anyio
+async def test_replaced_client_is_closed_on_its_own_loop() -> None:
+    other = asyncio.new_event_loop()
+    thread = threading.Thread(target=other.run_forever, daemon=True)
+    thread.start()
+    try:
+
+        async def create() -> None:
+            ProviderClients.openai(provider_id="stub", api_key="k")
+
+        asyncio.run_coroutine_threadsafe(create(), other).result(timeout=5)
+        (stale,) = ProviderClients._clients.values()
+
+        ProviderClients.openai(provider_id="stub", api_key="k")
+        for _ in range(100):
+            if stale.http.is_closed:
+                break
+            await asyncio.sleep(0.01)
+
+        assert stale.http.is_closed
+        assert ProviderClients.stats()["clients"] == 1
+    finally:
+        other.call_soon_threadsafe(other.stop)
+        thread.join(timeout=5)
+        other.close()
+        await ProviderClients.close_all()
+
+
+def test_pool_options_from_provider_config() -> None:
+    pool = PoolOptions.from_options(
+        {"baseURL": "http://x", "pool": {"maxConnections": 8, "keepaliveExpiry": 120, "http2": True}}
+    )
+    assert pool.max_connections == 8
+    assert pool.keepalive_expiry == 120.0
+    assert pool.http2 is True
+    assert PoolOptions.from_options(None) == PoolOptions()
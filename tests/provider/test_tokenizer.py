@@ -0,0 +1,65 @@
+import pytest
+
+from hotaru.provider.tokenizer import CharCounter, EstimateCounter, TokenCounter, Tokenizer
+
+
+@pytest.fixture(autouse=True)
+def _reset_tokenizer():
+    factories = dict(Tokenizer._factories)
+    Tokenizer.use(None)
+    yield
+    Tokenizer._factories = factories
+    Tokenizer.use(None)
+
+
+def test_estimate_charges_cjk_per_character() -> None:
+    text = "你好世界" * 100
+
+    assert EstimateCounter().count(text) == 400
+    assert CharCounter().count(text) == 100
+
+
+def test_estimate_counts_code_denser_than_chars() -> None:
+    code = "def fooBar(x_1, y):\n    return {'k': x_1 + y}\n" * 50
+
+    assert EstimateCounter().count(code) > CharCounter().count(code)
+
+
+def test_empty_text_is_free() -> None:
+    assert Tokenizer.count("") == 0
+    assert Tokenizer.count(None) == 0
+
+
+def test_use_switches_counter_and_unknown_name_raises() -> None:
+    assert Tokenizer.use("chars").name == "chars"
+    assert Tokenizer.count("x" * 40) == 10
+
+    with pytest.raises(ValueError):
+        Tokenizer.use("missing")
+
+
+def test_counter_that_fails_to_load_falls_back_to_estimate() -> None:
+    def broken() -> TokenCounter:
+        raise RuntimeError("no vocabulary")
+
+    Tokenizer.register("broken", broken)
+
+    assert Tokenizer.use("broken").name == "estimate"
+    assert Tokenizer.requested() == "broken"
+
+
+def test_large_texts_are_counted_once() -> None:
+    calls: list[str] = []
+
+    class Recording(TokenCounter):
+        name = "recording"
+
+        def count(self, text: str) -> int:
+            calls.append(text)
+            return len(text)
+
+    Tokenizer.use(Recording())
+    text = "a" * Tokenizer.CACHE_MIN_CHARS
+
+    assert Tokenizer.count(text) == Tokenizer.count(text) == len(text)
+    assert len(calls) == 1
@@ -67,3 +67,21 @@ async def test_startup_marks_degraded_for_non_critical_subsystem() -> None:
     assert app.subsystem_ready("lsp") is False
 
     await app.shutdown()
+
+
+@pytest.mark.anyio
+async def test_project_directory_resolves_git_worktree_root(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    subdir = tmp_path / "pkg"
+    subdir.mkdir()
+    projects = {"git": SimpleNamespace(vcs="git"), "none": SimpleNamespace(vcs=None)}
+    kind = ["git"]
+
+    async def fake_from_directory(cls, directory: str):
+        return projects[kind[0]], str(tmp_path)
+
+    monkeypatch.setattr("hotaru.project.Project.from_directory", classmethod(fake_from_directory))
+    monkeypatch.chdir(subdir)
+
+    assert await AppContext._project_directory() == str(tmp_path)
+    kind[0] = "none"
+    assert await AppContext._project_directory() == str(subdir)
@@ -0,0 +1,114 @@
+import json
+from typing import Any
+
+import pytest
+
+from hotaru.app_services.event_service import EventService
+from hotaru.core.bus import Bus
+from hotaru.runtime.event_hub import EventHub
+
+
+def _emit(hub: EventHub, event_type: str, **data: Any) -> None:
+    hub._on_event({"type": event_type, "properties": data})
+
+
+def _delta(hub: EventHub, text: str, part_id: str = "part_1") -> None:
+    _emit(
+        hub,
+        "message.part.delta",
+        session_id="session_1",
+        message_id="message_1",
+        part_id=part_id,
+        field="text",
+        delta=text,
+    )
+
+
+def test_events_get_increasing_ids_and_are_encoded_once() -> None:
+    hub = EventHub(Bus())
+    first, _ = hub.subscribe()
+    second, _ = hub.subscribe()
+
+    _emit(hub, "session.status", session_id="session_1", status={"type": "busy"})
+    _emit(hub, "session.status", session_id="session_1", status={"type": "idle"})
+
+    a = first.pending()
+    b = second.pending()
+    assert [event["id"] for event in a] == [1, 2]
+    assert a[0] is b[0] and a[0]["encoded"] is b[0]["encoded"]
+    body = json.loads(a[1]["encoded"])
+    assert body["id"] == 2
+    assert body["session_id"] == "session_1"
+    assert body["data"]["status"] == {"type": "idle"}
+
+
+def test_subscribe_replays_after_last_event_id() -> None:
+    hub = EventHub(Bus(), replay=3)
+    for index in range(5):
+        _emit(hub, "session.status", session_id="session_1", index=index)
+
+    subscriber, resumed = hub.subscribe(last_event_id=3)
+    assert resumed is True
+    assert [event["id"] for event in subscriber.pending()] == [4, 5]
+
+    # Event 2 has already left the ring.
+    _, resumed = hub.subscribe(last_event_id=1)
+    assert resumed is False
+
+
+def test_consecutive_deltas_merge_while_queued() -> None:
+    hub = EventHub(Bus())
+    subscriber, _ = hub.subscribe()
+
+    for text in ["Hel", "lo", " wor", "ld"]:
+        _delta(hub, text)
+    _delta(hub, "!", part_id="part_2")
+    _delta(hub, "?", part_id="part_2")
+
+    queued = subscriber.pending()
+    assert [event["data"]["delta"] for event in queued] == ["Hello world", "!?"]
+    assert [event["id"] for event in queued] == [4, 6]
+    assert json.loads(queued[0]["encoded"])["data"]["delta"] == "Hello world"
+    assert subscriber.merged == 4
+
+
+@pytest.mark.anyio
+async def test_stream_resumes_and_disconnects_slow_clients() -> None:
+    hub = EventHub(Bus(), queue_size=2)
+    _emit(hub, "session.status", session_id="session_1", index=0)
+    _emit(hub, "session.status", session_id="session_1", index=1)
+
+    stream = EventService.stream(hub, last_event_id=1)
+    connected = await stream.__anext__()
+    assert connected["type"] == "server.connected"
+    assert connected["data"] == {"last_event_id": 1, "resumed": True}
+    assert (await stream.__anext__())["id"] == 2
+
+    for index in range(3):
+        _emit(hub, "session.status", session_id="session_1", index=index)
+    with pytest.raises(StopAsyncIteration):
+        await stream.__anext__()
+    assert not hub._subscribers
+
+
+def test_replay_ring_is_bounded_by_encoded_size() -> None:
+    hub = EventHub(Bus(), replay_bytes=2_000)
+    for index in range(20):
+        _emit(hub, "message.part.updated", part={"session_id": "session_1", "id": "part_1", "text": "x" * 400})
+
+    assert 1 <= len(hub._ring) <= 5
+    assert hub._ring_bytes == sum(len(event["encoded"]) for event in hub._ring)
+    assert hub._ring[-1]["id"] == 20
+
+
+def test_session_filter_applies_before_queueing() -> None:
+    hub = EventHub(Bus(), queue_size=2)
+    subscriber, _ = hub.subscribe(session_id="session_1")
+
+    for index in range(5):
+        _emit(hub, "session.status", session_id="session_2", index=index)
+    _emit(hub, "session.status", session_id="session_1", index=0)
+    _emit(hub, "pty.output", id="pty_1")
+
+    assert not subscriber.overflowed
+    assert [event["type"] for event in subscriber.pending()] == ["session.status", "pty.output"]
@@ -18,7 +18,7 @@ def _decode_sse(response: Any) -> list[dict[str, Any]]:
 
 
 def test_v1_event_stream_filters_by_session_id(monkeypatch, app_ctx) -> None:  # type: ignore[no-untyped-def]
-    async def fake_events(cls, bus) -> AsyncIterator[dict[str, Any]]:  # type: ignore[no-untyped-def]
+    async def fake_events(cls, hub, last_event_id=None, session_id="") -> AsyncIterator[dict[str, Any]]:  # type: ignore[no-untyped-def]
         yield {"type": "message.updated", "session_id": "session_1", "data": {"info": {"session_id": "session_1", "id": "m_1"}}}
         yield {"type": "message.updated", "session_id": "session_2", "data": {"info": {"session_id": "session_2", "id": "m_2"}}}
 
@@ -36,7 +36,7 @@ def test_v1_event_stream_filters_by_session_id(monkeypatch, app_ctx) -> None:  #
 
 
 def test_v1_event_stream_without_session_filter_returns_all(monkeypatch, app_ctx) -> None:  # type: ignore[no-untyped-def]
-    async def fake_events(cls, bus) -> AsyncIterator[dict[str, Any]]:  # type: ignore[no-untyped-def]
+    async def fake_events(cls, hub, last_event_id=None, session_id="") -> AsyncIterator[dict[str, Any]]:  # type: ignore[no-untyped-def]
         yield {"type": "session.status", "session_id": "session_1", "data": {"session_id": "session_1", "status": {"type": "working"}}}
         yield {"type": "session.status", "session_id": "session_2", "data": {"session_id": "session_2", "status": {"type": "idle"}}}
 
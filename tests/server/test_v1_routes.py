@@ -4,6 +4,7 @@ from typing import Any, AsyncIterator
 from fastapi.testclient import TestClient
 
 from hotaru.agent.agent import AgentInfo, AgentMode
+from hotaru.core.bus import EventStats
 from hotaru.server.server import Server
 
 
@@ -350,7 +351,7 @@ def test_v1_permission_question_and_event_routes_delegate_to_services(monkeypatc
         captured["question_reject"] = request_id
         return True
 
-    async def fake_events(cls, bus) -> AsyncIterator[dict[str, Any]]:  # type: ignore[no-untyped-def]
+    async def fake_events(cls, hub, last_event_id=None, session_id="") -> AsyncIterator[dict[str, Any]]:  # type: ignore[no-untyped-def]
         yield {"type": "server.connected", "data": {"healthy": True}}
 
     monkeypatch.setattr("hotaru.app_services.permission_service.PermissionService.list", classmethod(fake_permission_list))
@@ -396,3 +397,43 @@ def test_v1_permission_question_and_event_routes_delegate_to_services(monkeypatc
     assert captured["permission_reply"]["payload"]["reply"] == "once"
     assert captured["question_reply"]["request_id"] == "q_1"
     assert captured["question_reject"] == "q_1"
+
+
+def test_v1_instances_route_reports_instance_cache_metrics(monkeypatch, app_ctx) -> None:  # type: ignore[no-untyped-def]
+    metrics = {
+        "live": 2,
+        "active": 1,
+        "disposing": 0,
+        "hits": 40,
+        "created": 5,
+        "evicted_idle": 2,
+        "evicted_capacity": 1,
+        "max_instances": 8,
+        "idle_ttl": 600.0,
+    }
+    monkeypatch.setattr("hotaru.server.routes.system.Instance.metrics", classmethod(lambda cls: dict(metrics)))
+
+    app = Server._create_app(app_ctx)
+    with TestClient(app) as client:
+        response = client.get("/v1/instances")
+
+    assert response.status_code == 200
+    assert response.json() == metrics
+
+
+def test_v1_bus_metrics_route_reports_per_event_stats(monkeypatch, app_ctx) -> None:  # type: ignore[no-untyped-def]
+    stats = EventStats()
+    stats.published = 3
+    stats.deliveries = 6
+    stats.observe(0.002)
+    monkeypatch.setattr(app_ctx.bus, "metrics", lambda: {"message.part.delta": stats.snapshot()})
+
+    app = Server._create_app(app_ctx)
+    with TestClient(app) as client:
+        response = client.get("/v1/bus/metrics")
+
+    assert response.status_code == 200
+    body = response.json()["message.part.delta"]
+    assert body["published"] == 3
+    assert body["deliveries"] == 6
+    assert body["histogram"]["le_10ms"] == 1
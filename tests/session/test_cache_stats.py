@@ -0,0 +1,36 @@
+import pytest
+
+from hotaru.session.cache_stats import SessionCacheStats
+from hotaru.session.message_store import TokenUsage
+
+
+@pytest.fixture(autouse=True)
+def _reset_stats():
+    SessionCacheStats.clear()
+    yield
+    SessionCacheStats.clear()
+
+
+def test_record_accumulates_read_and_write_ratios() -> None:
+    SessionCacheStats.record("s1", TokenUsage(input=100, cache_write=900))
+    totals = SessionCacheStats.record("s1", TokenUsage(input=50, cache_read=900, cache_write=50))
+
+    stats = totals.to_dict()
+    assert stats["steps"] == 2
+    assert stats["cache_read"] == 900
+    assert stats["cache_write"] == 950
+    assert stats["read_ratio"] == pytest.approx(900 / 2_000)
+    assert stats["write_ratio"] == pytest.approx(950 / 2_000)
+    assert stats["last_read_ratio"] == pytest.approx(0.9)
+
+
+def test_stats_are_bounded_and_cleared_per_session(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(SessionCacheStats, "MAX_SESSIONS", 2)
+
+    for session_id in ("s1", "s2", "s3"):
+        SessionCacheStats.record(session_id, TokenUsage(input=10))
+    SessionCacheStats.clear("s3")
+
+    assert SessionCacheStats.get("s1") is None
+    assert SessionCacheStats.get("s2") is not None
+    assert SessionCacheStats.get("s3") is None
@@ -5,7 +5,8 @@ import pytest
 from hotaru.core.config import ConfigManager
 from hotaru.provider.models import ModelLimit
 from hotaru.provider.provider import ProcessedModelInfo
-from hotaru.session.compaction import SessionCompaction
+from hotaru.provider.tokenizer import Tokenizer
+from hotaru.session.compaction import ContextProjection, SessionCompaction
 from hotaru.session.message_store import (
     MessageInfo,
     MessageTime,
@@ -15,6 +16,9 @@ from hotaru.session.message_store import (
     ToolState,
     ToolStateTime,
     WithParts,
+    count_part_tokens,
+    part_tokens,
+    transcript_tokens,
 )
 from hotaru.session.session import Session
 
@@ -87,7 +91,7 @@ def _conversation_with_tool_output(output: str) -> list[WithParts]:
 async def test_prune_uses_token_estimate_not_utf8_bytes(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    # This is ~90KB UTF-8 but only ~7.5K estimated tokens.
+    # This is ~90KB UTF-8 but only ~30K tokens, under PRUNE_PROTECT.
     output = "你" * 30_000
     messages = _conversation_with_tool_output(output)
     updated_parts: list[ToolPart] = []
@@ -135,3 +139,91 @@ async def test_prune_marks_very_large_historical_output(
     await SessionCompaction.prune(session_id="s1")
     assert len(updated_parts) == 1
     assert updated_parts[0].state.time.compacted is not None
+
+
+def test_part_token_count_is_cached_on_the_part() -> None:
+    part = TextPart(id="p1", session_id="s1", message_id="m1", text="hello world")
+    part.token_count = 1234
+
+    assert part_tokens(part) == 1234
+    assert count_part_tokens(part) == Tokenizer.count("hello world")
+
+
+def test_compacted_tool_output_counts_as_placeholder() -> None:
+    messages = _conversation_with_tool_output("x" * 200_000)
+    tool = messages[1].parts[0]
+    full = count_part_tokens(tool)
+    tool.state.time.compacted = 10
+
+    assert count_part_tokens(tool) < full // 100
+    assert transcript_tokens(messages) < full
+
+
+@pytest.mark.anyio
+async def test_project_counts_system_tools_and_messages(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def fake_get_config(cls):
+        return SimpleNamespace(compaction=None)
+
+    monkeypatch.setattr(ConfigManager, "get", classmethod(fake_get_config))
+
+    messages = _conversation_with_tool_output("output")
+    projection = await SessionCompaction.project(
+        messages=messages,
+        system_prompt="You are helpful.",
+        tool_definitions=[{"type": "function", "function": {"name": "bash", "parameters": {}}}],
+    )
+
+    assert projection.system == Tokenizer.count("You are helpful.")
+    assert projection.tools > 0
+    assert projection.messages == transcript_tokens(messages)
+    assert projection.total == projection.system + projection.tools + projection.messages
+
+
+@pytest.mark.anyio
+async def test_project_does_not_reload_a_tokenizer_that_fell_back(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def fake_get_config(cls):
+        return SimpleNamespace(compaction=SimpleNamespace(tokenizer="tiktoken"))
+
+    loads: list[str] = []
+
+    def unavailable():
+        loads.append("tiktoken")
+        raise RuntimeError("no vocabulary")
+
+    monkeypatch.setattr(ConfigManager, "get", classmethod(fake_get_config))
+    monkeypatch.setitem(Tokenizer._factories, "tiktoken", unavailable)
+    Tokenizer.use(None)
+    try:
+        for _ in range(3):
+            await SessionCompaction.project(messages=[], system_prompt="hi")
+        assert loads == ["tiktoken"]
+        assert Tokenizer.counter().name == "estimate"
+    finally:
+        Tokenizer.use(None)
+
+
+@pytest.mark.anyio
+async def test_will_overflow_checks_projection_against_usable_input(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def fake_get_config(cls):
+        return SimpleNamespace(compaction=SimpleNamespace(auto=True, reserved=10_000))
+
+    monkeypatch.setattr(ConfigManager, "get", classmethod(fake_get_config))
+    model = ProcessedModelInfo(
+        id="m1",
+        provider_id="openai",
+        name="m1",
+        api_id="m1",
+        limit=ModelLimit(context=100_000, input=70_000, output=10_000),
+    )
+
+    below = ContextProjection(system=1_000, tools=1_000, messages=57_000)
+    above = ContextProjection(system=1_000, tools=1_000, messages=58_000)
+
+    assert await SessionCompaction.will_overflow(projection=below, model=model) is False
+    assert await SessionCompaction.will_overflow(projection=above, model=model) is True
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 import pytest
@@ -7,6 +8,13 @@ from hotaru.core.global_paths import GlobalPath
 from hotaru.session.instruction import InstructionPrompt
 
 
+@pytest.fixture(autouse=True)
+def _reset_instruction_cache():
+    InstructionPrompt.invalidate()
+    yield
+    InstructionPrompt.invalidate()
+
+
 def _patch_config(monkeypatch: pytest.MonkeyPatch, data: dict) -> None:
     config = Config.model_validate(data)
 
@@ -20,6 +28,35 @@ def _patch_config(monkeypatch: pytest.MonkeyPatch, data: dict) -> None:
     monkeypatch.setattr(ConfigManager, "get", classmethod(fake_get))
 
 
+class _FakeResponse:
+    def __init__(self, text: str, status_code: int = 200, headers: dict | None = None):
+        self.text = text
+        self.status_code = status_code
+        self.is_success = 200 <= status_code < 300
+        self.headers = headers or {}
+
+
+def _client_returning(*responses: "str | _FakeResponse", requests: list | None = None):
+    queue = [item if isinstance(item, _FakeResponse) else _FakeResponse(item) for item in responses]
+
+    class _FakeClient:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):
+            return False
+
+        async def get(self, url: str, headers: dict | None = None):
+            if requests is not None:
+                requests.append(dict(headers or {}))
+            return queue.pop(0) if len(queue) > 1 else queue[0]
+
+    return _FakeClient
+
+
 def _patch_paths(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> tuple[Path, Path]:
     config_dir = tmp_path / "global-config"
     home_dir = tmp_path / "home"
@@ -153,27 +190,112 @@ async def test_system_loads_configured_file_and_remote_instructions(
     )
     _patch_paths(monkeypatch, tmp_path)
 
-    class _FakeResponse:
-        def __init__(self, text: str):
-            self.text = text
-            self.is_success = True
+    monkeypatch.setattr("hotaru.session.instruction.httpx.AsyncClient", _client_returning("Remote rule body"))
 
-    class _FakeClient:
-        def __init__(self, *args, **kwargs):
-            pass
+    blocks = await InstructionPrompt.system(str(src_dir), str(project_dir))
 
-        async def __aenter__(self):
-            return self
+    assert any(f"Instructions from: {instruction_file.resolve()}" in block for block in blocks)
+    assert any("Instructions from: https://example.com/shared-rules.md" in block for block in blocks)
 
-        async def __aexit__(self, exc_type, exc, tb):
-            return False
 
-        async def get(self, url: str):
-            return _FakeResponse("Remote rule body")
+@pytest.mark.anyio
+async def test_system_rereads_local_file_only_when_it_changes(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    _patch_config(monkeypatch, {})
+    _patch_paths(monkeypatch, tmp_path)
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    agents = project_dir / "AGENTS.md"
+    agents.write_text("first", encoding="utf-8")
 
-    monkeypatch.setattr("hotaru.session.instruction.httpx.AsyncClient", _FakeClient)
+    reads: list[Path] = []
+    original = Path.read_text
 
-    blocks = await InstructionPrompt.system(str(src_dir), str(project_dir))
+    def counting_read_text(self, *args, **kwargs):
+        reads.append(self)
+        return original(self, *args, **kwargs)
 
-    assert any(f"Instructions from: {instruction_file.resolve()}" in block for block in blocks)
-    assert any("Instructions from: https://example.com/shared-rules.md" in block for block in blocks)
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+
+    assert "first" in (await InstructionPrompt.system(str(project_dir), str(project_dir)))[0]
+    assert "first" in (await InstructionPrompt.system(str(project_dir), str(project_dir)))[0]
+    assert len(reads) == 1
+
+    agents.write_text("second, longer", encoding="utf-8")
+    assert "second, longer" in (await InstructionPrompt.system(str(project_dir), str(project_dir)))[0]
+    assert len(reads) == 2
+
+
+@pytest.mark.anyio
+async def test_system_paths_pick_up_new_rule_file(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    _patch_config(monkeypatch, {})
+    _patch_paths(monkeypatch, tmp_path)
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+
+    assert await InstructionPrompt.system_paths(str(project_dir), str(project_dir)) == []
+
+    agents = project_dir / "AGENTS.md"
+    agents.write_text("rules", encoding="utf-8")
+    # Make sure the directory mtime moves even on coarse-grained filesystems.
+    stat = project_dir.stat()
+    os.utime(project_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert await InstructionPrompt.system_paths(str(project_dir), str(project_dir)) == [str(agents.resolve())]
+
+
+@pytest.mark.anyio
+async def test_remote_instructions_are_revalidated_with_etag_after_ttl(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    url = "https://example.com/rules.md"
+    _patch_config(monkeypatch, {"instructions": [url]})
+    _patch_paths(monkeypatch, tmp_path)
+
+    requests: list[dict] = []
+    client = _client_returning(
+        _FakeResponse("Remote body", headers={"etag": '"v1"'}),
+        _FakeResponse("", status_code=304),
+        requests=requests,
+    )
+    monkeypatch.setattr("hotaru.session.instruction.httpx.AsyncClient", client)
+
+    first = await InstructionPrompt.system(str(project_dir), str(project_dir))
+    second = await InstructionPrompt.system(str(project_dir), str(project_dir))
+    assert first == second == [f"Instructions from: {url}\nRemote body"]
+    assert len(requests) == 1
+
+    monkeypatch.setattr(InstructionPrompt, "REMOTE_TTL", 0.0)
+    third = await InstructionPrompt.system(str(project_dir), str(project_dir))
+    assert third == first
+    assert requests[-1] == {"If-None-Match": '"v1"'}
+
+
+@pytest.mark.anyio
+async def test_failed_remote_instruction_is_not_refetched_before_ttl(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    url = "https://example.com/missing.md"
+    _patch_config(monkeypatch, {"instructions": [url]})
+    _patch_paths(monkeypatch, tmp_path)
+
+    requests: list[dict] = []
+    client = _client_returning(_FakeResponse("", status_code=404), requests=requests)
+    monkeypatch.setattr("hotaru.session.instruction.httpx.AsyncClient", client)
+
+    first = await InstructionPrompt.system(str(project_dir), str(project_dir))
+    second = await InstructionPrompt.system(str(project_dir), str(project_dir))
+
+    assert first == second == []
+    assert len(requests) == 1
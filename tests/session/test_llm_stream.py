@@ -53,6 +53,8 @@ async def test_llm_anthropic_tool_roundtrip_and_finish_reason_normalized(
         temperature=None,
         top_p=None,
         options=None,
+        provider_id=None,
+        provider_options=None,
     ):
         captured["messages"] = messages
         captured["tools"] = tools
@@ -125,6 +127,8 @@ async def test_llm_passes_through_reasoning_events(monkeypatch: pytest.MonkeyPat
         temperature=None,
         top_p=None,
         options=None,
+        provider_id=None,
+        provider_options=None,
     ):
         yield StreamChunk(type="reasoning_start", reasoning_id="r1")
         yield StreamChunk(type="reasoning_delta", reasoning_id="r1", reasoning_text="plan")
@@ -191,6 +195,8 @@ async def test_llm_retries_retryable_error_then_succeeds(monkeypatch: pytest.Mon
         temperature=None,
         top_p=None,
         options=None,
+        provider_id=None,
+        provider_options=None,
     ):
         calls["count"] += 1
         if calls["count"] == 1:
@@ -262,6 +268,8 @@ async def test_llm_does_not_retry_non_retryable_error(monkeypatch: pytest.Monkey
         temperature=None,
         top_p=None,
         options=None,
+        provider_id=None,
+        provider_options=None,
     ):
         calls["count"] += 1
         raise _StatusError(400)
@@ -332,6 +340,8 @@ async def test_llm_stops_after_retry_budget_exhausted(monkeypatch: pytest.Monkey
         temperature=None,
         top_p=None,
         options=None,
+        provider_id=None,
+        provider_options=None,
     ):
         calls["count"] += 1
         raise _StatusError(503)
@@ -401,6 +411,8 @@ async def test_llm_kimi_default_omits_temperature_and_top_p(monkeypatch: pytest.
         temperature=None,
         top_p=None,
         options=None,
+        provider_id=None,
+        provider_options=None,
     ):
         captured["temperature"] = temperature
         captured["top_p"] = top_p
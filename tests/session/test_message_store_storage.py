@@ -112,6 +112,79 @@ async def test_delete_messages_removes_message_store_parts(monkeypatch: pytest.M
     assert await Session.messages(session_id=session.id) == []
 
 
+@pytest.mark.anyio
+async def test_part_deltas_are_written_behind(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    _setup_storage(monkeypatch, tmp_path)
+
+    session = await Session.create(project_id="p1", agent="build", directory=str(tmp_path))
+    msg_id = Identifier.ascending("message")
+    part = TextPart(
+        id=Identifier.ascending("part"),
+        session_id=session.id,
+        message_id=msg_id,
+        text="",
+    )
+    await Session.update_part(part)
+
+    db = Storage._conn()
+    before = db.total_changes
+    for _ in range(10_000):
+        await Session.update_part_delta(
+            session_id=session.id,
+            message_id=msg_id,
+            part_id=part.id,
+            field="text",
+            delta="tok ",
+        )
+
+    # 10k deltas used to cost two row writes each (part + session touch).
+    assert db.total_changes - before < 20
+
+    parts = await Session.parts(session.id, msg_id)
+    assert parts[0].text == "tok " * 10_000
+
+    await Session.flush_deltas(session.id)
+    Session._deltas.clear()
+    parts = await Session.parts(session.id, msg_id)
+    assert parts[0].text == "tok " * 10_000
+
+
+@pytest.mark.anyio
+async def test_update_part_supersedes_buffered_deltas(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    _setup_storage(monkeypatch, tmp_path)
+
+    session = await Session.create(project_id="p1", agent="build", directory=str(tmp_path))
+    msg_id = Identifier.ascending("message")
+    part = TextPart(
+        id=Identifier.ascending("part"),
+        session_id=session.id,
+        message_id=msg_id,
+        text="",
+    )
+    await Session.update_part(part)
+    await Session.update_part_delta(
+        session_id=session.id,
+        message_id=msg_id,
+        part_id=part.id,
+        field="text",
+        delta="draft",
+    )
+
+    await Session.update_part(part.model_copy(update={"text": "final"}))
+    assert await Session.flush_deltas(session.id) == 0
+
+    wrong = await Session.update_part_delta(
+        session_id=session.id,
+        message_id="message_other",
+        part_id=part.id,
+        field="text",
+        delta="x",
+    )
+    assert wrong is None
+    parts = await Session.parts(session.id, msg_id)
+    assert parts[0].text == "final"
+
+
 def test_filter_compacted_keeps_latest_compaction_window() -> None:
     c1 = "message_compaction"
     messages = [
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from pydantic import BaseModel
 
@@ -618,3 +620,68 @@ async def test_processor_sanitizes_control_chars_without_truncating_text(
 
     assert result.text == "健康状态管理 - 启动\ufffd并发初始化"
     assert "".join(seen) == "健康状态管理 - 启动\ufffd并发初始化"
+
+
+@pytest.mark.anyio
+async def test_processor_runs_read_only_tools_concurrently_in_call_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    registry = ToolRegistry()
+    second_started = asyncio.Event()
+    stream_finished = asyncio.Event()
+
+    class _Params(BaseModel):
+        pass
+
+    async def slow_read(_params: _Params, _ctx: ToolContext) -> ToolResult:
+        # Completes only once the later glob call is already running.
+        await asyncio.wait_for(second_started.wait(), timeout=2)
+        return ToolResult(title="read", output="read-output")
+
+    async def fast_glob(_params: _Params, _ctx: ToolContext) -> ToolResult:
+        second_started.set()
+        return ToolResult(title="glob", output="glob-output")
+
+    for tool_id, fn in (("read", slow_read), ("glob", fast_glob)):
+        registry.register(
+            Tool.define(
+                tool_id=tool_id,
+                description=tool_id,
+                parameters_type=_Params,
+                execute_fn=fn,
+                auto_truncate=False,
+            )
+        )
+
+    async def fake_stream(cls, _stream_input):
+        for call_id, name in (("call_1", "read"), ("call_2", "glob")):
+            yield StreamChunk(type="tool_call_start", tool_call_id=call_id, tool_call_name=name)
+            yield StreamChunk(type="tool_call_end", tool_call=ToolCall(id=call_id, name=name, input={}))
+        stream_finished.set()
+        yield StreamChunk(type="text", text="after tools")
+
+    async def fake_get_agent(name: str, **_kw):
+        return AgentInfo(name=name, mode=AgentMode.PRIMARY, permission=[], options={})
+
+    monkeypatch.setattr(LLM, "stream", classmethod(fake_stream))
+
+    ended = []
+
+    processor = SessionProcessor(
+        app=fake_app(agents=fake_agents(get=fake_get_agent), tools=registry),
+        session_id="ses_parallel",
+        model_id="model",
+        provider_id="provider",
+        agent="build",
+        cwd="/tmp",
+        worktree="/tmp",
+    )
+
+    result = await processor.process_step(
+        on_tool_end=lambda name, *_args: ended.append((name, stream_finished.is_set())),
+    )
+
+    assert [tc.id for tc in result.tool_calls] == ["call_1", "call_2"]
+    assert [tc.output for tc in result.tool_calls] == ["read-output", "glob-output"]
+    assert [name for name, _ in ended] == ["read", "glob"]
+    assert result.text == "after tools"
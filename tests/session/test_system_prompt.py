@@ -1,4 +1,11 @@
+from datetime import datetime
+
+import pytest
+
+from hotaru.core.config import ConfigManager
 from hotaru.provider.provider import ProcessedModelInfo
+from hotaru.session import system as system_module
+from hotaru.session.instruction import InstructionPrompt
 from hotaru.session.system import SystemPrompt
 
 
@@ -41,3 +48,33 @@ def test_for_model_fallback_path() -> None:
     prompts = SystemPrompt.for_model(_model("custom-model-1", provider_id="custom"))
     assert len(prompts) == 1
     assert "You are hotaru, an interactive CLI tool" in prompts[0]
+
+
+@pytest.mark.anyio
+async def test_build_full_prompt_is_reused_until_instructions_change(monkeypatch: pytest.MonkeyPatch) -> None:
+    blocks = ["Instructions from: AGENTS.md\nrules"]
+    days = [datetime(2026, 1, 1, 23, 59), datetime(2026, 1, 2, 0, 1)]
+
+    async def fake_system(cls, directory=None, worktree=None):
+        return list(blocks)
+
+    class _Clock:
+        @staticmethod
+        def now():
+            return days.pop(0) if len(days) > 1 else days[0]
+
+    monkeypatch.setattr(InstructionPrompt, "system", classmethod(fake_system))
+    monkeypatch.setattr(ConfigManager, "directories", classmethod(lambda cls: ["/cfg"]))
+    monkeypatch.setattr(system_module, "datetime", _Clock)
+    SystemPrompt.invalidate()
+    model = _model("gpt-5")
+
+    first = await SystemPrompt.build_full_prompt(model=model, directory="/repo", worktree="/repo")
+    second = await SystemPrompt.build_full_prompt(model=model, directory="/repo", worktree="/repo")
+    assert second is first
+    assert "Thu Jan 01 2026" in first
+
+    blocks.append("Instructions from: CLAUDE.md\nmore")
+    third = await SystemPrompt.build_full_prompt(model=model, directory="/repo", worktree="/repo")
+    assert third.endswith("Instructions from: CLAUDE.md\nmore")
+    assert "Fri Jan 02 2026" in third
@@ -0,0 +1,119 @@
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+from hotaru.core.config import ToolConcurrencyConfig
+from hotaru.session.processor_types import ToolCallState
+from hotaru.session.tool_scheduler import ToolPolicy, ToolScheduler
+
+
+class _Recorder:
+    def __init__(self, *, stop_on: str = "") -> None:
+        self.active = 0
+        self.peak = 0
+        self.started: List[str] = []
+        self.finished: List[str] = []
+        self.stop_on = stop_on
+
+    async def execute(self, tc: ToolCallState) -> Dict[str, Any]:
+        self.started.append(tc.id)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.active -= 1
+        return {"output": tc.id}
+
+    async def finish(self, tc: ToolCallState, result: Dict[str, Any]) -> bool:
+        self.finished.append(result["output"])
+        return tc.id == self.stop_on
+
+
+def _call(call_id: str, name: str, **tool_input: Any) -> ToolCallState:
+    return ToolCallState(id=call_id, name=name, input=tool_input)
+
+
+async def _run(policy: ToolPolicy, calls: List[ToolCallState], recorder: _Recorder) -> ToolScheduler:
+    scheduler = ToolScheduler(policy=policy, execute=recorder.execute, finish=recorder.finish)
+    for tc in calls:
+        scheduler.submit(tc)
+    await scheduler.join()
+    await scheduler.cancel()
+    return scheduler
+
+
+@pytest.mark.anyio
+async def test_read_only_calls_overlap_and_mutations_are_barriers() -> None:
+    recorder = _Recorder()
+    calls = [
+        _call("r1", "read", filePath="a.py"),
+        _call("r2", "grep", pattern="x"),
+        _call("e1", "edit", filePath="a.py"),
+        _call("r3", "read", filePath="b.py"),
+    ]
+    await _run(ToolPolicy(), calls, recorder)
+
+    assert recorder.finished == ["r1", "r2", "e1", "r3"]
+    assert set(recorder.started[:2]) == {"r1", "r2"}
+    assert recorder.started[2:] == ["e1", "r3"]
+    assert recorder.peak == 2
+
+
+@pytest.mark.anyio
+async def test_path_rule_only_orders_overlapping_paths() -> None:
+    policy = ToolPolicy.from_config(ToolConcurrencyConfig(serialize={"edit": "path", "write": "path"}))
+    recorder = _Recorder()
+    calls = [
+        _call("e1", "edit", filePath="src/a.py"),
+        _call("w1", "write", filePath="src/b.py"),
+        _call("r1", "read", filePath="src/a.py"),
+        _call("l1", "ls", path="docs"),
+    ]
+    await _run(policy, calls, recorder)
+
+    assert recorder.finished == ["e1", "w1", "r1", "l1"]
+    assert recorder.started.index("r1") > recorder.started.index("e1")
+    assert recorder.peak == 3
+
+
+@pytest.mark.anyio
+async def test_disabled_policy_and_parallel_limit_serialize() -> None:
+    recorder = _Recorder()
+    calls = [_call(f"r{i}", "read", filePath=f"{i}.py") for i in range(3)]
+    await _run(ToolPolicy(enabled=False), calls, recorder)
+    assert recorder.peak == 1
+
+    recorder = _Recorder()
+    await _run(ToolPolicy(max_parallel=2), [_call(f"g{i}", "glob") for i in range(4)], recorder)
+    assert recorder.peak == 2
+    assert recorder.finished == ["g0", "g1", "g2", "g3"]
+
+
+@pytest.mark.anyio
+async def test_stop_cancels_unfinished_calls() -> None:
+    recorder = _Recorder(stop_on="b1")
+    calls = [_call("b1", "bash", command="false"), _call("r1", "read", filePath="a.py")]
+    scheduler = await _run(ToolPolicy(), calls, recorder)
+
+    assert scheduler.stopped
+    assert recorder.finished == ["b1"]
+    assert "r1" not in recorder.started
+
+
+@pytest.mark.anyio
+async def test_conflicting_call_waits_for_earlier_result_to_be_handled() -> None:
+    class _SlowDenial(_Recorder):
+        async def finish(self, tc: ToolCallState, result: Dict[str, Any]) -> bool:
+            # e.g. recording a rejected permission takes a while.
+            await asyncio.sleep(0.05)
+            return await super().finish(tc, result)
+
+    recorder = _SlowDenial(stop_on="e1")
+    calls = [_call("e1", "edit", filePath="a.py"), _call("b1", "bash", command="rm a.py")]
+    scheduler = await _run(ToolPolicy(), calls, recorder)
+
+    assert scheduler.stopped
+    assert recorder.finished == ["e1"]
+    assert recorder.started == ["e1"]
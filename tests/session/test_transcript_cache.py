@@ -0,0 +1,139 @@
+from pathlib import Path
+
+import pytest
+
+from hotaru.core.bus import Bus
+from hotaru.core.global_paths import GlobalPath
+from hotaru.core.id import Identifier
+from hotaru.session.message_store import CompactionPart, MessageInfo, MessageTime, TextPart
+from hotaru.session.session import Session
+from hotaru.session.transcript_cache import TranscriptCache
+from hotaru.storage import Storage
+
+
+def _setup_storage(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    data_dir = tmp_path / "data"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    monkeypatch.setattr(GlobalPath, "data", classmethod(lambda cls: str(data_dir)))
+    Storage.reset()
+
+
+async def _add_message(session_id: str, role: str, text: str) -> tuple[str, str]:
+    message_id = Identifier.ascending("message")
+    part_id = Identifier.ascending("part")
+    await Session.update_message(
+        MessageInfo(id=message_id, session_id=session_id, role=role, time=MessageTime(created=1))
+    )
+    await Session.update_part(TextPart(id=part_id, session_id=session_id, message_id=message_id, text=text))
+    return message_id, part_id
+
+
+@pytest.mark.anyio
+async def test_transcript_cache_tracks_bus_events(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    _setup_storage(monkeypatch, tmp_path)
+    cache = TranscriptCache()
+    cache.bind(Bus._current())
+    session = await Session.create(project_id="p1", agent="build", directory=str(tmp_path))
+    user_id, _ = await _add_message(session.id, "user", "hi")
+
+    assert await cache.latest_user_id(session.id) == user_id
+
+    loads = 0
+    original = Session.messages.__func__
+
+    async def counting_messages(cls, *, session_id: str):
+        nonlocal loads
+        loads += 1
+        return await original(cls, session_id=session_id)
+
+    monkeypatch.setattr(Session, "messages", classmethod(counting_messages))
+
+    assistant_id, part_id = await _add_message(session.id, "assistant", "he")
+    await Session.update_part_delta(
+        session_id=session.id,
+        message_id=assistant_id,
+        part_id=part_id,
+        field="text",
+        delta="llo",
+    )
+    next_user_id, _ = await _add_message(session.id, "user", "again")
+
+    messages = await cache.messages(session.id)
+    assert [msg.info.id for msg in messages] == [user_id, assistant_id, next_user_id]
+    assert messages[1].parts[0].text == "hello"
+    assert await cache.latest_user_id(session.id) == next_user_id
+    assert await cache.model_messages(session.id)
+    assert loads == 0
+
+    await Session.delete_messages(session.id, [next_user_id])
+    assert session.id not in cache
+    assert await cache.latest_user_id(session.id) == user_id
+    assert loads == 1
+    cache.reset()
+
+
+@pytest.mark.anyio
+async def test_transcript_cache_pending_compaction(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    _setup_storage(monkeypatch, tmp_path)
+    cache = TranscriptCache()
+    cache.bind(Bus._current())
+    session = await Session.create(project_id="p1", agent="build", directory=str(tmp_path))
+    await _add_message(session.id, "user", "hi")
+    assert await cache.pending_compaction(session.id) is None
+
+    request_id = Identifier.ascending("message")
+    await Session.update_message(
+        MessageInfo(id=request_id, session_id=session.id, role="user", time=MessageTime(created=2))
+    )
+    await Session.update_part(
+        CompactionPart(id=Identifier.ascending("part"), session_id=session.id, message_id=request_id, auto=True)
+    )
+    pending = await cache.pending_compaction(session.id)
+    assert pending is not None
+    assert pending[0] == request_id
+    assert pending[1].auto is True
+
+    await Session.update_message(
+        MessageInfo(
+            id=Identifier.ascending("message"),
+            session_id=session.id,
+            role="assistant",
+            parent_id=request_id,
+            summary=True,
+            finish="stop",
+            time=MessageTime(created=3),
+        )
+    )
+    assert await cache.pending_compaction(session.id) is None
+    assert [msg.info.id for msg in await cache.filtered(session.id)][0] == request_id
+    cache.reset()
+
+
+@pytest.mark.anyio
+async def test_transcript_cache_evicts_least_recently_used(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    _setup_storage(monkeypatch, tmp_path)
+    cache = TranscriptCache(capacity=2)
+    cache.bind(Bus._current())
+    sessions = [await Session.create(project_id="p1", directory=str(tmp_path)) for _ in range(3)]
+
+    await cache.messages(sessions[0].id)
+    await cache.messages(sessions[1].id)
+    await cache.messages(sessions[0].id)
+    await cache.messages(sessions[2].id)
+
+    assert sessions[0].id in cache
+    assert sessions[1].id not in cache
+    assert sessions[2].id in cache
+    assert len(cache) == 2
+    cache.reset()
+
+
+@pytest.mark.anyio
+async def test_unbound_transcript_cache_reads_storage(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    _setup_storage(monkeypatch, tmp_path)
+    cache = TranscriptCache()
+    session = await Session.create(project_id="p1", directory=str(tmp_path))
+    user_id, _ = await _add_message(session.id, "user", "hi")
+
+    assert await cache.latest_user_id(session.id) == user_id
+    assert len(cache) == 0
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+from typing import Iterator, List
+
+import pytest
+
+from hotaru.core.global_paths import GlobalPath
+from hotaru.snapshot import SnapshotTracker
+
+
+@pytest.fixture
+def workspace(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Iterator[Path]:
+    data = tmp_path / "data"
+    monkeypatch.setattr(GlobalPath, "data", classmethod(lambda cls: str(data)))
+    root = tmp_path / "repo"
+    (root / "src").mkdir(parents=True)
+    subprocess.run(["git", "init", "-q"], cwd=root, check=True)
+    (root / ".gitignore").write_text("build/\n")
+    (root / "src" / "a.py").write_text("a = 1\n")
+    (root / "src" / "b.py").write_text("b = 1\n")
+    SnapshotTracker.reset()
+    yield root
+    SnapshotTracker.reset()
+
+
+def _count_full_scans(monkeypatch: pytest.MonkeyPatch) -> List[int]:
+    scans: List[int] = []
+    original = SnapshotTracker._add_all.__func__
+
+    async def counting(cls, **kwargs):
+        scans.append(1)
+        return await original(cls, **kwargs)
+
+    monkeypatch.setattr(SnapshotTracker, "_add_all", classmethod(counting))
+    return scans
+
+
+async def _track(root: Path) -> str:
+    value = await SnapshotTracker.track(session_id="ses_1", cwd=str(root), worktree=str(root))
+    assert value
+    return value
+
+
+async def _patched(root: Path, base: str) -> List[str]:
+    result = await SnapshotTracker.patch(session_id="ses_1", base_hash=base, cwd=str(root), worktree=str(root))
+    return sorted(Path(path).relative_to(root.resolve()).as_posix() for path in result.files)
+
+
+@pytest.mark.anyio
+async def test_reported_paths_update_only_their_entries(monkeypatch: pytest.MonkeyPatch, workspace: Path) -> None:
+    scans = _count_full_scans(monkeypatch)
+    base = await _track(workspace)
+    assert len(scans) == 1
+
+    (workspace / "src" / "a.py").write_text("a = 2\n")
+    (workspace / "src" / "b.py").unlink()
+    (workspace / "src" / "c.py").write_text("c = 1\n")
+    (workspace / "build").mkdir()
+    (workspace / "build" / "out.js").write_text("ignored\n")
+    # Not reported: stays out of the incremental snapshot.
+    (workspace / "notes.txt").write_text("unreported\n")
+    SnapshotTracker.mark_changed(
+        str(workspace / path) for path in ["src/a.py", "src/b.py", "src/c.py", "build/out.js"]
+    )
+    SnapshotTracker.mark_changed(["/elsewhere/file.py"])
+
+    assert await _patched(workspace, base) == ["src/a.py", "src/b.py", "src/c.py"]
+    assert len(scans) == 1
+
+
+@pytest.mark.anyio
+async def test_unknown_changes_and_new_turns_reconcile_fully(monkeypatch: pytest.MonkeyPatch, workspace: Path) -> None:
+    scans = _count_full_scans(monkeypatch)
+    base = await _track(workspace)
+
+    (workspace / "notes.txt").write_text("from bash\n")
+    SnapshotTracker.mark_unknown()
+    assert await _patched(workspace, base) == ["notes.txt"]
+    assert len(scans) == 2
+
+    await _track(workspace)
+    assert len(scans) == 2
+    SnapshotTracker.reconcile("ses_1")
+    await _track(workspace)
+    assert len(scans) == 3
+
+
+@pytest.mark.anyio
+async def test_subdirectory_session_tracks_reported_deletions(monkeypatch: pytest.MonkeyPatch, workspace: Path) -> None:
+    scans = _count_full_scans(monkeypatch)
+    cwd = workspace / "src"
+    base = await SnapshotTracker.track(session_id="ses_1", cwd=str(cwd), worktree=str(workspace))
+    assert base
+
+    (cwd / "a.py").unlink()
+    (cwd / "b.py").write_text("b = 2\n")
+    (workspace / "outside.txt").write_text("outside cwd\n")
+    SnapshotTracker.mark_changed([str(cwd / "a.py"), str(cwd / "b.py"), str(workspace / "outside.txt")])
+
+    result = await SnapshotTracker.patch(session_id="ses_1", base_hash=base, cwd=str(cwd), worktree=str(workspace))
+    files = sorted(Path(path).relative_to(workspace.resolve()).as_posix() for path in result.files)
+
+    assert files == ["src/a.py", "src/b.py"]
+    assert len(scans) == 1
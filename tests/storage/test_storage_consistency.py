@@ -111,3 +111,56 @@ def test_cross_process_update_is_serialized(monkeypatch: pytest.MonkeyPatch, tmp
 
     result = asyncio.run(verify())
     assert result["n"] == 240
+
+
+@pytest.mark.anyio
+async def test_scan_filters_parts_by_message(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    _setup_storage(monkeypatch, tmp_path)
+
+    await Storage.initialize()
+    await Storage.write(["part", "session_1", "part_a"], {"message_id": "message_1", "type": "text"})
+    await Storage.write(["part", "session_1", "part_b"], {"message_id": "message_2", "type": "tool"})
+    await Storage.write(["part", "session_1", "part_c"], {"message_id": "message_1", "type": "text"})
+    # "_" must not act as a LIKE wildcard across sessions.
+    await Storage.write(["part", "sessionX1", "part_d"], {"message_id": "message_1", "type": "text"})
+
+    rows = await Storage.scan(["part", "session_1"], message_id="message_1")
+    assert [key[-1] for key, _ in rows] == ["part_a", "part_c"]
+    assert [key[-1] for key in await Storage.list(["part", "session_1"])] == ["part_a", "part_b", "part_c"]
+
+    with pytest.raises(ValueError):
+        await Storage.scan(["part", "session_1"], tool="read")
+    Storage.close()
+
+
+@pytest.mark.anyio
+async def test_legacy_key_value_tables_are_migrated(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    import sqlite3
+
+    data_dir = _setup_storage(monkeypatch, tmp_path)
+    db = sqlite3.connect(str(data_dir / "storage.db"))
+    for table in ("messages", "parts"):
+        db.execute(f"CREATE TABLE {table} (key TEXT PRIMARY KEY, data TEXT NOT NULL)")
+    db.execute(
+        "INSERT INTO messages (key, data) VALUES (?, ?)",
+        ("message_store/session_1/message_1", json.dumps({"id": "message_1"})),
+    )
+    db.execute(
+        "INSERT INTO parts (key, data) VALUES (?, ?)",
+        ("part/session_1/part_a", json.dumps({"message_id": "message_1", "type": "text"})),
+    )
+    db.commit()
+    db.close()
+
+    await Storage.initialize()
+    rows = await Storage.scan(["part", "session_1"], message_id="message_1")
+    assert [key for key, _ in rows] == [["part", "session_1", "part_a"]]
+    messages = await Storage.scan(["message_store", "session_1"], message_id="message_1")
+    assert [data for _, data in messages] == [{"id": "message_1"}]
+    Storage.close()
+
+    db = sqlite3.connect(str(data_dir / "storage.db"))
+    assert db.execute("PRAGMA user_version").fetchone()[0] == 1
+    indexes = {row[1] for row in db.execute("PRAGMA index_list(parts)")}
+    assert "parts_by_message" in indexes
+    db.close()
@@ -1,7 +1,12 @@
+import asyncio
+import sys
 from pathlib import Path
+from typing import Any, Dict, List
 
 import pytest
 
+from hotaru.core.global_paths import GlobalPath
+from hotaru.tool import bash as bash_module
 from hotaru.tool.bash import BashParams, BashTool, _requires_conservative_approval
 from hotaru.tool.tool import ToolContext
 from tests.helpers import fake_app
@@ -41,3 +46,72 @@ async def test_bash_tool_exposes_permissions_from_permission_hook(tmp_path: Path
         "command": "git status",
         "description": "Check git status",
     }
+
+
+def _ctx(tmp_path: Path, updates: List[Dict[str, Any]]) -> ToolContext:
+    return ToolContext(
+        app=fake_app(),
+        session_id="ses",
+        message_id="msg",
+        call_id="call",
+        agent="build",
+        cwd=str(tmp_path),
+        worktree=str(tmp_path),
+        _on_metadata=updates.append,
+    )
+
+
+@pytest.mark.anyio
+@pytest.mark.skipif(sys.platform == "win32", reason="uses POSIX shell syntax")
+async def test_bash_streams_large_output_to_file(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(GlobalPath, "data", classmethod(lambda cls: str(tmp_path / "data")))
+    updates: List[Dict[str, Any]] = []
+    command = "for i in $(seq 1 200000); do echo line-$i; done; echo done >&2"
+
+    result = await BashTool.execute(BashParams(command=command, description="Print lines"), _ctx(tmp_path, updates))
+
+    assert result.metadata["truncated"] is True
+    saved = Path(result.metadata["output_path"]).read_text()
+    assert saved.startswith("line-1\nline-2\n")
+    assert "line-200000\n" in saved and "done\n" in saved
+    assert len(saved) > 2_000_000
+    assert result.output.startswith("line-1\n")
+    assert "bytes truncated" in result.output
+    assert result.output.rstrip().endswith("done")
+    assert len(result.output) < 60_000
+    assert result.metadata["exit"] == 0
+
+
+@pytest.mark.anyio
+@pytest.mark.skipif(sys.platform == "win32", reason="uses POSIX shell syntax")
+async def test_bash_publishes_output_while_running(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(bash_module, "METADATA_INTERVAL", 0.02)
+    updates: List[Dict[str, Any]] = []
+    ctx = _ctx(tmp_path, updates)
+
+    task = asyncio.create_task(
+        BashTool.execute(BashParams(command="echo started; sleep 30", description="Wait"), ctx)
+    )
+    for _ in range(200):
+        if any(update.get("output") == "started\n" for update in updates):
+            break
+        await asyncio.sleep(0.02)
+    assert any(update.get("output") == "started\n" for update in updates)
+
+    ctx.abort()
+    result = await asyncio.wait_for(task, timeout=5)
+    assert result.output.startswith("started\n")
+    assert "User aborted the command" in result.output
+    assert result.metadata["truncated"] is False
+
+
+@pytest.mark.anyio
+@pytest.mark.skipif(sys.platform == "win32", reason="uses POSIX shell syntax")
+async def test_bash_timeout_keeps_partial_output(tmp_path: Path) -> None:
+    updates: List[Dict[str, Any]] = []
+    params = BashParams(command="echo partial; sleep 30", timeout=300, description="Time out")
+
+    result = await asyncio.wait_for(BashTool.execute(params, _ctx(tmp_path, updates)), timeout=5)
+
+    assert result.output.startswith("partial\n")
+    assert "exceeding timeout 300 ms" in result.output
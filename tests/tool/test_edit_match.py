@@ -0,0 +1,82 @@
+import time
+
+import pytest
+
+from hotaru.tool.edit_match import levenshtein, replace
+
+
+def test_banded_levenshtein_matches_full_distance() -> None:
+    pairs = [("kitten", "sitting"), ("", "abc"), ("flaw", "lawn"), ("same", "same"), ("abcdef", "azced")]
+    for a, b in pairs:
+        full = levenshtein(a, b)
+        for limit in range(6):
+            expected = full if full <= limit else limit + 1
+            assert levenshtein(a, b, limit) == expected
+
+
+def test_fuzzy_strategies_keep_their_semantics() -> None:
+    content = "def f():\n    x = 1\n    return x\n"
+    assert replace(content, "x = 1\n  return x", "x = 2\nreturn x") == "def f():\nx = 2\nreturn x\n"
+    assert replace(content, "def f():\n    x =   1", "def g():\n    x = 1") == "def g():\n    x = 1\n    return x\n"
+
+    blocks = "start\n  alpha one\nend\nstart\n  beta two\nend\n"
+    assert replace(blocks, "start\nbeta tow\nend", "gone") == "start\n  alpha one\nend\ngone\n"
+
+    with pytest.raises(ValueError, match="not found"):
+        replace(content, "missing", "x")
+    with pytest.raises(ValueError, match="multiple matches"):
+        replace("a\na\n", "a", "b")
+
+
+def _anchors(count: int) -> tuple[str, str, str]:
+    blocks = [
+        "def handler():\n"
+        + "".join(f"    value_{i}_{j} = compute(arg_{j}, {i})\n" for j in range(8))
+        + "}"
+        for i in range(count)
+    ]
+    target = count * 3 // 4
+    find = (
+        "def handler():\n"
+        + "".join(f"    value_{target}_{j} = compute(arg_{j},  {target})\n" for j in range(8))
+        + "}"
+    )
+    return "\n".join(blocks), find, blocks[target]
+
+
+def _long_lines(count: int) -> tuple[str, str, str]:
+    long = "x" * 400
+    blocks = [f"begin\n{long}{i:05d}\n{long}{i:05d}\nend" for i in range(count)]
+    target = count * 3 // 4
+    find = f"begin\n{long}0x{target:03d}\n{long}0y{target:03d}\nend"
+    return "\n".join(blocks), find, blocks[target]
+
+
+def _whitespace(count: int) -> tuple[str, str, str]:
+    content = "\n".join(f"line {i} = something({i})" for i in range(count))
+    last = count - 5
+    find = f"line   {last} =  something({last})\nline {last + 1} = something({last + 1})"
+    return content, find, f"line {last} = something({last})\nline {last + 1} = something({last + 1})"
+
+
+@pytest.mark.parametrize(
+    ("build", "count"),
+    [(_anchors, 2000), (_long_lines, 300), (_whitespace, 20000)],
+    ids=["repeated-anchors", "long-near-duplicates", "whitespace-20k-lines"],
+)
+def test_pathological_inputs_stay_fast(build, count: int) -> None:
+    content, find, expected = build(count)
+    started = time.perf_counter()
+    result = replace(content, find, "REPLACED")
+    elapsed = time.perf_counter() - started
+
+    assert result == content.replace(expected, "REPLACED", 1)
+    assert elapsed < 5.0
+
+
+def test_missing_text_in_large_file_fails_fast() -> None:
+    content = "\n".join(f"line {i} = something({i})" for i in range(20000))
+    started = time.perf_counter()
+    with pytest.raises(ValueError, match="not found"):
+        replace(content, "line 5 = nothing(5)\nline 6 = nothing(6)\n", "x")
+    assert time.perf_counter() - started < 5.0
@@ -0,0 +1,74 @@
+import re
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from hotaru.tool import grep_engine
+
+BACKENDS = ["python", pytest.param("rg", marks=pytest.mark.skipif(not grep_engine.rg_path(), reason="rg not on PATH"))]
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "python":
+        monkeypatch.setattr(grep_engine, "rg_path", lambda: None)
+    return request.param
+
+
+def _files(tmp_path: Path, count: int, text: str) -> List[str]:
+    paths = []
+    for index in range(count):
+        path = tmp_path / f"f{index:03d}.txt"
+        path.write_text(text, encoding="utf-8")
+        paths.append(str(path))
+    return paths
+
+
+@pytest.mark.anyio
+async def test_search_skips_binary_files_and_clips_lines(tmp_path: Path, backend: str) -> None:
+    text_file = tmp_path / "a.txt"
+    text_file.write_text("x\nneedle " + "y" * 3000 + "\n", encoding="utf-8")
+    binary = tmp_path / "b.bin"
+    binary.write_bytes(b"needle\0\x01\x02")
+
+    found = await grep_engine.search([str(text_file), str(binary)], re.compile("needle"), limit=10)
+
+    assert [(m.path, m.line_number) for m in found] == [(str(text_file), 2)]
+    assert found[0].text.endswith("...")
+    assert len(found[0].text) == grep_engine.MAX_LINE_LENGTH + 3
+
+
+@pytest.mark.anyio
+async def test_search_stops_at_limit(tmp_path: Path, backend: str) -> None:
+    files = _files(tmp_path, 300, "needle\n" * 5)
+    found = await grep_engine.search(files, re.compile("needle"), limit=7)
+    assert len(found) == 7
+
+
+@pytest.mark.anyio
+async def test_search_stops_inside_a_file_with_many_matches(tmp_path: Path, backend: str) -> None:
+    big = tmp_path / "big.txt"
+    big.write_text("needle\n" * 50_000, encoding="utf-8")
+    files = [str(big), *_files(tmp_path, 3, "needle\n")]
+
+    first = await grep_engine.search(files, re.compile("needle"), limit=5)
+    second = await grep_engine.search(files, re.compile("needle"), limit=5)
+
+    assert [(m.path, m.line_number) for m in first] == [(str(big), line) for line in range(1, 6)]
+    assert second == first
+
+
+@pytest.mark.anyio
+async def test_search_honors_abort(tmp_path: Path, backend: str) -> None:
+    files = _files(tmp_path, 600, "needle\n")
+    found = await grep_engine.search(files, re.compile("needle"), limit=1000, aborted=lambda: True)
+    assert len(found) < 600
+
+
+@pytest.mark.anyio
+async def test_python_only_syntax_falls_back_to_scanner(tmp_path: Path) -> None:
+    path = tmp_path / "a.txt"
+    path.write_text("foo bar\nbar\n", encoding="utf-8")
+    found = await grep_engine.search([str(path)], re.compile(r"(?<=foo )bar"), limit=10)
+    assert [(m.line_number, m.text) for m in found] == [(1, "foo bar")]
@@ -47,7 +47,7 @@ async def test_write_tool_appends_lsp_feedback(monkeypatch: pytest.MonkeyPatch,
     other_path = tmp_path / "other.py"
     touched: list[tuple[str, bool]] = []
 
-    async def fake_touch_file(cls, file: str, wait_for_diagnostics: bool = False) -> int:
+    async def fake_touch_file(cls, file: str, wait_for_diagnostics: bool = False, content: str | None = None) -> int:
         touched.append((file, wait_for_diagnostics))
         return 1
 
@@ -88,7 +88,7 @@ async def test_edit_tool_appends_lsp_feedback_for_existing_file(
     filepath.write_text("x = 1\n", encoding="utf-8")
     touched: list[tuple[str, bool]] = []
 
-    async def fake_touch_file(cls, file: str, wait_for_diagnostics: bool = False) -> int:
+    async def fake_touch_file(cls, file: str, wait_for_diagnostics: bool = False, content: str | None = None) -> int:
         touched.append((file, wait_for_diagnostics))
         return 1
 
@@ -130,7 +130,7 @@ async def test_edit_tool_appends_lsp_feedback_when_creating_file(
     filepath = tmp_path / "new_file.py"
     touched: list[tuple[str, bool]] = []
 
-    async def fake_touch_file(cls, file: str, wait_for_diagnostics: bool = False) -> int:
+    async def fake_touch_file(cls, file: str, wait_for_diagnostics: bool = False, content: str | None = None) -> int:
         touched.append((file, wait_for_diagnostics))
         return 1
 
@@ -169,7 +169,7 @@ async def test_write_tool_reports_when_no_lsp_client(
     async def fake_has_clients(cls, file: str) -> bool:
         return False
 
-    async def fake_touch_file(cls, file: str, wait_for_diagnostics: bool = False) -> int:
+    async def fake_touch_file(cls, file: str, wait_for_diagnostics: bool = False, content: str | None = None) -> int:
         return 0
 
     async def fake_diagnostics(cls):
@@ -197,7 +197,7 @@ async def test_write_tool_reports_when_diagnostics_not_received(
     async def fake_has_clients(cls, file: str) -> bool:
         return True
 
-    async def fake_touch_file(cls, file: str, wait_for_diagnostics: bool = False) -> int:
+    async def fake_touch_file(cls, file: str, wait_for_diagnostics: bool = False, content: str | None = None) -> int:
         return 1
 
     async def fake_diagnostics(cls):
@@ -225,7 +225,7 @@ async def test_write_tool_reports_when_lsp_server_fails_to_start(
     async def fake_has_clients(cls, file: str) -> bool:
         return True
 
-    async def fake_touch_file(cls, file: str, wait_for_diagnostics: bool = False) -> int:
+    async def fake_touch_file(cls, file: str, wait_for_diagnostics: bool = False, content: str | None = None) -> int:
         return 0
 
     async def fake_diagnostics(cls):
@@ -253,7 +253,7 @@ async def test_write_tool_reports_when_lsp_collection_fails(
     async def fake_has_clients(cls, file: str) -> bool:
         return True
 
-    async def fake_touch_file(cls, file: str, wait_for_diagnostics: bool = False) -> int:
+    async def fake_touch_file(cls, file: str, wait_for_diagnostics: bool = False, content: str | None = None) -> int:
         del cls, file, wait_for_diagnostics
         raise RuntimeError("boom")
 
@@ -0,0 +1,97 @@
+from pathlib import Path
+
+import pytest
+
+import hotaru.tool.line_index as line_index
+from hotaru.lsp import LSP
+from hotaru.tool.read import ReadParams, read_execute
+from hotaru.tool.tool import ToolContext
+from tests.helpers import fake_app
+
+
+@pytest.fixture(autouse=True)
+def _small_chunks(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(line_index, "SCAN_CHUNK", 256)
+    monkeypatch.setattr(line_index, "SKIP_BLOCK", 64)
+    line_index.invalidate()
+    yield
+    line_index.invalidate()
+
+
+def _tool_context(tmp_path: Path) -> ToolContext:
+    ctx = ToolContext(
+        app=fake_app(lsp=LSP()),
+        session_id="session_test",
+        message_id="message_test",
+        agent="build",
+        cwd=str(tmp_path),
+        worktree=str(tmp_path),
+    )
+
+    async def fake_ask(*, permission, patterns, always=None, metadata=None) -> None:
+        return None
+
+    ctx.ask = fake_ask  # type: ignore[method-assign]
+    return ctx
+
+
+async def _noop_touch(cls, file: str, wait_for_diagnostics: bool = False) -> int:
+    return 0
+
+
+@pytest.mark.anyio
+async def test_read_window_deep_in_file(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(LSP, "touch_file", classmethod(_noop_touch))
+    filepath = tmp_path / "big.log"
+    filepath.write_text("".join(f"line {i}\n" for i in range(1, 5001)), encoding="utf-8")
+
+    result = await read_execute(ReadParams(file_path=str(filepath), offset=4000, limit=3), _tool_context(tmp_path))
+
+    assert "4000: line 4000\n4001: line 4001\n4002: line 4002" in result.output
+    assert "read beyond line 4002" in result.output
+    assert result.metadata["truncated"] is True
+
+
+@pytest.mark.anyio
+async def test_read_window_reaches_end_of_file(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(LSP, "touch_file", classmethod(_noop_touch))
+    filepath = tmp_path / "crlf.txt"
+    filepath.write_bytes(b"".join(b"row %d\r\n" % i for i in range(1, 101)))
+
+    result = await read_execute(ReadParams(file_path=str(filepath), offset=99), _tool_context(tmp_path))
+
+    assert "99: row 99\n100: row 100\n101: \n" in result.output
+    assert "(End of file - total 101 lines)" in result.output
+
+    with pytest.raises(ValueError, match=r"out of range for this file \(101 lines\)"):
+        await read_execute(ReadParams(file_path=str(filepath), offset=102), _tool_context(tmp_path))
+
+
+@pytest.mark.anyio
+async def test_line_index_is_reused_and_rebuilt_on_change(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(LSP, "touch_file", classmethod(_noop_touch))
+    filepath = tmp_path / "data.txt"
+    filepath.write_text("".join(f"a{i}\n" for i in range(1000)), encoding="utf-8")
+    ctx = _tool_context(tmp_path)
+
+    await read_execute(ReadParams(file_path=str(filepath), offset=900, limit=1), ctx)
+    first = line_index._indexes[str(filepath)]
+    await read_execute(ReadParams(file_path=str(filepath), offset=10, limit=1), ctx)
+    assert line_index._indexes[str(filepath)] is first
+
+    filepath.write_text("".join(f"b{i}\n" for i in range(2000)), encoding="utf-8")
+    result = await read_execute(ReadParams(file_path=str(filepath), offset=1500, limit=1), ctx)
+
+    assert line_index._indexes[str(filepath)] is not first
+    assert "1500: b1499" in result.output
+
+
+@pytest.mark.anyio
+async def test_read_window_clips_overlong_lines(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(LSP, "touch_file", classmethod(_noop_touch))
+    filepath = tmp_path / "minified.js"
+    filepath.write_text("x" * 50_000 + "\nnext\n", encoding="utf-8")
+
+    result = await read_execute(ReadParams(file_path=str(filepath)), _tool_context(tmp_path))
+
+    assert f"1: {'x' * 2000}...\n2: next" in result.output
@@ -2,7 +2,7 @@ import pytest
 
 from hotaru.core.config import Config, ConfigManager, ExperimentalConfig
 from hotaru.tool.registry import ToolRegistry
-from tests.helpers import fake_app
+from tests.helpers import fake_agents, fake_app
 
 
 @pytest.mark.anyio
@@ -84,3 +84,47 @@ async def test_registry_strictifies_builtin_tool_schema() -> None:
     assert "anyOf" not in limit
     assert "default" not in limit
     assert "title" not in limit
+
+
+@pytest.mark.anyio
+async def test_registry_caches_definitions_until_registries_change(monkeypatch: pytest.MonkeyPatch) -> None:
+    from hotaru.tool import registry as registry_module
+
+    config = Config()
+    built: list[str] = []
+
+    async def fake_get(cls):  # type: ignore[no-untyped-def]
+        return config
+
+    async def fake_skill_description(caller_agent, *, skills, agents):  # type: ignore[no-untyped-def]
+        built.append(caller_agent)
+        return f"skills v{skills.version} for {caller_agent}"
+
+    monkeypatch.setattr(ConfigManager, "get", classmethod(fake_get))
+    monkeypatch.setattr(registry_module, "build_skill_description", fake_skill_description)
+
+    async def no_agents():  # type: ignore[no-untyped-def]
+        return []
+
+    registry = ToolRegistry()
+    app = fake_app(tools=registry, agents=fake_agents(list=no_agents))
+
+    async def definitions(agent: str) -> dict:
+        items = await registry.get_tool_definitions(app=app, caller_agent=agent, provider_id="p", model_id="m")
+        return {item["function"]["name"]: item for item in items}
+
+    first = await definitions("build")
+    second = await definitions("build")
+    assert first == second
+    assert all(first[name] is second[name] for name in first)
+    assert built == ["build"]
+
+    other = await definitions("plan")
+    assert other["skill"]["function"]["description"] == "skills v0 for plan"
+    assert other["read"] is first["read"]
+
+    app.skills.version += 1
+    third = await definitions("build")
+    assert third["skill"]["function"]["description"] == "skills v1 for build"
+    assert third["read"]["function"]["parameters"] is first["read"]["function"]["parameters"]
+    assert built == ["build", "plan", "build"]
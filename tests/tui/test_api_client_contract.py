@@ -39,6 +39,8 @@ async def test_api_client_calls_expected_v1_contract_endpoints() -> None:
             return httpx.Response(200, json={"ok": True, "interrupted": True})
         if route == ("POST", "/v1/sessions/session_1/compact"):
             return httpx.Response(200, json={"ok": True})
+        if route == ("GET", "/v1/sessions/session_1/cache"):
+            return httpx.Response(200, json={"steps": 1, "read_ratio": 0.5})
         if route == ("GET", "/v1/path"):
             return httpx.Response(200, json={"home": "/tmp", "state": "/tmp", "config": "/tmp", "cwd": "/tmp"})
         if route == ("GET", "/v1/events"):
@@ -101,6 +103,7 @@ async def test_api_client_calls_expected_v1_contract_endpoints() -> None:
     message_result = await client.send_session_message("session_1", {"content": "hello"})
     await client.interrupt_session("session_1")
     await client.compact_session("session_1")
+    await client.session_cache("session_1")
     await client.get_paths()
     global_events = [event async for event in client.stream_events()]
     await client.list_providers()
@@ -148,6 +151,7 @@ async def test_api_client_calls_expected_v1_contract_endpoints() -> None:
         ("POST", "/v1/sessions/session_1/messages"),
         ("POST", "/v1/sessions/session_1/interrupt"),
         ("POST", "/v1/sessions/session_1/compact"),
+        ("GET", "/v1/sessions/session_1/cache"),
         ("GET", "/v1/path"),
         ("GET", "/v1/events"),
         ("GET", "/v1/providers"),
@@ -0,0 +1,127 @@
+import time
+from typing import Any, Dict, List
+
+import pytest
+from textual.app import App, ComposeResult
+
+from hotaru.tui.widgets import AssistantTextPart, BlockSpec, MessageBlock, MessageTimeline, ToolDisplay
+
+
+def _render(message: Dict[str, Any]) -> List[BlockSpec]:
+    blocks = [
+        BlockSpec(
+            key=f"{message['id']}-bubble",
+            kind="bubble",
+            props={"content": "", "role": "assistant", "agent": None, "timestamp": None},
+            classes="message",
+        )
+    ]
+    for part in message["parts"]:
+        if part["type"] == "tool":
+            blocks.append(BlockSpec(key=part["id"], kind="tool", props={"part": part}, classes="message"))
+        else:
+            blocks.append(
+                BlockSpec(
+                    key=part["id"],
+                    kind="text",
+                    props={"content": part["text"], "part_id": part["id"]},
+                    classes="message",
+                )
+            )
+    return blocks
+
+
+def _message(index: int, text: str = "") -> Dict[str, Any]:
+    return {
+        "id": f"msg-{index}",
+        "role": "assistant",
+        "info": {},
+        "parts": [{"id": f"part-{index}", "type": "text", "text": text or f"message {index}\nsecond line"}],
+    }
+
+
+class _TimelineApp(App[None]):
+    def compose(self) -> ComposeResult:
+        yield MessageTimeline(window=20, id="timeline")
+
+
+@pytest.mark.anyio
+async def test_streaming_updates_widgets_in_place() -> None:
+    app = _TimelineApp()
+    messages = [_message(0), _message(1, "hel")]
+    async with app.run_test(size=(80, 24)) as pilot:
+        timeline = app.query_one(MessageTimeline)
+        await timeline.sync(messages, _render)
+        await pilot.pause()
+        first = list(app.query(MessageBlock))
+        text = app.query(AssistantTextPart).last()
+
+        messages[1]["parts"][0]["text"] += "lo"
+        messages[1]["parts"].append(
+            {"id": "tool-1", "type": "tool", "tool": "bash", "state": {"status": "running", "input": {}}}
+        )
+        await timeline.sync(messages, _render)
+        await pilot.pause()
+
+        assert list(app.query(MessageBlock)) == first
+        assert app.query(AssistantTextPart).last() is text
+        assert text.content == "hello"
+        tool = app.query_one(ToolDisplay)
+
+        completed = {**messages[1]["parts"][1], "state": {"status": "completed", "input": {}, "output": "ok"}}
+        messages[1]["parts"][1] = completed
+        await timeline.sync(messages, _render)
+        await pilot.pause()
+
+        assert app.query_one(ToolDisplay) is tool
+        assert tool.part is completed
+
+
+@pytest.mark.anyio
+async def test_long_session_mounts_a_bounded_window() -> None:
+    app = _TimelineApp()
+    messages = [_message(i) for i in range(1000)]
+    async with app.run_test(size=(80, 24)) as pilot:
+        timeline = app.query_one(MessageTimeline)
+        await timeline.sync(messages, _render)
+        await pilot.pause()
+
+        assert timeline.mounted_messages == 20
+        assert app.query(MessageBlock).last().key == "msg-999"
+        assert timeline.is_vertical_scroll_end
+
+        timeline.scroll_home(animate=False, immediate=True)
+        await pilot.pause()
+        await pilot.pause()
+
+        keys = [block.key for block in app.query(MessageBlock)]
+        assert "msg-0" in keys
+        assert len(keys) <= 40
+
+        # New messages do not yank the reader back to the bottom.
+        messages.append(_message(1000))
+        await timeline.sync(messages, _render)
+        await pilot.pause()
+        assert timeline.scroll_y == 0
+        assert "msg-1000" not in [block.key for block in app.query(MessageBlock)]
+
+
+@pytest.mark.anyio
+async def test_streaming_into_long_session_stays_fast() -> None:
+    app = _TimelineApp()
+    messages = [_message(i) for i in range(1000)]
+    async with app.run_test(size=(80, 24)) as pilot:
+        timeline = app.query_one(MessageTimeline)
+        await timeline.sync(messages, _render)
+        await pilot.pause()
+
+        part = messages[-1]["parts"][0]
+        started = time.perf_counter()
+        for i in range(50):
+            part["text"] += f" token{i}"
+            await timeline.sync(messages, _render)
+            await pilot.pause()
+        per_frame = (time.perf_counter() - started) / 50
+
+        assert timeline.mounted_messages == 20
+        assert per_frame < 0.1
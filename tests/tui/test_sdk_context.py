@@ -112,6 +112,20 @@ class _ApiFlakyEventStreamStub:
             raise
 
 
+class _ApiResumingEventStreamStub:
+    def __init__(self) -> None:
+        self.resumed_from: list[int | None] = []
+
+    async def stream_events(self, last_event_id: int | None = None):
+        self.resumed_from.append(last_event_id)
+        if len(self.resumed_from) == 1:
+            yield {"type": "server.connected", "data": {}}
+            yield {"id": 7, "type": "runtime", "data": {"state": "ready"}}
+            raise RuntimeError("connection dropped")
+        yield {"type": "server.connected", "data": {"last_event_id": last_event_id, "resumed": True}}
+        await asyncio.Event().wait()
+
+
 class _ApiAlwaysFailEventStreamStub:
     def __init__(self) -> None:
         self.started = 0
@@ -281,3 +295,27 @@ async def test_event_stream_stops_after_retry_limit_and_emits_exhausted_state(
 
     assert api.started == 3
     assert states[-1] == {"state": "exhausted", "attempt": 3}
+
+
+@pytest.mark.anyio
+async def test_event_stream_reconnects_with_last_event_id(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path,
+) -> None:
+    api = _ApiResumingEventStreamStub()
+    sdk = SDKContext(cwd=str(tmp_path), api_client=api)
+    wait = asyncio.sleep
+
+    async def fake_sleep(_delay: float) -> None:
+        await wait(0)
+
+    monkeypatch.setattr("hotaru.tui.context.sdk.asyncio.sleep", fake_sleep)
+
+    task = asyncio.create_task(sdk._run_event_stream())
+    for _ in range(20):
+        await wait(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert api.resumed_from == [None, 7]
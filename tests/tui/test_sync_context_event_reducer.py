@@ -1,3 +1,7 @@
+import asyncio
+
+import pytest
+
 from hotaru.tui.context.sync import SyncContext, SyncEvent
 
 
@@ -108,3 +112,51 @@ def test_runtime_event_reducer_emits_sync_events() -> None:
     )
 
     assert seen == ["message", "part"]
+
+
+def test_out_of_order_messages_are_inserted_sorted() -> None:
+    sync = SyncContext()
+
+    for message_id in ["message_1", "message_3", "message_2"]:
+        sync.apply_runtime_event(
+            "message.updated",
+            {"info": {"id": message_id, "session_id": "session_1", "role": "assistant"}},
+        )
+    sync.apply_runtime_event(
+        "message.updated",
+        {"info": {"id": "message_2", "session_id": "session_1", "role": "assistant", "agent": "plan"}},
+    )
+
+    messages = sync.get_messages("session_1")
+    assert [message["id"] for message in messages] == ["message_1", "message_2", "message_3"]
+    assert messages[1]["info"]["agent"] == "plan"
+
+
+@pytest.mark.anyio
+async def test_part_deltas_are_coalesced_per_frame() -> None:
+    sync = SyncContext()
+    parts: list[str] = []
+    updates: list[dict] = []
+    sync.on(SyncEvent.PART_UPDATED, lambda payload: parts.append(payload["part"]["text"]))
+    sync.on(SyncEvent.MESSAGES_UPDATED, updates.append)
+
+    for i in range(100):
+        sync.apply_runtime_event(
+            "message.part.delta",
+            {
+                "session_id": "session_1",
+                "message_id": "message_1",
+                "part_id": "part_1",
+                "field": "text",
+                "delta": str(i % 10),
+            },
+        )
+    assert updates == []
+
+    await asyncio.sleep(SyncContext.FRAME_INTERVAL * 3)
+
+    assert parts == ["0123456789" * 10]
+    assert len(updates) == 1
+    assert updates[0]["message_ids"] == ["message_1"]
+    assert updates[0]["part_ids"] == ["part_1"]
+    assert sync.get_parts("message_1")[0]["text"] == "0123456789" * 10